@@ -10,6 +10,7 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from framework.testing.arrival_rate import DEFAULT_MAX_IN_FLIGHT, ArrivalRateProfile
 from framework.testing.load_tester import (
     LoadTester,
     LoadTestConfig,
@@ -41,6 +42,28 @@ def load() -> None:
 @click.option("--ramp-up", type=int, help="Override ramp-up time (seconds)")
 @click.option("--output", type=click.Path(), help="Output directory for results")
 @click.option("--fail-fast", is_flag=True, help="Stop on critical errors")
+@click.option(
+    "--rate",
+    help="Open model: start sessions at RATE per second for the duration, or in stages 'RATE:SECONDS,RATE:SECONDS'",
+)
+@click.option(
+    "--max-in-flight",
+    type=int,
+    default=DEFAULT_MAX_IN_FLIGHT,
+    show_default=True,
+    help="Open model: max concurrent sessions; further arrivals are dropped",
+)
+@click.option(
+    "--workers",
+    type=int,
+    help="Threads running sessions (default: 10; with --rate, --max-in-flight so arrivals never queue)",
+)
+@click.option(
+    "--in-process",
+    is_flag=True,
+    help="Collect the test once and run it in this process per iteration instead of starting pytest each time",
+)
+@click.option("--select", "test_filter", help="In-process: pytest -k expression selecting the one test to run")
 def run(
     test_path: str,
     profile: str,
@@ -49,6 +72,11 @@ def run(
     ramp_up: int | None,
     output: str | None,
     fail_fast: bool,
+    rate: str | None,
+    max_in_flight: int,
+    workers: int | None,
+    in_process: bool,
+    test_filter: str | None,
 ) -> None:
     """Run load test"""
     console.print(Panel.fit("🔥 Load Testing", style="bold magenta"))
@@ -64,24 +92,51 @@ def run(
     if ramp_up is not None:
         load_profile.ramp_up_seconds = ramp_up
 
+    arrival_rate = None
+    if rate:
+        try:
+            arrival_rate = ArrivalRateProfile.parse(rate, load_profile.duration_seconds, max_in_flight)
+        except ValueError as e:
+            console.print(f"[red]✗[/red] Invalid --rate '{rate}': {e}")
+            raise SystemExit(1)
+
+    if workers is not None and workers < 1:
+        console.print("[red]✗[/red] --workers must be at least 1")
+        raise SystemExit(1)
+    if workers is None and arrival_rate:
+        # Sessions block a thread each; threads are only started as arrivals need them
+        workers = arrival_rate.max_in_flight
+
     # Create config
     config = LoadTestConfig(
         test_path=Path(test_path),
         profile=load_profile,
         fail_fast=fail_fast,
         output_dir=Path(output) if output else None,
+        arrival_rate=arrival_rate,
+        in_process=in_process,
+        test_filter=test_filter,
     )
+    if workers is not None:
+        config.max_workers = workers
 
     # Display config
     config_table = Table(title="Load Test Configuration")
     config_table.add_column("Setting", style="cyan")
     config_table.add_column("Value", style="green")
 
-    config_table.add_row("Profile", load_profile.name)
-    config_table.add_row("Virtual Users", str(load_profile.virtual_users))
-    config_table.add_row("Duration", f"{load_profile.duration_seconds}s")
-    config_table.add_row("Ramp-up", f"{load_profile.ramp_up_seconds}s")
+    if arrival_rate:
+        config_table.add_row("Arrival Rate", arrival_rate.description)
+        config_table.add_row("Max In Flight", str(arrival_rate.max_in_flight))
+        config_table.add_row("Workers", str(config.max_workers))
+    else:
+        config_table.add_row("Profile", load_profile.name)
+        config_table.add_row("Virtual Users", str(load_profile.virtual_users))
+        config_table.add_row("Duration", f"{load_profile.duration_seconds}s")
+        config_table.add_row("Ramp-up", f"{load_profile.ramp_up_seconds}s")
     config_table.add_row("Test Path", test_path)
+    if in_process:
+        config_table.add_row("Execution", "in-process" + (f" (-k {test_filter})" if test_filter else ""))
 
     console.print(config_table)
     console.print()
@@ -97,6 +152,9 @@ def run(
         task = progress.add_task("Running load test...", total=None)
 
         def progress_callback(message: str) -> None:
+            live = tester.live_stats()
+            if live["count"]:
+                message = f"{message} | last 10s: p95 {live['p95']:.2f}s, p99 {live['p99']:.2f}s"
             progress.update(task, description=message)
 
         result = tester.run(progress_callback=progress_callback)
@@ -111,9 +169,13 @@ def run(
 
     results_table.add_row("Duration", f"{result.duration_seconds:.2f}s")
     results_table.add_row("Total Tests", str(result.total_tests))
-    results_table.add_row("✅ Passed", f"{result.passed_tests} ({result.passed_tests / result.total_tests * 100:.1f}%)")
-    results_table.add_row("❌ Failed", f"{result.failed_tests} ({result.failed_tests / result.total_tests * 100:.1f}%)")
+    total = result.total_tests or 1
+    results_table.add_row("✅ Passed", f"{result.passed_tests} ({result.passed_tests / total * 100:.1f}%)")
+    results_table.add_row("❌ Failed", f"{result.failed_tests} ({result.failed_tests / total * 100:.1f}%)")
     results_table.add_row("Throughput", f"{result.throughput:.2f} tests/sec")
+    if "dropped_sessions" in result.metrics:
+        results_table.add_row("Dropped Sessions", str(result.metrics["dropped_sessions"]))
+        results_table.add_row("Max Start Lag", f"{result.metrics['max_start_lag_seconds']:.3f}s")
     results_table.add_row("Avg Response Time", f"{result.avg_response_time:.3f}s")
     results_table.add_row("Min Response Time", f"{result.min_response_time:.3f}s")
     results_table.add_row("Max Response Time", f"{result.max_response_time:.3f}s")
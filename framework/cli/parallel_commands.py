@@ -11,8 +11,10 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
+from framework.devices.device_layer import Device, DeviceCapabilities, DeviceType, Platform
 from framework.devices.device_manager import DeviceManager
 from framework.devices.device_pool import DevicePool, PoolStrategy
+from framework.execution.duration_history import DEFAULT_HISTORY_PATH, DurationHistory
 from framework.execution.parallel_executor import ParallelExecutor, TestStatus
 from framework.execution.test_sharding import ShardStrategy, TestCase, TestSharding
 
@@ -35,7 +37,19 @@ def parallel() -> None:
     help="Sharding strategy",
 )
 @click.option("--pytest-args", default="", help="Additional pytest arguments")
-def run(test_dir: Path, workers: int, shard_strategy: str, pytest_args: str) -> None:
+@click.option(
+    "--persistent-workers/--process-per-test",
+    default=True,
+    help="Reuse one pytest process per worker, or start a new one for every test",
+)
+@click.option(
+    "--dynamic",
+    is_flag=True,
+    help="Workers pull tests longest-first from a shared queue instead of running fixed shards",
+)
+def run(
+    test_dir: Path, workers: int, shard_strategy: str, pytest_args: str, persistent_workers: bool, dynamic: bool
+) -> None:
     """Run tests in parallel."""
     if not test_dir.exists():
         console.print(f"[red]❌ Test directory not found: {test_dir}[/red]")
@@ -78,12 +92,19 @@ def run(test_dir: Path, workers: int, shard_strategy: str, pytest_args: str) ->
     else:
         strategy = ShardStrategy.ROUND_ROBIN
 
-    sharding = TestSharding()
-    shards = sharding.create_shards(tests, num_shards=workers, strategy=strategy)
-    console.print(f"[green]✓[/green] Created {len(shards)} shards")
+    if dynamic:
+        console.print("[green]✓[/green] Dynamic scheduling: workers pull tests longest-first")
+    else:
+        sharding = TestSharding()
+        shards = sharding.create_shards(tests, num_shards=workers, strategy=strategy)
+        console.print(f"[green]✓[/green] Created {len(shards)} shards")
 
     # Execute in parallel
-    executor = ParallelExecutor(max_workers=workers, pytest_args=pytest_args.split() if pytest_args else [])
+    executor = ParallelExecutor(
+        max_workers=workers,
+        pytest_args=pytest_args.split() if pytest_args else [],
+        persistent_workers=persistent_workers,
+    )
 
     with Progress(
         SpinnerColumn(),
@@ -93,12 +114,15 @@ def run(test_dir: Path, workers: int, shard_strategy: str, pytest_args: str) ->
         TimeElapsedColumn(),
         console=console,
     ) as progress:
-        task = progress.add_task("[cyan]Executing tests...", total=len(shards))
+        task = progress.add_task("[cyan]Executing tests...", total=len(tests) if dynamic else len(shards))
 
         def update_progress(completed: int, total: int) -> None:
             progress.update(task, completed=completed)
 
-        results = executor.execute_shards(shards, Path.cwd(), progress_callback=update_progress)
+        if dynamic:
+            results = executor.execute_dynamic(tests, Path.cwd(), progress_callback=update_progress)
+        else:
+            results = executor.execute_shards(shards, Path.cwd(), progress_callback=update_progress)
 
     # Display results
     console.print("\n" + executor.generate_summary(results))
@@ -123,12 +147,52 @@ def run(test_dir: Path, workers: int, shard_strategy: str, pytest_args: str) ->
     raise SystemExit(exit_code)
 
 
+def _device_pool(devices: list) -> DevicePool:
+    """DevicePool of devices discovered by DeviceManager"""
+    pool = DevicePool(name="local", strategy=PoolStrategy.ROUND_ROBIN)
+    for info in devices:
+        if info.get("platform") == "ios":
+            # simctl runtimes look like "iOS-17-0"
+            device_type = DeviceType.SIMULATOR
+            version = (info.get("ios_version") or "").split("-", 1)[-1].replace("-", ".")
+        else:
+            device_type = DeviceType.EMULATOR if info["id"].startswith("emulator-") else DeviceType.REAL
+            version = info.get("api_level")
+        capabilities = DeviceCapabilities(
+            platform=Platform(info["platform"]),
+            platform_version=str(version or ""),
+            device_name=info.get("name") or info["id"],
+            udid=info["id"],
+            device_type=device_type,
+        )
+        pool.add_device(Device(capabilities, driver=None))
+    return pool
+
+
 @parallel.command()
 @click.argument("test_dir", type=Path)
 @click.option("--platform", type=click.Choice(["android", "ios", "both"]), default="both")
+@click.option("--min-version", default=None, help="Minimum platform version (API level on Android)")
+@click.option("--workers", "-w", default=None, type=int, help="Max parallel workers (default: one per device)")
 @click.option("--pytest-args", default="", help="Additional pytest arguments")
-def on_devices(test_dir: Path, platform: str, pytest_args: str) -> None:
-    """Run tests in parallel across multiple devices."""
+@click.option(
+    "--persistent-workers/--process-per-test",
+    default=True,
+    help="Reuse one pytest process per device, or start a new one for every test",
+)
+def on_devices(
+    test_dir: Path,
+    platform: str,
+    min_version: Optional[str],
+    workers: Optional[int],
+    pytest_args: str,
+    persistent_workers: bool,
+) -> None:
+    """Run tests in parallel, one worker per leased device."""
+    if not test_dir.exists():
+        console.print(f"[red]❌ Test directory not found: {test_dir}[/red]")
+        return
+
     console.print(
         Panel(
             "[cyan]🔌 Multi-Device Parallel Execution[/cyan]\n\n"
@@ -154,9 +218,6 @@ def on_devices(test_dir: Path, platform: str, pytest_args: str) -> None:
 
     console.print(f"[green]✓[/green] Found {len(devices)} device(s)")
 
-    # Note: Device pool requires Device objects, but we have dicts from DeviceManager
-    # This is a display-only operation, so we just show the available devices
-
     # Show devices
     table = Table(title="Available Devices")
     table.add_column("Device", style="cyan")
@@ -168,14 +229,48 @@ def on_devices(test_dir: Path, platform: str, pytest_args: str) -> None:
         table.add_row(
             device.get("name", "Unknown"),
             device.get("platform", "Unknown"),
-            device.get("platform_version", device.get("os_version", "Unknown")),
+            str(device.get("platform_version", device.get("api_level", device.get("ios_version", "Unknown")))),
             device.get("status", "Unknown"),
         )
 
     console.print(table)
 
-    console.print("\n[yellow]Note:[/yellow] Multi-device execution is a work in progress.")
-    console.print("For now, use [cyan]observe parallel run[/cyan] for parallel execution on single device.")
+    pool = _device_pool(devices)
+    filters = {"min_version": min_version} if min_version else None
+    test_files = list(test_dir.rglob("test_*.py"))
+    tests = [TestCase(file=f, name=f.stem, estimated_duration=10.0) for f in test_files]
+
+    executor = ParallelExecutor(
+        max_workers=workers or len(devices),
+        pytest_args=pytest_args.split() if pytest_args else [],
+        persistent_workers=persistent_workers,
+    )
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("[cyan]Executing tests...", total=len(tests))
+
+        def update_progress(completed: int, total: int) -> None:
+            progress.update(task, completed=completed)
+
+        try:
+            results = executor.execute_on_devices(
+                tests, Path.cwd(), pool, device_filters=filters, progress_callback=update_progress
+            )
+        except RuntimeError as e:
+            console.print(f"[red]❌ {e}[/red]")
+            raise SystemExit(1)
+
+    console.print("\n" + executor.generate_summary(results))
+
+    aggregated = executor.aggregate_results(results)
+    raise SystemExit(1 if aggregated["failed"] > 0 or aggregated["errors"] > 0 else 0)
 
 
 @parallel.command()
@@ -227,6 +322,30 @@ def create_shards_cmd(test_dir: Path, num_shards: int, strategy: str, output: Op
         console.print(f"\n[green]✓[/green] Saved shards to {output}")
 
 
+@parallel.command()
+@click.option("--db", type=Path, default=DEFAULT_HISTORY_PATH, help="Test duration history database")
+@click.option("--limit", "-n", default=20, help="Number of tests to show")
+def durations(db: Path, limit: int) -> None:
+    """Show recorded test durations, slowest first."""
+    with DurationHistory(db) as history:
+        stats = history.stats()
+
+    if not stats:
+        console.print(f"[yellow]No test duration history in {db}[/yellow]")
+        return
+
+    table = Table(title=f"Test Durations ({len(stats)} tests)")
+    table.add_column("Test", style="cyan")
+    table.add_column("EWMA", justify="right")
+    table.add_column("p90", justify="right")
+    table.add_column("Runs", justify="right")
+
+    for entry in stats[:limit]:
+        table.add_row(entry["test_name"], f"{entry['ewma']:.2f}s", f"{entry['p90']:.2f}s", str(entry["runs"]))
+
+    console.print(table)
+
+
 @parallel.command()
 @click.option("--workers", "-w", default=4, help="Number of workers")
 @click.option("--test-count", default=100, help="Number of test simulations")
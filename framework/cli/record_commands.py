@@ -2,6 +2,8 @@
 Recording session commands for capturing mobile app behavior.
 """
 
+import hashlib
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +14,26 @@ from framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Characters allowed in per-session output file names; session IDs come from recorded data
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+# Files correlate-all writes next to the per-session results
+_RESERVED_FILENAMES = {"summary"}
+
+
+def _session_filename(session_id: str) -> str:
+    """
+    Output file name for a session, confined to a single path component
+
+    When the ID had to be changed (or names a reserved file), a short hash of
+    the raw ID is appended so that different sessions never share a file.
+    """
+    name = _UNSAFE_FILENAME_CHARS.sub("_", session_id).lstrip(".") or "session"
+    if name != session_id or name.lower() in _RESERVED_FILENAMES:
+        name = f"{name}-{hashlib.sha256(session_id.encode()).hexdigest()[:8]}"
+    return f"{name}.json"
+
 
 @click.group()
 def record():
@@ -101,3 +123,142 @@ def correlate(session_id: str, output: str):
     print_success(f"Correlation complete! Model saved to: {output_path / 'app_model.yaml'}")
 
     logger.info(f"Session correlation completed: {session_id}")
+
+
+@record.command("correlate-all")
+@click.option("--db", "db_path", default="observe_events.db", help="Event database (SQLite)")
+@click.option("--workers", "-w", type=int, default=None, help="Worker processes (default: CPU count)")
+@click.option("--output", type=click.Path(), help="Directory for per-session correlation results (JSON)")
+@click.option("--session-id", "session_ids", multiple=True, help="Session to correlate (repeatable; default: all)")
+def correlate_all(db_path: str, workers: Optional[int], output: Optional[str], session_ids: tuple):
+    """
+    Correlate every recorded session in parallel
+
+    Sessions are spread across worker processes, each reading the event
+    database through its own read-only connection.
+
+    Example:
+        observe record correlate-all --db observe_events.db --workers 8 --output correlations
+    """
+    import time
+
+    from framework.cli.rich_output import print_summary, print_table, print_warning
+    from framework.correlation import EventCorrelator, MultiSessionSummary
+    from framework.storage import EventStore
+
+    print_header("🔗 Correlating All Sessions", f"Database: {db_path}")
+
+    try:
+        store = EventStore(db_path, read_only=True)
+    except FileNotFoundError as e:
+        print_error(str(e))
+        raise click.Abort()
+
+    output_path = Path(output) if output else None
+    if output_path:
+        output_path.mkdir(parents=True, exist_ok=True)
+
+    correlator = EventCorrelator(event_store=store)
+    outcomes = []
+    start = time.perf_counter()
+
+    try:
+        for outcome in correlator.correlate_all_sessions(max_workers=workers, session_ids=list(session_ids) or None):
+            outcomes.append(outcome)
+            if not outcome.succeeded:
+                print_error(f"{outcome.session_id}: {outcome.error}")
+                continue
+
+            result = outcome.result
+            print_success(
+                f"{outcome.session_id}: {len(result.full_flows)} flows, "
+                f"{result.correlation_rate:.0%} UI events correlated ({outcome.elapsed_ms:.0f}ms)"
+            )
+            if output_path:
+                (output_path / _session_filename(outcome.session_id)).write_text(result.model_dump_json(indent=2))
+    finally:
+        store.close()
+
+    if not outcomes:
+        print_warning("No sessions to correlate")
+        return
+
+    summary = MultiSessionSummary.from_outcomes(outcomes, (time.perf_counter() - start) * 1000)
+    print_summary(
+        "Correlation Summary",
+        {
+            "sessions": summary.total_sessions,
+            "succeeded": summary.succeeded,
+            "failed": summary.failed,
+            "wall_time": f"{summary.wall_time_ms / 1000:.2f}s",
+            "mean_session_time": f"{summary.mean_session_ms:.0f}ms",
+            "slowest_session_time": f"{summary.max_session_ms:.0f}ms",
+            "parallel_speedup": f"{summary.parallel_speedup:.1f}x",
+        },
+    )
+
+    slowest = sorted(summary.session_timings.items(), key=lambda item: item[1], reverse=True)[:10]
+    print_table(
+        [{"session": session_id, "time_ms": f"{ms:.0f}"} for session_id, ms in slowest],
+        title="Slowest Sessions",
+    )
+
+    if output_path:
+        (output_path / "summary.json").write_text(summary.model_dump_json(indent=2))
+        print_info(f"Results saved to: {output_path.absolute()}")
+
+    logger.info(f"Correlated {summary.total_sessions} sessions in {summary.wall_time_ms:.0f}ms")
+
+    if summary.failed:
+        raise SystemExit(1)
+
+
+@record.command()
+@click.option("--db", "db_path", default="observe_events.db", help="Event database (SQLite) the recording writes to")
+@click.option("--session-id", required=True, help="Session being recorded")
+@click.option("--poll-interval", type=float, default=0.5, show_default=True, help="Seconds between database polls")
+@click.option("--idle-timeout", type=float, default=None, help="Stop after this many seconds without new events")
+@click.option("--output", type=click.Path(), help="Append emitted flows to this file (JSON lines)")
+def follow(db_path: str, session_id: str, poll_interval: float, idle_timeout: Optional[float], output: Optional[str]):
+    """
+    Correlate a session live while it is being recorded
+
+    Flows are printed (and optionally written) as soon as their windows close.
+    Stop with Ctrl+C or --idle-timeout.
+
+    Example:
+        observe record follow --session-id session_20240101_120000_ab12cd34 --output flows.jsonl
+    """
+    import json
+
+    from framework.correlation.streaming import follow_session
+    from framework.correlation.types import FullFlowCorrelation
+    from framework.storage import EventStore
+
+    print_header("📡 Following Recording Session", f"Session: {session_id}")
+
+    try:
+        store = EventStore(db_path, read_only=True)
+    except FileNotFoundError as e:
+        print_error(str(e))
+        raise click.Abort()
+
+    flows = 0
+    sink = open(output, "a") if output else None
+    try:
+        for correlation in follow_session(store, session_id, poll_interval=poll_interval, idle_timeout=idle_timeout):
+            if sink:
+                record_type = type(correlation).__name__
+                sink.write(json.dumps({"type": record_type, **correlation.model_dump(mode="json")}) + "\n")
+                sink.flush()
+            if isinstance(correlation, FullFlowCorrelation):
+                flows += 1
+                print_success(f"Flow {correlation.flow_id}: {correlation.description or correlation.flow_name or ''}")
+    except KeyboardInterrupt:
+        print_info("Stopped following")
+    finally:
+        if sink:
+            sink.close()
+        store.close()
+
+    print_info(f"{flows} flows correlated")
@@ -13,6 +13,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from framework.security.sast_analyzer import SASTAnalyzer
+from framework.security.sast_cache import SASTFindingsCache
 from framework.cli.security.base import (
     security,
     console,
@@ -30,6 +31,9 @@ from framework.cli.security.base import (
 @click.option("--format", "-f", type=click.Choice(["json", "sarif", "html"]), default="json")
 @click.option("--taint/--no-taint", default=True, help="Enable taint analysis")
 @click.option("--crypto/--no-crypto", default=True, help="Enable cryptography analysis")
+@click.option("--workers", "-w", type=int, default=1, help="Worker processes for analysis (0 = CPU count)")
+@click.option("--since", help="Only analyze files changed since this git ref (e.g. origin/main)")
+@click.option("--cache/--no-cache", default=True, help="Reuse findings of unchanged files (.observe/sast_cache.db)")
 def sast(
     source_path: Path,
     language: str,
@@ -37,6 +41,9 @@ def sast(
     format: str,
     taint: bool,
     crypto: bool,
+    workers: int,
+    since: Optional[str],
+    cache: bool,
 ) -> None:
     """
     Run Static Application Security Testing (SAST).
@@ -48,6 +55,8 @@ def sast(
         observe security sast ./src --language python
         observe security sast ./app -l java -o sast_report.sarif --format sarif
         observe security sast ./project --taint --crypto
+        observe security sast ./monorepo --workers 0
+        observe security sast ./app --since origin/main
     """
     if not validate_path(source_path):
         raise SystemExit(1)
@@ -63,17 +72,29 @@ def sast(
         )
     )
 
-    analyzer = SASTAnalyzer()
+    analyzer = SASTAnalyzer(cache=SASTFindingsCache() if cache else None)
+
+    try:
+        with create_progress_context() as progress:
+            task = progress.add_task("Running SAST analysis...", total=None)
+            result = analyzer.analyze(
+                source_path,
+                language=language if language != "all" else None,
+                enable_taint=taint,
+                enable_crypto=crypto,
+                workers=workers,
+                since=since,
+            )
+            progress.update(task, completed=True)
+    except ValueError as e:
+        console.print(f"[red]✗[/red] Error: {e}")
+        raise SystemExit(1)
+    finally:
+        if analyzer.cache is not None:
+            analyzer.cache.close()
 
-    with create_progress_context() as progress:
-        task = progress.add_task("Running SAST analysis...", total=None)
-        result = analyzer.analyze(
-            source_path,
-            language=language if language != "all" else None,
-            enable_taint=taint,
-            enable_crypto=crypto,
-        )
-        progress.update(task, completed=True)
+    if result.files_from_cache:
+        console.print(f"[dim]{result.files_from_cache}/{result.files_scanned} files unchanged (cached findings)[/dim]")
 
     console.print()
     console.print(Panel.fit("SAST Analysis Results", style="bold green"))
@@ -6,17 +6,24 @@ to build a comprehensive understanding of application behavior.
 """
 
 from framework.correlation.correlator import EventCorrelator
+from framework.correlation.streaming import StreamingCorrelator, follow_session
 from framework.correlation.types import (
     CorrelationResult,
     UIToAPICorrelation,
     APIToNavigationCorrelation,
     CorrelationStrength,
+    MultiSessionSummary,
+    SessionCorrelationOutcome,
 )
 
 __all__ = [
     "EventCorrelator",
+    "StreamingCorrelator",
+    "follow_session",
     "CorrelationResult",
     "UIToAPICorrelation",
     "APIToNavigationCorrelation",
     "CorrelationStrength",
+    "MultiSessionSummary",
+    "SessionCorrelationOutcome",
 ]
@@ -0,0 +1,161 @@
+"""
+Candidate Index
+
+Finds the events that can possibly correlate with a given event, so the
+correlator evaluates strategies only on those instead of on every pair.
+
+Events are sorted by timestamp once and temporal windows are looked up with
+bisect; correlation-id, thread-id and screen matches come from hash maps.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List, Optional
+
+from framework.correlation.strategies import (
+    CorrelationIDStrategy,
+    CorrelationStrategy,
+    HybridCorrelationStrategy,
+    ScreenContextStrategy,
+    TemporalProximityStrategy,
+    ThreadCorrelationStrategy,
+)
+
+
+def correlation_id_of(event: Dict[str, Any]) -> Any:
+    """Correlation ID as read by CorrelationIDStrategy"""
+    return event.get("correlationId") or event.get("correlation_id")
+
+
+def thread_id_of(event: Dict[str, Any]) -> Any:
+    """Thread ID as read by ThreadCorrelationStrategy"""
+    return event.get("threadId") or event.get("thread_id")
+
+
+def screen_of(event: Dict[str, Any]) -> Any:
+    """Screen as read by ScreenContextStrategy"""
+    return event.get("screen")
+
+
+# Key-matching strategies and the event key each one compares
+STRATEGY_KEY_FUNCTIONS: Dict[type, Callable[[Dict[str, Any]], Any]] = {
+    CorrelationIDStrategy: correlation_id_of,
+    ThreadCorrelationStrategy: thread_id_of,
+    ScreenContextStrategy: screen_of,
+}
+
+
+class TimeWindowIndex:
+    """Events sorted by timestamp for O(log n) window lookups"""
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        self._order = sorted(range(len(events)), key=lambda i: events[i].get("timestamp", 0))
+        self._times = [events[i].get("timestamp", 0) for i in self._order]
+
+    def between(self, start: float, end: float) -> List[int]:
+        """Indices (into the original list) of events with start <= timestamp <= end"""
+        lo = bisect_left(self._times, start)
+        hi = bisect_right(self._times, end)
+        return self._order[lo:hi]
+
+
+class KeyIndex:
+    """Hash index from a key (correlation ID, thread, screen) to event indices"""
+
+    def __init__(self, events: List[Dict[str, Any]], key_fn: Callable[[Dict[str, Any]], Any]):
+        self.key_fn = key_fn
+        self._buckets: Dict[Any, List[int]] = {}
+
+        for i, event in enumerate(events):
+            key = key_fn(event)
+            if key:  # Strategies ignore missing/empty keys
+                self._buckets.setdefault(key, []).append(i)
+
+    def matching(self, event: Dict[str, Any]) -> List[int]:
+        """Indices of events sharing this event's key"""
+        key = self.key_fn(event)
+        if not key:
+            return []
+        try:
+            return self._buckets.get(key, [])
+        except TypeError:
+            # Unhashable keys never equal the hashable keys stored here
+            return []
+
+
+class CandidateIndex:
+    """
+    Candidate lookup for a correlation strategy
+
+    Supports the built-in strategies (and a HybridCorrelationStrategy made of
+    them). For any other strategy build() returns None and the caller must
+    evaluate every pair.
+
+    Candidates are a superset of the correlating targets: callers still run
+    the strategy on each one, so results are identical to a full scan.
+    """
+
+    # Widens time windows so float rounding can never drop a boundary match
+    WINDOW_SLACK_MS = 1
+
+    def __init__(self, windows: List[tuple], key_indexes: List[KeyIndex]):
+        """
+        Args:
+            windows: (TimeWindowIndex, max_delta_ms) pairs; targets within
+                [source_time, source_time + max_delta_ms] are candidates
+            key_indexes: Hash indexes; targets sharing a key are candidates
+        """
+        self.windows = windows
+        self.key_indexes = key_indexes
+
+    @classmethod
+    def build(cls, strategy: CorrelationStrategy, targets: List[Dict[str, Any]]) -> Optional["CandidateIndex"]:
+        """Build an index over targets for strategy, or None if it cannot be indexed"""
+        # Exact type checks: subclasses may override correlate() with other rules
+        if type(strategy) is HybridCorrelationStrategy:
+            parts = strategy.strategies
+        else:
+            parts = [strategy]
+
+        window_index: Optional[TimeWindowIndex] = None
+        windows = []
+        key_indexes = []
+
+        try:
+            for part in parts:
+                if type(part) is TemporalProximityStrategy:
+                    window_index = window_index or TimeWindowIndex(targets)
+                    windows.append((window_index, part.max_time_delta_ms))
+                elif type(part) in STRATEGY_KEY_FUNCTIONS:
+                    key_indexes.append(KeyIndex(targets, STRATEGY_KEY_FUNCTIONS[type(part)]))
+                else:
+                    return None
+        except TypeError:
+            # Unhashable keys or unorderable timestamps
+            return None
+
+        return cls(windows, key_indexes)
+
+    @classmethod
+    def for_window(cls, targets: List[Dict[str, Any]], max_delta_ms: float) -> "CandidateIndex":
+        """Index that only matches targets within max_delta_ms after the source"""
+        return cls([(TimeWindowIndex(targets), max_delta_ms)], [])
+
+    def candidates(self, source: Dict[str, Any]) -> List[int]:
+        """Indices of targets that may correlate with source, in original order"""
+        source_time = source.get("timestamp", 0)
+        slack = self.WINDOW_SLACK_MS
+
+        if len(self.windows) + len(self.key_indexes) == 1:
+            # Single lookup: no duplicates to merge
+            if self.windows:
+                window, max_delta = self.windows[0]
+                return sorted(window.between(source_time - slack, source_time + max_delta + slack))
+            return list(self.key_indexes[0].matching(source))
+
+        found = set()
+        for window, max_delta in self.windows:
+            found.update(window.between(source_time - slack, source_time + max_delta + slack))
+        for key_index in self.key_indexes:
+            found.update(key_index.matching(source))
+
+        return sorted(found)
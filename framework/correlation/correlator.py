@@ -6,12 +6,17 @@ Supports both high-performance Rust implementation and Python fallback.
 """
 
 import logging
+import os
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
+from framework.correlation.candidate_index import CandidateIndex
+from framework.correlation.numpy_backend import NUMPY_AVAILABLE, NumpyCorrelationBackend
 from framework.correlation.strategies import HybridCorrelationStrategy, TemporalProximityStrategy
 from framework.correlation.types import (
     CorrelationResult,
+    SessionCorrelationOutcome,
     UIToAPICorrelation,
     APIToNavigationCorrelation,
     FullFlowCorrelation,
@@ -46,22 +51,29 @@ class EventCorrelator:
     - Full flows: UI → API → Navigation
 
     Performance: Uses Rust implementation when available for 16-90x speedup.
+    Without Rust, a vectorized NumPy backend is used when NumPy is installed.
+    The pure-Python fallback only evaluates candidate pairs found through a
+    timestamp-sorted window index and correlation/thread/screen hash maps.
     """
 
+    # Navigation must follow an API response within this window
+    NAV_WINDOW_MS = 3000
+
     def __init__(self, event_store: Optional[EventStore] = None, force_python: bool = False):
         """
         Initialize correlator
 
         Args:
             event_store: Optional EventStore for loading events
-            force_python: Force Python implementation even if Rust is available (for testing)
+            force_python: Force the pure-Python implementation even if Rust or NumPy is available
         """
         self.event_store = event_store
         self.use_rust = USE_RUST and not force_python
+        self.use_numpy = NUMPY_AVAILABLE and not force_python
 
         # Initialize strategies
         self.ui_strategy = HybridCorrelationStrategy()
-        self.nav_strategy = TemporalProximityStrategy(max_time_delta_ms=3000)
+        self.nav_strategy = TemporalProximityStrategy(max_time_delta_ms=self.NAV_WINDOW_MS)
 
         # Initialize Rust correlator if available
         if self.use_rust:
@@ -82,10 +94,10 @@ class EventCorrelator:
         if not self.event_store:
             raise ValueError("EventStore required for session correlation")
 
-        # Load events from store
-        ui_events = self.event_store.get_events(session_id=session_id, event_type="UIEvent")
-        api_events = self.event_store.get_events(session_id=session_id, event_type="NetworkEvent")
-        nav_events = self.event_store.get_events(session_id=session_id, event_type="NavigationEvent")
+        # Stream every event of the session from the store (no row limit)
+        ui_events = self.event_store.iter_events(session_id=session_id, event_type="UIEvent")
+        api_events = self.event_store.iter_events(session_id=session_id, event_type="NetworkEvent")
+        nav_events = self.event_store.iter_events(session_id=session_id, event_type="NavigationEvent")
 
         # Convert to dicts for processing
         ui_dicts = [self._event_to_dict(e) for e in ui_events]
@@ -96,6 +108,86 @@ class EventCorrelator:
             session_id=session_id, ui_events=ui_dicts, api_events=api_dicts, navigation_events=nav_dicts
         )
 
+    def correlate_all_sessions(
+        self, max_workers: Optional[int] = None, session_ids: Optional[List[str]] = None
+    ) -> Iterator[SessionCorrelationOutcome]:
+        """
+        Correlate many sessions in parallel worker processes
+
+        Each worker opens its own read-only EventStore on the same database and
+        correlates whole sessions with this correlator's strategies. Outcomes
+        are yielded as sessions finish (not in submission order); a failing
+        session yields an outcome with ``error`` set instead of aborting the run.
+        Use MultiSessionSummary.from_outcomes() for a timing summary.
+
+        Args:
+            max_workers: Worker processes (default: CPU count); 1 runs in-process
+            session_ids: Sessions to correlate (default: every session in the store)
+
+        Yields:
+            SessionCorrelationOutcome per session, in completion order
+        """
+        if not self.event_store:
+            raise ValueError("EventStore required for session correlation")
+
+        if session_ids is None:
+            # Largest sessions first, so a long one does not start last and
+            # leave the other workers idle at the end of the run
+            sessions = sorted(self.event_store.get_sessions(), key=lambda s: s["event_count"], reverse=True)
+            session_ids = [s["session_id"] for s in sessions]
+        if not session_ids:
+            return
+
+        worker_args = (
+            str(self.event_store.db_path),
+            self.ui_strategy,
+            self.nav_strategy,
+            self.use_rust,
+            self.use_numpy,
+        )
+        max_workers = min(max_workers or os.cpu_count() or 1, len(session_ids))
+
+        if max_workers == 1:
+            worker = _create_session_worker(*worker_args)
+            try:
+                for session_id in session_ids:
+                    yield worker._correlate_session_timed(session_id)
+            finally:
+                worker.event_store.close()
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_session_worker, initargs=worker_args
+        ) as executor:
+            futures = [executor.submit(_correlate_session_in_worker, session_id) for session_id in session_ids]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                # Consumer stopped early: drop sessions that have not started
+                for future in futures:
+                    future.cancel()
+
+    def _correlate_session_timed(self, session_id: str) -> SessionCorrelationOutcome:
+        """Correlate one session, capturing its duration and any error"""
+        start_time = time.perf_counter()
+        result = None
+        error = None
+
+        try:
+            result = self.correlate_session(session_id)
+        except Exception as e:
+            self.logger.error(f"Correlation of session {session_id} failed: {e}", exc_info=True)
+            error = f"{type(e).__name__}: {e}"
+
+        return SessionCorrelationOutcome(
+            session_id=session_id,
+            result=result,
+            elapsed_ms=(time.perf_counter() - start_time) * 1000,
+            worker_pid=os.getpid(),
+            error=error,
+        )
+
     def correlate_events(
         self,
         session_id: str,
@@ -130,7 +222,26 @@ class EventCorrelator:
                 return result
             except Exception as e:
                 self.logger.warning(f"Rust correlation failed, falling back to Python: {e}")
-                # Fall through to Python implementation
+                # Fall through to NumPy/Python implementation
+
+        # Vectorized NumPy backend for the built-in strategies
+        numpy_backend = None
+        if self.use_numpy:
+            numpy_backend = NumpyCorrelationBackend.create(self.ui_strategy, self.nav_strategy, self.NAV_WINDOW_MS)
+
+        if numpy_backend:
+            try:
+                result = self._correlate_with_numpy(numpy_backend, session_id, ui_events, api_events, navigation_events)
+                elapsed = time.time() - start_time
+                self.logger.info(
+                    f"NumPy correlation completed in {elapsed * 1000:.2f}ms "
+                    f"({len(ui_events)} UI, {len(api_events)} API, "
+                    f"{len(navigation_events)} nav events)"
+                )
+                return result
+            except TypeError as e:
+                # Event values NumPy cannot represent (non-numeric timestamps, unhashable keys)
+                self.logger.warning(f"NumPy correlation failed, falling back to Python: {e}")
 
         # Python fallback implementation
         result = self._correlate_with_python(session_id, ui_events, api_events, navigation_events)
@@ -184,6 +295,45 @@ class EventCorrelator:
         # Correlate API → Navigation
         api_to_nav = self._correlate_api_to_navigation(api_events, navigation_events)
 
+        return self._assemble_result(session_id, ui_events, api_events, navigation_events, ui_to_api, api_to_nav)
+
+    def _correlate_with_numpy(
+        self,
+        backend: NumpyCorrelationBackend,
+        session_id: str,
+        ui_events: List[Dict[str, Any]],
+        api_events: List[Dict[str, Any]],
+        navigation_events: List[Dict[str, Any]],
+    ) -> CorrelationResult:
+        """Correlate using the vectorized NumPy backend"""
+        ui_matches = backend.match_ui_to_api(ui_events, api_events)
+        ui_to_api = []
+        for ui_event, matches in zip(ui_events, ui_matches):
+            correlation = self._build_ui_correlation(
+                ui_event, [(api_events[api_index], methods, confidence) for api_index, methods, confidence in matches]
+            )
+            if correlation:
+                ui_to_api.append(correlation)
+
+        nav_matches = backend.match_api_to_navigation(api_events, navigation_events)
+        api_to_nav = [
+            self._build_navigation_correlation(api_event, navigation_events[nav_index], strength, methods, confidence)
+            for api_event, matches in zip(api_events, nav_matches)
+            for nav_index, strength, methods, confidence in matches
+        ]
+
+        return self._assemble_result(session_id, ui_events, api_events, navigation_events, ui_to_api, api_to_nav)
+
+    def _assemble_result(
+        self,
+        session_id: str,
+        ui_events: List[Dict[str, Any]],
+        api_events: List[Dict[str, Any]],
+        navigation_events: List[Dict[str, Any]],
+        ui_to_api: List[UIToAPICorrelation],
+        api_to_nav: List[APIToNavigationCorrelation],
+    ) -> CorrelationResult:
+        """Build flows and statistics from UI→API and API→Navigation correlations"""
         # Build full flows
         full_flows = self._build_full_flows(ui_to_api, api_to_nav)
 
@@ -221,69 +371,88 @@ class EventCorrelator:
         Correlate UI events with API calls
 
         For each UI event, find associated API calls using correlation strategies.
+        Only API calls that can possibly correlate (inside a temporal window or
+        sharing a correlation ID, thread or screen) are evaluated.
         """
         correlations = []
+        index = CandidateIndex.build(self.ui_strategy, api_events)
+        all_apis = range(len(api_events))
 
         for ui_event in ui_events:
             # Find API calls that might be related to this UI event
-            correlated_apis = []
+            matches = []
 
-            for api_event in api_events:
+            candidates = index.candidates(ui_event) if index else all_apis
+            for api_index in candidates:
+                api_event = api_events[api_index]
                 # Check correlation using hybrid strategy
                 is_correlated, strength, methods, confidence = self.ui_strategy.correlate(ui_event, api_event)
 
                 if is_correlated:
-                    correlated_apis.append(
-                        {
-                            "eventId": api_event.get("eventId", ""),
-                            "method": api_event.get("method", ""),
-                            "endpoint": api_event.get("url", ""),
-                            "statusCode": api_event.get("statusCode"),
-                            "timestamp": api_event.get("timestamp", 0),
-                            "duration": api_event.get("duration", 0),
-                            "correlationMethods": [m.value for m in methods],
-                            "confidence": confidence,
-                        }
-                    )
-
-            # Create correlation only if we found related APIs
-            if correlated_apis:
-                # Determine overall strength
-                confidences = [api["confidence"] for api in correlated_apis]
-                avg_confidence = sum(confidences) / len(confidences)
-
-                if avg_confidence >= 0.8:
-                    strength = CorrelationStrength.STRONG
-                elif avg_confidence >= 0.5:
-                    strength = CorrelationStrength.MEDIUM
-                else:
-                    strength = CorrelationStrength.WEAK
-                    # Keep avg_confidence as-is (don't overwrite to 0.0)
-                    # This preserves the actual measured correlation strength
-
-                # Calculate time delta
-                time_delta = None
-                if correlated_apis:
-                    first_api_time = min(api["timestamp"] for api in correlated_apis)
-                    time_delta = first_api_time - ui_event.get("timestamp", 0)
-
-                correlation = UIToAPICorrelation(
-                    ui_event_id=ui_event.get("eventId", ""),
-                    ui_event_type=ui_event.get("action", "unknown"),
-                    ui_element_id=ui_event.get("elementId"),
-                    ui_screen=ui_event.get("screen", "unknown"),
-                    ui_timestamp=ui_event.get("timestamp", 0),
-                    api_calls=correlated_apis,
-                    strength=strength,
-                    methods=[CorrelationMethod.HYBRID],
-                    confidence_score=avg_confidence,
-                    time_delta_ms=time_delta,
-                )
+                    matches.append((api_event, methods, confidence))
 
+            correlation = self._build_ui_correlation(ui_event, matches)
+            if correlation:
                 correlations.append(correlation)
 
         return correlations
 
+    def _build_ui_correlation(
+        self, ui_event: Dict[str, Any], matches: List[Tuple[Dict[str, Any], List[CorrelationMethod], float]]
+    ) -> Optional[UIToAPICorrelation]:
+        """
+        Build the correlation of one UI event from its (api_event, methods, confidence) matches
+
+        Returns None when nothing matched.
+        """
+        correlated_apis = [
+            {
+                "eventId": api_event.get("eventId", ""),
+                "method": api_event.get("method", ""),
+                "endpoint": api_event.get("url", ""),
+                "statusCode": api_event.get("statusCode"),
+                "timestamp": api_event.get("timestamp", 0),
+                "duration": api_event.get("duration", 0),
+                "correlationMethods": [m.value for m in methods],
+                "confidence": confidence,
+            }
+            for api_event, methods, confidence in matches
+        ]
+
+        # Create correlation only if we found related APIs
+        if not correlated_apis:
+            return None
+
+        # Determine overall strength
+        confidences = [api["confidence"] for api in correlated_apis]
+        avg_confidence = sum(confidences) / len(confidences)
+
+        if avg_confidence >= 0.8:
+            strength = CorrelationStrength.STRONG
+        elif avg_confidence >= 0.5:
+            strength = CorrelationStrength.MEDIUM
+        else:
+            strength = CorrelationStrength.WEAK
+            # Keep avg_confidence as-is (don't overwrite to 0.0)
+            # This preserves the actual measured correlation strength
+
+        # Calculate time delta
+        first_api_time = min(api["timestamp"] for api in correlated_apis)
+        time_delta = first_api_time - ui_event.get("timestamp", 0)
+
+        return UIToAPICorrelation(
+            ui_event_id=ui_event.get("eventId", ""),
+            ui_event_type=ui_event.get("action", "unknown"),
+            ui_element_id=ui_event.get("elementId"),
+            ui_screen=ui_event.get("screen", "unknown"),
+            ui_timestamp=ui_event.get("timestamp", 0),
+            api_calls=correlated_apis,
+            strength=strength,
+            methods=[CorrelationMethod.HYBRID],
+            confidence_score=avg_confidence,
+            time_delta_ms=time_delta,
+        )
+
     def _correlate_api_to_navigation(
         self, api_events: List[Dict[str, Any]], nav_events: List[Dict[str, Any]]
     ) -> List[APIToNavigationCorrelation]:
@@ -293,52 +462,67 @@ class EventCorrelator:
         API responses often trigger navigation (e.g., success → next screen, error → stay).
         """
         correlations = []
+        index = CandidateIndex.for_window(nav_events, self.NAV_WINDOW_MS)
 
         for api_event in api_events:
             api_time = api_event.get("timestamp", 0)
 
             # Find navigation events that happen shortly after this API call
-            for nav_event in nav_events:
-                nav_time = nav_event.get("timestamp", 0)
-                time_delta = nav_time - api_time
+            for nav_index in index.candidates(api_event):
+                nav_event = nav_events[nav_index]
+                time_delta = nav_event.get("timestamp", 0) - api_time
 
                 # Navigation should happen after API response
-                if time_delta < 0 or time_delta > 3000:  # Within 3 seconds
+                if time_delta < 0 or time_delta > self.NAV_WINDOW_MS:  # Within 3 seconds
                     continue
 
                 # Check if they're on the same screen context
                 is_correlated, strength, methods, confidence = self.nav_strategy.correlate(api_event, nav_event)
 
                 if is_correlated:
-                    # Build condition based on status code
-                    status_code = api_event.get("statusCode", 0)
-                    condition = None
-                    if 200 <= status_code < 300:
-                        condition = "success"
-                    elif status_code >= 400:
-                        condition = "error"
-
-                    correlation = APIToNavigationCorrelation(
-                        api_event_id=api_event.get("eventId", ""),
-                        api_method=api_event.get("method", ""),
-                        api_endpoint=api_event.get("url", ""),
-                        api_status_code=status_code,
-                        api_timestamp=api_time,
-                        navigation_event_id=nav_event.get("eventId", ""),
-                        from_screen=nav_event.get("fromScreen", "unknown"),
-                        to_screen=nav_event.get("toScreen", "unknown"),
-                        navigation_timestamp=nav_time,
-                        strength=strength,
-                        methods=methods,
-                        confidence_score=confidence,
-                        time_delta_ms=time_delta,
-                        condition=condition,
+                    correlations.append(
+                        self._build_navigation_correlation(api_event, nav_event, strength, methods, confidence)
                     )
 
-                    correlations.append(correlation)
-
         return correlations
 
+    def _build_navigation_correlation(
+        self,
+        api_event: Dict[str, Any],
+        nav_event: Dict[str, Any],
+        strength: CorrelationStrength,
+        methods: List[CorrelationMethod],
+        confidence: float,
+    ) -> APIToNavigationCorrelation:
+        """Build the correlation between an API response and the navigation it triggered"""
+        api_time = api_event.get("timestamp", 0)
+        nav_time = nav_event.get("timestamp", 0)
+
+        # Build condition based on status code
+        status_code = api_event.get("statusCode", 0)
+        condition = None
+        if 200 <= status_code < 300:
+            condition = "success"
+        elif status_code >= 400:
+            condition = "error"
+
+        return APIToNavigationCorrelation(
+            api_event_id=api_event.get("eventId", ""),
+            api_method=api_event.get("method", ""),
+            api_endpoint=api_event.get("url", ""),
+            api_status_code=status_code,
+            api_timestamp=api_time,
+            navigation_event_id=nav_event.get("eventId", ""),
+            from_screen=nav_event.get("fromScreen", "unknown"),
+            to_screen=nav_event.get("toScreen", "unknown"),
+            navigation_timestamp=nav_time,
+            strength=strength,
+            methods=methods,
+            confidence_score=confidence,
+            time_delta_ms=nav_time - api_time,
+            condition=condition,
+        )
+
     def _build_full_flows(
         self, ui_to_api: List[UIToAPICorrelation], api_to_nav: List[APIToNavigationCorrelation]
     ) -> List[FullFlowCorrelation]:
@@ -349,6 +533,11 @@ class EventCorrelator:
         """
         flows = []
 
+        # Hash-join: index navigation correlations by API event once
+        navs_by_api: Dict[str, List[APIToNavigationCorrelation]] = {}
+        for nav_corr in api_to_nav:
+            navs_by_api.setdefault(nav_corr.api_event_id, []).append(nav_corr)
+
         for ui_corr in ui_to_api:
             if not ui_corr.api_calls:
                 continue
@@ -359,8 +548,7 @@ class EventCorrelator:
                 api_id = api_call.get("eventId", "")
 
                 # Find navigation correlations for this API call
-                navs = [nav_corr for nav_corr in api_to_nav if nav_corr.api_event_id == api_id]
-                related_navs.extend(navs)
+                related_navs.extend(navs_by_api.get(api_id, ()))
 
             if related_navs:
                 # Determine overall strength
@@ -433,3 +621,32 @@ class EventCorrelator:
 
         # Fallback
         return {}
+
+
+# Correlator of the current worker process (see correlate_all_sessions)
+_worker_correlator: Optional[EventCorrelator] = None
+
+
+def _create_session_worker(
+    db_path: str, ui_strategy: Any, nav_strategy: Any, use_rust: bool, use_numpy: bool
+) -> EventCorrelator:
+    """Correlator with its own read-only store, configured like the parent's"""
+    correlator = EventCorrelator(EventStore(db_path, read_only=True), force_python=not (use_rust or use_numpy))
+    correlator.use_rust = correlator.use_rust and use_rust
+    correlator.use_numpy = correlator.use_numpy and use_numpy
+    correlator.ui_strategy = ui_strategy
+    correlator.nav_strategy = nav_strategy
+    return correlator
+
+
+def _init_session_worker(*worker_args: Any):
+    """ProcessPoolExecutor initializer: one correlator and store per worker process"""
+    global _worker_correlator
+    _worker_correlator = _create_session_worker(*worker_args)
+
+
+def _correlate_session_in_worker(session_id: str) -> SessionCorrelationOutcome:
+    """Correlate a session in a worker process"""
+    if _worker_correlator is None:
+        raise RuntimeError("Session worker not initialized")
+    return _worker_correlator._correlate_session_timed(session_id)
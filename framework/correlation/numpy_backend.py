@@ -0,0 +1,334 @@
+"""
+NumPy Correlation Backend
+
+Vectorized middle tier between the Rust core and the pure-Python engine.
+Timestamps, correlation IDs, thread IDs and screens are turned into arrays
+and every strategy is evaluated with broadcasting over blocks of events,
+restricted to the columns that fall inside the block's time window or share
+one of its keys.
+
+Only the built-in strategies are supported; the results are identical to
+the Python engine (same matches, order and confidence values).
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from framework.correlation.candidate_index import STRATEGY_KEY_FUNCTIONS
+from framework.correlation.strategies import (
+    CorrelationIDStrategy,
+    CorrelationStrategy,
+    HybridCorrelationStrategy,
+    ScreenContextStrategy,
+    TemporalProximityStrategy,
+    ThreadCorrelationStrategy,
+)
+from framework.correlation.types import CorrelationMethod, CorrelationStrength
+
+# What each key-matching strategy returns on a match: (strength, method, confidence)
+KEY_MATCH_RESULTS = {
+    CorrelationIDStrategy: (CorrelationStrength.STRONG, CorrelationMethod.CORRELATION_ID, 1.0),
+    ThreadCorrelationStrategy: (CorrelationStrength.MEDIUM, CorrelationMethod.THREAD, 0.7),
+    ScreenContextStrategy: (CorrelationStrength.WEAK, CorrelationMethod.CAUSALITY, 0.4),
+}
+
+# TemporalProximityStrategy thresholds (ms)
+TEMPORAL_MEDIUM_BELOW_MS = 500
+TEMPORAL_DISTANT_FROM_MS = 2000
+
+UIMatch = Tuple[int, List[CorrelationMethod], float]
+NavigationMatch = Tuple[int, CorrelationStrength, List[CorrelationMethod], float]
+
+
+class _StrategyPart:
+    """One strategy of a hybrid, reduced to what the vectorized code needs"""
+
+    def __init__(
+        self,
+        max_time_delta_ms: Optional[float] = None,
+        key_fn: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        strength: CorrelationStrength = CorrelationStrength.NONE,
+        method: CorrelationMethod = CorrelationMethod.TEMPORAL,
+        confidence: float = 0.0,
+    ):
+        self.max_time_delta_ms = max_time_delta_ms
+        self.key_fn = key_fn
+        self.strength = strength
+        self.method = method
+        self.confidence = confidence
+
+    @property
+    def is_temporal(self) -> bool:
+        return self.max_time_delta_ms is not None
+
+
+class NumpyCorrelationBackend:
+    """
+    Vectorized UI→API and API→Navigation matching
+
+    Use create() to obtain an instance; it returns None when NumPy is missing
+    or a strategy cannot be vectorized, in which case callers use the Python
+    engine.
+    """
+
+    # UI (or API) events evaluated together in one block; taller blocks widen
+    # the shared time window, so candidate columns grow with the row count
+    BLOCK_ROWS = 64
+
+    # Upper bound of pairwise cells per broadcast, bounding temporary memory
+    MAX_BLOCK_CELLS = 1 << 21
+
+    # Widens block time windows so float rounding can never drop a boundary match
+    WINDOW_SLACK_MS = 1
+
+    def __init__(self, ui_parts: List[_StrategyPart], nav_max_delta_ms: float, nav_window_ms: float):
+        self.ui_parts = ui_parts
+        self.nav_max_delta_ms = nav_max_delta_ms
+        self.nav_window_ms = nav_window_ms
+
+    @classmethod
+    def create(
+        cls, ui_strategy: CorrelationStrategy, nav_strategy: CorrelationStrategy, nav_window_ms: float
+    ) -> Optional["NumpyCorrelationBackend"]:
+        """Build a backend for these strategies, or None if they cannot be vectorized"""
+        if not NUMPY_AVAILABLE:
+            return None
+
+        ui_parts = cls._decompose(ui_strategy)
+        if ui_parts is None:
+            return None
+
+        # Exact type checks: subclasses may override correlate() with other rules
+        if type(nav_strategy) is not TemporalProximityStrategy or nav_strategy.max_time_delta_ms <= 0:
+            return None
+
+        return cls(ui_parts, nav_strategy.max_time_delta_ms, nav_window_ms)
+
+    @staticmethod
+    def _decompose(strategy: CorrelationStrategy) -> Optional[List[_StrategyPart]]:
+        """Split a hybrid strategy into vectorizable parts, or None if unsupported"""
+        # Only hybrids are vectorized: a bare strategy is not averaged or boosted
+        if type(strategy) is not HybridCorrelationStrategy:
+            return None
+
+        parts = []
+        for part in strategy.strategies:
+            if type(part) is TemporalProximityStrategy and part.max_time_delta_ms > 0:
+                parts.append(_StrategyPart(max_time_delta_ms=part.max_time_delta_ms, method=CorrelationMethod.TEMPORAL))
+            elif type(part) in KEY_MATCH_RESULTS:
+                strength, method, confidence = KEY_MATCH_RESULTS[type(part)]
+                parts.append(
+                    _StrategyPart(
+                        key_fn=STRATEGY_KEY_FUNCTIONS[type(part)],
+                        strength=strength,
+                        method=method,
+                        confidence=confidence,
+                    )
+                )
+            else:
+                return None
+
+        return parts
+
+    @staticmethod
+    def _timestamps(events: List[Dict[str, Any]]) -> "np.ndarray":
+        """Timestamps as float64; raises TypeError where Python arithmetic would"""
+        times = [event.get("timestamp", 0) for event in events]
+        for t in times:
+            if type(t) not in (int, float):
+                raise TypeError(f"Unsupported timestamp {t!r}")
+        return np.array(times, dtype=np.float64)
+
+    @staticmethod
+    def _encode_keys(
+        key_fn: Callable[[Dict[str, Any]], Any], sources: List[Dict[str, Any]], targets: List[Dict[str, Any]]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Integer codes for a key on both sides; 0 marks a missing key"""
+        codes: Dict[Any, int] = {}
+
+        def encode(events: List[Dict[str, Any]]) -> "np.ndarray":
+            values = []
+            for event in events:
+                key = key_fn(event)
+                values.append(codes.setdefault(key, len(codes) + 1) if key else 0)
+            return np.array(values, dtype=np.int64)
+
+        return encode(sources), encode(targets)
+
+    @staticmethod
+    def _temporal_confidence(delta: "np.ndarray", max_delta: float) -> "np.ndarray":
+        """TemporalProximityStrategy confidence for in-window deltas"""
+        confidence = 1.0 - delta / max_delta
+        return np.where(delta >= TEMPORAL_DISTANT_FROM_MS, confidence * 0.5, confidence)
+
+    def _window_columns(
+        self, block_times: "np.ndarray", sorted_times: "np.ndarray", order: "np.ndarray", max_delta: float
+    ) -> "np.ndarray":
+        """Target indices whose timestamp can fall in any row's window"""
+        slack = self.WINDOW_SLACK_MS
+        lo = np.searchsorted(sorted_times, block_times.min() - slack, side="left")
+        hi = np.searchsorted(sorted_times, block_times.max() + max_delta + slack, side="right")
+        return order[lo:hi]
+
+    def match_ui_to_api(self, ui_events: List[Dict[str, Any]], api_events: List[Dict[str, Any]]) -> List[List[UIMatch]]:
+        """
+        Correlated API calls of every UI event
+
+        Returns:
+            One list per UI event of (api_index, methods, confidence), in API order
+        """
+        results: List[List[UIMatch]] = [[] for _ in ui_events]
+        if not ui_events or not api_events:
+            return results
+
+        ui_times = self._timestamps(ui_events)
+        api_times = self._timestamps(api_events)
+        api_order = np.argsort(api_times, kind="stable")
+        api_sorted_times = api_times[api_order]
+
+        key_codes = [
+            self._encode_keys(part.key_fn, ui_events, api_events) if part.key_fn else None for part in self.ui_parts
+        ]
+        max_window = max((p.max_time_delta_ms for p in self.ui_parts if p.is_temporal), default=None)
+
+        methods_by_bits: Dict[int, List[CorrelationMethod]] = {}
+        ui_order = np.argsort(ui_times, kind="stable")
+
+        for start in range(0, len(ui_events), self.BLOCK_ROWS):
+            rows = ui_order[start : start + self.BLOCK_ROWS]
+
+            # Candidate API columns: inside the block's time window or sharing a key
+            pieces = []
+            if max_window is not None:
+                pieces.append(self._window_columns(ui_times[rows], api_sorted_times, api_order, max_window))
+            for codes in key_codes:
+                if codes is None:
+                    continue
+                ui_codes, api_codes = codes
+                block_codes = ui_codes[rows]
+                block_codes = block_codes[block_codes != 0]
+                if block_codes.size:
+                    pieces.append(np.flatnonzero(np.isin(api_codes, block_codes)))
+
+            if not pieces:
+                continue
+            cols = np.unique(np.concatenate(pieces))
+            if not cols.size:
+                continue
+
+            step = max(1, self.MAX_BLOCK_CELLS // cols.size)
+            for offset in range(0, len(rows), step):
+                self._evaluate_ui_block(
+                    rows[offset : offset + step], cols, ui_times, api_times, key_codes, methods_by_bits, results
+                )
+
+        return results
+
+    def _evaluate_ui_block(
+        self,
+        rows: "np.ndarray",
+        cols: "np.ndarray",
+        ui_times: "np.ndarray",
+        api_times: "np.ndarray",
+        key_codes: List[Optional[Tuple["np.ndarray", "np.ndarray"]]],
+        methods_by_bits: Dict[int, List[CorrelationMethod]],
+        results: List[List[UIMatch]],
+    ):
+        """Mirror HybridCorrelationStrategy.correlate over a rows × cols block"""
+        shape = (len(rows), len(cols))
+        matched_count = np.zeros(shape, dtype=np.int64)
+        total = np.zeros(shape, dtype=np.float64)
+        has_strong = np.zeros(shape, dtype=bool)
+        bits = np.zeros(shape, dtype=np.int64)
+
+        delta = None
+        for bit, (part, codes) in enumerate(zip(self.ui_parts, key_codes)):
+            if part.is_temporal:
+                if delta is None:
+                    delta = api_times[cols][None, :] - ui_times[rows][:, None]
+                mask = (delta >= 0) & (delta <= part.max_time_delta_ms)
+                confidence = self._temporal_confidence(delta, part.max_time_delta_ms)
+            else:
+                ui_codes, api_codes = codes
+                row_codes = ui_codes[rows][:, None]
+                mask = (row_codes == api_codes[cols][None, :]) & (row_codes != 0)
+                confidence = part.confidence
+                if part.strength == CorrelationStrength.STRONG:
+                    has_strong |= mask
+
+            # Summed in strategy order, like the Python loop (adding 0.0 is exact)
+            total = total + np.where(mask, confidence, 0.0)
+            matched_count += mask
+            bits |= mask.astype(np.int64) << bit
+
+        correlated = matched_count > 0
+        average = total / np.maximum(matched_count, 1)
+        boosted = np.minimum(0.9, average * 1.2)
+        confidence = np.minimum(1.0, np.where(~has_strong & (matched_count >= 2), boosted, average))
+
+        # Row-major nonzero keeps each UI event's matches in API order
+        hit_rows, hit_cols = np.nonzero(correlated)
+        for ui_index, api_index, pattern, value in zip(
+            rows[hit_rows].tolist(),
+            cols[hit_cols].tolist(),
+            bits[hit_rows, hit_cols].tolist(),
+            confidence[hit_rows, hit_cols].tolist(),
+        ):
+            methods = methods_by_bits.get(pattern)
+            if methods is None:
+                methods = [p.method for b, p in enumerate(self.ui_parts) if pattern >> b & 1]
+                methods_by_bits[pattern] = methods
+            results[ui_index].append((api_index, methods, value))
+
+    def match_api_to_navigation(
+        self, api_events: List[Dict[str, Any]], nav_events: List[Dict[str, Any]]
+    ) -> List[List[NavigationMatch]]:
+        """
+        Navigation events triggered by every API call
+
+        Returns:
+            One list per API event of (nav_index, strength, methods, confidence), in navigation order
+        """
+        results: List[List[NavigationMatch]] = [[] for _ in api_events]
+        if not api_events or not nav_events:
+            return results
+
+        api_times = self._timestamps(api_events)
+        nav_times = self._timestamps(nav_events)
+        nav_order = np.argsort(nav_times, kind="stable")
+        nav_sorted_times = nav_times[nav_order]
+        window = min(self.nav_window_ms, self.nav_max_delta_ms)
+
+        api_order = np.argsort(api_times, kind="stable")
+        for start in range(0, len(api_events), self.BLOCK_ROWS):
+            rows = api_order[start : start + self.BLOCK_ROWS]
+            cols = np.sort(self._window_columns(api_times[rows], nav_sorted_times, nav_order, window))
+            if not cols.size:
+                continue
+
+            step = max(1, self.MAX_BLOCK_CELLS // cols.size)
+            for offset in range(0, len(rows), step):
+                sub = rows[offset : offset + step]
+                delta = nav_times[cols][None, :] - api_times[sub][:, None]
+                mask = (delta >= 0) & (delta <= window)
+                confidence = self._temporal_confidence(delta, self.nav_max_delta_ms)
+                medium = delta < TEMPORAL_MEDIUM_BELOW_MS
+
+                hit_rows, hit_cols = np.nonzero(mask)
+                for api_index, nav_index, is_medium, value in zip(
+                    sub[hit_rows].tolist(),
+                    cols[hit_cols].tolist(),
+                    medium[hit_rows, hit_cols].tolist(),
+                    confidence[hit_rows, hit_cols].tolist(),
+                ):
+                    strength = CorrelationStrength.MEDIUM if is_medium else CorrelationStrength.WEAK
+                    results[api_index].append((nav_index, strength, [CorrelationMethod.TEMPORAL], value))
+
+        return results
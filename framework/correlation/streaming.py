@@ -0,0 +1,354 @@
+"""
+Streaming Correlator
+
+Online counterpart of EventCorrelator for live recording sessions. Events
+are fed one at a time; correlations are emitted as soon as no future event
+can change them, and events are dropped once nothing can correlate with
+them any more, so memory is bounded by the correlation window instead of
+the session length.
+
+Correlations are built with the same strategies and builders as the batch
+correlator. The difference: an API call is only considered for a UI event
+within ``horizon_ms`` of it, also for correlation-ID, thread and screen
+matches that the batch correlator would find arbitrarily far apart.
+"""
+
+import heapq
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+from framework.correlation.correlator import EventCorrelator
+from framework.correlation.strategies import CorrelationStrategy, HybridCorrelationStrategy, TemporalProximityStrategy
+from framework.correlation.types import APIToNavigationCorrelation, FullFlowCorrelation, UIToAPICorrelation
+
+StreamedCorrelation = Union[UIToAPICorrelation, APIToNavigationCorrelation, FullFlowCorrelation]
+
+# Event kinds accepted by StreamingCorrelator.add_event
+UI_EVENT = "ui"
+API_EVENT = "api"
+NAVIGATION_EVENT = "navigation"
+
+
+def classify_event(event: Dict[str, Any]) -> Optional[str]:
+    """
+    Kind of a raw recorded event (UI_EVENT, API_EVENT, NAVIGATION_EVENT), or None
+
+    Follows EventStore's detection rules and also accepts the
+    UIEvent/NetworkEvent/NavigationEvent ``eventType`` names.
+    """
+    if "actionType" in event:
+        return UI_EVENT
+    if "navType" in event or "toScreen" in event:
+        return NAVIGATION_EVENT
+    if "method" in event and "url" in event:
+        return API_EVENT
+
+    return {
+        "UIEvent": UI_EVENT,
+        "ui": UI_EVENT,
+        "NetworkEvent": API_EVENT,
+        "network": API_EVENT,
+        "NavigationEvent": NAVIGATION_EVENT,
+        "navigation": NAVIGATION_EVENT,
+    }.get(event.get("eventType"))
+
+
+def temporal_window_of(strategy: CorrelationStrategy) -> Optional[float]:
+    """Largest temporal window used by a strategy (or a hybrid of strategies), if any"""
+    if isinstance(strategy, HybridCorrelationStrategy):
+        windows = [temporal_window_of(part) for part in strategy.strategies]
+        return max((w for w in windows if w is not None), default=None)
+    if isinstance(strategy, TemporalProximityStrategy):
+        return strategy.max_time_delta_ms
+    return None
+
+
+class StreamingCorrelator:
+    """
+    Incremental UI → API → Navigation correlation
+
+    Time advances with the largest timestamp seen (the watermark). Events
+    are assumed to arrive in timestamp order, give or take
+    ``allowed_lateness_ms``; events older than that are still correlated but
+    may miss partners already dropped (they are counted in ``late_events``).
+
+    Windows close when the watermark (minus the allowed lateness) passes:
+    - API call + NAV_WINDOW_MS: its API→Navigation correlations are emitted
+    - UI event + horizon: its UI→API correlation is emitted
+    - last correlated API call + NAV_WINDOW_MS: the full flow is emitted
+
+    Usage:
+        streaming = StreamingCorrelator()
+        for event in live_events:
+            for correlation in streaming.add_event(event):
+                publish(correlation)
+        remaining = streaming.flush()
+    """
+
+    def __init__(
+        self,
+        correlator: Optional[EventCorrelator] = None,
+        horizon_ms: Optional[float] = None,
+        allowed_lateness_ms: float = 0,
+    ):
+        """
+        Args:
+            correlator: Batch correlator providing strategies and builders
+                (default: a pure-Python EventCorrelator)
+            horizon_ms: Max distance between correlated UI and API events
+                (default: the UI strategy's temporal window)
+            allowed_lateness_ms: How far out of order events may arrive
+        """
+        self.correlator = correlator or EventCorrelator(force_python=True)
+        self.nav_window_ms = self.correlator.NAV_WINDOW_MS
+
+        if horizon_ms is None:
+            horizon_ms = temporal_window_of(self.correlator.ui_strategy)
+            if horizon_ms is None:
+                raise ValueError("horizon_ms is required for UI strategies without a temporal window")
+        self.horizon_ms = horizon_ms
+        self.allowed_lateness_ms = allowed_lateness_ms
+
+        self.watermark: Optional[float] = None
+        self._seq = 0
+
+        # Buffered events in arrival order: (timestamp, seq, event)
+        self._apis: Deque[Tuple[float, int, Dict[str, Any]]] = deque()
+        self._navs: Deque[Tuple[float, int, Dict[str, Any]]] = deque()
+
+        # Open windows as (closes_after, seq, payload) heaps
+        self._open_ui: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._open_api: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._open_flows: List[Tuple[float, int, UIToAPICorrelation]] = []
+
+        # API→Navigation correlations kept until every flow that may need them is out
+        self._navs_by_api: Dict[str, List[APIToNavigationCorrelation]] = {}
+        self._nav_expiry: List[Tuple[float, int, str]] = []
+
+        self.events_received = 0
+        self.late_events = 0
+        self.emitted = {"ui_to_api": 0, "api_to_navigation": 0, "full_flows": 0}
+
+    @property
+    def buffered_events(self) -> int:
+        """Events currently held in memory"""
+        return len(self._apis) + len(self._navs) + len(self._open_ui)
+
+    def add_event(self, event: Dict[str, Any], kind: Optional[str] = None) -> List[StreamedCorrelation]:
+        """
+        Add one event and return the correlations whose windows it closed
+
+        Args:
+            event: Raw event dict
+            kind: UI_EVENT, API_EVENT or NAVIGATION_EVENT (default: classify_event)
+        """
+        kind = kind or classify_event(event)
+        if kind not in (UI_EVENT, API_EVENT, NAVIGATION_EVENT):
+            return []
+
+        timestamp = event.get("timestamp", 0)
+        self.events_received += 1
+        if self.watermark is not None and timestamp < self.watermark - self.allowed_lateness_ms:
+            self.late_events += 1
+
+        seq = self._next_seq()
+        if kind == UI_EVENT:
+            heapq.heappush(self._open_ui, (timestamp + self.horizon_ms, seq, event))
+        elif kind == API_EVENT:
+            self._apis.append((timestamp, seq, event))
+            heapq.heappush(self._open_api, (timestamp + self.nav_window_ms, seq, event))
+        else:
+            self._navs.append((timestamp, seq, event))
+
+        if self.watermark is None or timestamp > self.watermark:
+            self.watermark = timestamp
+
+        return self._close_windows(self.watermark - self.allowed_lateness_ms)
+
+    def add_ui_event(self, event: Dict[str, Any]) -> List[StreamedCorrelation]:
+        return self.add_event(event, UI_EVENT)
+
+    def add_api_event(self, event: Dict[str, Any]) -> List[StreamedCorrelation]:
+        return self.add_event(event, API_EVENT)
+
+    def add_navigation_event(self, event: Dict[str, Any]) -> List[StreamedCorrelation]:
+        return self.add_event(event, NAVIGATION_EVENT)
+
+    def advance_to(self, timestamp: float) -> List[StreamedCorrelation]:
+        """
+        Move the watermark forward without an event (e.g. from the wall clock
+        while the app is idle) and return the correlations that closed
+        """
+        if self.watermark is None or timestamp > self.watermark:
+            self.watermark = timestamp
+        return self._close_windows(self.watermark - self.allowed_lateness_ms)
+
+    def flush(self) -> List[StreamedCorrelation]:
+        """Close every open window (end of session) and clear the buffers"""
+        emitted = self._close_windows(float("inf"))
+        self._apis.clear()
+        self._navs.clear()
+        self._navs_by_api.clear()
+        self._nav_expiry.clear()
+        return emitted
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def _close_windows(self, closed_until: float) -> List[StreamedCorrelation]:
+        """Emit correlations whose windows end before closed_until, then drop expired events"""
+        emitted: List[StreamedCorrelation] = []
+
+        # Navigation correlations first: flows closing now depend on them
+        while self._open_api and self._open_api[0][0] < closed_until:
+            _, _, api_event = heapq.heappop(self._open_api)
+            emitted.extend(self._close_api(api_event))
+
+        while self._open_ui and self._open_ui[0][0] < closed_until:
+            _, _, ui_event = heapq.heappop(self._open_ui)
+            ui_correlation = self._close_ui(ui_event)
+            if ui_correlation:
+                emitted.append(ui_correlation)
+                last_api_time = max(api["timestamp"] for api in ui_correlation.api_calls)
+                heapq.heappush(self._open_flows, (last_api_time + self.nav_window_ms, self._next_seq(), ui_correlation))
+
+        while self._open_flows and self._open_flows[0][0] < closed_until:
+            _, _, ui_correlation = heapq.heappop(self._open_flows)
+            emitted.append(self._close_flow(ui_correlation))
+
+        self._drop_expired(closed_until)
+        return emitted
+
+    def _close_api(self, api_event: Dict[str, Any]) -> List[APIToNavigationCorrelation]:
+        """API→Navigation correlations of an API call whose navigation window closed"""
+        correlator = self.correlator
+        api_time = api_event.get("timestamp", 0)
+        correlations = []
+
+        for nav_time, _, nav_event in self._navs:
+            time_delta = nav_time - api_time
+            if time_delta < 0 or time_delta > self.nav_window_ms:
+                continue
+
+            is_correlated, strength, methods, confidence = correlator.nav_strategy.correlate(api_event, nav_event)
+            if is_correlated:
+                correlations.append(
+                    correlator._build_navigation_correlation(api_event, nav_event, strength, methods, confidence)
+                )
+
+        if correlations:
+            api_id = api_event.get("eventId", "")
+            self._navs_by_api.setdefault(api_id, []).extend(correlations)
+            # Flows of UI events up to one horizon later close within another horizon
+            expires = api_time + 2 * self.horizon_ms + self.nav_window_ms
+            heapq.heappush(self._nav_expiry, (expires, self._next_seq(), api_id))
+            self.emitted["api_to_navigation"] += len(correlations)
+
+        return correlations
+
+    def _close_ui(self, ui_event: Dict[str, Any]) -> Optional[UIToAPICorrelation]:
+        """UI→API correlation of a UI event whose horizon closed"""
+        ui_strategy = self.correlator.ui_strategy
+        ui_time = ui_event.get("timestamp", 0)
+        matches = []
+
+        for api_time, _, api_event in self._apis:
+            if abs(api_time - ui_time) > self.horizon_ms:
+                continue
+
+            is_correlated, _, methods, confidence = ui_strategy.correlate(ui_event, api_event)
+            if is_correlated:
+                matches.append((api_event, methods, confidence))
+
+        correlation = self.correlator._build_ui_correlation(ui_event, matches)
+        if correlation:
+            self.emitted["ui_to_api"] += 1
+        return correlation
+
+    def _close_flow(self, ui_correlation: UIToAPICorrelation) -> FullFlowCorrelation:
+        """Full flow of a UI correlation once all of its API calls' navigation windows closed"""
+        api_ids = dict.fromkeys(api.get("eventId", "") for api in ui_correlation.api_calls)
+        api_to_nav = [nav for api_id in api_ids for nav in self._navs_by_api.get(api_id, ())]
+
+        self.emitted["full_flows"] += 1
+        return self.correlator._build_full_flows([ui_correlation], api_to_nav)[0]
+
+    def _drop_expired(self, closed_until: float):
+        """Drop events and navigation correlations no open window can use any more"""
+        # An API call is matched by UI events up to one horizon later, whose
+        # windows close one horizon after that
+        while self._apis and self._apis[0][0] + 2 * self.horizon_ms < closed_until:
+            self._apis.popleft()
+
+        # A navigation is matched by API calls up to NAV_WINDOW_MS earlier
+        while self._navs and self._navs[0][0] + self.nav_window_ms < closed_until:
+            self._navs.popleft()
+
+        while self._nav_expiry and self._nav_expiry[0][0] < closed_until:
+            _, _, api_id = heapq.heappop(self._nav_expiry)
+            self._navs_by_api.pop(api_id, None)
+
+
+def follow_session(
+    event_store: Any,
+    session_id: str,
+    streaming: Optional[StreamingCorrelator] = None,
+    poll_interval: float = 0.5,
+    idle_timeout: Optional[float] = None,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[StreamedCorrelation]:
+    """
+    Correlate a session while it is being recorded into an EventStore
+
+    Polls the store for events written since the last poll and feeds their
+    recorded payloads, classified with classify_event, to the streaming
+    correlator in arrival order, yielding correlations as their
+    windows close. While no events arrive, the watermark follows the wall
+    clock so that the last interactions are still emitted during pauses.
+    Remaining windows are flushed when the stream ends.
+
+    Args:
+        event_store: EventStore the recording writes to
+        session_id: Session to follow
+        streaming: Correlator to feed (default: a new StreamingCorrelator)
+        poll_interval: Seconds between polls when no new events arrived
+        idle_timeout: Stop after this many seconds without new events (None: until stop is set)
+        stop: Set to end the stream
+    """
+    streaming = streaming or StreamingCorrelator()
+    last_id = 0
+    idle_since = time.monotonic()
+    idle_watermark = streaming.watermark
+
+    while stop is None or not stop.is_set():
+        received = False
+        for row in event_store.iter_events_since(last_id, session_id=session_id):
+            last_id = row["id"]
+            # Correlate the recorded payload; the row's event_type covers payloads without telltale fields
+            event = row["data"]
+            kind = classify_event(event) or classify_event({"eventType": row["event_type"]})
+            if kind is None:
+                continue
+            received = True
+            yield from streaming.add_event(event, kind)
+
+        now = time.monotonic()
+        if received:
+            idle_since, idle_watermark = now, streaming.watermark
+            continue
+
+        if idle_timeout is not None and now - idle_since >= idle_timeout:
+            break
+        if idle_watermark is not None:
+            # Event timestamps are in milliseconds
+            yield from streaming.advance_to(idle_watermark + (now - idle_since) * 1000)
+
+        if stop is not None:
+            stop.wait(poll_interval)
+        else:
+            time.sleep(poll_interval)
+
+    yield from streaming.flush()
@@ -132,3 +132,57 @@ class CorrelationResult(BaseModel):
     correlation_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Overall correlation success rate")
 
     statistics: Dict[str, Any] = Field(default_factory=dict, description="Additional statistics")
+
+
+class SessionCorrelationOutcome(BaseModel):
+    """
+    Outcome of correlating one session in a multi-session run
+    """
+
+    session_id: str = Field(description="Session ID")
+    result: Optional[CorrelationResult] = Field(default=None, description="Correlation result (None on failure)")
+    elapsed_ms: float = Field(ge=0.0, description="Time spent loading and correlating the session (ms)")
+    worker_pid: int = Field(description="Process that correlated the session")
+    error: Optional[str] = Field(default=None, description="Error message if correlation failed")
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class MultiSessionSummary(BaseModel):
+    """
+    Timing summary of a multi-session correlation run
+    """
+
+    total_sessions: int = Field(default=0)
+    succeeded: int = Field(default=0)
+    failed: int = Field(default=0)
+
+    wall_time_ms: float = Field(default=0.0, description="Elapsed time of the whole run (ms)")
+    total_session_ms: float = Field(default=0.0, description="Sum of per-session times (ms)")
+    mean_session_ms: float = Field(default=0.0)
+    max_session_ms: float = Field(default=0.0)
+    parallel_speedup: float = Field(default=0.0, description="total_session_ms / wall_time_ms")
+
+    session_timings: Dict[str, float] = Field(default_factory=dict, description="Per-session time (ms)")
+    failures: Dict[str, str] = Field(default_factory=dict, description="Error message per failed session")
+
+    @classmethod
+    def from_outcomes(cls, outcomes: List[SessionCorrelationOutcome], wall_time_ms: float) -> "MultiSessionSummary":
+        """Summarize the outcomes of a run that took wall_time_ms"""
+        timings = {o.session_id: o.elapsed_ms for o in outcomes}
+        total = sum(timings.values())
+
+        return cls(
+            total_sessions=len(outcomes),
+            succeeded=sum(1 for o in outcomes if o.succeeded),
+            failed=sum(1 for o in outcomes if not o.succeeded),
+            wall_time_ms=wall_time_ms,
+            total_session_ms=total,
+            mean_session_ms=total / len(outcomes) if outcomes else 0.0,
+            max_session_ms=max(timings.values(), default=0.0),
+            parallel_speedup=total / wall_time_ms if wall_time_ms > 0 else 0.0,
+            session_timings=timings,
+            failures={o.session_id: o.error for o in outcomes if o.error is not None},
+        )
@@ -27,7 +27,9 @@ from .device_layer import (
     Screenshot,
     LogEntry,
     APITrace,
+    capabilities_from_inventory,
 )
+from .device_inventory import DeviceInventory, InventoryChange, InventorySnapshot, get_inventory
 
 __all__ = [
     # Legacy (optional for backward compatibility)
@@ -47,4 +49,10 @@ __all__ = [
     "Screenshot",
     "LogEntry",
     "APITrace",
+    "capabilities_from_inventory",
+    # Shared device inventory
+    "DeviceInventory",
+    "InventoryChange",
+    "InventorySnapshot",
+    "get_inventory",
 ]
@@ -0,0 +1,422 @@
+"""
+Shared device inventory
+
+Discovers Android devices (adb) and iOS simulators (simctl) and keeps the
+result as an immutable snapshot, so consumers that ask for devices in a
+loop read it without starting any subprocess. The snapshot is refreshed
+once it is older than a TTL or, after start(), in the background: Android
+changes are applied as `adb track-devices` reports them and iOS simulators
+are polled every TTL.
+"""
+
+import json
+import logging
+import re
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INVENTORY_TTL = 5.0
+
+MAX_PROBE_WORKERS = 16
+
+# Read with a single `adb shell` per device, one value per line
+ANDROID_PROPERTIES = ("ro.product.model", "ro.build.version.sdk", "ro.build.version.release")
+
+AVAILABLE_STATUSES = ("online", "booted")
+
+PLATFORMS = ("android", "ios")
+
+DeviceEntry = Dict[str, Any]
+
+# simctl runtime keys look like "com.apple.CoreSimulator.SimRuntime.iOS-17-0" (or "iOS 16.0" on old Xcodes)
+_IOS_RUNTIME = re.compile(r"iOS[- ](\d+(?:[-.]\d+)*)")
+
+
+@dataclass(frozen=True)
+class InventorySnapshot:
+    """Devices known at one point in time, with lookups precomputed"""
+
+    devices: Tuple[DeviceEntry, ...] = ()
+    taken_at: Optional[float] = None
+    by_id: Dict[str, DeviceEntry] = field(default_factory=dict)
+    # "all", "android" and "ios" -> devices, and the available ones among them
+    by_platform: Dict[str, Tuple[DeviceEntry, ...]] = field(default_factory=dict)
+    available_by_platform: Dict[str, Tuple[DeviceEntry, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, devices: Iterable[DeviceEntry], taken_at: float) -> "InventorySnapshot":
+        devices = tuple(devices)
+        by_platform = {"all": devices}
+        for platform in PLATFORMS:
+            by_platform[platform] = tuple(d for d in devices if d["platform"] == platform)
+        available = {
+            platform: tuple(d for d in selected if d["status"] in AVAILABLE_STATUSES)
+            for platform, selected in by_platform.items()
+        }
+        return cls(
+            devices=devices,
+            taken_at=taken_at,
+            by_id={d["id"]: d for d in devices},
+            by_platform=by_platform,
+            available_by_platform=available,
+        )
+
+
+@dataclass(frozen=True)
+class InventoryChange:
+    """Difference between two consecutive snapshots, passed to subscribers"""
+
+    added: Tuple[DeviceEntry, ...] = ()
+    removed: Tuple[DeviceEntry, ...] = ()
+    # New entries of devices whose status or properties changed
+    changed: Tuple[DeviceEntry, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class DeviceInventory:
+    """
+    Cached device list shared by the device consumers
+
+    Reads return the current snapshot in O(1). Without background tracking
+    a read of a snapshot older than ttl refreshes it; while one thread
+    refreshes, the others keep reading the previous snapshot. Device
+    properties are probed once per connection, concurrently, so a refresh
+    costs one `adb devices` plus one `adb shell` per newly seen device.
+
+    Usage:
+        inventory = get_inventory()
+        inventory.subscribe(lambda change: print(change.added, change.removed))
+        inventory.start()  # Follow adb track-devices in the background
+        devices = inventory.available_devices("android")
+    """
+
+    def __init__(self, ttl: float = DEFAULT_INVENTORY_TTL, probe_workers: int = MAX_PROBE_WORKERS):
+        """
+        Args:
+            ttl: Seconds a snapshot is served before it is refreshed (and the
+                iOS polling interval when tracking in the background)
+            probe_workers: Max concurrent per-device property probes
+        """
+        self.ttl = ttl
+        self.probe_workers = probe_workers
+        self.refreshes = 0
+
+        self._snapshot = InventorySnapshot()
+        # Serializes discovery and notification, guards _properties; reentrant so listeners can read the inventory
+        self._refresh_lock = threading.RLock()
+        self._properties: Dict[str, Dict[str, str]] = {}
+        self._listeners: List[Callable[[InventoryChange], None]] = []
+
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._tracker: Optional[subprocess.Popen] = None
+        self._tracking = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    @property
+    def running(self) -> bool:
+        """Whether the snapshot is kept up to date in the background"""
+        return bool(self._threads)
+
+    def snapshot(self) -> InventorySnapshot:
+        """Current snapshot, refreshed first if it is stale"""
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            return snapshot
+
+        # Only the first read has nothing to serve while another thread refreshes
+        if not self._refresh_lock.acquire(blocking=snapshot.taken_at is None):
+            return snapshot
+        try:
+            if self._is_fresh(self._snapshot):
+                return self._snapshot
+            return self._refresh(PLATFORMS)
+        finally:
+            self._refresh_lock.release()
+
+    def devices(self, platform: str = "all") -> Tuple[DeviceEntry, ...]:
+        """All known devices of a platform ("all", "android" or "ios")"""
+        return self.snapshot().by_platform.get(platform, ())
+
+    def available_devices(self, platform: str = "all") -> Tuple[DeviceEntry, ...]:
+        """Online Android devices and booted simulators of a platform"""
+        return self.snapshot().available_by_platform.get(platform, ())
+
+    def get(self, device_id: str) -> Optional[DeviceEntry]:
+        """Device by ID, or None"""
+        return self.snapshot().by_id.get(device_id)
+
+    def refresh(self) -> InventorySnapshot:
+        """Rediscover all devices now, regardless of the snapshot's age"""
+        with self._refresh_lock:
+            return self._refresh(PLATFORMS)
+
+    def subscribe(self, listener: Callable[[InventoryChange], None]) -> None:
+        """Call listener with every non-empty InventoryChange, in order, from the refreshing thread"""
+        with self._refresh_lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[InventoryChange], None]) -> None:
+        with self._refresh_lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def start(self) -> None:
+        """Refresh now, then keep the snapshot up to date in the background until stop()"""
+        if self.running:
+            return
+
+        self.refresh()
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._track_android, name="device-inventory-track", daemon=True),
+            threading.Thread(target=self._poll, name="device-inventory-poll", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop background updates; reads go back to refreshing after ttl"""
+        self._stop.set()
+        tracker = self._tracker
+        if tracker is not None and tracker.poll() is None:
+            tracker.terminate()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    # Internals below expect self._refresh_lock to be held
+
+    def _is_fresh(self, snapshot: InventorySnapshot) -> bool:
+        if snapshot.taken_at is None:
+            return False
+        return self.running or time.monotonic() - snapshot.taken_at < self.ttl
+
+    def _refresh(self, platforms: Iterable[str]) -> InventorySnapshot:
+        devices: Dict[str, List[DeviceEntry]] = {}
+        if "android" in platforms:
+            devices["android"] = android_entries(android_device_states(), self._properties, self.probe_workers)
+        if "ios" in platforms:
+            devices["ios"] = discover_ios()
+        self.refreshes += 1
+        return self._publish(devices)
+
+    def _publish(self, devices: Dict[str, List[DeviceEntry]]) -> InventorySnapshot:
+        """Replace the devices of the platforms in devices, keep the others, and notify listeners"""
+        previous = self._snapshot
+        entries = [d for d in previous.devices if d["platform"] not in devices]
+        for platform_devices in devices.values():
+            entries.extend(platform_devices)
+        snapshot = InventorySnapshot.build(entries, time.monotonic())
+        self._snapshot = snapshot
+
+        change = InventoryChange(
+            added=tuple(d for d in snapshot.devices if d["id"] not in previous.by_id),
+            removed=tuple(d for d in previous.devices if d["id"] not in snapshot.by_id),
+            changed=tuple(d for d in snapshot.devices if d["id"] in previous.by_id and previous.by_id[d["id"]] != d),
+        )
+        if change:
+            for listener in list(self._listeners):
+                try:
+                    listener(change)
+                except Exception:
+                    logger.warning("Device inventory listener %r failed", listener, exc_info=True)
+        return snapshot
+
+    # Background threads
+
+    def _track_android(self) -> None:
+        while not self._stop.is_set():
+            try:
+                tracker = subprocess.Popen(["adb", "track-devices"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            except OSError:
+                logger.debug("adb track-devices unavailable, polling Android devices instead")
+                return
+
+            self._tracker = tracker
+            self._tracking = True
+            try:
+                for states in read_track_devices(tracker.stdout):
+                    with self._refresh_lock:
+                        if self._stop.is_set():
+                            break
+                        self._publish({"android": android_entries(states, self._properties, self.probe_workers)})
+            finally:
+                self._tracking = False
+                if tracker.poll() is None:
+                    tracker.terminate()
+                tracker.wait()
+
+            # The adb server went away; poll until it can be tracked again
+            self._stop.wait(self.ttl)
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.ttl):
+            platforms = ("ios",) if self._tracking else PLATFORMS
+            with self._refresh_lock:
+                try:
+                    self._refresh(platforms)
+                except Exception:
+                    logger.warning("Device inventory refresh failed", exc_info=True)
+
+
+def parse_device_states(output: str) -> List[Tuple[str, str]]:
+    """(serial, state) pairs of `adb devices` (or one `adb track-devices` update) output"""
+    states = []
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) < 2 or line.startswith(("List of devices", "*")):
+            continue
+        states.append((parts[0], parts[1]))
+    return states
+
+
+def read_track_devices(stream: IO[bytes]) -> Iterator[List[Tuple[str, str]]]:
+    """
+    Device states of each `adb track-devices` update, until the stream ends
+
+    Every update is the full device list, prefixed with its length as four
+    hex digits.
+    """
+    while True:
+        header = stream.read(4)
+        if len(header) < 4:
+            return
+        try:
+            length = int(header, 16)
+        except ValueError:
+            logger.debug("Unexpected adb track-devices output: %r", header)
+            return
+        payload = stream.read(length) if length else b""
+        yield parse_device_states(payload.decode(errors="replace"))
+
+
+def android_device_states() -> List[Tuple[str, str]]:
+    """(serial, state) of the devices adb knows, or none if adb is unavailable"""
+    try:
+        result = subprocess.run(["adb", "devices"], capture_output=True, text=True, timeout=5)
+    except (subprocess.SubprocessError, OSError) as e:
+        logger.debug("Cannot list Android devices: %s", e)
+        return []
+    if result.returncode != 0:
+        return []
+    return parse_device_states(result.stdout)
+
+
+def probe_android_device(serial: str) -> Dict[str, str]:
+    """ANDROID_PROPERTIES of a device (empty for those it could not read) in a single adb shell"""
+    command = "; ".join(f"getprop {name}" for name in ANDROID_PROPERTIES)
+    try:
+        result = subprocess.run(["adb", "-s", serial, "shell", command], capture_output=True, text=True, timeout=5)
+        values = result.stdout.splitlines() if result.returncode == 0 else []
+    except (subprocess.SubprocessError, OSError):
+        values = []
+    return {name: (values[i].strip() if i < len(values) else "") for i, name in enumerate(ANDROID_PROPERTIES)}
+
+
+def android_entries(
+    states: List[Tuple[str, str]],
+    properties: Optional[Dict[str, Dict[str, str]]] = None,
+    probe_workers: int = MAX_PROBE_WORKERS,
+) -> List[DeviceEntry]:
+    """
+    Inventory entries of Android devices, probing the online ones concurrently
+
+    Args:
+        states: (serial, state) pairs, as from android_device_states()
+        properties: Properties already probed per serial; updated in place
+            with new probes, and devices no longer listed are dropped from it
+        probe_workers: Max concurrent probes
+    """
+    properties = {} if properties is None else properties
+    listed = {serial for serial, _ in states}
+    for serial in list(properties):
+        if serial not in listed:
+            del properties[serial]
+
+    pending = [serial for serial, state in states if state == "device" and serial not in properties]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(len(pending), probe_workers)) as executor:
+            properties.update(zip(pending, executor.map(probe_android_device, pending)))
+
+    entries = []
+    for serial, state in states:
+        props = properties.get(serial, {})
+        try:
+            api_level = int(props.get("ro.build.version.sdk", ""))
+        except ValueError:
+            api_level = None
+        entries.append(
+            {
+                "id": serial,
+                "name": props.get("ro.product.model") or serial,
+                "platform": "android",
+                "status": "online" if state == "device" else state,
+                "api_level": api_level,
+                "platform_version": props.get("ro.build.version.release") or None,
+                "device_type": "emulator" if "emulator" in serial else "real",
+            }
+        )
+    return entries
+
+
+def discover_android(probe_workers: int = MAX_PROBE_WORKERS) -> List[DeviceEntry]:
+    """Inventory entries of the Android devices adb knows, probed now"""
+    return android_entries(android_device_states(), probe_workers=probe_workers)
+
+
+def discover_ios() -> List[DeviceEntry]:
+    """Inventory entries of the available iOS simulators"""
+    try:
+        result = subprocess.run(["xcrun", "simctl", "list", "devices", "-j"], capture_output=True, text=True, timeout=5)
+        data = json.loads(result.stdout) if result.returncode == 0 else {}
+    except (subprocess.SubprocessError, OSError, json.JSONDecodeError):
+        return []
+
+    entries = []
+    for runtime, device_list in data.get("devices", {}).items():
+        match = _IOS_RUNTIME.search(runtime)
+        for device in device_list:
+            if not device.get("isAvailable", False):
+                continue
+            entries.append(
+                {
+                    "id": device["udid"],
+                    "name": device["name"],
+                    "platform": "ios",
+                    "status": device["state"].lower(),
+                    "ios_version": runtime.split(".")[-1],
+                    "platform_version": match.group(1).replace("-", ".") if match else None,
+                    "device_type": "simulator",
+                }
+            )
+    return entries
+
+
+# Shared inventory instance
+_inventory: Optional[DeviceInventory] = None
+_inventory_lock = threading.Lock()
+
+
+def get_inventory() -> DeviceInventory:
+    """Get the process-wide device inventory"""
+    global _inventory
+    with _inventory_lock:
+        if _inventory is None:
+            _inventory = DeviceInventory()
+        return _inventory
@@ -10,14 +10,13 @@ This module handles:
 - Multi-language support
 """
 
-import json
-import subprocess
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Protocol
+from typing import Any, Dict, Iterable, List, Optional, Protocol
 
+from framework.devices.device_inventory import DeviceInventory, discover_android, discover_ios, get_inventory
 from framework.licensing.validator import check_feature
 
 
@@ -317,112 +316,69 @@ def _validate_device_id(udid: str) -> bool:
     return False
 
 
-class LocalDeviceProvider:
-    """Provider for local emulators/simulators and real devices"""
-
-    def list_devices(self) -> List[DeviceCapabilities]:
-        """List available local devices"""
-        devices = []
-
-        # List Android devices
-        devices.extend(self._list_android_devices())
-
-        # List iOS simulators (macOS only)
-        devices.extend(self._list_ios_simulators())
-
-        return devices
-
-    def _list_android_devices(self) -> List[DeviceCapabilities]:
-        """List Android devices via adb"""
-        devices = []
+def capabilities_from_inventory(entry: Dict[str, Any]) -> DeviceCapabilities:
+    """DeviceCapabilities of a device inventory entry"""
+    if entry["platform"] == "ios":
+        platform, automation_name = Platform.IOS, "XCUITest"
+    else:
+        platform, automation_name = Platform.ANDROID, "UiAutomator2"
 
-        try:
-            result = subprocess.run(["adb", "devices", "-l"], capture_output=True, text=True, timeout=5)
-
-            for line in result.stdout.split("\n")[1:]:
-                if not line.strip() or "List of devices" in line:
-                    continue
+    return DeviceCapabilities(
+        platform=platform,
+        platform_version=entry.get("platform_version") or "unknown",
+        device_name=entry.get("name") or entry["id"],
+        udid=entry["id"],
+        device_type=DeviceType(entry["device_type"]),
+        automation_name=automation_name,
+    )
 
-                parts = line.split()
-                if len(parts) >= 2:
-                    udid = parts[0]
 
-                    # Validate device ID to prevent command injection
-                    if not _validate_device_id(udid):
-                        print(f"⚠️  Skipping device with invalid ID format: {udid}")
-                        continue
+class LocalDeviceProvider:
+    """
+    Provider for local emulators/simulators and real devices
 
-                    device_type = DeviceType.EMULATOR if "emulator" in udid else DeviceType.REAL
+    Devices are listed from the shared device inventory snapshot (see
+    framework.devices.device_inventory) rather than by running adb/simctl
+    on every call.
+    """
 
-                    # Get device properties
-                    prop_result = subprocess.run(
-                        ["adb", "-s", udid, "shell", "getprop", "ro.build.version.release"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    version = prop_result.stdout.strip() or "unknown"
+    def __init__(self, inventory: Optional[DeviceInventory] = None):
+        """
+        Args:
+            inventory: Device inventory to list from (default: the shared one)
+        """
+        self.inventory = inventory or get_inventory()
 
-                    name_result = subprocess.run(
-                        ["adb", "-s", udid, "shell", "getprop", "ro.product.model"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    name = name_result.stdout.strip() or udid
-
-                    devices.append(
-                        DeviceCapabilities(
-                            platform=Platform.ANDROID,
-                            platform_version=version,
-                            device_name=name,
-                            udid=udid,
-                            device_type=device_type,
-                            automation_name="UiAutomator2",
-                        )
-                    )
-        except FileNotFoundError:
-            print("⚠️  adb not found. Install Android SDK.")
-        except (subprocess.SubprocessError, OSError, subprocess.TimeoutExpired) as e:
-            print(f"⚠️  Error listing Android devices: {e}")
+    def list_devices(self) -> List[DeviceCapabilities]:
+        """List available local devices"""
+        snapshot = self.inventory.snapshot()
+        return self._android_capabilities(snapshot.by_platform.get("android", ())) + self._ios_capabilities(
+            snapshot.by_platform.get("ios", ())
+        )
 
-        return devices
+    def _list_android_devices(self) -> List[DeviceCapabilities]:
+        """List Android devices via adb, bypassing the inventory"""
+        return self._android_capabilities(discover_android())
 
     def _list_ios_simulators(self) -> List[DeviceCapabilities]:
-        """List iOS simulators via xcrun simctl"""
-        devices = []
-
-        try:
-            result = subprocess.run(
-                ["xcrun", "simctl", "list", "devices", "--json"], capture_output=True, text=True, timeout=5
-            )
-
-            data = json.loads(result.stdout)
-
-            for version, device_list in data.get("devices", {}).items():
-                for device in device_list:
-                    if device.get("isAvailable") and device.get("state") == "Booted":
-                        # Extract iOS version from key like 'iOS 16.0'
-                        ios_version = version.split()[-1] if "iOS" in version else "unknown"
-
-                        devices.append(
-                            DeviceCapabilities(
-                                platform=Platform.IOS,
-                                platform_version=ios_version,
-                                device_name=device["name"],
-                                udid=device["udid"],
-                                device_type=DeviceType.SIMULATOR,
-                                automation_name="XCUITest",
-                            )
-                        )
-        except FileNotFoundError:
-            # Not on macOS or Xcode not installed
-            pass
-        except (subprocess.SubprocessError, json.JSONDecodeError, subprocess.TimeoutExpired) as e:
-            print(f"⚠️  Error listing iOS simulators: {e}")
+        """List iOS simulators via xcrun simctl, bypassing the inventory"""
+        return self._ios_capabilities(discover_ios())
 
+    @staticmethod
+    def _android_capabilities(entries: Iterable[Dict[str, Any]]) -> List[DeviceCapabilities]:
+        devices = []
+        for entry in entries:
+            # Validate device ID to prevent command injection
+            if not _validate_device_id(entry["id"]):
+                print(f"⚠️  Skipping device with invalid ID format: {entry['id']}")
+                continue
+            devices.append(capabilities_from_inventory(entry))
         return devices
 
+    @staticmethod
+    def _ios_capabilities(entries: Iterable[Dict[str, Any]]) -> List[DeviceCapabilities]:
+        return [capabilities_from_inventory(entry) for entry in entries if entry["status"] == "booted"]
+
     def connect(self, caps: DeviceCapabilities) -> Device:
         """Connect to device using Appium"""
         try:
@@ -516,8 +472,8 @@ class DeviceLayer:
     Manages device connections and captures artifacts
     """
 
-    def __init__(self):
-        self.local_provider = LocalDeviceProvider()
+    def __init__(self, inventory: Optional[DeviceInventory] = None):
+        self.local_provider = LocalDeviceProvider(inventory)
         self.cloud_provider: Optional[CloudDeviceProvider] = None
         self.connected_devices: List[Device] = []
 
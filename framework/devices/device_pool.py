@@ -2,12 +2,23 @@
 Device pool management for parallel test execution
 """
 
+import itertools
+import logging
+import random
 import threading
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Optional, Any
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
-from .device_layer import Device, DeviceStatus, DeviceType
+from .device_inventory import AVAILABLE_STATUSES, DeviceInventory, InventoryChange, get_inventory
+from .device_layer import Device, DeviceStatus, DeviceType, Platform, capabilities_from_inventory
+
+logger = logging.getLogger(__name__)
+
+# Free lists are keyed by what most filters select on
+FreeListKey = Tuple[Platform, str]
 
 
 class PoolStrategy(Enum):
@@ -19,54 +30,97 @@ class PoolStrategy(Enum):
     PRIORITY = "priority"
 
 
+class _Waiter:
+    """A blocked acquire() call; released devices are handed to it directly"""
+
+    def __init__(self, filters: Optional[Dict], lock: threading.Lock):
+        self.filters = filters
+        self.condition = threading.Condition(lock)
+        self.device: Optional[Device] = None
+
+
 @dataclass
 class DevicePool:
     """
     Manages a pool of devices for parallel test execution
 
     Features:
-    - Device reservation and locking
-    - Load balancing
-    - Health monitoring
-    - Automatic recovery
+    - Device reservation from free lists indexed by platform and version:
+      leasing touches only matching free devices instead of the whole pool
+    - Blocking acquire(timeout) instead of polling: a released device is
+      handed straight to the longest-waiting caller it matches, so waiters
+      are served first come, first served and cannot be overtaken
+    - Load balancing (ROUND_ROBIN and LEAST_BUSY lease the device that has
+      been free the longest)
+    - Health monitoring: devices marked offline or in error are not leased
     """
 
     name: str
     devices: List[Device] = field(default_factory=list)
     strategy: PoolStrategy = PoolStrategy.ROUND_ROBIN
 
-    # Internal state
-    _locks: Dict[str, threading.Lock] = field(default_factory=dict)
-    _reserved: Dict[str, bool] = field(default_factory=dict)
-    _last_used_index: int = 0
+    # Internal state, guarded by _lock
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _by_id: Dict[str, Device] = field(default_factory=dict, repr=False)
+    _priority: Dict[str, int] = field(default_factory=dict, repr=False)
+    _reserved: Dict[str, bool] = field(default_factory=dict, repr=False)
+    # Free device IDs per key, least recently released first
+    _free: Dict[FreeListKey, "OrderedDict[str, None]"] = field(default_factory=dict, repr=False)
+    _freed_at: Dict[str, int] = field(default_factory=dict, repr=False)
+    _waiters: Deque[_Waiter] = field(default_factory=deque, repr=False)
+    _counter: Iterator[int] = field(default_factory=itertools.count, repr=False)
+
+    def __post_init__(self):
+        devices, self.devices = self.devices, []
+        with self._lock:
+            for device in devices:
+                if device.id not in self._by_id:
+                    self._index(device)
 
     def add_device(self, device: Device) -> None:
         """Add device to pool"""
-        if device.id not in [d.id for d in self.devices]:
-            self.devices.append(device)
-            self._locks[device.id] = threading.Lock()
-            self._reserved[device.id] = False
-            print(f"  Added {device.name} to pool '{self.name}'")
+        with self._lock:
+            if device.id in self._by_id:
+                return
+            self._index(device)
+        print(f"  Added {device.name} to pool '{self.name}'")
 
     def remove_device(self, device_id: str) -> None:
         """Remove device from pool"""
-        self.devices = [d for d in self.devices if d.id != device_id]
-        if device_id in self._locks:
-            del self._locks[device_id]
-        if device_id in self._reserved:
-            del self._reserved[device_id]
+        with self._lock:
+            device = self._by_id.pop(device_id, None)
+            if device is None:
+                return
+            self.devices = [d for d in self.devices if d.id != device_id]
+            self._free.get(self._key(device), {}).pop(device_id, None)
+            self._priority.pop(device_id, None)
+            self._freed_at.pop(device_id, None)
+            self._reserved.pop(device_id, None)
+
+    def get_device(self, device_id: str) -> Optional[Device]:
+        """Device by ID, or None if it is not in the pool"""
+        with self._lock:
+            return self._by_id.get(device_id)
 
     def get_available_count(self) -> int:
         """Get number of available devices"""
-        return sum(
-            1
-            for device in self.devices
-            if not self._reserved.get(device.id, False) and device.status == DeviceStatus.AVAILABLE
-        )
+        with self._lock:
+            return sum(
+                1 for free in self._free.values() for device_id in free if self._is_leasable(self._by_id[device_id])
+            )
+
+    def count_devices(self, filters: Optional[Dict] = None) -> int:
+        """Number of usable (available or busy) devices matching filters, reserved or not"""
+        with self._lock:
+            return sum(
+                1
+                for d in self.devices
+                if d.status in (DeviceStatus.AVAILABLE, DeviceStatus.BUSY) and self._matches(d, filters)
+            )
 
     def acquire_device(self, filters: Optional[Dict] = None) -> Optional[Device]:
         """
-        Acquire (reserve) a device from the pool
+        Acquire (reserve) a device from the pool without waiting
 
         Args:
             filters: Optional filters (platform, model, version, etc.)
@@ -74,84 +128,202 @@ class DevicePool:
         Returns:
             Reserved device or None if no devices available
         """
-        # Filter devices
-        candidates = self._filter_devices(filters)
+        return self.acquire(filters, timeout=0)
 
-        if not candidates:
-            return None
+    def acquire(self, filters: Optional[Dict] = None, timeout: Optional[float] = None) -> Optional[Device]:
+        """
+        Acquire (reserve) a device, waiting until a matching one is released
 
-        # Apply strategy
-        if self.strategy == PoolStrategy.ROUND_ROBIN:
-            device = self._acquire_round_robin(candidates)
-        elif self.strategy == PoolStrategy.LEAST_BUSY:
-            device = self._acquire_least_busy(candidates)
-        elif self.strategy == PoolStrategy.RANDOM:
-            import random
+        Args:
+            filters: Optional filters (platform, type, model, min_version)
+            timeout: Max seconds to wait; None waits indefinitely, 0 does not wait
 
-            device = random.choice(candidates) if candidates else None
-        else:
-            device = candidates[0] if candidates else None
+        Returns:
+            Reserved device, or None if none became available in time
+
+        Raises:
+            ValueError: If a platform or type filter is not a known value
+        """
+        filters = self._normalize_filters(filters)
+
+        with self._lock:
+            device = self._take(filters)
+
+            if device is None and (timeout is None or timeout > 0):
+                waiter = _Waiter(filters, self._lock)
+                self._waiters.append(waiter)
+                deadline = None if timeout is None else time.monotonic() + timeout
+
+                while waiter.device is None:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    waiter.condition.wait(remaining)
+
+                device = waiter.device
+                if device is None:
+                    self._waiters.remove(waiter)
 
         if device:
-            # Get lock reference while holding no locks to avoid race
-            device_id = device.id
-            if device_id not in self._locks:
-                return None
-            lock = self._locks[device_id]
-
-            with lock:
-                # Double-check device still exists and is not reserved
-                if device_id not in self._reserved:
-                    return None
-                if not self._reserved[device_id]:
-                    self._reserved[device_id] = True
-                    device.status = DeviceStatus.BUSY
-                    print(f"  Acquired device: {device.name} ({device.id})")
-                    return device
-
-        return None
+            logger.debug("Acquired device %s (%s) from pool '%s'", device.name, device.id, self.name)
+        return device
 
     def release_device(self, device_id: str) -> None:
         """Release (unreserve) a device back to the pool"""
-        if device_id in self._reserved:
-            with self._locks[device_id]:
-                self._reserved[device_id] = False
-
-                # Update device status
-                for device in self.devices:
-                    if device.id == device_id:
-                        device.status = DeviceStatus.AVAILABLE
-                        print(f"  Released device: {device.name} ({device_id})")
-                        break
+        with self._lock:
+            device = self._by_id.get(device_id)
+            if device is None or not self._reserved.get(device_id):
+                return
+
+            self._reserved[device_id] = False
+            if device.status == DeviceStatus.BUSY:
+                device.status = DeviceStatus.AVAILABLE
+            self._offer(device)
+
+        logger.debug("Released device %s (%s) to pool '%s'", device.name, device_id, self.name)
+
+    def set_device_status(self, device_id: str, status: DeviceStatus) -> None:
+        """
+        Update a device's health status
+
+        Offline and failed devices are not leased; a device that becomes
+        available again goes back to its free list (or to a waiter).
+        """
+        with self._lock:
+            device = self._by_id.get(device_id)
+            if device is None:
+                return
+
+            device.status = status
+            free = self._free.get(self._key(device), {})
+            if status == DeviceStatus.AVAILABLE and not self._reserved.get(device_id) and device_id not in free:
+                self._offer(device)
+            elif status in (DeviceStatus.OFFLINE, DeviceStatus.ERROR):
+                free.pop(device_id, None)
+
+    # Internals below expect self._lock to be held
+
+    @staticmethod
+    def _key(device: Device) -> FreeListKey:
+        return device.platform, device.platform_version or ""
+
+    @staticmethod
+    def _is_leasable(device: Device) -> bool:
+        return device.status == DeviceStatus.AVAILABLE
+
+    def _index(self, device: Device):
+        self.devices.append(device)
+        self._by_id[device.id] = device
+        self._priority[device.id] = next(self._counter)
+        self._reserved[device.id] = False
+        if self._is_leasable(device):
+            self._offer(device)
+
+    def _reserve(self, device: Device):
+        self._reserved[device.id] = True
+        device.status = DeviceStatus.BUSY
+
+    def _offer(self, device: Device):
+        """Hand a free device to the first waiter it matches, or put it on its free list"""
+        if not self._is_leasable(device):
+            # Stays off the free list until set_device_status() brings it back
+            return
+
+        for waiter in self._waiters:
+            try:
+                matches = self._matches(device, waiter.filters)
+            except (ValueError, TypeError, AttributeError) as e:
+                logger.warning("Skipping waiter with unusable filters %r: %s", waiter.filters, e)
+                continue
+            if matches:
+                self._waiters.remove(waiter)
+                self._reserve(device)
+                waiter.device = device
+                waiter.condition.notify()
+                return
+
+        self._freed_at[device.id] = next(self._counter)
+        self._free.setdefault(self._key(device), OrderedDict())[device.id] = None
+
+    @staticmethod
+    def _normalize_filters(filters: Optional[Dict]) -> Optional[Dict]:
+        """Resolve platform/type filters to enums so bad values fail before a lease is attempted"""
+        if not filters:
+            return filters
+
+        normalized = dict(filters)
+        if isinstance(normalized.get("platform"), str):
+            normalized["platform"] = Platform(normalized["platform"].lower())
+        if isinstance(normalized.get("type"), str):
+            normalized["type"] = DeviceType(normalized["type"])
+        return normalized
+
+    def _take(self, filters: Optional[Dict]) -> Optional[Device]:
+        """Reserve a free device matching filters, chosen by the pool strategy"""
+        least_recent = self.strategy in (PoolStrategy.ROUND_ROBIN, PoolStrategy.LEAST_BUSY)
+        candidates: List[Device] = []
+
+        for key, free in self._free.items():
+            if not free or not self._key_matches(key, filters):
+                continue
+            for device_id in free:
+                device = self._by_id[device_id]
+                if self._is_leasable(device) and self._attributes_match(device, filters):
+                    candidates.append(device)
+                    if least_recent:
+                        break  # Longest-free device of this free list
 
-    def _filter_devices(self, filters: Optional[Dict]) -> List[Device]:
-        """Filter available devices by criteria"""
-        # Start with available devices
-        candidates = [
-            d for d in self.devices if not self._reserved.get(d.id, False) and d.status == DeviceStatus.AVAILABLE
-        ]
+        if not candidates:
+            return None
+
+        if self.strategy == PoolStrategy.RANDOM:
+            device = random.choice(candidates)
+        elif self.strategy == PoolStrategy.PRIORITY:
+            device = min(candidates, key=lambda d: self._priority[d.id])
+        else:
+            device = min(candidates, key=lambda d: self._freed_at[d.id])
 
+        del self._free[self._key(device)][device.id]
+        self._reserve(device)
+        return device
+
+    def _matches(self, device: Device, filters: Optional[Dict]) -> bool:
+        return self._key_matches(self._key(device), filters) and self._attributes_match(device, filters)
+
+    def _key_matches(self, key: FreeListKey, filters: Optional[Dict]) -> bool:
+        """Platform and min_version filters, decided once per free list"""
         if not filters:
-            return candidates
+            return True
 
-        # Apply filters
+        platform, version = key
         if "platform" in filters:
-            candidates = [d for d in candidates if d.platform == filters["platform"]]
+            wanted = (
+                Platform(filters["platform"].lower()) if isinstance(filters["platform"], str) else filters["platform"]
+            )
+            if platform != wanted:
+                return False
+
+        # Use proper semantic version comparison instead of string comparison
+        if "min_version" in filters and self._compare_versions(version, filters["min_version"]) < 0:
+            return False
+
+        return True
+
+    @staticmethod
+    def _attributes_match(device: Device, filters: Optional[Dict]) -> bool:
+        """Type and model filters"""
+        if not filters:
+            return True
 
         if "type" in filters:
             device_type = DeviceType(filters["type"]) if isinstance(filters["type"], str) else filters["type"]
-            candidates = [d for d in candidates if d.type == device_type]
-
-        if "model" in filters:
-            model = filters["model"].lower()
-            candidates = [d for d in candidates if model in (d.model or "").lower()]
+            if device.type != device_type:
+                return False
 
-        if "min_version" in filters:
-            # Use proper semantic version comparison instead of string comparison
-            min_version = filters["min_version"]
-            candidates = [d for d in candidates if self._compare_versions(d.platform_version, min_version) >= 0]
+        if "model" in filters and filters["model"].lower() not in (device.model or "").lower():
+            return False
 
-        return candidates
+        return True
 
     def _compare_versions(self, version1: str, version2: str) -> int:
         """
@@ -191,25 +363,6 @@ class DevicePool:
                 return 1
             return 0
 
-    def _acquire_round_robin(self, candidates: List[Device]) -> Optional[Device]:
-        """Round-robin device selection"""
-        if not candidates:
-            return None
-
-        # Find next device after last used index
-        # Guard against empty list (though checked above, for safety)
-        num_candidates = len(candidates)
-        if num_candidates == 0:
-            return None
-        self._last_used_index = (self._last_used_index + 1) % num_candidates
-        return candidates[self._last_used_index]
-
-    def _acquire_least_busy(self, candidates: List[Device]) -> Optional[Device]:
-        """Select least busy device (for future use with metrics)"""
-        # For now, just return first available
-        # TODO: Track device usage metrics and select least busy
-        return candidates[0] if candidates else None
-
     def health_check(self) -> Dict[str, Any]:
         """Perform health check on all devices in pool"""
         healthy = 0
@@ -246,21 +399,81 @@ class DevicePool:
 
 
 class PoolManager:
-    """Manages multiple device pools"""
+    """
+    Manages multiple device pools
 
-    def __init__(self) -> None:
+    A pool created with from_inventory=True is filled from the device
+    inventory snapshot and follows its change notifications: devices that
+    connect are added, devices that disconnect or go offline are not leased
+    until they are back.
+    """
+
+    def __init__(self, inventory: Optional[DeviceInventory] = None) -> None:
+        """
+        Args:
+            inventory: Device inventory for pools created from it (default: the shared one)
+        """
         self.pools: Dict[str, DevicePool] = {}
+        self._inventory = inventory
+        self._listeners: Dict[str, Callable[[InventoryChange], None]] = {}
+
+    @property
+    def inventory(self) -> DeviceInventory:
+        if self._inventory is None:
+            self._inventory = get_inventory()
+        return self._inventory
+
+    def create_pool(
+        self,
+        name: str,
+        strategy: PoolStrategy = PoolStrategy.ROUND_ROBIN,
+        from_inventory: bool = False,
+        platform: str = "all",
+    ) -> DevicePool:
+        """
+        Create a new device pool
 
-    def create_pool(self, name: str, strategy: PoolStrategy = PoolStrategy.ROUND_ROBIN) -> DevicePool:
-        """Create a new device pool"""
+        Args:
+            name: Pool name
+            strategy: Allocation strategy
+            from_inventory: Fill the pool from the device inventory and keep it in sync
+            platform: Inventory platform to take devices from ("all", "android" or "ios")
+        """
         if name in self.pools:
             raise ValueError(f"Pool '{name}' already exists")
 
         pool = DevicePool(name=name, strategy=strategy)
+        if from_inventory:
+            listener = self._follow(pool, platform)
+            self.inventory.subscribe(listener)
+            self._listeners[name] = listener
+            # Subscribed first, so a change published meanwhile is not missed
+            for entry in self.inventory.available_devices(platform):
+                pool.add_device(Device(capabilities_from_inventory(entry), driver=None))
+
         self.pools[name] = pool
         print(f"Created device pool: '{name}' with strategy: {strategy.value}")
         return pool
 
+    @staticmethod
+    def _follow(pool: DevicePool, platform: str) -> Callable[[InventoryChange], None]:
+        """Inventory listener applying device changes to pool"""
+
+        def on_change(change: InventoryChange) -> None:
+            for entry in change.removed:
+                pool.set_device_status(entry["id"], DeviceStatus.OFFLINE)
+            for entry in change.added + change.changed:
+                if platform != "all" and entry["platform"] != platform:
+                    continue
+                if entry["status"] not in AVAILABLE_STATUSES:
+                    pool.set_device_status(entry["id"], DeviceStatus.OFFLINE)
+                elif pool.get_device(entry["id"]) is None:
+                    pool.add_device(Device(capabilities_from_inventory(entry), driver=None))
+                else:
+                    pool.set_device_status(entry["id"], DeviceStatus.AVAILABLE)
+
+        return on_change
+
     def get_pool(self, name: str) -> Optional[DevicePool]:
         """Get pool by name"""
         return self.pools.get(name)
@@ -269,6 +482,9 @@ class PoolManager:
         """Delete a pool"""
         if name in self.pools:
             del self.pools[name]
+            listener = self._listeners.pop(name, None)
+            if listener is not None:
+                self.inventory.unsubscribe(listener)
             print(f"Deleted pool: '{name}'")
 
     def list_pools(self) -> None:
@@ -4,6 +4,8 @@ Parallel test execution with intelligent sharding
 Distributes tests across multiple workers for faster execution.
 """
 
+from .duration_history import DurationHistory
+from .inprocess_test import InProcessTest, InProcessTestError
 from .parallel_executor import ParallelExecutor, ExecutionResult
 from .test_sharding import TestSharding, ShardStrategy
 
@@ -12,4 +14,7 @@ __all__ = [
     "ShardStrategy",
     "ParallelExecutor",
     "ExecutionResult",
+    "DurationHistory",
+    "InProcessTest",
+    "InProcessTestError",
 ]
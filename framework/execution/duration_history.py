@@ -0,0 +1,164 @@
+"""
+Persistent test duration history
+
+Keeps per-test duration statistics across runs in a small SQLite database
+keyed by TestCase.full_name, so sharding and dynamic scheduling start from
+measured durations instead of a flat default estimate.
+"""
+
+import json
+import math
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from framework.storage.connection_pool import SQLiteConnectionPool
+
+# Relative to the project root (ParallelExecutor) or working directory (TestSharding)
+DEFAULT_HISTORY_PATH = Path(".observe") / "test_durations.db"
+
+
+class DurationHistory:
+    """
+    Duration statistics per test
+
+    Every recorded run updates an exponentially weighted moving average
+    (recent runs count more, so a test that got slower is picked up within
+    a few runs) and the 90th percentile over the last ``window`` runs.
+
+    Usage:
+        history = DurationHistory(".observe/test_durations.db")
+        history.record([("tests/test_login.py::test_ok", 2.4)])
+        TestSharding(history.estimates())  # What TestSharding() loads by default
+    """
+
+    STATISTICS = ("ewma", "p90")
+
+    def __init__(self, db_path: Path = DEFAULT_HISTORY_PATH, alpha: float = 0.3, window: int = 20):
+        """
+        Args:
+            db_path: Path to the SQLite database (created on first write)
+            alpha: EWMA smoothing factor, weight of the newest run (0 < alpha <= 1)
+            window: Recent runs kept per test for the p90
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        if window < 1:
+            raise ValueError("window must be >= 1")
+
+        self.db_path = Path(db_path)
+        self.alpha = alpha
+        self.window = window
+        self._pool: Optional[SQLiteConnectionPool] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._pool is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._pool = SQLiteConnectionPool(str(self.db_path))
+            conn = self._pool.acquire()
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS test_durations (
+                    test_name TEXT PRIMARY KEY,
+                    ewma REAL NOT NULL,
+                    p90 REAL NOT NULL,
+                    samples TEXT NOT NULL,
+                    runs INTEGER NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+        return self._pool.acquire()
+
+    def record(self, durations: Iterable[Tuple[str, float]]):
+        """
+        Add one run's durations (test full name, seconds) in a single transaction
+
+        A test listed several times counts as several runs, in order.
+        """
+        durations = list(durations)
+        if not durations:
+            return
+
+        conn = self._connection()
+        with conn:
+            names = list(dict.fromkeys(name for name, _ in durations))
+            stored = self._rows(conn, names)
+            now = time.time()
+
+            for name, duration in durations:
+                ewma, _, samples, runs = stored.get(name, (duration, 0.0, [], 0))
+                ewma = self.alpha * duration + (1 - self.alpha) * ewma
+                samples = (samples + [duration])[-self.window :]
+                stored[name] = (ewma, percentile(samples, 90), samples, runs + 1)
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO test_durations (test_name, ewma, p90, samples, runs, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (name, ewma, p90, json.dumps(samples), runs, now)
+                    for name, (ewma, p90, samples, runs) in stored.items()
+                ],
+            )
+
+    @staticmethod
+    def _rows(conn: sqlite3.Connection, names: List[str]) -> Dict[str, Tuple[float, float, List[float], int]]:
+        """Stored (ewma, p90, samples, runs) of the given tests"""
+        rows = {}
+        # Stay below SQLite's bound parameter limit
+        for i in range(0, len(names), 500):
+            chunk = names[i : i + 500]
+            cursor = conn.execute(
+                f"SELECT test_name, ewma, p90, samples, runs FROM test_durations "
+                f"WHERE test_name IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for row in cursor:
+                rows[row["test_name"]] = (row["ewma"], row["p90"], json.loads(row["samples"]), row["runs"])
+        return rows
+
+    def estimates(self, statistic: str = "ewma") -> Dict[str, float]:
+        """
+        Duration estimate of every known test (test full name -> seconds)
+
+        Args:
+            statistic: "ewma" (expected duration) or "p90" (pessimistic)
+        """
+        if statistic not in self.STATISTICS:
+            raise ValueError(f"Unknown statistic: {statistic}")
+        if self._pool is None and not self.db_path.exists():
+            return {}
+
+        cursor = self._connection().execute(f"SELECT test_name, {statistic} FROM test_durations")
+        return {row[0]: row[1] for row in cursor}
+
+    def stats(self) -> List[Dict[str, float]]:
+        """All tests with their statistics, slowest (by p90) first"""
+        if self._pool is None and not self.db_path.exists():
+            return []
+
+        cursor = self._connection().execute(
+            "SELECT test_name, ewma, p90, runs, updated_at FROM test_durations ORDER BY p90 DESC"
+        )
+        return [dict(row) for row in cursor]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of samples"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[rank - 1]
@@ -0,0 +1,179 @@
+"""
+In-process pytest test execution
+
+Collects a single pytest test once, sets up its fixtures once, and then
+runs the test body as many times as asked, in this process. Used by load
+tests, where starting `python -m pytest` for every iteration would make
+interpreter startup and collection the dominant part of each measured
+response time.
+
+Each InProcessTest keeps its own pytest session open in a helper thread,
+so several can run side by side (one per virtual user). pytest's
+configuration, collection and fixture setup/teardown touch process-wide
+state and are serialized; only the test calls themselves run concurrently.
+Output capturing is disabled because it would redirect the process-wide
+stdout/stderr.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+import pytest
+
+from framework.execution.test_runner import TestResult, TestResultStatus
+
+# Held while a session configures, collects and sets up, and while it tears down
+_PYTEST_LOCK = threading.Lock()
+
+# Quiet sessions without output capture or cache writes
+DEFAULT_PYTEST_ARGS = ["-qq", "--no-header", "--no-summary", "-s", "-p", "no:cacheprovider"]
+
+# pytest.fail/skip/xfail raise BaseException subclasses that `except Exception` misses
+_OUTCOME_EXCEPTIONS = (pytest.fail.Exception, pytest.skip.Exception, pytest.xfail.Exception)
+
+
+class InProcessTestError(RuntimeError):
+    """The test could not be collected or its fixtures could not be set up"""
+
+
+class _SessionHolder:
+    """pytest plugin: set up the only collected test, hand it over, and tear it down when asked"""
+
+    def __init__(self, owner: "InProcessTest"):
+        self.owner = owner
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session) -> bool:
+        owner = self.owner
+        if session.testsfailed:
+            owner._error = f"Collection of {owner.target} failed"
+            return True
+        if len(session.items) != 1:
+            owner._error = f"{owner.target} selects {len(session.items)} tests; select exactly one (path::name)"
+            return True
+
+        item = session.items[0]
+        try:
+            item.ihook.pytest_runtest_setup(item=item)
+        except (Exception, *_OUTCOME_EXCEPTIONS) as e:
+            owner._error = f"Setup of {item.nodeid} failed: {e}"
+            self._teardown(item)
+            return True
+
+        owner._item = item
+        _PYTEST_LOCK.release()
+        owner._locked = False
+        owner._ready.set()
+
+        owner._closing.wait()
+
+        _PYTEST_LOCK.acquire()
+        owner._locked = True
+        self._teardown(item)
+        return True
+
+    def _teardown(self, item: Any):
+        try:
+            item.ihook.pytest_runtest_teardown(item=item, nextitem=None)
+        except (Exception, *_OUTCOME_EXCEPTIONS) as e:
+            self.owner.teardown_error = str(e)
+
+
+class InProcessTest:
+    """
+    A pytest test collected and set up once, run on demand
+
+    Function-scoped fixtures are created once per InProcessTest and shared
+    by all its runs; create one per virtual user to keep their state apart.
+    A run cannot be interrupted, so a hanging test hangs its caller.
+
+    Usage:
+        with InProcessTest("tests/test_checkout.py::test_buy") as test:
+            for _ in range(100):
+                result = test.run()
+    """
+
+    def __init__(self, target: Union[str, Path], args: Optional[List[str]] = None):
+        """
+        Args:
+            target: pytest node ID or path selecting exactly one test
+            args: Extra pytest arguments (e.g. -k EXPR to select the test)
+        """
+        self.target = str(target)
+        self.args = list(args or [])
+        self.teardown_error: Optional[str] = None
+
+        self._item: Any = None
+        self._error: Optional[str] = None
+        self._locked = False
+        self._ready = threading.Event()
+        self._closing = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    @property
+    def name(self) -> str:
+        return self._item.nodeid if self._item is not None else self.target
+
+    def start(self):
+        """
+        Collect the test and set up its fixtures
+
+        Raises:
+            InProcessTestError: If collection or setup failed
+        """
+        self._thread = threading.Thread(target=self._hold_session, name="inprocess-test", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._item is None:
+            self._thread.join()
+            raise InProcessTestError(self._error or f"pytest session for {self.target} ended unexpectedly")
+
+    def run(self) -> TestResult:
+        """Run the test body once with the fixtures set up by start()"""
+        if self._item is None or self._closing.is_set():
+            raise InProcessTestError("Test is not set up; call start() first")
+
+        start = time.perf_counter()
+        status, message = TestResultStatus.PASSED, None
+        try:
+            self._item.runtest()
+        except pytest.skip.Exception as e:
+            status, message = TestResultStatus.SKIPPED, str(e)
+        except (Exception, *_OUTCOME_EXCEPTIONS) as e:
+            status, message = TestResultStatus.FAILED, f"{type(e).__name__}: {e}"
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        return TestResult(name=self.name, status=status, duration_ms=duration_ms, message=message)
+
+    def close(self, timeout: float = 60.0):
+        """Tear the fixtures down and end the pytest session"""
+        self._closing.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._item = None
+
+    def _hold_session(self):
+        _PYTEST_LOCK.acquire()
+        self._locked = True
+        try:
+            exit_code = pytest.main([self.target, *DEFAULT_PYTEST_ARGS, *self.args], plugins=[_SessionHolder(self)])
+            if self._item is None and self._error is None:
+                self._error = f"pytest exited with {exit_code!r} for {self.target}"
+        except Exception as e:
+            self._error = f"pytest failed for {self.target}: {e}"
+        finally:
+            if self._locked:
+                self._locked = False
+                _PYTEST_LOCK.release()
+            self._ready.set()
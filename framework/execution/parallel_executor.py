@@ -5,15 +5,25 @@ Executes tests in parallel across multiple workers/devices.
 """
 
 import concurrent.futures
+import heapq
+import os
+import sqlite3
 import subprocess
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import Any, List, Dict, Optional, Callable, Tuple
 
-from .test_sharding import TestCase, TestShard
+from framework.devices.device_layer import Device, Platform
+from framework.devices.device_pool import DevicePool
+
+from .duration_history import DEFAULT_HISTORY_PATH, DurationHistory
+from .pytest_worker import PytestWorker, WorkerError, WorkerTimeout
+from .test_sharding import TestCase, TestShard, TestSharding
+from .work_queue import WorkQueue
 
 
 class TestStatus(Enum):
@@ -45,6 +55,11 @@ class ShardResult:
     test_results: List[ExecutionResult]
     total_duration: float
     worker_id: Optional[str] = None
+    device_id: Optional[str] = None  # Device leased by the worker (execute_on_devices)
+    lease_wait: float = 0.0  # Seconds the worker waited for its device
+    # Wall clock (time.time()) when the shard started and finished running tests
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
 
     @property
     def passed_count(self) -> int:
@@ -59,21 +74,69 @@ class ShardResult:
         return len(self.test_results)
 
 
+def device_environment(device: Device) -> Dict[str, str]:
+    """Environment variables telling tests which device they run against"""
+    env = {
+        "OBSERVE_DEVICE_UDID": device.id,
+        "OBSERVE_DEVICE_NAME": device.name,
+        "OBSERVE_PLATFORM": device.platform.value,
+        "OBSERVE_PLATFORM_VERSION": device.platform_version or "",
+    }
+    if device.platform == Platform.ANDROID:
+        env["ANDROID_SERIAL"] = device.id  # Picked up by adb and uiautomator2
+    return env
+
+
 class ParallelExecutor:
     """
     Executes tests in parallel across multiple workers
+
+    By default every shard runs in one persistent pytest worker process
+    (see pytest_worker) that receives the shard's tests in batches, so
+    interpreter startup, plugin loading and conftest imports are paid once
+    per shard. With persistent_workers=False each test gets its own
+    ``pytest -k`` subprocess.
+
+    Durations of passed and failed tests are recorded in a DurationHistory
+    after every run, which TestSharding and execute_dynamic use as the
+    tests' estimated durations next time.
     """
 
-    def __init__(self, max_workers: int = 4, pytest_args: List[str] = None):
+    # Seconds a single test may run before its worker is killed
+    TEST_TIMEOUT = 300
+
+    # Seconds a device worker waits for a device lease
+    DEVICE_LEASE_TIMEOUT = 600
+
+    # Precedence when several pytest results make up one TestCase
+    STATUS_PRECEDENCE = [TestStatus.ERROR, TestStatus.FAILED, TestStatus.PASSED, TestStatus.SKIPPED]
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        pytest_args: List[str] = None,
+        persistent_workers: bool = True,
+        batch_size: int = 50,
+        history_path: Optional[Path] = DEFAULT_HISTORY_PATH,
+    ):
         """
         Initialize parallel executor
 
         Args:
             max_workers: Maximum number of parallel workers
             pytest_args: Additional arguments for pytest
+            persistent_workers: Run each shard in one long-lived pytest process
+            batch_size: Tests sent to a persistent worker per pytest session
+            history_path: Duration database, relative to the project root; None to disable
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
         self.max_workers = max_workers
         self.pytest_args = pytest_args or []
+        self.persistent_workers = persistent_workers
+        self.batch_size = batch_size
+        self.history_path = history_path
 
     def execute_shards(
         self,
@@ -122,27 +185,457 @@ class ParallelExecutor:
                     if progress_callback:
                         progress_callback(completed, total)
 
+        self._record_durations(results, project_root)
         return sorted(results, key=lambda r: r.shard_id)
 
     def _execute_shard(self, shard: TestShard, project_root: Path) -> ShardResult:
         """Execute a single shard"""
+        if self.persistent_workers:
+            return self._execute_shard_persistent(shard, project_root)
+
         start_time = time.time()
         test_results = []
 
-        # Build pytest command
-        # test_files =  # Unused list(set(test.file for test in shard.tests))
-        # test_names =  # Unused [test.full_name for test in shard.tests]
-
         # Execute tests
         for test in shard.tests:
             result = self._execute_test(test, project_root)
             test_results.append(result)
 
-        total_duration = time.time() - start_time
+        end_time = time.time()
+
+        return ShardResult(
+            shard_id=shard.shard_id,
+            test_results=test_results,
+            total_duration=end_time - start_time,
+            started_at=start_time,
+            finished_at=end_time,
+        )
+
+    def _execute_shard_persistent(self, shard: TestShard, project_root: Path) -> ShardResult:
+        """Execute a shard in one persistent pytest worker"""
+        start_time = time.time()
+
+        worker = PytestWorker(project_root)
+        try:
+            test_results = self._run_in_worker(worker, shard.tests, project_root)
+        finally:
+            worker.close()
+        end_time = time.time()
+
+        return ShardResult(
+            shard_id=shard.shard_id,
+            test_results=test_results,
+            total_duration=end_time - start_time,
+            worker_id=f"pytest-worker-{worker.pid}" if worker.pid else None,
+            started_at=start_time,
+            finished_at=end_time,
+        )
+
+    def _run_in_worker(self, worker: PytestWorker, tests: List[TestCase], project_root: Path) -> List[ExecutionResult]:
+        """Run tests in batches on a persistent worker, (re)starting it after a crash or timeout"""
+        results: Dict[int, ExecutionResult] = {}
+        batches = [list(range(i, min(i + self.batch_size, len(tests)))) for i in range(0, len(tests), self.batch_size)]
+
+        while batches:
+            batch = batches.pop(0)
+
+            if not worker.alive:
+                try:
+                    worker.close()
+                    worker.start()
+                except (WorkerError, OSError) as e:
+                    worker.kill()
+                    for index in batch + [i for b in batches for i in b]:
+                        results[index] = ExecutionResult(
+                            test=tests[index],
+                            status=TestStatus.ERROR,
+                            duration=0.0,
+                            error_message=f"Worker failed to start: {e}",
+                        )
+                    break
+
+            finished, retry = self._run_batch(worker, [tests[i] for i in batch], project_root)
+            for position, result in finished.items():
+                results[batch[position]] = result
+            # Retried sub-batches run next, before the remaining tests
+            batches[:0] = [[batch[position] for position in positions] for positions in retry]
+
+        return [results[i] for i in range(len(tests))]
+
+    def execute_dynamic(
+        self,
+        tests: List[TestCase],
+        project_root: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[ShardResult]:
+        """
+        Execute tests with dynamic scheduling instead of fixed shards
+
+        Workers pull chunks from a shared WorkQueue ordered by
+        estimated_duration, longest first; a worker that runs out of work
+        takes over whatever is left, so no worker idles while another still
+        has a backlog. Returns one ShardResult per worker.
+
+        Args:
+            tests: Tests to execute
+            project_root: Project root directory
+            progress_callback: Callback for progress updates (completed tests, total tests)
+        """
+        workers = min(self.max_workers, len(tests))
+        if not workers:
+            return []
+
+        if self.history_path is not None:
+            TestSharding(history_path=Path(project_root) / self.history_path).apply_duration_history(tests)
+
+        work = WorkQueue(tests, workers, max_chunk=self.batch_size if self.persistent_workers else 1)
+        lock = threading.Lock()
+        completed = [0]
+
+        def on_chunk_done(count: int):
+            if progress_callback:
+                with lock:
+                    completed[0] += count
+                    progress_callback(completed[0], len(tests))
+
+        results = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_worker = {
+                executor.submit(self._execute_dynamic_worker, worker_index, work, project_root, on_chunk_done): (
+                    worker_index
+                )
+                for worker_index in range(workers)
+            }
+            for future in concurrent.futures.as_completed(future_to_worker):
+                worker_index = future_to_worker[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"Worker {worker_index} failed with exception: {e}")
+                    results.append(ShardResult(shard_id=worker_index, test_results=[], total_duration=0))
+
+        self._record_durations(results, project_root)
+        return sorted(results, key=lambda r: r.shard_id)
+
+    def _record_durations(self, shard_results: List[ShardResult], project_root: Path):
+        """Add the run's test durations to the duration history"""
+        if self.history_path is None:
+            return
+
+        # Skipped and errored tests did not run their body; their durations mislead
+        durations = [
+            (result.test.full_name, result.duration)
+            for shard_result in shard_results
+            for result in shard_result.test_results
+            if result.status in (TestStatus.PASSED, TestStatus.FAILED)
+        ]
+        try:
+            with DurationHistory(Path(project_root) / self.history_path) as history:
+                history.record(durations)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not update test duration history: {e}")
+
+    def _execute_dynamic_worker(
+        self,
+        worker_index: int,
+        work: WorkQueue,
+        project_root: Path,
+        on_chunk_done: Callable[[int], None],
+        env: Optional[Dict[str, str]] = None,
+    ) -> ShardResult:
+        """Pull and run chunks until the queue is drained"""
+        start_time = time.time()
+        test_results: List[ExecutionResult] = []
+        worker = PytestWorker(project_root, env=env) if self.persistent_workers else None
+
+        try:
+            chunk = work.take()
+            while chunk:
+                if worker:
+                    test_results.extend(self._run_in_worker(worker, chunk, project_root))
+                else:
+                    test_results.extend(self._execute_test(test, project_root, env) for test in chunk)
+                on_chunk_done(len(chunk))
+                chunk = work.take()
+        finally:
+            if worker:
+                worker.close()
+
+        end_time = time.time()
+        worker_id = f"pytest-worker-{worker.pid}" if worker and worker.pid else f"worker-{worker_index}"
+        return ShardResult(
+            shard_id=worker_index,
+            test_results=test_results,
+            total_duration=end_time - start_time,
+            worker_id=worker_id,
+            started_at=start_time,
+            finished_at=end_time,
+        )
+
+    def execute_on_devices(
+        self,
+        tests: List[TestCase],
+        project_root: Path,
+        device_pool: DevicePool,
+        device_filters: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        lease_timeout: Optional[float] = None,
+    ) -> List[ShardResult]:
+        """
+        Execute tests with every worker bound to a device leased from a DevicePool
+
+        One worker runs per matching device (at most max_workers). Each
+        worker leases a device, pulls tests from a shared WorkQueue as in
+        execute_dynamic and runs them against its device (see
+        device_environment), then returns the device. Results carry the
+        device and how long the lease took; aggregate_results reports lease
+        wait and device utilization.
 
-        return ShardResult(shard_id=shard.shard_id, test_results=test_results, total_duration=total_duration)
+        Args:
+            tests: Tests to execute
+            project_root: Project root directory
+            device_pool: Pool to lease devices from
+            device_filters: DevicePool filters (platform, type, model, min_version)
+            progress_callback: Callback for progress updates (completed tests, total tests)
+            lease_timeout: Max seconds a worker waits for a device (default DEVICE_LEASE_TIMEOUT)
+
+        Raises:
+            RuntimeError: If no device in the pool matches the filters
+        """
+        if not tests:
+            return []
+
+        devices = device_pool.count_devices(device_filters)
+        if not devices:
+            raise RuntimeError(f"No devices in pool '{device_pool.name}' match {device_filters or 'any'}")
+
+        if self.history_path is not None:
+            TestSharding(history_path=Path(project_root) / self.history_path).apply_duration_history(tests)
+
+        workers = min(self.max_workers, len(tests), devices)
+        work = WorkQueue(tests, workers, max_chunk=self.batch_size if self.persistent_workers else 1)
+        lease_timeout = self.DEVICE_LEASE_TIMEOUT if lease_timeout is None else lease_timeout
+        lock = threading.Lock()
+        completed = [0]
+
+        def on_chunk_done(count: int):
+            if progress_callback:
+                with lock:
+                    completed[0] += count
+                    progress_callback(completed[0], len(tests))
+
+        results = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_worker = {
+                executor.submit(
+                    self._execute_device_worker,
+                    worker_index,
+                    work,
+                    project_root,
+                    on_chunk_done,
+                    device_pool,
+                    device_filters,
+                    lease_timeout,
+                ): worker_index
+                for worker_index in range(workers)
+            }
+            for future in concurrent.futures.as_completed(future_to_worker):
+                worker_index = future_to_worker[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"Device worker {worker_index} failed with exception: {e}")
+                    results.append(ShardResult(shard_id=worker_index, test_results=[], total_duration=0))
+
+        # Left over only when no worker got a device in time
+        unscheduled = []
+        chunk = work.take()
+        while chunk:
+            unscheduled.extend(
+                ExecutionResult(
+                    test=test,
+                    status=TestStatus.ERROR,
+                    duration=0.0,
+                    error_message=f"No device leased within {lease_timeout:.0f}s",
+                )
+                for test in chunk
+            )
+            chunk = work.take()
+        if unscheduled:
+            on_chunk_done(len(unscheduled))
+            results.append(
+                ShardResult(shard_id=workers, test_results=unscheduled, total_duration=0, worker_id="unscheduled")
+            )
+
+        self._record_durations(results, project_root)
+        return sorted(results, key=lambda r: r.shard_id)
+
+    def _execute_device_worker(
+        self,
+        worker_index: int,
+        work: WorkQueue,
+        project_root: Path,
+        on_chunk_done: Callable[[int], None],
+        device_pool: DevicePool,
+        device_filters: Optional[Dict[str, Any]],
+        lease_timeout: float,
+    ) -> ShardResult:
+        """Lease a device, run tests from the queue on it, return it"""
+        start_time = time.time()
+        # Blocks until another worker (or pool user) releases a matching device
+        device = device_pool.acquire(device_filters, timeout=lease_timeout) if len(work) else None
+        lease_wait = time.time() - start_time
 
-    def _execute_test(self, test: TestCase, project_root: Path) -> ExecutionResult:
+        if device is None:
+            return ShardResult(shard_id=worker_index, test_results=[], total_duration=0, lease_wait=lease_wait)
+
+        try:
+            result = self._execute_dynamic_worker(
+                worker_index, work, project_root, on_chunk_done, env=device_environment(device)
+            )
+        finally:
+            device_pool.release_device(device.id)
+
+        result.device_id = device.id
+        result.lease_wait = lease_wait
+        return result
+
+    def _run_batch(
+        self, worker: PytestWorker, batch: List[TestCase], project_root: Path
+    ) -> Tuple[Dict[int, ExecutionResult], List[List[int]]]:
+        """
+        Run one batch in a persistent worker
+
+        Returns:
+            (results by position in batch, sub-batches of positions to run again)
+        """
+        locate = self._test_locator(batch, project_root)
+        messages: Dict[int, List[Dict[str, Any]]] = {}
+        current = None
+        exit_code = None
+
+        try:
+            node_ids = [self._node_id(test) for test in batch]
+            for message in worker.run(node_ids, ["--tb=short"] + self.pytest_args, timeout=self.TEST_TIMEOUT):
+                event = message.get("event")
+                if event == "start":
+                    current = message
+                elif event == "result":
+                    position = locate(message)
+                    if position is not None:
+                        messages.setdefault(position, []).append(message)
+                    current = None
+                elif event == "done":
+                    exit_code = message.get("exit_code")
+
+        except WorkerError as e:
+            # The worker hung or died: blame the running test, rerun the rest
+            worker.kill()
+            failed = locate(current) if current else None
+            finished = {
+                position: self._combine_results(batch[position], reported)
+                for position, reported in messages.items()
+                if position != failed
+            }
+            remaining = [position for position in range(len(batch)) if position not in finished and position != failed]
+
+            if failed is not None:
+                timed_out = isinstance(e, WorkerTimeout)
+                finished[failed] = ExecutionResult(
+                    test=batch[failed],
+                    status=TestStatus.ERROR,
+                    duration=self.TEST_TIMEOUT if timed_out else sum(m["duration"] for m in messages.get(failed, [])),
+                    error_message=(
+                        f"Test timeout ({self.TEST_TIMEOUT}s)" if timed_out else f"Worker crashed during test: {e}"
+                    ),
+                )
+                return finished, [remaining] if remaining else []
+
+            if len(remaining) == 1:
+                finished[remaining[0]] = ExecutionResult(
+                    test=batch[remaining[0]],
+                    status=TestStatus.ERROR,
+                    duration=0.0,
+                    error_message=f"Execution error: {e}",
+                )
+                return finished, []
+            # Crashed outside any test (e.g. while collecting): isolate the culprit
+            return finished, [[position] for position in remaining]
+
+        finished = {
+            position: self._combine_results(batch[position], reported) for position, reported in messages.items()
+        }
+        missing = [position for position in range(len(batch)) if position not in finished]
+
+        if missing and len(batch) > 1 and exit_code not in (0, 1, 5):
+            # Usage or collection errors (e.g. a node ID not found) abort the whole session
+            return finished, [[position] for position in missing]
+
+        log_tail = worker.log_tail() if missing and exit_code not in (0, 1, 5) else ""
+        for position in missing:
+            # Nothing collected for this test, like `pytest -k` exiting with code 5
+            if exit_code in (0, 1, 5) or "ERROR: not found:" in log_tail:
+                finished[position] = ExecutionResult(
+                    test=batch[position], status=TestStatus.SKIPPED, duration=0.0, error_message="No tests collected"
+                )
+            else:
+                finished[position] = ExecutionResult(
+                    test=batch[position],
+                    status=TestStatus.FAILED,
+                    duration=0.0,
+                    output=log_tail,
+                    error_message=f"pytest exited with code {exit_code}",
+                )
+
+        return finished, []
+
+    @staticmethod
+    def _node_id(test: TestCase) -> str:
+        """pytest node ID of a test; a TestCase named after its file's stem means the whole file"""
+        if test.name == test.file.stem:
+            return str(test.file)
+        return f"{test.file}::{test.name}"
+
+    def _test_locator(self, batch: List[TestCase], project_root: Path) -> Callable[[Dict[str, Any]], Optional[int]]:
+        """Map a worker message (absolute path and name of a pytest item) to a position in batch"""
+        by_file: Dict[str, List[int]] = {}
+        for position, test in enumerate(batch):
+            by_file.setdefault(os.path.realpath(project_root / test.file), []).append(position)
+
+        def locate(message: Dict[str, Any]) -> Optional[int]:
+            name = message.get("name", "")
+            for position in by_file.get(message.get("path") or "", ()):
+                test = batch[position]
+                if (
+                    test.name == test.file.stem
+                    or name == test.name
+                    or name.startswith(test.name + "[")  # Parametrized
+                    or name.startswith(test.name + "::")  # Test class
+                ):
+                    return position
+            return None
+
+        return locate
+
+    def _combine_results(self, test: TestCase, reported: List[Dict[str, Any]]) -> ExecutionResult:
+        """One ExecutionResult from the pytest results of a TestCase (several for files or parametrized tests)"""
+        statuses = [TestStatus(message["status"]) for message in reported]
+        status = min(statuses, key=self.STATUS_PRECEDENCE.index)
+        error_message = next(
+            (m["error_message"] for m, s in zip(reported, statuses) if s == status and m["error_message"]), None
+        )
+
+        return ExecutionResult(
+            test=test,
+            status=status,
+            duration=sum(message["duration"] for message in reported),
+            output="".join(message["output"] for message in reported),
+            error_message=error_message if status != TestStatus.PASSED else None,
+        )
+
+    def _execute_test(
+        self, test: TestCase, project_root: Path, env: Optional[Dict[str, str]] = None
+    ) -> ExecutionResult:
         """Execute a single test"""
         start_time = time.time()
 
@@ -151,7 +644,12 @@ class ParallelExecutor:
 
         try:
             result = subprocess.run(
-                cmd, cwd=project_root, capture_output=True, text=True, timeout=300  # 5 minute timeout per test
+                cmd,
+                cwd=project_root,
+                capture_output=True,
+                text=True,
+                timeout=300,  # 5 minute timeout per test
+                env={**os.environ, **env} if env else None,
             )
 
             duration = time.time() - start_time
@@ -206,6 +704,77 @@ class ParallelExecutor:
             "total_duration": total_duration,
             "pass_rate": (passed / len(all_results) * 100) if all_results else 0,
             "parallelization_speedup": self._calculate_speedup(all_results, total_duration),
+            **self._load_balance(shard_results, all_results),
+            **self._device_usage(shard_results),
+        }
+
+    def _load_balance(self, shard_results: List[ShardResult], results: List[ExecutionResult]) -> Dict[str, float]:
+        """
+        Observed balance of the run, over shards that executed tests
+
+        Empty shards and those that never ran (failed device lease, unscheduled
+        tests) are left out.
+
+        - makespan: wall time from the first shard start to the last shard
+          finish; without timestamps, the busiest worker when shards are
+          handed to max_workers workers in order
+        - makespan_lower_bound: no schedule of the observed test durations on
+          this many workers finishes sooner than max(total / workers, longest test)
+        - makespan_ratio: makespan / makespan_lower_bound (1.0 is optimal)
+        - imbalance_ratio: (longest - shortest shard) / mean shard duration
+        """
+        executed = [sr for sr in shard_results if sr.test_results and sr.total_duration > 0]
+        if not executed:
+            return {"makespan": 0.0, "makespan_lower_bound": 0.0, "makespan_ratio": 1.0, "imbalance_ratio": 0.0}
+
+        durations = [sr.total_duration for sr in executed]
+        workers = min(len(executed), self.max_workers)
+        test_durations = [r.duration for sr in executed for r in sr.test_results]
+        lower_bound = max(sum(test_durations) / workers, max(test_durations, default=0.0))
+        makespan = self._makespan(executed, workers)
+        mean = sum(durations) / len(durations)
+
+        return {
+            "makespan": makespan,
+            "makespan_lower_bound": lower_bound,
+            "makespan_ratio": makespan / lower_bound if lower_bound > 0 else 1.0,
+            "imbalance_ratio": (max(durations) - min(durations)) / mean if mean > 0 else 0.0,
+        }
+
+    @staticmethod
+    def _makespan(shard_results: List[ShardResult], workers: int) -> float:
+        """Wall time of the shards, from their timestamps or simulated on workers"""
+        if all(sr.started_at is not None and sr.finished_at is not None for sr in shard_results):
+            return max(sr.finished_at for sr in shard_results) - min(sr.started_at for sr in shard_results)
+
+        # Each shard goes to the first worker to become free, in submission order
+        loads = [0.0] * workers
+        for sr in sorted(shard_results, key=lambda r: r.shard_id):
+            heapq.heapreplace(loads, loads[0] + sr.total_duration)
+        return max(loads)
+
+    def _device_usage(self, shard_results: List[ShardResult]) -> Dict[str, float]:
+        """
+        Device lease statistics of an execute_on_devices run (empty otherwise)
+
+        - devices_used: devices leased by a worker
+        - lease_wait_total / lease_wait_max: seconds workers waited for a lease
+        - device_utilization: share of the run's wall time (lease wait plus
+          longest worker) that leased devices spent running tests
+        """
+        leased = [sr for sr in shard_results if sr.device_id]
+        if not leased:
+            return {}
+
+        wall_time = max(sr.lease_wait + sr.total_duration for sr in shard_results)
+        busy = sum(r.duration for sr in leased for r in sr.test_results)
+        waits = [sr.lease_wait for sr in shard_results]
+
+        return {
+            "devices_used": len(leased),
+            "lease_wait_total": sum(waits),
+            "lease_wait_max": max(waits),
+            "device_utilization": busy / (len(leased) * wall_time) if wall_time > 0 else 0.0,
         }
 
     def _calculate_speedup(self, results: List[ExecutionResult], parallel_duration: float) -> float:
@@ -232,7 +801,18 @@ class ParallelExecutor:
         summary += "\n"
         summary += f"Total Duration:  {aggregated['total_duration']:.2f}s\n"
         summary += f"Speedup:         {aggregated['parallelization_speedup']:.2f}x\n"
+        summary += (
+            f"Makespan:        {aggregated['makespan']:.2f}s "
+            f"(lower bound {aggregated['makespan_lower_bound']:.2f}s, {aggregated['makespan_ratio']:.2f}x)\n"
+        )
+        summary += f"Imbalance:       {aggregated['imbalance_ratio'] * 100:.1f}%\n"
         summary += f"Workers Used:    {len(shard_results)}\n"
+        if "devices_used" in aggregated:
+            summary += (
+                f"Devices:         {aggregated['devices_used']} leased, "
+                f"{aggregated['device_utilization'] * 100:.1f}% utilized, "
+                f"lease wait {aggregated['lease_wait_total']:.2f}s total / {aggregated['lease_wait_max']:.2f}s max\n"
+            )
         summary += "\n"
 
         # Per-shard breakdown
@@ -240,7 +820,8 @@ class ParallelExecutor:
         for shard_result in shard_results:
             summary += f"  Shard {shard_result.shard_id}: "
             summary += f"{shard_result.passed_count}/{shard_result.total_count} passed, "
-            summary += f"{shard_result.total_duration:.2f}s\n"
+            summary += f"{shard_result.total_duration:.2f}s"
+            summary += f" on {shard_result.device_id}\n" if shard_result.device_id else "\n"
 
         summary += "\n" + "=" * 80 + "\n"
 
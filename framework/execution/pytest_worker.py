@@ -0,0 +1,288 @@
+"""
+Persistent pytest worker
+
+A long-lived pytest process that runs batches of test node IDs in-process,
+so interpreter startup, plugin loading, conftest and test module imports
+are paid once per worker instead of once per test.
+
+Protocol: JSON lines. The parent writes ``{"node_ids": [...], "args": [...]}``
+to the worker's stdin; the worker answers on its original stdout with
+``{"event": "start", "node_id": ...}`` and ``{"event": "result", ...}`` per
+test and ``{"event": "done", "exit_code": ...}`` per batch. Everything else
+the tests or pytest print goes to the worker's stderr.
+
+Run as: python -m framework.execution.pytest_worker
+"""
+
+import json
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+# Importable framework package for workers started outside the repository
+FRAMEWORK_ROOT = Path(__file__).resolve().parents[2]
+
+
+class WorkerError(Exception):
+    """The worker process crashed or broke the protocol"""
+
+
+class WorkerTimeout(WorkerError):
+    """The worker produced no message within the timeout (a test hung)"""
+
+
+class _ResultReporter:
+    """pytest plugin that streams one result per test over the protocol pipe"""
+
+    def __init__(self, channel: TextIO):
+        self.channel = channel
+        self._paths: Dict[str, str] = {}
+        self._reports: Dict[str, List[Any]] = {}
+
+    def _send(self, event: str, nodeid: str, **fields: Any):
+        # Node IDs are relative to pytest's rootdir; the absolute path and the
+        # name part let the parent map results back to what it asked for
+        message = {
+            "event": event,
+            "node_id": nodeid,
+            "path": self._paths.get(nodeid),
+            "name": nodeid.split("::", 1)[1] if "::" in nodeid else "",
+            **fields,
+        }
+        self.channel.write(json.dumps(message) + "\n")
+        self.channel.flush()
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        for item in items:
+            self._paths[item.nodeid] = os.path.realpath(str(getattr(item, "path", None) or item.fspath))
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self._reports[nodeid] = []
+        self._send("start", nodeid)
+
+    def pytest_runtest_logreport(self, report):
+        self._reports.setdefault(report.nodeid, []).append(report)
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        reports = self._reports.pop(nodeid, [])
+        self._send("result", nodeid, **summarize_reports(reports))
+
+
+def summarize_reports(reports: List[Any]) -> Dict[str, Any]:
+    """Collapse the setup/call/teardown reports of one test into a single result"""
+    status = "passed"
+    error_message = None
+
+    for report in reports:
+        if report.failed:
+            # Failures outside the test body are errors, as pytest reports them
+            status = "failed" if report.when == "call" else "error"
+            error_message = report.longreprtext
+            break
+        if report.skipped:
+            status = "skipped"
+            error_message = getattr(report, "wasxfail", None) or _skip_reason(report)
+
+    # Each phase's report also carries the output captured in earlier phases
+    output = reports[-1].capstdout + reports[-1].capstderr if reports else ""
+    return {
+        "status": status,
+        "duration": sum(report.duration for report in reports),
+        "output": output,
+        "error_message": error_message,
+    }
+
+
+def _skip_reason(report: Any) -> str:
+    """Reason of a skipped report (longrepr is a (path, line, reason) tuple)"""
+    if isinstance(report.longrepr, tuple) and len(report.longrepr) == 3:
+        return str(report.longrepr[2])
+    return report.longreprtext
+
+
+def main() -> int:
+    """Worker loop: run each batch read from stdin until EOF"""
+    import pytest
+
+    # Keep the real stdout for the protocol; anything printed goes to stderr
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), "w", buffering=1)
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    channel.write(json.dumps({"event": "ready", "pid": os.getpid()}) + "\n")
+    channel.flush()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+
+        exit_code = pytest.main(
+            list(request["node_ids"]) + list(request.get("args", [])), plugins=[_ResultReporter(channel)]
+        )
+        channel.write(json.dumps({"event": "done", "exit_code": int(exit_code)}) + "\n")
+        channel.flush()
+
+    return 0
+
+
+class PytestWorker:
+    """
+    Parent-side handle of a persistent pytest worker process
+
+    Usage:
+        with PytestWorker(project_root) as worker:
+            for message in worker.run(["tests/test_login.py::test_ok"], ["--tb=short"]):
+                ...
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        python: Optional[str] = None,
+        startup_timeout: float = 60.0,
+        env: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            project_root: Directory pytest runs in (rootdir, conftest lookup)
+            python: Interpreter for the worker (default: the current one)
+            startup_timeout: Seconds to wait for the worker to come up
+            env: Extra environment variables for the worker (e.g. the leased device)
+        """
+        self.project_root = Path(project_root)
+        self.python = python or sys.executable
+        self.startup_timeout = startup_timeout
+        self.env = env or {}
+
+        self.process: Optional[subprocess.Popen] = None
+        self.pid: Optional[int] = None
+        self._messages: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._log: Optional[Any] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """Launch the worker and wait until it is ready"""
+        env = {**os.environ, **self.env}
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(FRAMEWORK_ROOT), env.get("PYTHONPATH")]))
+        env["PYTHONUNBUFFERED"] = "1"
+
+        self._log = tempfile.TemporaryFile()
+        self._messages = queue.Queue()
+        self.process = subprocess.Popen(
+            [self.python, "-m", "framework.execution.pytest_worker"],
+            cwd=self.project_root,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._log,
+            text=True,
+        )
+        threading.Thread(target=self._read_messages, args=(self.process.stdout, self._messages), daemon=True).start()
+
+        ready = self._next_message(self.startup_timeout)
+        if ready.get("event") != "ready":
+            raise WorkerError(f"Unexpected worker greeting: {ready}")
+        self.pid = ready["pid"]
+
+    @staticmethod
+    def _read_messages(stream: TextIO, messages: "queue.Queue[Optional[Dict[str, Any]]]"):
+        """Reader thread: decode protocol lines; None marks end of stream"""
+        try:
+            for line in stream:
+                try:
+                    messages.put(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # Not a protocol line
+        except (OSError, ValueError):
+            pass  # Pipe closed under us
+        finally:
+            messages.put(None)
+
+    def _next_message(self, timeout: Optional[float]) -> Dict[str, Any]:
+        try:
+            message = self._messages.get(timeout=timeout)
+        except queue.Empty:
+            raise WorkerTimeout(f"Worker produced no result within {timeout:.0f}s")
+        if message is None:
+            raise WorkerError(f"Worker exited unexpectedly\n{self.log_tail()}")
+        return message
+
+    def run(self, node_ids: List[str], args: List[str], timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Run a batch of node IDs, yielding protocol messages as they arrive
+
+        Yields "start" and "result" messages, then the final "done" message.
+
+        Args:
+            node_ids: pytest node IDs
+            args: Extra pytest arguments
+            timeout: Max seconds between two messages (one test), None to wait forever
+
+        Raises:
+            WorkerTimeout: If no message arrives within timeout; the worker must be killed
+            WorkerError: If the worker dies
+        """
+        if not self.alive:
+            raise WorkerError("Worker is not running")
+
+        self.process.stdin.write(json.dumps({"node_ids": node_ids, "args": args}) + "\n")
+        self.process.stdin.flush()
+
+        while True:
+            message = self._next_message(timeout)
+            yield message
+            if message.get("event") == "done":
+                return
+
+    def log_tail(self, limit: int = 2000) -> str:
+        """Last output of the worker's stderr (pytest and test output)"""
+        if self._log is None:
+            return ""
+        size = self._log.seek(0, os.SEEK_END)
+        self._log.seek(max(0, size - limit))
+        return self._log.read().decode("utf-8", errors="replace")
+
+    def close(self, timeout: float = 5.0):
+        """Stop the worker (close stdin, then terminate if it does not exit)"""
+        if self.process is not None:
+            try:
+                if self.process.poll() is None:
+                    self.process.stdin.close()
+                    try:
+                        self.process.wait(timeout=timeout)
+                    except subprocess.TimeoutExpired:
+                        self.kill()
+            except OSError:
+                self.kill()
+            self.process.stdout.close()
+            self.process = None
+
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def kill(self):
+        """Kill the worker immediately"""
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
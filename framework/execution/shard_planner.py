@@ -0,0 +1,187 @@
+"""
+Shard planner
+
+Partitions weighted items into a fixed number of shards with a small
+makespan (the load of the heaviest shard). An item is a single test, or a
+whole file when the tests of a file must run in the same shard.
+
+Planning runs in two passes:
+- LPT: items longest first, each onto the least-loaded shard (a heap of
+  shard loads, O(n log k) instead of a scan over all shards per item)
+- Refinement: local search on the heaviest shard. Its items and those of
+  the lightest shard are re-split with Karmarkar-Karp differencing; when
+  that does not help, the best move or pairwise swap with another shard
+  is applied. Every step strictly reduces the sum of squared loads, so
+  the search terminates.
+"""
+
+import heapq
+import itertools
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Tuple
+
+# Load differences below this are considered balanced
+EPSILON = 1e-9
+
+
+def plan_shards(weights: Sequence[float], num_shards: int, max_rounds: Optional[int] = None) -> List[int]:
+    """
+    Shard of every item (LPT plus refinement)
+
+    Args:
+        weights: Item weights (estimated durations)
+        num_shards: Number of shards
+        max_rounds: Cap on refinement steps (default: 8 per shard)
+
+    Returns:
+        Shard index per item
+    """
+    assignment = lpt_assign(weights, num_shards)
+    return refine_assignment(weights, assignment, num_shards, max_rounds=max_rounds)
+
+
+def lpt_assign(weights: Sequence[float], num_shards: int) -> List[int]:
+    """Longest-processing-time-first assignment; ties go to the lowest shard index"""
+    if num_shards <= 0:
+        raise ValueError("num_shards must be positive")
+
+    assignment = [0] * len(weights)
+    heap = [(0.0, shard) for shard in range(num_shards)]
+    for item in sorted(range(len(weights)), key=lambda i: -weights[i]):
+        load, shard = heap[0]
+        assignment[item] = shard
+        heapq.heapreplace(heap, (load + weights[item], shard))
+
+    return assignment
+
+
+def refine_assignment(
+    weights: Sequence[float],
+    assignment: Sequence[int],
+    num_shards: int,
+    max_rounds: Optional[int] = None,
+    tolerance: float = 0.0,
+) -> List[int]:
+    """
+    Improve an assignment by local search on the heaviest shard
+
+    Args:
+        weights: Item weights
+        assignment: Shard index per item
+        num_shards: Number of shards
+        max_rounds: Cap on refinement steps (default: 8 per shard)
+        tolerance: Stop once heaviest - lightest load is within this
+
+    Returns:
+        Refined shard index per item
+    """
+    assignment = list(assignment)
+    members: List[List[int]] = [[] for _ in range(num_shards)]
+    loads = [0.0] * num_shards
+    for item, shard in enumerate(assignment):
+        members[shard].append(item)
+        loads[shard] += weights[item]
+
+    for _ in range(max_rounds if max_rounds is not None else 8 * num_shards):
+        heavy = max(range(num_shards), key=loads.__getitem__)
+        light = min(range(num_shards), key=loads.__getitem__)
+        if loads[heavy] - loads[light] <= max(tolerance, EPSILON):
+            break
+
+        if not _resplit_pair(weights, members, loads, heavy, light) and not _best_exchange(
+            weights, members, loads, heavy
+        ):
+            break  # Local optimum
+
+    for shard, items in enumerate(members):
+        for item in items:
+            assignment[item] = shard
+    return assignment
+
+
+def karmarkar_karp(weights: Sequence[float], items: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """
+    Two-way split of items by the largest differencing method
+
+    The two largest remaining differences are repeatedly committed to
+    opposite sides, which leaves a much smaller final difference than
+    greedy assignment.
+
+    Returns:
+        (heavier side, lighter side)
+    """
+    counter = itertools.count()
+    # (-difference, tiebreak, heavier side, lighter side)
+    heap = [(-weights[item], next(counter), [item], []) for item in items]
+    heapq.heapify(heap)
+
+    while len(heap) > 1:
+        diff1, _, heavy1, light1 = heapq.heappop(heap)
+        diff2, _, heavy2, light2 = heapq.heappop(heap)
+        # Put the heavy side of the second against the heavy side of the first
+        heapq.heappush(heap, (diff1 - diff2, next(counter), heavy1 + light2, light1 + heavy2))
+
+    if not heap:
+        return [], []
+    _, _, heavy, light = heap[0]
+    return heavy, light
+
+
+def _resplit_pair(weights: Sequence[float], members: List[List[int]], loads: List[float], heavy: int, light: int):
+    """Re-split the items of two shards with Karmarkar-Karp if it lowers the heavier one"""
+    side_a, side_b = karmarkar_karp(weights, members[heavy] + members[light])
+    load_a = sum(weights[item] for item in side_a)
+    load_b = sum(weights[item] for item in side_b)
+
+    if max(load_a, load_b) >= loads[heavy] - EPSILON:
+        return False
+
+    members[heavy], members[light] = side_a, side_b
+    loads[heavy], loads[light] = load_a, load_b
+    return True
+
+
+def _best_exchange(weights: Sequence[float], members: List[List[int]], loads: List[float], heavy: int) -> bool:
+    """
+    Move one item off the heaviest shard, or swap it for a lighter one
+
+    Shards are tried lightest first; within a shard the exchange that
+    brings both loads closest to their mean is applied.
+    """
+    heavy_items = members[heavy]
+
+    for other in sorted(range(len(loads)), key=loads.__getitem__):
+        gap = loads[heavy] - loads[other]
+        if other == heavy or gap <= EPSILON:
+            break
+
+        # (weight, item) of the other shard; (0, None) stands for a plain move
+        candidates = sorted([(weights[item], item) for item in members[other]] + [(0.0, None)], key=lambda c: c[0])
+        candidate_weights = [weight for weight, _ in candidates]
+
+        best = None  # (distance from gap / 2, position in heavy, candidate)
+        for position, item in enumerate(heavy_items):
+            # Exchanging weight a for b moves a - b; ideal is gap / 2
+            target = weights[item] - gap / 2
+            index = bisect_left(candidate_weights, target)
+            for candidate in candidates[max(0, index - 1) : index + 1]:
+                delta = weights[item] - candidate[0]
+                if EPSILON < delta < gap - EPSILON:
+                    distance = abs(delta - gap / 2)
+                    if best is None or distance < best[0]:
+                        best = (distance, position, candidate)
+
+        if best is not None:
+            _, position, (weight, swapped) = best
+            item = heavy_items.pop(position)
+            members[other].append(item)
+            loads[heavy] -= weights[item]
+            loads[other] += weights[item]
+            if swapped is not None:
+                members[other].remove(swapped)
+                heavy_items.append(swapped)
+                loads[heavy] += weight
+                loads[other] -= weight
+            return True
+
+    return False
@@ -8,7 +8,10 @@ import hashlib
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from .duration_history import DEFAULT_HISTORY_PATH, DurationHistory
+from .shard_planner import plan_shards, refine_assignment
 
 
 class ShardStrategy(Enum):
@@ -58,15 +61,35 @@ class TestSharding:
     Divides tests into balanced shards for parallel execution
     """
 
-    def __init__(self, duration_history: Dict[str, float] = None):
+    def __init__(self, duration_history: Dict[str, float] = None, history_path: Optional[Path] = DEFAULT_HISTORY_PATH):
         """
         Initialize test sharding
 
         Args:
             duration_history: Historical test durations (test_name -> seconds)
+            history_path: Duration database loaded when duration_history is not
+                given (written by ParallelExecutor); None to skip
         """
+        if duration_history is None and history_path is not None:
+            with DurationHistory(history_path) as history:
+                duration_history = history.estimates()
         self.duration_history = duration_history or {}
 
+    def apply_duration_history(self, tests: List[TestCase]) -> int:
+        """
+        Set estimated_duration of tests from the duration history
+
+        Returns:
+            Number of tests with a historical duration
+        """
+        updated = 0
+        for test in tests:
+            historical_duration = self.duration_history.get(test.full_name)
+            if historical_duration:
+                test.estimated_duration = historical_duration
+                updated += 1
+        return updated
+
     def create_shards(
         self, tests: List[TestCase], num_shards: int, strategy: ShardStrategy = ShardStrategy.DURATION_BASED
     ) -> List[TestShard]:
@@ -84,6 +107,8 @@ class TestSharding:
         if num_shards <= 0:
             raise ValueError("num_shards must be positive")
 
+        self.apply_duration_history(tests)
+
         if num_shards >= len(tests):
             # One test per shard
             return [TestShard(shard_id=i, total_shards=num_shards, tests=[test]) for i, test in enumerate(tests)]
@@ -110,46 +135,31 @@ class TestSharding:
         return shards
 
     def _shard_by_file(self, tests: List[TestCase], num_shards: int) -> List[TestShard]:
-        """Group tests by file, distribute files across shards"""
-        # Group tests by file
+        """Group tests by file, balance files across shards (a file never spans shards)"""
         by_file: Dict[Path, List[TestCase]] = {}
         for test in tests:
-            if test.file not in by_file:
-                by_file[test.file] = []
-            by_file[test.file].append(test)
+            by_file.setdefault(test.file, []).append(test)
 
-        # Sort files by total estimated duration (descending)
-        files_sorted = sorted(by_file.items(), key=lambda x: sum(t.estimated_duration for t in x[1]), reverse=True)
-
-        # Initialize shards
-        shards = [TestShard(shard_id=i, total_shards=num_shards, tests=[]) for i in range(num_shards)]
-
-        # Assign files to shards (greedy algorithm - smallest duration first)
-        for file_path, file_tests in files_sorted:
-            # Find shard with smallest current duration
-            shard = min(shards, key=lambda s: s.estimated_duration)
-            shard.tests.extend(file_tests)
-
-        return shards
+        groups = list(by_file.values())
+        return self._fill_shards(groups, plan_shards([self._duration(g) for g in groups], num_shards), num_shards)
 
     def _shard_by_duration(self, tests: List[TestCase], num_shards: int) -> List[TestShard]:
         """Balance shards by estimated duration"""
-        # Update durations from history
-        for test in tests:
-            historical_duration = self.duration_history.get(test.full_name)
-            if historical_duration:
-                test.estimated_duration = historical_duration
+        groups = [[test] for test in tests]
+        return self._fill_shards(
+            groups, plan_shards([test.estimated_duration for test in tests], num_shards), num_shards
+        )
 
-        # Sort tests by duration (descending)
-        tests_sorted = sorted(tests, key=lambda t: t.estimated_duration, reverse=True)
+    @staticmethod
+    def _duration(tests: List[TestCase]) -> float:
+        return sum(test.estimated_duration for test in tests)
 
-        # Initialize shards
+    def _fill_shards(self, groups: List[List[TestCase]], assignment: List[int], num_shards: int) -> List[TestShard]:
+        """Shards from a planner assignment of test groups, longest group first within each shard"""
         shards = [TestShard(shard_id=i, total_shards=num_shards, tests=[]) for i in range(num_shards)]
-
-        # Assign tests to shards (greedy - smallest duration first)
-        for test in tests_sorted:
-            shard = min(shards, key=lambda s: s.estimated_duration)
-            shard.tests.append(test)
+        order = sorted(range(len(groups)), key=lambda i: self._duration(groups[i]), reverse=True)
+        for i in order:
+            shards[assignment[i]].tests.extend(groups[i])
 
         return shards
 
@@ -165,50 +175,53 @@ class TestSharding:
 
         return shards
 
-    def optimize_shards(self, shards: List[TestShard], max_imbalance: float = 0.2) -> List[TestShard]:
+    def optimize_shards(
+        self, shards: List[TestShard], max_imbalance: float = 0.2, keep_files_together: bool = False
+    ) -> List[TestShard]:
         """
         Optimize shard balance by redistributing tests
 
+        Moves and swaps tests (see shard_planner.refine_assignment) until the
+        heaviest and lightest shards are within max_imbalance of the average.
+
         Args:
             shards: List of shards to optimize
             max_imbalance: Maximum acceptable imbalance (0.2 = 20%)
+            keep_files_together: Only move whole files that sit in one shard
 
         Returns:
-            Optimized shards
+            Optimized shards (the same TestShard objects, with new tests)
         """
         if not shards:
             return shards
 
-        # Calculate average duration
-        total_duration = sum(s.estimated_duration for s in shards)
-        avg_duration = total_duration / len(shards)
-
-        # Check if optimization needed
-        max_duration = max(s.estimated_duration for s in shards)
-        min_duration = min(s.estimated_duration for s in shards)
+        durations = [s.estimated_duration for s in shards]
+        avg_duration = sum(durations) / len(shards)
 
-        if avg_duration == 0 or (max_duration - min_duration) / avg_duration <= max_imbalance:
+        if avg_duration == 0 or (max(durations) - min(durations)) / avg_duration <= max_imbalance:
             return shards  # Already balanced
 
-        # Simple rebalancing: move tests from heaviest to lightest
-        # (In production, use more sophisticated algorithms)
-        iterations = 0
-        max_iterations = 100
-
-        while iterations < max_iterations:
-            heaviest = max(shards, key=lambda s: s.estimated_duration)
-            lightest = min(shards, key=lambda s: s.estimated_duration)
-
-            if (heaviest.estimated_duration - lightest.estimated_duration) / avg_duration <= max_imbalance:
-                break
-
-            # Move shortest test from heaviest to lightest
-            if heaviest.tests:
-                test_to_move = min(heaviest.tests, key=lambda t: t.estimated_duration)
-                heaviest.tests.remove(test_to_move)
-                lightest.tests.append(test_to_move)
-
-            iterations += 1
+        groups: List[List[TestCase]] = []
+        assignment: List[int] = []
+        for index, shard in enumerate(shards):
+            if keep_files_together:
+                by_file: Dict[Path, List[TestCase]] = {}
+                for test in shard.tests:
+                    by_file.setdefault(test.file, []).append(test)
+                shard_groups = list(by_file.values())
+            else:
+                shard_groups = [[test] for test in shard.tests]
+            groups.extend(shard_groups)
+            assignment.extend([index] * len(shard_groups))
+
+        assignment = refine_assignment(
+            [self._duration(g) for g in groups], assignment, len(shards), tolerance=max_imbalance * avg_duration
+        )
+
+        for shard in shards:
+            shard.tests = []
+        for group, index in zip(groups, assignment):
+            shards[index].tests.extend(group)
 
         return shards
 
@@ -0,0 +1,64 @@
+"""
+Shared work queue for dynamic test scheduling
+
+Workers pull tests from one queue ordered longest-first instead of running
+a shard fixed in advance, so a worker that finishes early keeps taking the
+remaining work (longest-processing-time-first list scheduling).
+"""
+
+import heapq
+import threading
+from typing import List
+
+from .test_sharding import TestCase
+
+
+class WorkQueue:
+    """
+    Thread-safe longest-first queue of tests
+
+    take() hands out chunks sized by estimated duration (guided
+    self-scheduling): about 1 / (2 * workers) of the remaining estimated
+    work per chunk, so early chunks amortize per-batch overhead while the
+    tail is handed out test by test and workers finish close together.
+    """
+
+    def __init__(self, tests: List[TestCase], workers: int, max_chunk: int = 1):
+        """
+        Args:
+            tests: Tests to schedule (estimated_duration sets the order)
+            workers: Number of workers pulling from the queue
+            max_chunk: Max tests handed out per take()
+        """
+        if workers < 1 or max_chunk < 1:
+            raise ValueError("workers and max_chunk must be >= 1")
+
+        self.workers = workers
+        self.max_chunk = max_chunk
+        # (-duration, insertion order, test): longest first, stable among equals
+        self._heap = [(-test.estimated_duration, i, test) for i, test in enumerate(tests)]
+        heapq.heapify(self._heap)
+        self._remaining = sum(test.estimated_duration for test in tests)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+    def take(self) -> List[TestCase]:
+        """Next chunk of tests, longest first; empty when the queue is drained"""
+        with self._lock:
+            budget = self._remaining / (2 * self.workers)
+            chunk: List[TestCase] = []
+            estimated = 0.0
+
+            while self._heap and len(chunk) < self.max_chunk:
+                duration = -self._heap[0][0]
+                if chunk and estimated + duration > budget:
+                    break
+                _, _, test = heapq.heappop(self._heap)
+                chunk.append(test)
+                estimated += duration
+
+            self._remaining -= estimated
+            return chunk
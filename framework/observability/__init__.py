@@ -5,6 +5,10 @@ Metrics collection, structured logging, and distributed tracing.
 """
 
 from framework.observability.metrics import (
+    DEFAULT_BUCKETS,
+    Counter,
+    Gauge,
+    Histogram,
     MetricsCollector,
     StructuredLogger,
     TracingContext,
@@ -14,6 +18,10 @@ from framework.observability.metrics import (
 )
 
 __all__ = [
+    "DEFAULT_BUCKETS",
+    "Counter",
+    "Gauge",
+    "Histogram",
     "MetricsCollector",
     "StructuredLogger",
     "TracingContext",
@@ -12,12 +12,16 @@ Features:
 """
 
 import json
+import threading
 import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Generic, Optional, List, Tuple, Type, TypeVar, Union
 
 
 class MetricType(Enum):
@@ -41,10 +45,221 @@ class Metric:
     help_text: str = ""
 
 
+# Prometheus client default buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+
+def _format_value(value: float) -> str:
+    """Prometheus sample value"""
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(value)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Per-thread shard of a _ShardedMetric
+_Shard = TypeVar("_Shard")
+
+
+class _ShardedMetric(ABC, Generic[_Shard]):
+    """
+    Metric whose writes go to a per-thread shard
+
+    A thread only ever writes its own shard, so recording needs no lock;
+    the lock is taken when a thread records its first value and on export,
+    which merges the shards. Shards of threads that have ended are folded
+    into one, so pools of short-lived threads do not grow the shard list.
+    """
+
+    TYPE: MetricType
+
+    def __init__(self, name: str, labels: Dict[str, str], help_text: str):
+        self.name = name
+        self.labels = labels
+        self.help_text = help_text
+        # Formatted once: {k="v",...} in label name order
+        self.label_str = MetricsCollector._format_labels(labels)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, _Shard]] = []
+        self._retired = self._new_shard()
+
+    @abstractmethod
+    def _new_shard(self) -> _Shard:
+        """Empty shard"""
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _fold(into: _Shard, shard: _Shard) -> None:
+        """Add the values of shard to into"""
+        pass
+
+    def _add_shard(self) -> _Shard:
+        shard = self._new_shard()
+        with self._lock:
+            self._shards.append((threading.current_thread(), shard))
+        self._local.shard = shard
+        return shard
+
+    def _merged(self) -> _Shard:
+        """All shards folded into a new one; values written concurrently may be missed"""
+        merged = self._new_shard()
+        with self._lock:
+            live = []
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    live.append((thread, shard))
+                else:
+                    self._fold(self._retired, shard)
+            self._shards = live
+            self._fold(merged, self._retired)
+            for _, shard in live:
+                self._fold(merged, shard)
+        return merged
+
+
+class Counter(_ShardedMetric[List[float]]):
+    """Monotonically increasing count for one label set"""
+
+    TYPE = MetricType.COUNTER
+
+    def inc(self, value: float = 1.0) -> None:
+        """Add value (must not be negative)"""
+        if value < 0:
+            raise ValueError(f"Counter {self.name} cannot decrease (got {value})")
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._add_shard()
+        shard[0] += value
+
+    @property
+    def value(self) -> float:
+        return self._merged()[0]
+
+    def _new_shard(self) -> List[float]:
+        return [0.0]
+
+    @staticmethod
+    def _fold(into: List[float], shard: List[float]) -> None:
+        into[0] += shard[0]
+
+
+class Gauge:
+    """Last set value for one label set"""
+
+    TYPE: MetricType = MetricType.GAUGE
+
+    def __init__(self, name: str, labels: Dict[str, str], help_text: str):
+        self.name = name
+        self.labels = labels
+        self.help_text = help_text
+        self.label_str = MetricsCollector._format_labels(labels)
+        # A single attribute store is atomic, so no sharding or lock is needed
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the current value"""
+        self.value = value
+
+
+class _HistogramShard:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, buckets: int):
+        # One count per upper bound plus the +Inf bucket; not cumulative
+        self.counts = [0] * (buckets + 1)
+        self.sum = 0.0
+
+
+class Histogram(_ShardedMetric["_HistogramShard"]):
+    """Observation counts in fixed buckets, with their sum, for one label set"""
+
+    TYPE = MetricType.HISTOGRAM
+
+    def __init__(
+        self,
+        name: str,
+        labels: Dict[str, str],
+        help_text: str,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = buckets
+        super().__init__(name, labels, help_text)
+        # Cumulative bucket labels, formatted once, with le last
+        prefix = self.label_str[:-1] + "," if labels else "{"
+        self._bucket_label_strs = [
+            f'{prefix}le="{_format_value(float(bound))}"}}' for bound in (*buckets, float("inf"))
+        ]
+
+    def observe(self, value: float) -> None:
+        """Record one observation"""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._add_shard()
+        # Buckets are upper-inclusive (le): the first bound >= value
+        shard.counts[bisect_left(self.buckets, value)] += 1
+        shard.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self._merged().counts)
+
+    @property
+    def sum(self) -> float:
+        return self._merged().sum
+
+    def cumulative_counts(self) -> List[int]:
+        """Observations <= each bucket bound, the last being +Inf (the total count)"""
+        return list(accumulate(self._merged().counts))
+
+    def _new_shard(self) -> _HistogramShard:
+        return _HistogramShard(len(self.buckets))
+
+    @staticmethod
+    def _fold(into: _HistogramShard, shard: _HistogramShard) -> None:
+        into.counts = [a + b for a, b in zip(into.counts, shard.counts)]
+        into.sum += shard.sum
+
+
+MetricHandle = Union[Counter, Gauge, Histogram]
+_Handle = TypeVar("_Handle", Counter, Gauge, Histogram)
+
+
+@dataclass
+class _MetricFamily:
+    """All label sets of one metric name"""
+
+    type: MetricType
+    help_text: str
+    buckets: Optional[Tuple[float, ...]] = None
+    children: List[MetricHandle] = field(default_factory=list)
+
+
 class MetricsCollector:
     """
     Collect and export metrics in Prometheus format
 
+    Hot paths should get a handle once and record through it; a handle
+    caches its label set, and recording is lock-free (per-thread shards):
+
+        failures = collector.counter("test_failures_total", {"suite": "login"})
+        failures.inc()
+
+        duration = collector.histogram("test_duration_seconds", help_text="Test duration")
+        duration.observe(1.7)
+
+    inc_counter/set_gauge/observe_histogram look the handle up by name and
+    labels on every call.
+
     Example metrics:
     - test_duration_seconds
     - test_failures_total
@@ -52,9 +267,38 @@ class MetricsCollector:
     - healing_success_rate
     """
 
-    def __init__(self):
-        self.metrics: Dict[str, Metric] = {}
-        self.histograms: Dict[str, List[float]] = {}
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._families: Dict[str, _MetricFamily] = {}
+        # (name, label items) -> handle, for label items in sorted and in caller order
+        self._handles: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], MetricHandle] = {}
+
+    def counter(self, name: str, labels: Optional[Dict[str, str]] = None, help_text: str = "") -> Counter:
+        """Counter handle for name and labels, created on first use"""
+        return self._handle(Counter, name, labels, help_text)
+
+    def gauge(self, name: str, labels: Optional[Dict[str, str]] = None, help_text: str = "") -> Gauge:
+        """Gauge handle for name and labels, created on first use"""
+        return self._handle(Gauge, name, labels, help_text)
+
+    def histogram(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+        help_text: str = "",
+        buckets: Optional[Tuple[float, ...]] = None,
+    ) -> Histogram:
+        """
+        Histogram handle for name and labels, created on first use
+
+        Args:
+            buckets: Increasing upper bounds (default: DEFAULT_BUCKETS); all
+                label sets of a name share the buckets of the first one
+
+        Raises:
+            ValueError: If buckets are not increasing or differ from the name's
+        """
+        return self._handle(Histogram, name, labels, help_text, buckets)
 
     def inc_counter(
         self,
@@ -64,18 +308,7 @@ class MetricsCollector:
         help_text: str = "",
     ) -> None:
         """Increment counter metric"""
-        key = self._make_key(name, labels or {})
-
-        if key in self.metrics:
-            self.metrics[key].value += value
-        else:
-            self.metrics[key] = Metric(
-                name=name,
-                type=MetricType.COUNTER,
-                value=value,
-                labels=labels or {},
-                help_text=help_text,
-            )
+        self._handle(Counter, name, labels, help_text).inc(value)
 
     def set_gauge(
         self,
@@ -85,15 +318,7 @@ class MetricsCollector:
         help_text: str = "",
     ) -> None:
         """Set gauge metric"""
-        key = self._make_key(name, labels or {})
-
-        self.metrics[key] = Metric(
-            name=name,
-            type=MetricType.GAUGE,
-            value=value,
-            labels=labels or {},
-            help_text=help_text,
-        )
+        self._handle(Gauge, name, labels, help_text).set(value)
 
     def observe_histogram(
         self,
@@ -103,21 +328,80 @@ class MetricsCollector:
         help_text: str = "",
     ) -> None:
         """Record histogram observation"""
-        key = self._make_key(name, labels or {})
+        self._handle(Histogram, name, labels, help_text).observe(value)
 
-        if key not in self.histograms:
-            self.histograms[key] = []
-
-        self.histograms[key].append(value)
-
-        # Store as metric for export
-        self.metrics[key] = Metric(
-            name=name,
-            type=MetricType.HISTOGRAM,
-            value=value,
-            labels=labels or {},
-            help_text=help_text,
-        )
+    def _handle(
+        self,
+        cls: Type[_Handle],
+        name: str,
+        labels: Optional[Dict[str, str]],
+        help_text: str,
+        buckets: Optional[Tuple[float, ...]] = None,
+    ) -> _Handle:
+        key = (name, tuple(labels.items()) if labels else ())
+        handle = self._handles.get(key)
+        if handle is None:
+            handle = self._register(cls, name, labels or {}, help_text, buckets, key)
+        if not isinstance(handle, cls):
+            raise ValueError(f"Metric {name} is a {handle.TYPE.value}, not a {cls.TYPE.value}")
+        if isinstance(handle, Histogram) and buckets is not None and tuple(buckets) != handle.buckets:
+            raise ValueError(f"Histogram {name} already uses buckets {handle.buckets}")
+        return handle
+
+    def _register(
+        self,
+        cls: Type[MetricHandle],
+        name: str,
+        labels: Dict[str, str],
+        help_text: str,
+        buckets: Optional[Tuple[float, ...]],
+        key: Tuple[str, Tuple[Tuple[str, str], ...]],
+    ) -> MetricHandle:
+        labels = {str(k): str(v) for k, v in sorted(labels.items())}
+        canonical = (name, tuple(labels.items()))
+
+        with self._lock:
+            handle = self._handles.get(canonical)
+            if handle is None:
+                family = self._families.get(name)
+                if family is None:
+                    if cls is Histogram:
+                        buckets = tuple(float(b) for b in (buckets or DEFAULT_BUCKETS))
+                        if list(buckets) != sorted(set(buckets)):
+                            raise ValueError(f"Histogram {name} buckets must be increasing: {buckets}")
+                    family = _MetricFamily(type=cls.TYPE, help_text=help_text, buckets=buckets)
+                    self._families[name] = family
+                elif family.type is not cls.TYPE:
+                    raise ValueError(f"Metric {name} is a {family.type.value}, not a {cls.TYPE.value}")
+
+                if cls is Histogram:
+                    handle = Histogram(name, labels, family.help_text, family.buckets or DEFAULT_BUCKETS)
+                else:
+                    handle = cls(name, labels, family.help_text)
+                family.children.append(handle)
+                self._handles[canonical] = handle
+            # Callers usually pass labels in the same order; find them without sorting next time
+            self._handles[key] = handle
+        return handle
+
+    @property
+    def metrics(self) -> Dict[str, Metric]:
+        """Current value of every label set (a histogram's is its sum), by name{labels} key"""
+        with self._lock:
+            families = [(family, list(family.children)) for family in self._families.values()]
+
+        snapshot = {}
+        for family, children in families:
+            for handle in children:
+                value = handle.sum if isinstance(handle, Histogram) else handle.value
+                snapshot[self._make_key(handle.name, handle.labels)] = Metric(
+                    name=handle.name,
+                    type=family.type,
+                    value=value,
+                    labels=handle.labels,
+                    help_text=family.help_text,
+                )
+        return snapshot
 
     @staticmethod
     def _make_key(name: str, labels: Dict[str, str]) -> str:
@@ -127,32 +411,36 @@ class MetricsCollector:
 
     def export_prometheus(self, output_path: Optional[Path] = None) -> str:
         """
-        Export metrics in Prometheus format
+        Export metrics in Prometheus text format
+
+        Histograms are exported as cumulative _bucket series plus _sum and _count.
 
         Returns:
             Prometheus-formatted metrics string
         """
         lines = []
 
-        # Group by metric name
-        grouped: Dict[str, List[Metric]] = {}
-        for metric in self.metrics.values():
-            if metric.name not in grouped:
-                grouped[metric.name] = []
-            grouped[metric.name].append(metric)
+        with self._lock:
+            families = [(name, family, list(family.children)) for name, family in sorted(self._families.items())]
 
-        # Generate output
-        for name, metrics_list in sorted(grouped.items()):
+        for name, family, children in families:
             # Add HELP and TYPE comments
-            first = metrics_list[0]
-            if first.help_text:
-                lines.append(f"# HELP {name} {first.help_text}")
-            lines.append(f"# TYPE {name} {first.type.value}")
+            if family.help_text:
+                help_text = family.help_text.replace("\\", "\\\\").replace("\n", "\\n")
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {family.type.value}")
 
             # Add metric values
-            for metric in metrics_list:
-                labels_str = self._format_labels(metric.labels)
-                lines.append(f"{name}{labels_str} {metric.value}")
+            for handle in children:
+                if isinstance(handle, Histogram):
+                    merged = handle._merged()
+                    cumulative = list(accumulate(merged.counts))
+                    for label_str, count in zip(handle._bucket_label_strs, cumulative):
+                        lines.append(f"{name}_bucket{label_str} {count}")
+                    lines.append(f"{name}_sum{handle.label_str} {_format_value(merged.sum)}")
+                    lines.append(f"{name}_count{handle.label_str} {cumulative[-1]}")
+                else:
+                    lines.append(f"{name}{handle.label_str} {_format_value(handle.value)}")
 
         output = "\n".join(lines) + "\n"
 
@@ -170,26 +458,36 @@ class MetricsCollector:
         if not labels:
             return ""
 
-        items = [f'{k}="{v}"' for k, v in sorted(labels.items())]
+        items = [f'{k}="{_escape_label_value(str(v))}"' for k, v in sorted(labels.items())]
         return "{" + ",".join(items) + "}"
 
     def get_summary(self) -> Dict[str, Any]:
         """Get metrics summary as dict"""
-        return {
-            "total_metrics": len(self.metrics),
-            "counters": sum(1 for m in self.metrics.values() if m.type == MetricType.COUNTER),
-            "gauges": sum(1 for m in self.metrics.values() if m.type == MetricType.GAUGE),
-            "histograms": sum(1 for m in self.metrics.values() if m.type == MetricType.HISTOGRAM),
-            "metrics": [
-                {
-                    "name": m.name,
-                    "type": m.type.value,
-                    "value": m.value,
-                    "labels": m.labels,
-                }
-                for m in self.metrics.values()
-            ],
+        summary: Dict[str, Any] = {
+            "total_metrics": 0,
+            "counters": 0,
+            "gauges": 0,
+            "histograms": 0,
+            "metrics": [],
         }
+        kinds = {MetricType.COUNTER: "counters", MetricType.GAUGE: "gauges", MetricType.HISTOGRAM: "histograms"}
+
+        with self._lock:
+            families = [(family, list(family.children)) for family in self._families.values()]
+
+        for family, children in families:
+            summary["total_metrics"] += len(children)
+            summary[kinds[family.type]] += len(children)
+            for handle in children:
+                entry: Dict[str, Any] = {"name": handle.name, "type": family.type.value, "labels": handle.labels}
+                if isinstance(handle, Histogram):
+                    merged = handle._merged()
+                    entry.update(value=merged.sum, count=sum(merged.counts), sum=merged.sum)
+                else:
+                    entry["value"] = handle.value
+                summary["metrics"].append(entry)
+
+        return summary
 
 
 class StructuredLogger:
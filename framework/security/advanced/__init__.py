@@ -12,6 +12,7 @@ from framework.security.advanced.base import (
     SecurityVulnerability,
     SecretPattern,
 )
+from framework.security.advanced.corpus import ScanCorpus
 from framework.security.advanced.secrets import HardcodedSecretsScanner
 from framework.security.advanced.pinning import CertificatePinningAnalyzer
 from framework.security.advanced.binary import BinarySecurityAnalyzer
@@ -25,6 +26,7 @@ __all__ = [
     "RiskLevel",
     "SecurityVulnerability",
     "SecretPattern",
+    "ScanCorpus",
     "HardcodedSecretsScanner",
     "CertificatePinningAnalyzer",
     "BinarySecurityAnalyzer",
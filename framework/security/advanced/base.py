@@ -125,7 +125,14 @@ class SecurityVulnerability:
 
 
 class SecretPattern:
-    """Pattern for detecting hardcoded secrets"""
+    """
+    Pattern for detecting hardcoded secrets
+
+    keywords are literals of which every match contains at least one
+    (case-insensitive). The scanner only runs the pattern near places where
+    a keyword occurs, and skips it for content without any; patterns without
+    keywords are run over the whole content.
+    """
 
     def __init__(
         self,
@@ -134,9 +141,11 @@ class SecretPattern:
         severity: RiskLevel,
         entropy_threshold: float = 3.5,
         validators: Optional[List[Callable]] = None,
+        keywords: Optional[List[str]] = None,
     ):
         self.name = name
         self.pattern = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
         self.severity = severity
         self.entropy_threshold = entropy_threshold
         self.validators = validators or []
+        self.keywords = [keyword.lower() for keyword in keywords or []]
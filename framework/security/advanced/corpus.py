@@ -0,0 +1,112 @@
+"""
+Shared scan corpus for the advanced security analyzers
+
+Walks a project tree once and reads each file once, so a full scan running
+several analyzers does not re-walk the tree and re-read every file per
+analyzer.
+"""
+
+import fnmatch
+import os
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Version control metadata never holds scannable sources
+DEFAULT_EXCLUDES = (".git", ".hg", ".svn")
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class ScanCorpus:
+    """
+    Files of a project tree, walked once and read once
+
+    Analyzers select files by name pattern or suffix instead of walking the
+    tree themselves, and read them through read_text. Contents are cached,
+    least recently used evicted first, up to max_cache_bytes; a file larger
+    than the cap is read every time it is asked for.
+
+    Exclude patterns are matched (fnmatch) against each file or directory
+    name and against its path relative to the root; excluded directories
+    are not descended into.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        exclude: Optional[Iterable[str]] = None,
+        max_cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ):
+        self.root = Path(root)
+        self.exclude = list(DEFAULT_EXCLUDES if exclude is None else exclude)
+        self.max_cache_bytes = max_cache_bytes
+
+        self._cache: "OrderedDict[Path, str]" = OrderedDict()
+        self._cache_bytes = 0
+        self._selections: Dict[str, List[Path]] = {}
+        self.reads = 0
+        self.cache_hits = 0
+
+        start = time.perf_counter()
+        self.paths = self._walk()
+        self.walk_seconds = time.perf_counter() - start
+
+    def _excluded(self, name: str, relative: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative, pattern) for pattern in self.exclude)
+
+    def _walk(self) -> List[Path]:
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            directory = Path(dirpath)
+            relative = directory.relative_to(self.root).as_posix()
+            prefix = "" if relative == "." else f"{relative}/"
+            dirnames[:] = sorted(name for name in dirnames if not self._excluded(name, prefix + name))
+            paths.extend(directory / name for name in sorted(filenames) if not self._excluded(name, prefix + name))
+        return paths
+
+    def files(self, *patterns: str) -> List[Path]:
+        """Files whose name matches the glob patterns, pattern by pattern (like one rglob per pattern)"""
+        selected = []
+        for pattern in patterns:
+            if pattern not in self._selections:
+                self._selections[pattern] = [path for path in self.paths if fnmatch.fnmatch(path.name, pattern)]
+            selected.extend(self._selections[pattern])
+        return selected
+
+    def files_with_suffix(self, suffixes: Iterable[str]) -> List[Path]:
+        """Files whose suffix is one of suffixes, in walk order"""
+        suffixes = set(suffixes)
+        return [path for path in self.paths if path.suffix in suffixes]
+
+    def read_text(self, path: Path) -> str:
+        """Read a file (undecodable bytes ignored), from the cache when it has been read before"""
+        content = self._cache.get(path)
+        if content is not None:
+            self._cache.move_to_end(path)
+            self.cache_hits += 1
+            return content
+
+        content = path.read_text(errors="ignore")
+        self.reads += 1
+
+        size = sys.getsizeof(content)
+        if size <= self.max_cache_bytes:
+            self._cache[path] = content
+            self._cache_bytes += size
+            while self._cache_bytes > self.max_cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= sys.getsizeof(evicted)
+        return content
+
+    def stats(self) -> Dict[str, Any]:
+        """Walk and read statistics"""
+        return {
+            "files": len(self.paths),
+            "walk_seconds": self.walk_seconds,
+            "reads": self.reads,
+            "cache_hits": self.cache_hits,
+            "cached_bytes": self._cache_bytes,
+        }
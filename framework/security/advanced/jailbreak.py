@@ -27,6 +27,7 @@ from framework.security.advanced.base import (
     SecurityVulnerability,
     SecretPattern,
 )
+from framework.security.advanced.corpus import ScanCorpus
 
 logger = logging.getLogger(__name__)
 
@@ -52,23 +53,27 @@ class RootJailbreakAnalyzer:
             re.compile(r"canOpenURL.*cydia", re.I),
         ]
 
-    def analyze(self, source_dir: Path, platform: str = "android") -> List[SecurityVulnerability]:
+    def analyze(
+        self, source_dir: Path, platform: str = "android", *, corpus: Optional[ScanCorpus] = None
+    ) -> List[SecurityVulnerability]:
         """Analyze root/jailbreak detection implementation"""
+        if corpus is None:
+            corpus = ScanCorpus(source_dir)
+
         vulnerabilities = []
         has_detection = False
 
         patterns = self.android_root_checks if platform == "android" else self.ios_jailbreak_checks
         extensions = ["*.java", "*.kt"] if platform == "android" else ["*.swift", "*.m"]
 
-        for ext in extensions:
-            for file_path in source_dir.rglob(ext):
-                try:
-                    content = file_path.read_text(errors="ignore")
-                    if any(p.search(content) for p in patterns):
-                        has_detection = True
-                        break
-                except Exception:
-                    pass
+        for file_path in corpus.files(*extensions):
+            try:
+                content = corpus.read_text(file_path)
+                if any(p.search(content) for p in patterns):
+                    has_detection = True
+                    break
+            except Exception:
+                pass
 
         if not has_detection:
             term = "root" if platform == "android" else "jailbreak"
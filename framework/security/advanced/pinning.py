@@ -27,6 +27,7 @@ from framework.security.advanced.base import (
     SecurityVulnerability,
     SecretPattern,
 )
+from framework.security.advanced.corpus import ScanCorpus
 
 logger = logging.getLogger(__name__)
 
@@ -70,8 +71,11 @@ class CertificatePinningAnalyzer:
             re.compile(r"NSAllowsArbitraryLoads.*true", re.I),
         ]
 
-    def analyze_android(self, source_dir: Path) -> List[SecurityVulnerability]:
+    def analyze_android(self, source_dir: Path, *, corpus: Optional[ScanCorpus] = None) -> List[SecurityVulnerability]:
         """Analyze Android app for certificate pinning"""
+        if corpus is None:
+            corpus = ScanCorpus(source_dir)
+
         vulnerabilities = []
         has_pinning = False
         has_bypass = False
@@ -84,41 +88,40 @@ class CertificatePinningAnalyzer:
                 has_pinning = True
 
         # Scan Java/Kotlin files
-        for ext in ["*.java", "*.kt"]:
-            for file_path in source_dir.rglob(ext):
-                content = file_path.read_text(errors="ignore")
-
-                # Check for pinning implementation
-                if any(p.search(content) for p in self.android_pinning_patterns):
-                    has_pinning = True
-
-                # Check for bypass patterns
-                for pattern in self.bypass_patterns:
-                    match = pattern.search(content)
-                    if match:
-                        has_bypass = True
-                        line_num = content[: match.start()].count("\n") + 1
-                        vulnerabilities.append(
-                            SecurityVulnerability(
-                                id=f"CERT-BYPASS-{hashlib.md5(str(file_path).encode()).hexdigest()[:8]}",
-                                title="Certificate Validation Bypass Detected",
-                                description="Code that bypasses SSL/TLS certificate validation was found. "
-                                "This makes the app vulnerable to man-in-the-middle attacks.",
-                                owasp_category=OWASPMobileTop10.M5_INSECURE_COMMUNICATION,
-                                risk_level=RiskLevel.CRITICAL,
-                                cvss_score=9.0,
-                                cwe_ids=[295],  # CWE-295: Improper Certificate Validation
-                                location=f"{file_path}:{line_num}",
-                                evidence=f"Pattern: {pattern.pattern}",
-                                remediation="Remove certificate validation bypass code. Implement proper "
-                                "certificate pinning using OkHttp CertificatePinner or "
-                                "Network Security Config.",
-                                references=[
-                                    "https://developer.android.com/training/articles/security-ssl",
-                                    "https://owasp.org/www-community/controls/Certificate_and_Public_Key_Pinning",
-                                ],
-                            )
+        for file_path in corpus.files("*.java", "*.kt"):
+            content = corpus.read_text(file_path)
+
+            # Check for pinning implementation
+            if any(p.search(content) for p in self.android_pinning_patterns):
+                has_pinning = True
+
+            # Check for bypass patterns
+            for pattern in self.bypass_patterns:
+                match = pattern.search(content)
+                if match:
+                    has_bypass = True
+                    line_num = content[: match.start()].count("\n") + 1
+                    vulnerabilities.append(
+                        SecurityVulnerability(
+                            id=f"CERT-BYPASS-{hashlib.md5(str(file_path).encode()).hexdigest()[:8]}",
+                            title="Certificate Validation Bypass Detected",
+                            description="Code that bypasses SSL/TLS certificate validation was found. "
+                            "This makes the app vulnerable to man-in-the-middle attacks.",
+                            owasp_category=OWASPMobileTop10.M5_INSECURE_COMMUNICATION,
+                            risk_level=RiskLevel.CRITICAL,
+                            cvss_score=9.0,
+                            cwe_ids=[295],  # CWE-295: Improper Certificate Validation
+                            location=f"{file_path}:{line_num}",
+                            evidence=f"Pattern: {pattern.pattern}",
+                            remediation="Remove certificate validation bypass code. Implement proper "
+                            "certificate pinning using OkHttp CertificatePinner or "
+                            "Network Security Config.",
+                            references=[
+                                "https://developer.android.com/training/articles/security-ssl",
+                                "https://owasp.org/www-community/controls/Certificate_and_Public_Key_Pinning",
+                            ],
                         )
+                    )
 
         # Check if pinning is missing entirely
         if not has_pinning and not has_bypass:
@@ -144,8 +147,11 @@ class CertificatePinningAnalyzer:
 
         return vulnerabilities
 
-    def analyze_ios(self, source_dir: Path) -> List[SecurityVulnerability]:
+    def analyze_ios(self, source_dir: Path, *, corpus: Optional[ScanCorpus] = None) -> List[SecurityVulnerability]:
         """Analyze iOS app for certificate pinning"""
+        if corpus is None:
+            corpus = ScanCorpus(source_dir)
+
         vulnerabilities = []
         has_pinning = False
 
@@ -175,12 +181,11 @@ class CertificatePinningAnalyzer:
                 )
 
         # Scan Swift/Objective-C files
-        for ext in ["*.swift", "*.m", "*.mm"]:
-            for file_path in source_dir.rglob(ext):
-                content = file_path.read_text(errors="ignore")
+        for file_path in corpus.files("*.swift", "*.m", "*.mm"):
+            content = corpus.read_text(file_path)
 
-                if any(p.search(content) for p in self.ios_pinning_patterns):
-                    has_pinning = True
+            if any(p.search(content) for p in self.ios_pinning_patterns):
+                has_pinning = True
 
         if not has_pinning:
             vulnerabilities.append(
@@ -27,6 +27,7 @@ from framework.security.advanced.base import (
     SecurityVulnerability,
     SecretPattern,
 )
+from framework.security.advanced.corpus import ScanCorpus
 
 logger = logging.getLogger(__name__)
 
@@ -55,8 +56,13 @@ class PrivacyComplianceChecker:
             re.compile(r"adjust\.com", re.I),
         ]
 
-    def check_pii_logging(self, source_dir: Path) -> List[SecurityVulnerability]:
+    def check_pii_logging(
+        self, source_dir: Path, *, corpus: Optional[ScanCorpus] = None
+    ) -> List[SecurityVulnerability]:
         """Check for PII being logged"""
+        if corpus is None:
+            corpus = ScanCorpus(source_dir)
+
         vulnerabilities = []
 
         log_patterns = [
@@ -67,49 +73,53 @@ class PrivacyComplianceChecker:
             re.compile(r"logger\.\w+\s*\([^)]*", re.I),
         ]
 
-        for ext in ["*.java", "*.kt", "*.swift", "*.m", "*.py", "*.js", "*.ts"]:
-            for file_path in source_dir.rglob(ext):
-                try:
-                    content = file_path.read_text(errors="ignore")
-
-                    for log_pattern in log_patterns:
-                        for match in log_pattern.finditer(content):
-                            log_statement = match.group(0)
-
-                            for pii_type, pii_pattern in self.pii_patterns.items():
-                                if pii_pattern.search(log_statement):
-                                    line_num = content[: match.start()].count("\n") + 1
-                                    vulnerabilities.append(
-                                        SecurityVulnerability(
-                                            id=f"PRIVACY-LOG-{hashlib.md5(f'{file_path}:{line_num}'.encode()).hexdigest()[:8]}",
-                                            title=f"PII ({pii_type}) Potentially Logged",
-                                            description=f"A log statement may be logging {pii_type} data, "
-                                            "which violates GDPR/CCPA requirements.",
-                                            owasp_category=OWASPMobileTop10.M6_INADEQUATE_PRIVACY,
-                                            risk_level=RiskLevel.HIGH,
-                                            cvss_score=7.0,
-                                            cwe_ids=[532],  # CWE-532: Insertion of Sensitive Info into Log
-                                            location=f"{file_path}:{line_num}",
-                                            evidence=f"Log statement: {log_statement[:100]}...",
-                                            remediation="Remove PII from log statements or redact sensitive data.",
-                                            references=["https://gdpr-info.eu/art-5-gdpr/"],
-                                        )
+        for file_path in corpus.files("*.java", "*.kt", "*.swift", "*.m", "*.py", "*.js", "*.ts"):
+            try:
+                content = corpus.read_text(file_path)
+
+                for log_pattern in log_patterns:
+                    for match in log_pattern.finditer(content):
+                        log_statement = match.group(0)
+
+                        for pii_type, pii_pattern in self.pii_patterns.items():
+                            if pii_pattern.search(log_statement):
+                                line_num = content[: match.start()].count("\n") + 1
+                                vulnerabilities.append(
+                                    SecurityVulnerability(
+                                        id=f"PRIVACY-LOG-{hashlib.md5(f'{file_path}:{line_num}'.encode()).hexdigest()[:8]}",
+                                        title=f"PII ({pii_type}) Potentially Logged",
+                                        description=f"A log statement may be logging {pii_type} data, "
+                                        "which violates GDPR/CCPA requirements.",
+                                        owasp_category=OWASPMobileTop10.M6_INADEQUATE_PRIVACY,
+                                        risk_level=RiskLevel.HIGH,
+                                        cvss_score=7.0,
+                                        cwe_ids=[532],  # CWE-532: Insertion of Sensitive Info into Log
+                                        location=f"{file_path}:{line_num}",
+                                        evidence=f"Log statement: {log_statement[:100]}...",
+                                        remediation="Remove PII from log statements or redact sensitive data.",
+                                        references=["https://gdpr-info.eu/art-5-gdpr/"],
                                     )
+                                )
 
-                except Exception as e:
-                    logger.warning(f"Could not analyze {file_path}: {e}")
+            except Exception as e:
+                logger.warning(f"Could not analyze {file_path}: {e}")
 
         return vulnerabilities
 
-    def check_tracking_sdks(self, source_dir: Path) -> List[SecurityVulnerability]:
+    def check_tracking_sdks(
+        self, source_dir: Path, *, corpus: Optional[ScanCorpus] = None
+    ) -> List[SecurityVulnerability]:
         """Check for third-party tracking SDKs without consent"""
+        if corpus is None:
+            corpus = ScanCorpus(source_dir)
+
         vulnerabilities = []
         found_trackers = set()
 
         # Check Gradle files
-        for gradle_file in source_dir.rglob("*.gradle*"):
+        for gradle_file in corpus.files("*.gradle*"):
             try:
-                content = gradle_file.read_text(errors="ignore")
+                content = corpus.read_text(gradle_file)
                 for pattern in self.tracking_patterns:
                     if pattern.search(content):
                         found_trackers.add(pattern.pattern)
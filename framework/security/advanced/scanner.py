@@ -14,6 +14,7 @@ import tempfile
 import threading
 import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum, auto
@@ -28,6 +29,7 @@ from framework.security.advanced.base import (
     SecretPattern,
 )
 
+from framework.security.advanced.corpus import DEFAULT_CACHE_BYTES, ScanCorpus
 from framework.security.advanced.secrets import HardcodedSecretsScanner
 from framework.security.advanced.pinning import CertificatePinningAnalyzer
 from framework.security.advanced.binary import BinarySecurityAnalyzer
@@ -56,59 +58,97 @@ class AdvancedSecurityScanner:
         self.all_vulnerabilities: List[SecurityVulnerability] = []
         self.scan_start_time: Optional[datetime] = None
         self.scan_end_time: Optional[datetime] = None
-
-    def full_scan(self, project_dir: Path, platform: str = "android") -> Dict[str, Any]:
+        self.analyzer_seconds: Dict[str, float] = {}
+        self.corpus_stats: Dict[str, Any] = {}
+
+    @contextmanager
+    def _timed(self, analyzer: str):
+        """Add the time spent in the block to the analyzer's share of the scan"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.analyzer_seconds[analyzer] = self.analyzer_seconds.get(analyzer, 0.0) + time.perf_counter() - start
+
+    def full_scan(
+        self,
+        project_dir: Path,
+        platform: str = "android",
+        *,
+        exclude: Optional[List[str]] = None,
+        max_cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ) -> Dict[str, Any]:
         """
         Perform comprehensive security scan
 
+        The project tree is walked once and each file read once into a shared
+        ScanCorpus that every analyzer consumes.
+
         Args:
             project_dir: Path to project directory
             platform: 'android' or 'ios'
+            exclude: File/directory name or relative path patterns to skip
+                (default: version control directories)
+            max_cache_bytes: Cap on file contents kept in memory between analyzers
 
         Returns:
             Comprehensive security report
         """
         self.scan_start_time = datetime.now()
         self.all_vulnerabilities = []
+        self.analyzer_seconds = {}
 
         logger.info(f"Starting security scan of {project_dir}")
 
+        with self._timed("walk"):
+            corpus = ScanCorpus(project_dir, exclude=exclude, max_cache_bytes=max_cache_bytes)
+
         # 1. Hardcoded secrets scan
         logger.info("Scanning for hardcoded secrets...")
-        self.all_vulnerabilities.extend(self.secrets_scanner.scan_directory(project_dir))
+        with self._timed("secrets"):
+            self.all_vulnerabilities.extend(self.secrets_scanner.scan_directory(project_dir, corpus=corpus))
 
         # 2. Certificate pinning analysis
         logger.info("Analyzing certificate pinning...")
-        if platform == "android":
-            self.all_vulnerabilities.extend(self.cert_analyzer.analyze_android(project_dir))
-        else:
-            self.all_vulnerabilities.extend(self.cert_analyzer.analyze_ios(project_dir))
+        with self._timed("certificate_pinning"):
+            if platform == "android":
+                self.all_vulnerabilities.extend(self.cert_analyzer.analyze_android(project_dir, corpus=corpus))
+            else:
+                self.all_vulnerabilities.extend(self.cert_analyzer.analyze_ios(project_dir, corpus=corpus))
 
         # 3. Privacy compliance
         logger.info("Checking privacy compliance...")
-        self.all_vulnerabilities.extend(self.privacy_checker.check_pii_logging(project_dir))
-        self.all_vulnerabilities.extend(self.privacy_checker.check_tracking_sdks(project_dir))
+        with self._timed("privacy"):
+            self.all_vulnerabilities.extend(self.privacy_checker.check_pii_logging(project_dir, corpus=corpus))
+            self.all_vulnerabilities.extend(self.privacy_checker.check_tracking_sdks(project_dir, corpus=corpus))
 
         # 4. Root/Jailbreak detection
         logger.info("Analyzing root/jailbreak detection...")
-        self.all_vulnerabilities.extend(self.root_analyzer.analyze(project_dir, platform))
+        with self._timed("root_jailbreak"):
+            self.all_vulnerabilities.extend(self.root_analyzer.analyze(project_dir, platform, corpus=corpus))
 
         # 5. Secure coding practices
         logger.info("Analyzing secure coding practices...")
-        self.all_vulnerabilities.extend(self.code_analyzer.analyze(project_dir))
+        with self._timed("secure_coding"):
+            self.all_vulnerabilities.extend(self.code_analyzer.analyze(project_dir, corpus=corpus))
 
-        # 6. Binary analysis (if APK provided)
-        apk_files = list(project_dir.rglob("*.apk"))
-        for apk_file in apk_files:
-            logger.info(f"Analyzing APK: {apk_file}")
-            self.all_vulnerabilities.extend(self.binary_analyzer.analyze_android_apk(apk_file))
+        with self._timed("binary"):
+            # 6. Binary analysis (if APK provided)
+            for apk_file in corpus.files("*.apk"):
+                logger.info(f"Analyzing APK: {apk_file}")
+                self.all_vulnerabilities.extend(self.binary_analyzer.analyze_android_apk(apk_file))
 
-        # 7. Native library analysis
-        for so_file in project_dir.rglob("*.so"):
-            logger.info(f"Analyzing native library: {so_file}")
-            self.all_vulnerabilities.extend(self.binary_analyzer.analyze_native_libraries(so_file))
+            # 7. Native library analysis
+            for so_file in corpus.files("*.so"):
+                logger.info(f"Analyzing native library: {so_file}")
+                self.all_vulnerabilities.extend(self.binary_analyzer.analyze_native_libraries(so_file))
 
         self.scan_end_time = datetime.now()
+        self.corpus_stats = corpus.stats()
+        logger.info(
+            "Scan time by analyzer: "
+            + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.analyzer_seconds.items())
+        )
 
         return self.generate_report()
 
@@ -140,6 +180,8 @@ class AdvancedSecurityScanner:
                     else 0
                 ),
                 "total_vulnerabilities": len(self.all_vulnerabilities),
+                "analyzer_seconds": {name: round(seconds, 4) for name, seconds in self.analyzer_seconds.items()},
+                "corpus": dict(self.corpus_stats),
             },
             "risk_assessment": {
                 "overall_score": risk_score,
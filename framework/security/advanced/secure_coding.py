@@ -27,6 +27,7 @@ from framework.security.advanced.base import (
     SecurityVulnerability,
     SecretPattern,
 )
+from framework.security.advanced.corpus import ScanCorpus
 
 logger = logging.getLogger(__name__)
 
@@ -89,37 +90,39 @@ class SecureCodingAnalyzer:
             ),
         ]
 
-    def analyze(self, source_dir: Path) -> List[SecurityVulnerability]:
+    def analyze(self, source_dir: Path, *, corpus: Optional[ScanCorpus] = None) -> List[SecurityVulnerability]:
         """Analyze source code for insecure practices"""
+        if corpus is None:
+            corpus = ScanCorpus(source_dir)
+
         vulnerabilities = []
 
-        for ext in ["*.java", "*.kt", "*.swift", "*.m", "*.py", "*.js", "*.ts"]:
-            for file_path in source_dir.rglob(ext):
-                try:
-                    content = file_path.read_text(errors="ignore")
+        for file_path in corpus.files("*.java", "*.kt", "*.swift", "*.m", "*.py", "*.js", "*.ts"):
+            try:
+                content = corpus.read_text(file_path)
 
-                    for pattern, title, remediation, cwes in self.insecure_patterns:
-                        for match in pattern.finditer(content):
-                            line_num = content[: match.start()].count("\n") + 1
+                for pattern, title, remediation, cwes in self.insecure_patterns:
+                    for match in pattern.finditer(content):
+                        line_num = content[: match.start()].count("\n") + 1
 
-                            vulnerabilities.append(
-                                SecurityVulnerability(
-                                    id=f"CODE-{hashlib.md5(f'{file_path}:{line_num}:{title}'.encode()).hexdigest()[:8]}",
-                                    title=title,
-                                    description=f"Insecure coding practice detected: {title}",
-                                    owasp_category=OWASPMobileTop10.M4_INSUFFICIENT_INPUT_OUTPUT,
-                                    risk_level=RiskLevel.MEDIUM,
-                                    cvss_score=5.5,
-                                    cwe_ids=cwes,
-                                    location=f"{file_path}:{line_num}",
-                                    evidence=match.group(0)[:100],
-                                    remediation=remediation,
-                                    references=[],
-                                )
+                        vulnerabilities.append(
+                            SecurityVulnerability(
+                                id=f"CODE-{hashlib.md5(f'{file_path}:{line_num}:{title}'.encode()).hexdigest()[:8]}",
+                                title=title,
+                                description=f"Insecure coding practice detected: {title}",
+                                owasp_category=OWASPMobileTop10.M4_INSUFFICIENT_INPUT_OUTPUT,
+                                risk_level=RiskLevel.MEDIUM,
+                                cvss_score=5.5,
+                                cwe_ids=cwes,
+                                location=f"{file_path}:{line_num}",
+                                evidence=match.group(0)[:100],
+                                remediation=remediation,
+                                references=[],
                             )
+                        )
 
-                except Exception as e:
-                    logger.warning(f"Could not analyze {file_path}: {e}")
+            except Exception as e:
+                logger.warning(f"Could not analyze {file_path}: {e}")
 
         return vulnerabilities
 
@@ -19,14 +19,28 @@ Features:
 import ast
 import hashlib
 import json
+import os
 import re
+import subprocess
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Tuple
 import xml.etree.ElementTree as ET
 
+DEFAULT_EXCLUDE_PATTERNS = ["node_modules", "venv", ".git", "__pycache__", "build", "dist"]
+ANALYZED_EXTENSIONS = {".py", ".java", ".kt", ".swift", ".m", ".h", ".js", ".ts", ".xml", ".plist"}
+ANALYZED_FILENAMES = {"AndroidManifest.xml", "Info.plist"}
+
+# Upper bound on files per work item handed to a SAST worker process
+SAST_MAX_BATCH_SIZE = 64
+
+# Part of the findings cache key; bump when rules outside this module change
+SAST_RULESET_VERSION = 1
+
 
 class VulnerabilityType(Enum):
     """SAST vulnerability types"""
@@ -75,6 +89,7 @@ class VulnerabilityType(Enum):
 
 
 from framework.security.types import Severity  # noqa: E402  (canonical severity)
+from framework.security.sast_cache import SASTFindingsCache, content_hash  # noqa: E402
 
 
 @dataclass
@@ -153,6 +168,7 @@ class SASTResult:
     language: str = "auto"
     scan_time: str = field(default_factory=lambda: "")
     files_scanned: int = 0
+    files_from_cache: int = 0
 
     def __post_init__(self):
         from datetime import datetime
@@ -167,6 +183,7 @@ class SASTResult:
             "language": self.language,
             "scan_time": self.scan_time,
             "files_scanned": self.files_scanned,
+            "files_from_cache": self.files_from_cache,
             "summary": self.get_summary(),
         }
 
@@ -277,8 +294,9 @@ class TaintAnalyzer:
         self.tainted_vars: Dict[str, TaintSource] = {}
 
     def analyze_file(self, file_path: Path) -> List[TaintFlow]:
-        """Analyze file for taint flows"""
+        """Analyze file for taint flows (tainted variables are tracked per file)"""
         flows = []
+        self.tainted_vars = {}
 
         try:
             content = file_path.read_text()
@@ -842,13 +860,20 @@ class SASTAnalyzer:
     Combines all static analysis techniques.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[SASTFindingsCache] = None):
+        """
+        Args:
+            cache: Findings cache; files whose content was analyzed before
+                with the same rules reuse the cached findings
+        """
         self.taint_analyzer = TaintAnalyzer()
         self.control_flow_analyzer = ControlFlowAnalyzer()
         self.crypto_analyzer = CryptoAnalyzer()
         self.api_analyzer = InsecureAPIAnalyzer()
         self.android_analyzer = AndroidManifestAnalyzer()
         self.ios_analyzer = IOSPlistAnalyzer()
+        self.cache = cache
+        self.cache_hits = 0  # Files served from the cache by the last analyze_files
 
     def analyze_file(self, file_path: Path) -> List[SASTFinding]:
         """Analyze a single file"""
@@ -892,26 +917,89 @@ class SASTAnalyzer:
         return findings
 
     def analyze_directory(
-        self, directory: Path, recursive: bool = True, exclude_patterns: Optional[List[str]] = None
+        self,
+        directory: Path,
+        recursive: bool = True,
+        exclude_patterns: Optional[List[str]] = None,
+        workers: Optional[int] = 1,
     ) -> List[SASTFinding]:
-        """Analyze all files in directory"""
-        findings = []
-        exclude = exclude_patterns or ["node_modules", "venv", ".git", "__pycache__", "build", "dist"]
+        """Analyze all files in directory (see analyze_files for workers)"""
+        return self.analyze_files(self.collect_files(directory, recursive, exclude_patterns), workers=workers)
 
-        extensions = {".py", ".java", ".kt", ".swift", ".m", ".h", ".js", ".ts", ".xml", ".plist"}
+    def collect_files(
+        self, directory: Path, recursive: bool = True, exclude_patterns: Optional[List[str]] = None
+    ) -> List[Path]:
+        """Files under directory that SAST analyzes, in sorted order"""
+        exclude = exclude_patterns or DEFAULT_EXCLUDE_PATTERNS
 
         def should_exclude(path: Path) -> bool:
             return any(ex in str(path) for ex in exclude)
 
         pattern = "**/*" if recursive else "*"
 
-        for file_path in directory.glob(pattern):
-            if file_path.is_file() and not should_exclude(file_path):
-                if file_path.suffix.lower() in extensions or file_path.name in ["AndroidManifest.xml", "Info.plist"]:
-                    findings.extend(self.analyze_file(file_path))
+        return sorted(
+            file_path
+            for file_path in directory.glob(pattern)
+            if file_path.is_file()
+            and not should_exclude(file_path)
+            and (file_path.suffix.lower() in ANALYZED_EXTENSIONS or file_path.name in ANALYZED_FILENAMES)
+        )
+
+    def analyze_files(self, files: List[Path], workers: Optional[int] = 1) -> List[SASTFinding]:
+        """
+        Analyze files, optionally across a process pool
+
+        Files are split into contiguous batches that worker processes pick up
+        as they become free; findings are merged back in file order, so the
+        result is the same as a sequential run. With a cache, only files
+        whose file_cache_key is not cached for the current ruleset are analyzed.
 
+        Args:
+            files: Files to analyze
+            workers: Worker processes (None or 0: CPU count); 1 runs in-process
+        """
+        self.cache_hits = 0
+        if self.cache is None:
+            return [finding for file_findings in self._analyze_each(files, workers) for finding in file_findings]
+
+        ruleset = ruleset_version()
+        hashes = {}
+        for file_path in files:
+            try:
+                hashes[str(file_path)] = file_cache_key(file_path)
+            except OSError:
+                pass  # Analyzed (and reported) as usual, just not cached
+
+        cached = self.cache.lookup(hashes, ruleset)
+        missing = [file_path for file_path in files if str(file_path) not in cached]
+        fresh = dict(zip((str(file_path) for file_path in missing), self._analyze_each(missing, workers)))
+        self.cache.store(
+            ((path, hashes[path], file_findings) for path, file_findings in fresh.items() if path in hashes), ruleset
+        )
+        self.cache_hits = len(files) - len(missing)
+
+        findings = []
+        for file_path in files:
+            key = str(file_path)
+            findings.extend(cached[key] if key in cached else fresh[key])
         return findings
 
+    def _analyze_each(self, files: List[Path], workers: Optional[int]) -> List[List[SASTFinding]]:
+        """Findings per file, in file order"""
+        workers = min(workers or os.cpu_count() or 1, len(files))
+        if workers <= 1:
+            return [self.analyze_file(file_path) for file_path in files]
+
+        # Several batches per worker so one slow batch does not leave the others idle
+        batch_size = max(1, min(SAST_MAX_BATCH_SIZE, len(files) // (workers * 4)))
+        batches = [files[i : i + batch_size] for i in range(0, len(files), batch_size)]
+
+        per_file = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_sast_worker) as executor:
+            for batch_findings in executor.map(_analyze_batch_in_worker, batches):
+                per_file.extend(batch_findings)
+        return per_file
+
     def get_summary(self, findings: List[SASTFinding]) -> Dict[str, Any]:
         """Get analysis summary"""
         by_severity = {}
@@ -1013,6 +1101,8 @@ class SASTAnalyzer:
         enable_crypto: bool = True,
         recursive: bool = True,
         exclude_patterns: Optional[List[str]] = None,
+        workers: Optional[int] = 1,
+        since: Optional[str] = None,
     ) -> SASTResult:
         """
         CLI-compatible analyze method that returns SASTResult wrapper.
@@ -1024,39 +1114,32 @@ class SASTAnalyzer:
             enable_crypto: Enable cryptographic weakness detection
             recursive: Recursively analyze directories
             exclude_patterns: Patterns to exclude from analysis
+            workers: Worker processes for directories (None or 0: CPU count)
+            since: Git ref; only files changed since it (including uncommitted
+                and untracked changes) are analyzed
 
         Returns:
             SASTResult with findings and metadata
         """
-        findings = []
-        files_scanned = 0
-
         if source_path.is_file():
-            findings = self.analyze_file(source_path)
-            files_scanned = 1
+            files = [source_path]
         elif source_path.is_dir():
-            findings = self.analyze_directory(source_path, recursive=recursive, exclude_patterns=exclude_patterns)
-            # Count files scanned
-            exclude = exclude_patterns or ["node_modules", "venv", ".git", "__pycache__", "build", "dist"]
-            extensions = {".py", ".java", ".kt", ".swift", ".m", ".h", ".js", ".ts", ".xml", ".plist"}
-
-            def should_exclude(path: Path) -> bool:
-                return any(ex in str(path) for ex in exclude)
-
-            pattern = "**/*" if recursive else "*"
-            for file_path in source_path.glob(pattern):
-                if file_path.is_file() and not should_exclude(file_path):
-                    if file_path.suffix.lower() in extensions or file_path.name in [
-                        "AndroidManifest.xml",
-                        "Info.plist",
-                    ]:
-                        files_scanned += 1
+            files = self.collect_files(source_path, recursive, exclude_patterns)
+        else:
+            files = []
+
+        if since is not None:
+            changed = git_changed_files(source_path, since)
+            files = [file_path for file_path in files if file_path.resolve() in changed]
+
+        findings = self.analyze_files(files, workers=workers)
 
         return SASTResult(
             findings=findings,
             source_path=str(source_path),
             language=language,
-            files_scanned=files_scanned,
+            files_scanned=len(files),
+            files_from_cache=self.cache_hits,
         )
 
     def export_html(self, result: SASTResult, output_path: Path) -> None:
@@ -1178,3 +1261,64 @@ class SASTAnalyzer:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, "w") as f:
             f.write(html_content)
+
+
+_worker_analyzer: Optional[SASTAnalyzer] = None
+
+
+def _init_sast_worker():
+    """ProcessPoolExecutor initializer: one SASTAnalyzer per worker process"""
+    global _worker_analyzer
+    _worker_analyzer = SASTAnalyzer()
+
+
+def _analyze_batch_in_worker(files: List[Path]) -> List[List[SASTFinding]]:
+    """Analyze a batch of files in a worker process (findings per file)"""
+    if _worker_analyzer is None:
+        raise RuntimeError("SAST worker not initialized")
+    return [_worker_analyzer.analyze_file(file_path) for file_path in files]
+
+
+@lru_cache(maxsize=None)
+def ruleset_version() -> str:
+    """Cache key of the current rules: SAST_RULESET_VERSION plus a hash of this module's source"""
+    source_hash = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+    return f"{SAST_RULESET_VERSION}-{source_hash}"
+
+
+def file_cache_key(file_path: Path) -> str:
+    """
+    Findings cache key of a file: its content hash plus the file kind
+
+    analyze_file also branches on the suffix (.py control flow) and on
+    special file names, so identical content of another kind is not reused.
+    """
+    kind = file_path.name if file_path.name in ANALYZED_FILENAMES else file_path.suffix.lower()
+    return f"{content_hash(file_path)}:{kind}"
+
+
+def git_changed_files(path: Path, since: str) -> Set[Path]:
+    """
+    Files changed since a git ref in the repository containing path
+
+    Covers committed, staged and unstaged changes and untracked (not
+    ignored) files; deleted files are left out. Paths are resolved.
+
+    Raises:
+        ValueError: path is not in a git repository or the ref is unknown
+    """
+    cwd = path if path.is_dir() else path.parent
+
+    def git(*args: str) -> str:
+        try:
+            result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+        except FileNotFoundError:
+            raise ValueError("git is not installed")
+        except subprocess.CalledProcessError as e:
+            raise ValueError(f"git {' '.join(args)} failed: {e.stderr.strip()}")
+        return result.stdout
+
+    root = Path(git("rev-parse", "--show-toplevel").strip())
+    names = git("diff", "--name-only", "-z", "--diff-filter=d", since, "--").split("\0")
+    names += git("ls-files", "--others", "--exclude-standard", "-z", "--full-name").split("\0")
+    return {(root / name).resolve() for name in names if name}
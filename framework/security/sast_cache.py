@@ -0,0 +1,181 @@
+"""
+Persistent SAST findings cache
+
+Stores the findings of each analyzed file in a small SQLite database keyed
+by the file's content hash (with its kind, see file_cache_key) and the
+analyzer ruleset version, so repeated SAST runs only re-analyze files whose
+content (or the rules) changed.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from framework.security.types import Severity
+from framework.storage.connection_pool import SQLiteConnectionPool
+
+# Relative to the working directory, like the test duration history
+DEFAULT_SAST_CACHE_PATH = Path(".observe") / "sast_cache.db"
+
+
+class SASTFindingsCache:
+    """
+    Findings per (content key, ruleset version)
+
+    The content key is the file's content hash plus its suffix or special
+    name, as analysis depends on both. Findings mention the path they were found under; when the same content
+    is looked up under another path (a moved or copied file) the paths in
+    the cached findings are rewritten.
+
+    Usage:
+        analyzer = SASTAnalyzer(cache=SASTFindingsCache())
+        analyzer.analyze(Path("app/src"))  # Second run reuses unchanged files
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_SAST_CACHE_PATH):
+        """
+        Args:
+            db_path: Path to the SQLite database (created on first use)
+        """
+        self.db_path = Path(db_path)
+        self._pool: Optional[SQLiteConnectionPool] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._pool is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._pool = SQLiteConnectionPool(str(self.db_path))
+            conn = self._pool.acquire()
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sast_findings (
+                    content_hash TEXT NOT NULL,
+                    ruleset TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    findings TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (content_hash, ruleset)
+                )
+                """
+            )
+            conn.commit()
+        return self._pool.acquire()
+
+    def lookup(self, files: Dict[str, str], ruleset: str) -> Dict[str, List[Any]]:
+        """
+        Cached findings of files (path -> content key), for those that have any
+
+        Returns:
+            path -> findings, with paths rewritten to the path asked for
+        """
+        by_hash: Dict[str, List[str]] = {}
+        for path, content_hash in files.items():
+            by_hash.setdefault(content_hash, []).append(path)
+        hashes = list(by_hash)
+
+        conn = self._connection()
+        cached = {}
+        # Stay below SQLite's bound parameter limit
+        for i in range(0, len(hashes), 500):
+            chunk = hashes[i : i + 500]
+            cursor = conn.execute(
+                f"SELECT content_hash, file_path, findings FROM sast_findings "
+                f"WHERE ruleset = ? AND content_hash IN ({', '.join('?' * len(chunk))})",
+                [ruleset, *chunk],
+            )
+            for row in cursor:
+                stored = json.loads(row["findings"])
+                for path in by_hash[row["content_hash"]]:
+                    cached[path] = [finding_from_dict(_relocate(data, row["file_path"], path)) for data in stored]
+        return cached
+
+    def store(self, entries: Iterable[Tuple[str, str, List[Any]]], ruleset: str):
+        """Save findings of analyzed files (path, content key, findings) in a single transaction"""
+        now = time.time()
+        rows = [
+            (content_hash, ruleset, path, json.dumps([finding_to_dict(f) for f in findings], default=str), now)
+            for path, content_hash, findings in entries
+        ]
+        if not rows:
+            return
+
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sast_findings (content_hash, ruleset, file_path, findings, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def prune(self, ruleset: str) -> int:
+        """Drop entries from other ruleset versions; returns the number removed"""
+        if self._pool is None and not self.db_path.exists():
+            return 0
+
+        conn = self._connection()
+        with conn:
+            return conn.execute("DELETE FROM sast_findings WHERE ruleset != ?", (ruleset,)).rowcount
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+
+def content_hash(file_path: Path) -> str:
+    """SHA-256 of a file's bytes"""
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def finding_to_dict(finding: Any) -> Dict[str, Any]:
+    """Lossless JSON-ready form of a SASTFinding (SASTFinding.to_dict drops the taint flow)"""
+    data = asdict(finding)
+    data["vulnerability_type"] = finding.vulnerability_type.value
+    data["severity"] = finding.severity.value
+    if finding.taint_flow is not None:
+        data["taint_flow"]["vulnerability_type"] = finding.taint_flow.vulnerability_type.value
+    return data
+
+
+def finding_from_dict(data: Dict[str, Any]) -> Any:
+    """Inverse of finding_to_dict"""
+    from framework.security.sast_analyzer import SASTFinding, TaintFlow, TaintSink, TaintSource, VulnerabilityType
+
+    data = dict(data)
+    data["vulnerability_type"] = VulnerabilityType(data["vulnerability_type"])
+    data["severity"] = Severity(data["severity"])
+    flow = data.get("taint_flow")
+    if flow is not None:
+        data["taint_flow"] = TaintFlow(
+            source=TaintSource(**flow["source"]),
+            sink=TaintSink(**flow["sink"]),
+            path=flow["path"],
+            vulnerability_type=VulnerabilityType(flow["vulnerability_type"]),
+        )
+    return SASTFinding(**data)
+
+
+def _relocate(data: Dict[str, Any], old_path: str, new_path: str) -> Dict[str, Any]:
+    """Finding dict with the paths it was recorded under replaced by new_path"""
+    if old_path == new_path:
+        return data
+
+    data = dict(data, file_path=new_path if data["file_path"] == old_path else data["file_path"])
+    flow = data.get("taint_flow")
+    if flow is not None:
+        flow = dict(flow)
+        for end in ("source", "sink"):
+            if flow[end]["location"] == old_path:
+                flow[end] = dict(flow[end], location=new_path)
+        data["taint_flow"] = flow
+    return data
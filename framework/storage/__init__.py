@@ -2,6 +2,7 @@
 Event storage and persistence layer
 """
 
-from framework.storage.event_store import EventStore
+from framework.storage.connection_pool import SQLiteConnectionPool
+from framework.storage.event_store import EventFileReader, EventStore, StoredEvent
 
-__all__ = ["EventStore"]
+__all__ = ["EventStore", "EventFileReader", "StoredEvent", "SQLiteConnectionPool"]
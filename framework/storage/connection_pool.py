@@ -0,0 +1,137 @@
+"""
+Connection Pool - long-lived, thread-aware SQLite connections
+
+Each thread gets its own connection, opened once and reused for every
+query. Connections run in WAL mode so readers (dashboard, correlator) never
+block the recording writer.
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3.Connection that can be tracked by weak reference"""
+
+
+class SQLiteConnectionPool:
+    """
+    Per-thread SQLite connection pool
+
+    Features:
+    - One persistent connection per thread (sqlite3 connections are not thread-safe)
+    - WAL journal and tuned pragmas applied once per connection
+    - Connections of finished threads are released with the thread
+    - Fork-safe: a child process never reuses its parent's connections
+    - Optional read-only mode for processes that must never write
+    """
+
+    DEFAULT_PRAGMAS: Dict[str, Any] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",  # Durable in WAL mode, fsync only at checkpoint
+        "cache_size": -65536,  # 64 MB page cache
+        "mmap_size": 268435456,  # 256 MB memory-mapped I/O
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # ms to wait for a competing writer
+    }
+
+    def __init__(self, db_path: str, pragmas: Optional[Dict[str, Any]] = None, read_only: bool = False):
+        """
+        Args:
+            db_path: Path to SQLite database file
+            pragmas: Overrides merged into DEFAULT_PRAGMAS
+            read_only: Open connections with mode=ro; writes raise sqlite3.OperationalError
+        """
+        self.db_path = Path(db_path)
+        self.pragmas = {**self.DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.read_only = read_only
+        if read_only:
+            # The journal mode is persistent in the file and cannot be changed read-only
+            self.pragmas.pop("journal_mode", None)
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: "weakref.WeakSet[_PooledConnection]" = weakref.WeakSet()
+        self._pid = os.getpid()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close all connections"""
+        self.close()
+        return False
+
+    def acquire(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use"""
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.add(conn)
+
+        return conn
+
+    def _connect(self) -> _PooledConnection:
+        """Open a new connection and apply pragmas"""
+        # check_same_thread=False only so close() may run from another thread;
+        # each connection is otherwise used by its owning thread alone
+        if self.read_only:
+            database, uri = f"{self.db_path.resolve().as_uri()}?mode=ro", True
+        else:
+            database, uri = str(self.db_path), False
+        conn = sqlite3.connect(database, uri=uri, factory=_PooledConnection, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+
+        return conn
+
+    def _reset_after_fork(self):
+        """Forget connections inherited from the parent process; they are never reused"""
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections = weakref.WeakSet()
+        self._pid = os.getpid()
+
+    def release_thread(self):
+        """Close the calling thread's connection, if any"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            with self._lock:
+                self._connections.discard(conn)
+            conn.close()
+
+    def close(self):
+        """Close every connection opened by this pool (later calls reopen lazily)"""
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+
+        with self._lock:
+            connections = list(self._connections)
+            self._connections = weakref.WeakSet()
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass  # Already closed or unusable
+
+        self._local = threading.local()
+
+    @property
+    def size(self) -> int:
+        """Number of open connections"""
+        with self._lock:
+            return len(self._connections)
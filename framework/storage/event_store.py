@@ -4,11 +4,225 @@ Event Store - SQLite-based storage for observation events
 Stores events collected by Observe SDK for later analysis and code generation.
 """
 
+import codecs
 import json
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Generator
+from collections.abc import Mapping
+from typing import List, Optional, Dict, Any, Generator, Iterable, Iterator, Tuple, Callable
+
+from framework.storage.connection_pool import SQLiteConnectionPool
+
+JSON_LINES_SUFFIXES = {".jsonl", ".ndjson"}
+
+
+class EventFileReader:
+    """
+    Incremental reader for event export files
+
+    Yields events one at a time without loading the whole file, so memory
+    stays bounded by the chunk size and the largest single event.
+
+    Supported formats:
+    - JSON envelope exported by EventExporter: {"events": [...], ...}
+    - Bare JSON array of events
+    - JSON lines: one event object per line
+    """
+
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.total_bytes = self.path.stat().st_size
+        self.bytes_read = 0
+
+        self._decoder = json.JSONDecoder()
+        self._file: Any = None
+        self._text_decoder: Any = None
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    @property
+    def is_json_lines(self) -> bool:
+        """Whether the file is treated as JSON lines (by suffix)"""
+        return self.path.suffix.lower() in JSON_LINES_SUFFIXES
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_json_lines() if self.is_json_lines else self.iter_envelope()
+
+    def iter_json_lines(self) -> Iterator[Dict[str, Any]]:
+        """Yield events from a JSON-lines file"""
+        self.bytes_read = 0
+        with open(self.path, "rb") as f:
+            for line_no, line in enumerate(f, 1):
+                self.bytes_read += len(line)
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Malformed event on line {line_no} of {self.path}: {e}") from e
+
+    def iter_envelope(self) -> Iterator[Dict[str, Any]]:
+        """Yield events from an {"events": [...]} envelope or a bare JSON array"""
+        self.bytes_read = 0
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+        with open(self.path, "rb") as f:
+            self._file = f
+            try:
+                first = self._next_char()
+                if first == "[":
+                    yield from self._iter_array()
+                elif first == "{":
+                    yield from self._iter_object_events()
+                elif first:
+                    raise ValueError(f"Unexpected {first!r} at start of {self.path}")
+            finally:
+                self._file = None
+
+    def _iter_object_events(self) -> Iterator[Dict[str, Any]]:
+        """Scan top-level keys of the envelope and stream the "events" array"""
+        if self._peek_char() == "}":
+            return
+
+        while True:
+            key = self._decode_value()
+            self._expect(":")
+
+            if key == "events":
+                self._expect("[")
+                yield from self._iter_array()
+                # Remaining envelope keys carry no events
+                return
+
+            self._decode_value()
+
+            separator = self._next_char()
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed event export {self.path}: expected ',' or '}}', got {separator!r}")
+
+    def _iter_array(self) -> Iterator[Any]:
+        """Yield array elements; the opening '[' is already consumed"""
+        if self._peek_char() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._decode_value()
+
+            separator = self._next_char()
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed event export {self.path}: expected ',' or ']', got {separator!r}")
+
+    def _fill(self) -> bool:
+        """Read the next chunk into the buffer, dropping consumed text"""
+        if self._eof:
+            return False
+
+        chunk = self._file.read(self.chunk_size)
+        self.bytes_read += len(chunk)
+        self._buf = self._buf[self._pos :] + self._text_decoder.decode(chunk, final=not chunk)
+        self._pos = 0
+
+        if not chunk:
+            self._eof = True
+            return False
+        return True
+
+    def _peek_char(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _next_char(self) -> str:
+        """Consume and return the next non-whitespace character"""
+        char = self._peek_char()
+        if char:
+            self._pos += 1
+        return char
+
+    def _expect(self, expected: str):
+        char = self._next_char()
+        if char != expected:
+            raise ValueError(f"Malformed event export {self.path}: expected {expected!r}, got {char!r}")
+
+    def _decode_value(self) -> Any:
+        """Decode one JSON value at the cursor, reading more input as needed"""
+        self._peek_char()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"Malformed event export {self.path}: {e}") from e
+
+            # A scalar ending exactly at the buffer edge may be truncated ("12" of "123")
+            if end == len(self._buf) and self._fill():
+                continue
+
+            self._pos = end
+            return value
+
+
+class StoredEvent(Mapping):
+    """
+    Read-only event row whose JSON ``data`` column is decoded on first access
+
+    Behaves like the dicts returned by EventStore.get_events, but walking a
+    session without touching ``data`` never pays for json.loads.
+    """
+
+    __slots__ = ("_row", "_data", "_decoded")
+
+    def __init__(self, row: Dict[str, Any]):
+        self._row = row
+        self._data: Any = None
+        self._decoded = False
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "data":
+            if not self._decoded:
+                self._data = json.loads(self._row["data"])
+                self._decoded = True
+            return self._data
+        return self._row[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._row)
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    @property
+    def raw_data(self) -> str:
+        """Undecoded JSON of the event payload"""
+        return self._row["data"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Fully decoded copy, as returned by get_events"""
+        return {key: self[key] for key in self._row}
+
+    def __repr__(self) -> str:
+        return f"StoredEvent(id={self._row.get('id')}, event_type={self._row.get('event_type')!r})"
 
 
 class EventStore:
@@ -20,11 +234,49 @@ class EventStore:
     - Query events by session, screen, type
     - Support for event replay
     - Fast indexed queries
+    - Streaming iteration over arbitrarily long sessions
+    - Persistent per-thread connections in WAL mode
+    - Read-only mode for worker processes reading alongside a writer
     """
 
-    def __init__(self, db_path: str = "observe_events.db"):
+    DEFAULT_BATCH_SIZE = 1000
+
+    SCHEMA_VERSION = 2
+
+    # Migrations keyed by the schema version they upgrade to (tracked in PRAGMA user_version)
+    MIGRATIONS: Dict[int, str] = {
+        # Composite indexes matching get_events filters, so per-session lookups are
+        # index range scans already in timestamp order (no temp B-tree sort).
+        # (session_id, timestamp) makes the single-column session index redundant.
+        2: """
+            CREATE INDEX IF NOT EXISTS idx_events_session_time ON events(session_id, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_events_session_type_time ON events(session_id, event_type, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_events_session_screen_time ON events(session_id, screen, timestamp);
+            DROP INDEX IF EXISTS idx_session_id;
+        """,
+    }
+
+    def __init__(
+        self, db_path: str = "observe_events.db", pragmas: Optional[Dict[str, Any]] = None, read_only: bool = False
+    ):
+        """
+        Args:
+            db_path: Path to SQLite database file
+            pragmas: Overrides for SQLiteConnectionPool.DEFAULT_PRAGMAS
+            read_only: Open an existing database for queries only (no schema
+                setup or migrations; writes raise sqlite3.OperationalError)
+        """
         self.db_path = Path(db_path)
-        self._init_database()
+        self.read_only = read_only
+        if read_only and not self.db_path.exists():
+            raise FileNotFoundError(f"Event database not found: {self.db_path}")
+
+        self._pool = SQLiteConnectionPool(str(self.db_path), pragmas=pragmas, read_only=read_only)
+        # Session IDs known to exist in the sessions table, so bulk ingest
+        # does not have to SELECT once per event
+        self._known_sessions: set[str] = set()
+        if not read_only:
+            self._init_database()
 
     def _init_database(self):
         """Initialize database schema"""
@@ -92,7 +344,6 @@ class EventStore:
                                )
                                    );
 
-                               CREATE INDEX IF NOT EXISTS idx_session_id ON events(session_id);
                                CREATE INDEX IF NOT EXISTS idx_event_type ON events(event_type);
                                CREATE INDEX IF NOT EXISTS idx_screen ON events(screen);
                                CREATE INDEX IF NOT EXISTS idx_timestamp ON events(timestamp);
@@ -180,62 +431,192 @@ class EventStore:
                                """
             )
 
+            self._migrate(conn)
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """Apply pending schema migrations in order"""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+        for target in sorted(v for v in self.MIGRATIONS if v > version):
+            conn.executescript(self.MIGRATIONS[target])
+            conn.execute(f"PRAGMA user_version = {target}")
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - ensure connections are closed"""
+        self.close()
+        return False
+
+    def close(self):
+        """Close all pooled connections"""
+        self._pool.close()
+
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get database connection with context manager"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Get the calling thread's pooled connection, committing on success"""
+        conn = self._pool.acquire()
+
+        if conn.in_transaction:
+            # Nested use: the outermost block owns commit/rollback
+            yield conn
+            return
+
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
 
-    def import_from_json(self, json_path: str) -> int:
+    def import_from_json(
+        self,
+        json_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
         """
         Import events from JSON file (exported by EventExporter)
 
+        The file is streamed, so memory stays bounded regardless of its size.
+        Files ending in .jsonl/.ndjson are read as one event per line;
+        anything else as an {"events": [...]} envelope (or a bare array).
+
+        Args:
+            json_path: Path to the export file
+            batch_size: Number of events per transaction
+            progress_callback: Called after every batch with (bytes_read, total_bytes)
+
         Returns number of imported events
         """
-        with open(json_path, "r") as f:
-            data = json.load(f)
+        reader = EventFileReader(json_path)
 
-        events = data.get("events", [])
-        count = 0
+        return self.add_events(
+            reader, batch_size=batch_size, progress_callback=self._byte_progress(reader, progress_callback)
+        )
 
-        for event in events:
-            self.add_event(event)
-            count += 1
+    def import_from_jsonl(
+        self,
+        jsonl_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """
+        Import events from a JSON-lines file regardless of its suffix
 
-        return count
+        Returns number of imported events
+        """
+        reader = EventFileReader(jsonl_path)
+
+        return self.add_events(
+            reader.iter_json_lines(),
+            batch_size=batch_size,
+            progress_callback=self._byte_progress(reader, progress_callback),
+        )
+
+    @staticmethod
+    def _byte_progress(
+        reader: EventFileReader, progress_callback: Optional[Callable[[int, int], None]]
+    ) -> Optional[Callable[[int], None]]:
+        """add_events callback reporting a file import's (bytes_read, total_bytes)"""
+        if progress_callback is None:
+            return None
+        return lambda _imported: progress_callback(reader.bytes_read, reader.total_bytes)
 
     def add_event(self, event: Dict[str, Any]):
         """Add single event to store"""
-        # Extract common fields
-        session_id = event.get("sessionId", "unknown")
-        event_type = self._get_event_type(event)
-        timestamp = event.get("timestamp", 0)
-        screen = event.get("screen") or event.get("toScreen") or event.get("fromScreen")
+        self.add_events([event])
+
+    def add_events(
+        self,
+        events: Iterable[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Add many events over a single connection
+
+        Events are inserted with executemany, one transaction per batch.
+        Navigation screen/flow counters are aggregated per batch and flushed
+        with one upsert per key.
+
+        Args:
+            events: Iterable of raw event dicts (consumed lazily)
+            batch_size: Number of events per transaction
+            progress_callback: Called with the running total after each committed batch
+
+        Returns:
+            Number of events added
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        count = 0
+        batch: List[Dict[str, Any]] = []
+
+        try:
+            with self._get_connection() as conn:
+                for event in events:
+                    batch.append(event)
+                    if len(batch) >= batch_size:
+                        self._write_batch(conn, batch)
+                        conn.commit()
+                        count += len(batch)
+                        batch = []
+                        if progress_callback:
+                            progress_callback(count)
+
+                if batch:
+                    self._write_batch(conn, batch)
+                    conn.commit()
+                    count += len(batch)
+                    if progress_callback:
+                        progress_callback(count)
+        except Exception:
+            # The failed batch was rolled back, possibly with sessions it created
+            self._known_sessions.clear()
+            raise
+
+        return count
+
+    def _write_batch(self, conn: sqlite3.Connection, events: List[Dict[str, Any]]):
+        """Insert one batch of events and flush its aggregated navigation stats"""
+        rows = []
+        # (session_id, screen_name) -> [visits, first_visit, last_visit]
+        screen_stats: Dict[Tuple[str, str], List[int]] = {}
+        # (session_id, from_screen, to_screen) -> transitions
+        flow_stats: Dict[Tuple[str, str, str], int] = {}
+
+        for event in events:
+            # Extract common fields
+            session_id = event.get("sessionId", "unknown")
+            event_type = self._get_event_type(event)
+            timestamp = event.get("timestamp", 0)
+            screen = event.get("screen") or event.get("toScreen") or event.get("fromScreen")
 
-        with self._get_connection() as conn:
             # Ensure session exists
-            self._ensure_session(conn, session_id, event)
+            if session_id not in self._known_sessions:
+                self._ensure_session(conn, session_id, event)
+                self._known_sessions.add(session_id)
 
-            # Insert event
-            conn.execute(
-                """
-                         INSERT INTO events (session_id, event_type, timestamp, screen, data)
-                         VALUES (?, ?, ?, ?, ?)
-                         """,
-                (session_id, event_type, timestamp, screen, json.dumps(event)),
-            )
+            rows.append((session_id, event_type, timestamp, screen, json.dumps(event)))
 
-            # Update screens and flows
+            # Aggregate screens and flows
             if event_type == "navigation":
-                self._update_navigation_stats(conn, session_id, event)
+                self._aggregate_navigation_stats(screen_stats, flow_stats, session_id, event)
+
+        # Insert events
+        conn.executemany(
+            """
+                     INSERT INTO events (session_id, event_type, timestamp, screen, data)
+                     VALUES (?, ?, ?, ?, ?)
+                     """,
+            rows,
+        )
+
+        self._flush_navigation_stats(conn, screen_stats, flow_stats)
 
     def _ensure_session(self, conn: sqlite3.Connection, session_id: str, event: Dict[str, Any]):
         """Ensure session record exists"""
@@ -269,35 +650,66 @@ class EventStore:
         else:
             return "unknown"
 
-    def _update_navigation_stats(self, conn: sqlite3.Connection, session_id: str, event: Dict[str, Any]):
-        """Update screen and flow statistics"""
+    def _aggregate_navigation_stats(
+        self,
+        screen_stats: Dict[Tuple[str, str], List[int]],
+        flow_stats: Dict[Tuple[str, str, str], int],
+        session_id: str,
+        event: Dict[str, Any],
+    ):
+        """Accumulate screen and flow statistics for one navigation event"""
         to_screen = event.get("toScreen")
         from_screen = event.get("fromScreen")
         timestamp = event.get("timestamp", 0)
 
         if to_screen:
-            # Update screen visit
-            conn.execute(
+            # Count screen visit
+            stats = screen_stats.get((session_id, to_screen))
+            if stats is None:
+                screen_stats[(session_id, to_screen)] = [1, timestamp, timestamp]
+            else:
+                stats[0] += 1
+                stats[2] = timestamp
+
+        if from_screen and to_screen:
+            # Count flow
+            key = (session_id, from_screen, to_screen)
+            flow_stats[key] = flow_stats.get(key, 0) + 1
+
+    def _flush_navigation_stats(
+        self,
+        conn: sqlite3.Connection,
+        screen_stats: Dict[Tuple[str, str], List[int]],
+        flow_stats: Dict[Tuple[str, str, str], int],
+    ):
+        """Write aggregated screen and flow statistics, one upsert per key"""
+        if screen_stats:
+            conn.executemany(
                 """
                          INSERT INTO screens (session_id, screen_name, visit_count, first_visit, last_visit)
-                         VALUES (?, ?, 1, ?, ?) ON CONFLICT(session_id, screen_name) DO
+                         VALUES (?, ?, ?, ?, ?) ON CONFLICT(session_id, screen_name) DO
                          UPDATE SET
-                             visit_count = visit_count + 1,
-                             last_visit = ?
+                             visit_count = visit_count + excluded.visit_count,
+                             last_visit = excluded.last_visit
                          """,
-                (session_id, to_screen, timestamp, timestamp, timestamp),
+                [
+                    (session_id, screen, visits, first, last)
+                    for (session_id, screen), (visits, first, last) in screen_stats.items()
+                ],
             )
 
-        if from_screen and to_screen:
-            # Update flow
-            conn.execute(
+        if flow_stats:
+            conn.executemany(
                 """
                          INSERT INTO flows (session_id, from_screen, to_screen, count)
-                         VALUES (?, ?, ?, 1) ON CONFLICT(session_id, from_screen, to_screen) DO
+                         VALUES (?, ?, ?, ?) ON CONFLICT(session_id, from_screen, to_screen) DO
                          UPDATE SET
-                             count = count + 1
+                             count = count + excluded.count
                          """,
-                (session_id, from_screen, to_screen),
+                [
+                    (session_id, from_screen, to_screen, n)
+                    for (session_id, from_screen, to_screen), n in flow_stats.items()
+                ],
             )
 
     def get_sessions(self) -> List[Dict[str, Any]]:
@@ -323,8 +735,132 @@ class EventStore:
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
         """Query events with filters"""
+        query, params = self._build_events_query(session_id, event_type, screen)
+        query += " LIMIT ?"
+        params.append(limit)
+
+        with self._get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+            events = []
+            for row in rows:
+                event = dict(row)
+                event["data"] = json.loads(event["data"])
+                events.append(event)
+
+            return events
+
+    def iter_events(
+        self,
+        session_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        screen: Optional[str] = None,
+        page_size: int = 1000,
+        lazy_data: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Iterate over all matching events in timestamp order without a limit
+
+        Pages through the table with keyset pagination on (timestamp, id), so
+        memory stays bounded by page_size however long the session is, and no
+        read transaction is held between pages.
+
+        Args:
+            session_id: Filter by session
+            event_type: Filter by event type
+            screen: Filter by screen
+            page_size: Rows fetched per query
+            lazy_data: Yield StoredEvent objects that decode ``data`` on first
+                access instead of dicts with ``data`` already decoded
+
+        Yields:
+            Event dicts (or StoredEvent mappings when lazy_data is set)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        after: Optional[Tuple[int, int]] = None
+
+        while True:
+            query, params = self._build_events_query(session_id, event_type, screen, after=after)
+            query += " LIMIT ?"
+            params.append(page_size)
+
+            with self._get_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+
+            for row in rows:
+                if lazy_data:
+                    yield StoredEvent(dict(row))
+                else:
+                    event = dict(row)
+                    event["data"] = json.loads(event["data"])
+                    yield event
+
+            if len(rows) < page_size:
+                return
+
+            last = rows[-1]
+            after = (last["timestamp"], last["id"])
+
+    def iter_events_since(
+        self, after_id: int = 0, session_id: Optional[str] = None, page_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over events stored after the event with row ID after_id, in insertion order
+
+        Unlike iter_events this follows arrival order rather than timestamps,
+        so a reader polling a live session with the last ``id`` it saw never
+        skips an event that was written late with an earlier timestamp.
+
+        Args:
+            after_id: Row ID of the last event already read (0 for all)
+            session_id: Filter by session
+            page_size: Rows fetched per query
+
+        Yields:
+            Event dicts with ``data`` decoded
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        while True:
+            query = "SELECT * FROM events WHERE id > ?"
+            params: List[Any] = [after_id]
+            if session_id:
+                query += " AND session_id = ?"
+                params.append(session_id)
+            query += " ORDER BY id ASC LIMIT ?"
+            params.append(page_size)
+
+            with self._get_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+
+            for row in rows:
+                event = dict(row)
+                event["data"] = json.loads(event["data"])
+                yield event
+
+            if len(rows) < page_size:
+                return
+
+            after_id = rows[-1]["id"]
+
+    def _build_events_query(
+        self,
+        session_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        screen: Optional[str] = None,
+        after: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the filtered events query used by get_events and iter_events
+
+        Rows are ordered by (timestamp, id); ``after`` resumes strictly past
+        that key for keyset pagination.
+        """
         query = "SELECT * FROM events WHERE 1=1"
-        params = []
+        params: List[Any] = []
 
         if session_id:
             query += " AND session_id = ?"
@@ -338,19 +874,12 @@ class EventStore:
             query += " AND screen = ?"
             params.append(screen)
 
-        query += " ORDER BY timestamp ASC LIMIT ?"
-        params.append(limit)
+        if after is not None:
+            query += " AND (timestamp, id) > (?, ?)"
+            params.extend(after)
 
-        with self._get_connection() as conn:
-            rows = conn.execute(query, params).fetchall()
-
-            events = []
-            for row in rows:
-                event = dict(row)
-                event["data"] = json.loads(event["data"])
-                events.append(event)
-
-            return events
+        query += " ORDER BY timestamp ASC, id ASC"
+        return query, params
 
     def get_screens(self, session_id: str) -> List[Dict[str, Any]]:
         """Get all screens visited in session"""
@@ -392,7 +921,7 @@ class EventStore:
 
     def get_event_timeline(self, session_id: str) -> List[Dict[str, Any]]:
         """Get complete event timeline for session"""
-        return self.get_events(session_id=session_id, limit=10000)
+        return list(self.iter_events(session_id=session_id))
 
     def clear_session(self, session_id: str):
         """Delete all data for session"""
@@ -402,6 +931,8 @@ class EventStore:
             conn.execute("DELETE FROM events WHERE session_id = ?", (session_id,))
             conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
 
+        self._known_sessions.discard(session_id)
+
     def clear_all(self):
         """Clear all data"""
         with self._get_connection() as conn:
@@ -410,6 +941,8 @@ class EventStore:
             conn.execute("DELETE FROM events")
             conn.execute("DELETE FROM sessions")
 
+        self._known_sessions.clear()
+
     def get_statistics(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """Get statistics about stored events"""
         with self._get_connection() as conn:
@@ -8,6 +8,8 @@ from framework.testing.load_tester import (
     LoadTestResult,
     LoadProfile,
 )
+from framework.testing.arrival_rate import ArrivalRateGenerator, ArrivalRateProfile, RateStage
+from framework.testing.latency import LatencyHistogram, LatencyRecorder
 from framework.testing.profiler import (
     PerformanceProfiler,
     ProfilerConfig,
@@ -19,6 +21,11 @@ __all__ = [
     "LoadTestConfig",
     "LoadTestResult",
     "LoadProfile",
+    "ArrivalRateGenerator",
+    "ArrivalRateProfile",
+    "RateStage",
+    "LatencyHistogram",
+    "LatencyRecorder",
     "PerformanceProfiler",
     "ProfilerConfig",
     "ProfileResult",
@@ -0,0 +1,279 @@
+"""
+Open-model (arrival-rate) load generation
+
+Sessions are started at the rate the profile asks for, whether or not the
+earlier ones have finished, as real users arrive independently of each
+other. Latency is measured from each session's scheduled start, so time a
+session spent waiting because the system (or the generator) fell behind
+is counted instead of silently omitted ("coordinated omission").
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from framework.testing.latency import LatencyHistogram, LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 1000
+
+# Session failures kept for the report; the rest are only counted
+MAX_RECORDED_ERRORS = 100
+
+Session = Callable[[int], Union[bool, Awaitable[bool]]]
+
+
+@dataclass
+class RateStage:
+    """Sessions started per second for a period"""
+
+    rate: float
+    duration_seconds: float
+
+
+@dataclass
+class ArrivalRateProfile:
+    """Open-model load profile: one stage for a constant rate, several for a stepped one"""
+
+    name: str
+    stages: List[RateStage]
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    description: str = ""
+
+    @classmethod
+    def constant(
+        cls, rate: float, duration_seconds: float, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> "ArrivalRateProfile":
+        """rate sessions per second for duration_seconds"""
+        return cls(
+            name=f"Constant {rate:g}/s",
+            stages=[RateStage(rate, duration_seconds)],
+            max_in_flight=max_in_flight,
+            description=f"{rate:g} sessions/s for {duration_seconds:g}s",
+        )
+
+    @classmethod
+    def stepped(
+        cls,
+        start_rate: float,
+        step_rate: float,
+        steps: int,
+        step_seconds: float,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> "ArrivalRateProfile":
+        """start_rate, then step_rate more every step_seconds, for steps stages"""
+        stages = [RateStage(start_rate + i * step_rate, step_seconds) for i in range(steps)]
+        return cls(
+            name=f"Stepped {start_rate:g}/s +{step_rate:g}/s",
+            stages=stages,
+            max_in_flight=max_in_flight,
+            description=f"{steps} steps of {step_seconds:g}s from {start_rate:g} to {stages[-1].rate:g} sessions/s",
+        )
+
+    @classmethod
+    def parse(
+        cls, spec: str, duration_seconds: float, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> "ArrivalRateProfile":
+        """
+        Profile from a rate spec
+
+        Args:
+            spec: "RATE" for a constant rate over duration_seconds, or
+                "RATE:SECONDS,RATE:SECONDS,..." for stages
+            duration_seconds: Duration of a constant rate
+            max_in_flight: Max sessions running at once
+
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        if ":" not in spec:
+            return cls.constant(float(spec), duration_seconds, max_in_flight)
+
+        stages = []
+        for part in spec.split(","):
+            rate, _, seconds = part.partition(":")
+            stages.append(RateStage(float(rate), float(seconds)))
+        return cls(
+            name="Stepped " + " → ".join(f"{stage.rate:g}/s" for stage in stages),
+            stages=stages,
+            max_in_flight=max_in_flight,
+            description=", ".join(f"{s.rate:g}/s for {s.duration_seconds:g}s" for s in stages),
+        )
+
+    def __post_init__(self):
+        if not self.stages:
+            raise ValueError("An arrival rate profile needs at least one stage")
+        for stage in self.stages:
+            if stage.rate < 0 or stage.duration_seconds <= 0:
+                raise ValueError(f"Invalid stage: {stage.rate}/s for {stage.duration_seconds}s")
+        if self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+    @property
+    def duration_seconds(self) -> float:
+        return sum(stage.duration_seconds for stage in self.stages)
+
+    def arrivals(self) -> Iterator[float]:
+        """Scheduled start of every session, in seconds from the start of the run, evenly spaced per stage"""
+        stage_start = 0.0
+        for stage in self.stages:
+            if stage.rate > 0:
+                count = round(stage.rate * stage.duration_seconds)
+                for i in range(count):
+                    yield stage_start + i / stage.rate
+            stage_start += stage.duration_seconds
+
+
+@dataclass
+class ArrivalRateResult:
+    """Outcome of an open-model run"""
+
+    scheduled: int = 0
+    completed: int = 0
+    passed: int = 0
+    failed: int = 0
+    # Arrivals not started because max_in_flight sessions were already running
+    dropped: int = 0
+    duration_seconds: float = 0.0
+    # Largest delay between a session's scheduled and actual start
+    max_start_lag: float = 0.0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    # From scheduled start to completion (coordinated-omission corrected)
+    latency: LatencyRecorder = field(default_factory=LatencyRecorder)
+    # From actual start to completion
+    service_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class ArrivalRateGenerator:
+    """
+    Asyncio open-model load generator
+
+    A single scheduler coroutine starts one task per arrival. Coroutine
+    sessions run on the event loop, so thousands can be in flight on one
+    machine; plain callables (blocking test runs) go to a thread pool of
+    blocking_workers threads. When max_in_flight sessions are running, new
+    arrivals are dropped and counted rather than queued without bound.
+
+    Usage:
+        async def session(index):
+            return await client.get("/health") is not None
+
+        result = ArrivalRateGenerator(ArrivalRateProfile.constant(500, 60), session).run()
+        result.latency.total.quantile(0.99)
+    """
+
+    def __init__(
+        self,
+        profile: ArrivalRateProfile,
+        session: Session,
+        latency: Optional[LatencyRecorder] = None,
+        blocking_workers: int = 32,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Args:
+            profile: Arrival rate profile
+            session: Called with the arrival index; returns (or resolves to)
+                whether the session passed. Exceptions count as failures.
+            latency: Recorder for the corrected latencies (default: a new one)
+            blocking_workers: Threads for sessions that are not coroutine functions
+            progress_callback: Called with a status line once per second
+        """
+        self.profile = profile
+        self.session = session
+        self.blocking_workers = blocking_workers
+        self.progress_callback = progress_callback
+        self.result = ArrivalRateResult(latency=latency or LatencyRecorder())
+
+        self._is_coroutine = inspect.iscoroutinefunction(session)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def run(self) -> ArrivalRateResult:
+        """Run the profile to completion on a new event loop"""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> ArrivalRateResult:
+        """Run the profile to completion on the running event loop"""
+        loop = asyncio.get_running_loop()
+        in_flight: set = set()
+        if not self._is_coroutine:
+            self._executor = ThreadPoolExecutor(max_workers=self.blocking_workers, thread_name_prefix="load-session")
+
+        start = loop.time()
+        next_progress = start + 1
+        try:
+            for index, offset in enumerate(self.profile.arrivals()):
+                scheduled = start + offset
+                delay = scheduled - loop.time()
+                # Behind schedule: start the overdue arrivals right away, their lag is measured
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self.result.scheduled += 1
+                if len(in_flight) >= self.profile.max_in_flight:
+                    self.result.dropped += 1
+                else:
+                    task = asyncio.ensure_future(self._run_session(index, scheduled))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+                if self.progress_callback and loop.time() >= next_progress:
+                    next_progress = loop.time() + 1
+                    self.progress_callback(self._status(len(in_flight)))
+
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+        self.result.duration_seconds = loop.time() - start
+        return self.result
+
+    async def _run_session(self, index: int, scheduled: float) -> None:
+        loop = asyncio.get_running_loop()
+        if self._is_coroutine:
+            started = loop.time()
+            try:
+                passed, error = await self.session(index), None
+            except Exception as e:
+                passed, error = False, e
+        else:
+            # Started once a thread picks it up: waiting for one is lag, not service time
+            started, passed, error = await loop.run_in_executor(self._executor, self._run_blocking, index)
+        finished = loop.time()
+
+        result = self.result
+        result.max_start_lag = max(result.max_start_lag, started - scheduled)
+        result.latency.record(finished - scheduled)
+        result.service_time.record(finished - started)
+        result.completed += 1
+        if passed:
+            result.passed += 1
+        else:
+            result.failed += 1
+            if error is not None:
+                logger.debug("Load session %d failed: %s", index, error)
+                if len(result.errors) < MAX_RECORDED_ERRORS:
+                    result.errors.append({"arrival": index, "error": str(error)})
+
+    def _run_blocking(self, index: int) -> Tuple[float, bool, Optional[Exception]]:
+        # The event loop's clock is time.monotonic
+        started = time.monotonic()
+        try:
+            return started, self.session(index), None
+        except Exception as e:
+            return started, False, e
+
+    def _status(self, in_flight: int) -> str:
+        live = self.result.latency.window(1).summary()
+        return (
+            f"{self.result.scheduled} started, {in_flight} in flight, {self.result.dropped} dropped"
+            f" | p95 {live['p95']:.3f}s"
+        )
@@ -0,0 +1,216 @@
+"""
+Streaming latency statistics
+
+A mergeable quantile sketch for response times: values are counted in
+logarithmic buckets whose width is a fixed fraction of their value, so
+memory depends on the range of values, not on how many were recorded, and
+every quantile is within the relative accuracy of the exact one.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+# Quantiles are within 1% of the exact value
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Values at or below this (1 microsecond) are counted as zero
+DEFAULT_MIN_VALUE = 1e-6
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    """
+    Thread-safe log-bucketed histogram (DDSketch style)
+
+    Bucket i holds the values in (gamma^(i-1), gamma^i] with
+    gamma = (1 + a) / (1 - a), and is reported as the value within a
+    relative error a of all of them. Recording is O(1); with a = 1% the
+    values from 1 microsecond to 1 hour fit in about 1100 buckets. Count,
+    sum, min and max are exact.
+
+    Usage:
+        histogram = LatencyHistogram()
+        histogram.record(0.250)
+        histogram.quantile(0.95)
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, min_value: float = DEFAULT_MIN_VALUE):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be between 0 and 1, got {relative_accuracy}")
+
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self._lock = threading.Lock()
+        self._counts: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float) -> None:
+        """Add one value"""
+        key = math.ceil(math.log(value) / self._log_gamma) if value > self.min_value else None
+        with self._lock:
+            if key is None:
+                self._zero_count += 1
+            else:
+                self._counts[key] = self._counts.get(key, 0) + 1
+            self.count += 1
+            self.sum += value
+            if value < self.min:
+                self.min = value
+            if value > self.max:
+                self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add all values recorded by other (which must have the same accuracy)"""
+        if other.relative_accuracy != self.relative_accuracy or other.min_value != self.min_value:
+            raise ValueError("Cannot merge histograms with different accuracy")
+
+        with other._lock:
+            counts = dict(other._counts)
+            zero_count, count, total, low, high = other._zero_count, other.count, other.sum, other.min, other.max
+        with self._lock:
+            for key, n in counts.items():
+                self._counts[key] = self._counts.get(key, 0) + n
+            self._zero_count += zero_count
+            self.count += count
+            self.sum += total
+            self.min = min(self.min, low)
+            self.max = max(self.max, high)
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of non-empty buckets (the memory used)"""
+        return len(self._counts) + (1 if self._zero_count else 0)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile q (0..1), or 0 if nothing was recorded"""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Values at several quantiles, in one pass over the buckets"""
+        with self._lock:
+            if not self.count:
+                return [0.0 for _ in qs]
+
+            values = [0.0] * len(qs)
+            seen = self._zero_count
+            value = self.min
+            buckets = iter(sorted(self._counts.items()))
+            for i in sorted(range(len(qs)), key=lambda i: qs[i]):
+                # Nearest rank, as sorted(values)[int(n * q)]
+                rank = min(int(qs[i] * self.count), self.count - 1)
+                while seen <= rank:
+                    key, n = next(buckets)
+                    seen += n
+                    value = 2 * self._gamma**key / (self._gamma + 1)
+                values[i] = min(max(value, self.min), self.max)
+            return values
+
+    def summary(self, qs: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, float]:
+        """count, mean, min, max and the pNN values of qs"""
+        values = self.quantiles(qs)
+        stats = {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+        }
+        for q, value in zip(qs, values):
+            stats[f"p{q * 100:g}"] = value
+        return stats
+
+
+class LatencyRecorder:
+    """
+    Cumulative latency histogram plus per-second histograms of the recent past
+
+    Each second's values go to their own histogram; when the second is over
+    its summary is appended to a bounded timeline and the histogram is kept
+    for window_seconds, so live percentiles over the last seconds can be
+    read while a load test runs.
+
+    Usage:
+        recorder = LatencyRecorder()
+        recorder.record(0.180)  # From any thread
+        recorder.window(10).quantile(0.95)  # Live p95 over the last 10 s
+        recorder.total.summary()  # Whole run
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 10,
+        history_seconds: int = 3600,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            window_seconds: Seconds of per-second histograms kept for window()
+            history_seconds: Per-second summaries kept in the timeline
+            relative_accuracy: Relative accuracy of every histogram
+            clock: Monotonic time source in seconds
+        """
+        self.window_seconds = window_seconds
+        self.relative_accuracy = relative_accuracy
+        self.total = LatencyHistogram(relative_accuracy)
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._start = clock()
+        self._second = 0
+        self._current = LatencyHistogram(relative_accuracy)
+        self._recent: Deque[Tuple[int, LatencyHistogram]] = deque(maxlen=window_seconds)
+        self._timeline: Deque[Dict[str, float]] = deque(maxlen=history_seconds)
+
+    def record(self, seconds: float) -> None:
+        """Add one response time"""
+        with self._lock:
+            self._advance()
+            self._current.record(seconds)
+        self.total.record(seconds)
+
+    def window(self, seconds: Optional[int] = None) -> LatencyHistogram:
+        """Merged histogram of the last seconds (at most window_seconds), the current one included"""
+        seconds = self.window_seconds if seconds is None else min(seconds, self.window_seconds)
+        merged = LatencyHistogram(self.relative_accuracy)
+        with self._lock:
+            self._advance()
+            for second, histogram in self._recent:
+                if second > self._second - seconds:
+                    merged.merge(histogram)
+            merged.merge(self._current)
+        return merged
+
+    def timeline(self) -> List[Dict[str, float]]:
+        """Summary of each second with responses (oldest dropped after history_seconds), the current one last"""
+        with self._lock:
+            self._advance()
+            timeline = list(self._timeline)
+            if self._current.count:
+                timeline.append({"second": self._second, **self._current.summary()})
+        return timeline
+
+    def _advance(self) -> None:
+        """Close the current second if it is over; expects self._lock to be held"""
+        second = int(self._clock() - self._start)
+        if second == self._second:
+            return
+        if self._current.count:
+            self._recent.append((self._second, self._current))
+            self._timeline.append({"second": self._second, **self._current.summary()})
+            self._current = LatencyHistogram(self.relative_accuracy)
+        self._second = second
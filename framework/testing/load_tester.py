@@ -3,7 +3,7 @@ Load Testing - Stress testing and performance profiling
 """
 
 import json
-import statistics
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
@@ -11,8 +11,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable
 
-from framework.devices.device_manager import DeviceManager
-from framework.execution.test_runner import TestRunner
+from framework.devices.device_inventory import DeviceInventory, get_inventory
+from framework.execution.inprocess_test import InProcessTest, InProcessTestError
+from framework.execution.test_runner import TestResultStatus, TestRunner
+from framework.testing.arrival_rate import ArrivalRateGenerator, ArrivalRateProfile
+from framework.testing.latency import LatencyRecorder
 
 
 @dataclass
@@ -40,6 +43,12 @@ class LoadTestConfig:
     fail_fast: bool = False
     collect_metrics: bool = True
     output_dir: Optional[Path] = None
+    # Open model: start sessions at this arrival rate instead of looping virtual users
+    arrival_rate: Optional[ArrivalRateProfile] = None
+    # Collect the test once and call it in this process per iteration instead of forking pytest;
+    # test_path (plus test_filter, a pytest -k expression) must select exactly one test
+    in_process: bool = False
+    test_filter: Optional[str] = None
 
 
 @dataclass
@@ -140,14 +149,21 @@ class LoadTester:
         ),
     }
 
-    def __init__(self, config: LoadTestConfig) -> None:
+    def __init__(self, config: LoadTestConfig, inventory: Optional[DeviceInventory] = None) -> None:
         self.config = config
-        self.device_manager = DeviceManager()
+        # Virtual users read the shared device snapshot instead of listing devices per iteration
+        self.inventory = inventory or get_inventory()
         self.results: List[Dict[str, Any]] = []
-        self.response_times: List[float] = []
+        # Constant-memory response time statistics, readable while the test runs
+        self.latency = LatencyRecorder()
+        # In-process mode: the InProcessTest of the virtual user (or open-model worker) on each thread
+        self._in_process = threading.local()
 
     def run(self, progress_callback: Optional[Callable[[str], None]] = None) -> LoadTestResult:
         """Run load test"""
+        if self.config.arrival_rate is not None:
+            return self._run_open_model(progress_callback)
+
         start_time = datetime.now()
         profile = self.config.profile
 
@@ -204,6 +220,50 @@ class LoadTester:
         # Generate final results
         return self._generate_results(start_time, end_time)
 
+    def _run_open_model(self, progress_callback: Optional[Callable[[str], None]] = None) -> LoadTestResult:
+        """Run the configured arrival rate profile; each arrival is one test execution"""
+        arrival_rate = self.config.arrival_rate
+        if progress_callback:
+            progress_callback(f"Starting open-model load test: {arrival_rate.name}")
+            progress_callback(f"Arrivals: {arrival_rate.description}")
+
+        session = self._execute_test
+        in_process_tests: List[InProcessTest] = []
+        if self.config.in_process:
+            session = self._in_process_session(in_process_tests)
+
+        start_time = datetime.now()
+        generator = ArrivalRateGenerator(
+            arrival_rate,
+            session=session,
+            latency=self.latency,
+            blocking_workers=self.config.max_workers,
+            progress_callback=progress_callback,
+        )
+        try:
+            outcome = generator.run()
+        finally:
+            for test in in_process_tests:
+                test.close()
+        end_time = datetime.now()
+
+        errors = [{"user_id": e["arrival"], "iteration": 0, "error": e["error"]} for e in outcome.errors]
+        return self._build_result(
+            start_time,
+            end_time,
+            total_tests=outcome.completed,
+            passed_tests=outcome.passed,
+            failed_tests=outcome.failed,
+            errors=errors,
+            metrics={
+                "arrival_rate_profile": arrival_rate.name,
+                "scheduled_sessions": outcome.scheduled,
+                "dropped_sessions": outcome.dropped,
+                "max_start_lag_seconds": outcome.max_start_lag,
+                "service_time": outcome.service_time.summary(),
+            },
+        )
+
     def _run_user_session(
         self,
         user_id: int,
@@ -211,8 +271,45 @@ class LoadTester:
         progress_callback: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """Run a single user session"""
-        profile = self.config.profile
         session_results: List[Dict[str, Any]] = []
+
+        iteration = 0
+        try:
+            # Fixtures are set up once per virtual user and reused by all its iterations
+            if self.config.in_process:
+                self._in_process.test = self._start_in_process_test()
+            iteration = self._run_iterations(user_id, start_time, session_results, progress_callback)
+        except InProcessTestError as e:
+            # Bad selection, collection or fixture failure: the session never ran an iteration
+            session_results.append(
+                {
+                    "success": False,
+                    "error": str(e),
+                    "response_time": 0,
+                    "iteration": iteration,
+                }
+            )
+        finally:
+            test = getattr(self._in_process, "test", None)
+            if test is not None:
+                self._in_process.test = None
+                test.close()
+
+        return {
+            "user_id": user_id,
+            "iterations": iteration,
+            "results": session_results,
+        }
+
+    def _run_iterations(
+        self,
+        user_id: int,
+        start_time: datetime,
+        session_results: List[Dict[str, Any]],
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> int:
+        """Run one user's iterations until the duration or iteration limit; returns the iteration count"""
+        profile = self.config.profile
         iteration = 0
 
         while True:
@@ -229,7 +326,7 @@ class LoadTester:
             try:
                 success = self._execute_test(user_id)
                 test_duration = time.time() - test_start
-                self.response_times.append(test_duration)
+                self.latency.record(test_duration)
 
                 session_results.append(
                     {
@@ -261,32 +358,55 @@ class LoadTester:
 
             iteration += 1
 
-        return {
-            "user_id": user_id,
-            "iterations": iteration,
-            "results": session_results,
-        }
+        return iteration
 
     def _execute_test(self, user_id: int) -> bool:
-        """Execute a single test"""
+        """Execute a single test, in this process when this thread has an InProcessTest"""
         # Get available device
-        devices = self.device_manager.get_all_devices()
+        devices = self.inventory.devices()
         if not devices:
             raise RuntimeError("No devices available")
 
         device = devices[user_id % len(devices)]
 
         # Run test
-        runner = TestRunner()
-        test_path = Path(self.config.test_path) if self.config.test_path else None
-        result = runner.run_test(test_name=f"load_test_{user_id}", test_path=test_path)
+        test = getattr(self._in_process, "test", None)
+        if test is not None:
+            result = test.run()
+        else:
+            runner = TestRunner()
+            test_path = Path(self.config.test_path) if self.config.test_path else None
+            result = runner.run_test(test_name=f"load_test_{user_id}", test_path=test_path)
 
         if result is None:
             return False
-        from framework.execution.test_runner import TestResultStatus
 
         return result.status == TestResultStatus.PASSED
 
+    def _start_in_process_test(self) -> InProcessTest:
+        """Collect the configured test and set up its fixtures"""
+        args = ["-k", self.config.test_filter] if self.config.test_filter else []
+        test = InProcessTest(self.config.test_path, args)
+        test.start()
+        return test
+
+    def _in_process_session(self, tests: List[InProcessTest]) -> Callable[[int], bool]:
+        """Open-model session starting an InProcessTest per worker thread on first use; started tests go to tests"""
+        lock = threading.Lock()
+
+        def session(index: int) -> bool:
+            if getattr(self._in_process, "test", None) is None:
+                self._in_process.test = self._start_in_process_test()
+                with lock:
+                    tests.append(self._in_process.test)
+            return self._execute_test(index)
+
+        return session
+
+    def live_stats(self, window_seconds: int = 10) -> Dict[str, float]:
+        """Response time count, mean, min, max, p50, p95 and p99 over the last window_seconds"""
+        return self.latency.window(window_seconds).summary()
+
     def _has_critical_errors(self) -> bool:
         """Check if there are critical errors"""
         if len(self.results) < 10:
@@ -301,8 +421,6 @@ class LoadTester:
 
     def _generate_results(self, start_time: datetime, end_time: datetime) -> LoadTestResult:
         """Generate final test results"""
-        duration = (end_time - start_time).total_seconds()
-
         # Count results
         total_tests = 0
         passed_tests = 0
@@ -325,23 +443,34 @@ class LoadTester:
                                     "error": test_result["error"],
                                 }
                             )
+            elif "error" in user_result:
+                # The user session itself failed (timeout, crash) before reporting results
+                total_tests += 1
+                failed_tests += 1
+                errors.append({"error": user_result["error"]})
 
-        # Calculate response time statistics
-        if self.response_times:
-            avg_response = statistics.mean(self.response_times)
-            min_response = min(self.response_times)
-            max_response = max(self.response_times)
-            sorted_times = sorted(self.response_times)
-            p50 = sorted_times[int(len(sorted_times) * 0.50)]
-            p95 = sorted_times[int(len(sorted_times) * 0.95)]
-            p99 = sorted_times[int(len(sorted_times) * 0.99)]
-        else:
-            avg_response = min_response = max_response = p50 = p95 = p99 = 0
+        return self._build_result(start_time, end_time, total_tests, passed_tests, failed_tests, errors)
+
+    def _build_result(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        total_tests: int,
+        passed_tests: int,
+        failed_tests: int,
+        errors: List[Dict[str, Any]],
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> LoadTestResult:
+        """LoadTestResult with the response time statistics of self.latency"""
+        duration = (end_time - start_time).total_seconds()
+
+        # Response time statistics (percentiles within the sketch's relative accuracy)
+        response_times = self.latency.total.summary()
 
         throughput = total_tests / duration if duration > 0 else 0
 
         return LoadTestResult(
-            profile_name=self.config.profile.name,
+            profile_name=self.config.arrival_rate.name if self.config.arrival_rate else self.config.profile.name,
             start_time=start_time,
             end_time=end_time,
             duration_seconds=duration,
@@ -351,14 +480,19 @@ class LoadTester:
             skipped_tests=0,
             error_tests=len(errors),
             total_requests=total_tests,
-            avg_response_time=avg_response,
-            min_response_time=min_response,
-            max_response_time=max_response,
-            p50_response_time=p50,
-            p95_response_time=p95,
-            p99_response_time=p99,
+            avg_response_time=response_times["mean"],
+            min_response_time=response_times["min"],
+            max_response_time=response_times["max"],
+            p50_response_time=response_times["p50"],
+            p95_response_time=response_times["p95"],
+            p99_response_time=response_times["p99"],
             throughput=throughput,
             errors=errors,
+            metrics={
+                "percentile_relative_accuracy": self.latency.relative_accuracy,
+                "response_time_timeline": self.latency.timeline(),
+                **(metrics or {}),
+            },
         )
 
     def save_results(self, result: LoadTestResult, output_path: Path) -> None:
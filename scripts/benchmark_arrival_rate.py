@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark open-model load generation
+
+Drives a simulated mock backend (a fixed service latency, plus a stall
+every few seconds) with the closed thread-per-virtual-user model LoadTester
+used so far and with ArrivalRateGenerator at a fixed arrival rate. It
+reports the throughput each one reaches and the latency it measures. During
+a stall the closed model stops sending, so the stall never shows in its
+latency (coordinated omission); the open model keeps arriving and reports it.
+
+Usage:
+    python scripts/benchmark_arrival_rate.py --rate 2000 --duration 10 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.testing.arrival_rate import ArrivalRateGenerator, ArrivalRateProfile  # noqa: E402
+from framework.testing.latency import LatencyHistogram  # noqa: E402
+
+
+class MockBackend:
+    """Answers after latency seconds; every stall_every seconds it stops answering for stall seconds"""
+
+    def __init__(self, latency: float, stall_every: float, stall: float):
+        self.latency = latency
+        self.stall_every = stall_every
+        self.stall = stall
+        self.start = time.monotonic()
+
+    def delay(self) -> float:
+        phase = (time.monotonic() - self.start) % self.stall_every
+        # Requests arriving during a stall are answered when it ends
+        stalled = phase >= self.stall_every - self.stall
+        return self.latency + (self.stall_every - phase if stalled else 0.0)
+
+    def call(self) -> bool:
+        time.sleep(self.delay())
+        return True
+
+    async def call_async(self) -> bool:
+        await asyncio.sleep(self.delay())
+        return True
+
+
+def closed_model(backend: MockBackend, users: int, duration: float):
+    """The previous LoadTester loop: each virtual user thread sends, waits for the answer, sends again"""
+    latency = LatencyHistogram()
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def user():
+        while time.monotonic() < deadline:
+            start = time.monotonic()
+            backend.call()
+            with lock:
+                latency.record(time.monotonic() - start)
+
+    with ThreadPoolExecutor(max_workers=users) as executor:
+        for _ in range(users):
+            executor.submit(user)
+    return latency
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark open-model load generation")
+    parser.add_argument("--rate", type=float, default=2000, help="Target sessions per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per run")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Backend service latency")
+    parser.add_argument("--stall-every", type=float, default=5, help="Seconds between backend stalls")
+    parser.add_argument("--stall-ms", type=float, default=1000, help="Backend stall length (0 for none)")
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    # Closed-model users needed to reach the rate if the backend never stalled
+    users = max(1, round(args.rate * latency))
+    print(f"Target {args.rate:g}/s for {args.duration:g}s, backend {args.latency_ms:g} ms, stall {args.stall_ms:g} ms")
+
+    backend = MockBackend(latency, args.stall_every, args.stall_ms / 1000)
+    start = time.perf_counter()
+    closed = closed_model(backend, users, args.duration)
+    elapsed = time.perf_counter() - start
+    print(
+        f"before  closed, {users} threads   {closed.count / elapsed:8.1f}/s  "
+        f"p50 {closed.quantile(0.5) * 1000:7.1f} ms  p90 {closed.quantile(0.9) * 1000:7.1f} ms  "
+        f"p99 {closed.quantile(0.99) * 1000:7.1f} ms"
+    )
+
+    backend = MockBackend(latency, args.stall_every, args.stall_ms / 1000)
+
+    async def session(index):
+        return await backend.call_async()
+
+    profile = ArrivalRateProfile.constant(args.rate, args.duration, max_in_flight=100_000)
+    result = ArrivalRateGenerator(profile, session).run()
+    total = result.latency.total
+    print(
+        f"after   open, asyncio        {result.completed / result.duration_seconds:8.1f}/s  "
+        f"p50 {total.quantile(0.5) * 1000:7.1f} ms  p90 {total.quantile(0.9) * 1000:7.1f} ms  "
+        f"p99 {total.quantile(0.99) * 1000:7.1f} ms  "
+        f"(max start lag {result.max_start_lag * 1000:.1f} ms, dropped {result.dropped})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark device listing against the shared device inventory
+
+Simulates adb with a fixed latency per command and compares the previous
+per-call listing (`adb devices -l` plus two sequential getprop shells per
+device) with DeviceInventory: a cold refresh with concurrent single-shell
+probes, and the reads a load test makes once per virtual user iteration.
+
+Usage:
+    python scripts/benchmark_device_inventory.py --devices 40 --latency-ms 30 --reads 200
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.devices.device_inventory import DeviceInventory  # noqa: E402
+
+
+class FakeAdb:
+    """adb stand-in: every command takes latency seconds"""
+
+    def __init__(self, devices: int, latency: float):
+        self.serials = [f"emulator-{5554 + 2 * i}" for i in range(devices)]
+        self.latency = latency
+        self.commands = 0
+
+    def run(self, command, **kwargs):
+        self.commands += 1
+        time.sleep(self.latency)
+        if command[0] == "xcrun":
+            raise FileNotFoundError("xcrun")
+        if command[1] == "devices":
+            lines = "".join(f"{serial}\tdevice\n" for serial in self.serials)
+            return Mock(stdout=f"List of devices attached\n{lines}", returncode=0)
+        # getprop, one property or the three the inventory reads
+        return Mock(stdout="sdk_gphone64\n34\n14\n", returncode=0)
+
+
+def legacy_list_android_devices():
+    """DeviceManager.list_android_devices before the inventory: two sequential getprop shells per device"""
+    devices = []
+    result = subprocess.run(["adb", "devices", "-l"], capture_output=True, text=True, timeout=5)
+    for line in result.stdout.strip().split("\n")[1:]:
+        parts = line.split()
+        if len(parts) >= 2:
+            device_id = parts[0]
+            name = subprocess.run(
+                ["adb", "-s", device_id, "shell", "getprop", "ro.product.model"], capture_output=True, text=True
+            ).stdout.strip()
+            api_level = subprocess.run(
+                ["adb", "-s", device_id, "shell", "getprop", "ro.build.version.sdk"], capture_output=True, text=True
+            ).stdout.strip()
+            devices.append({"id": device_id, "name": name, "api_level": api_level})
+    return devices
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the shared device inventory")
+    parser.add_argument("--devices", type=int, default=40, help="Simulated emulators")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="Simulated latency of one adb command")
+    parser.add_argument("--reads", type=int, default=200, help="Device list reads (load test iterations)")
+    args = parser.parse_args()
+
+    adb = FakeAdb(args.devices, args.latency_ms / 1000)
+    with patch("subprocess.run", side_effect=adb.run):
+        start = time.perf_counter()
+        legacy_list_android_devices()
+        legacy_seconds = time.perf_counter() - start
+        legacy_commands, adb.commands = adb.commands, 0
+
+        inventory = DeviceInventory(ttl=3600)
+        start = time.perf_counter()
+        inventory.refresh()
+        cold_seconds = time.perf_counter() - start
+        cold_commands, adb.commands = adb.commands, 0
+
+        start = time.perf_counter()
+        for _ in range(args.reads):
+            inventory.devices()
+        read_seconds = time.perf_counter() - start
+
+    print(f"Devices: {args.devices}  adb latency: {args.latency_ms:.0f} ms")
+    print(f"before  one listing        {legacy_seconds * 1000:9.1f} ms  {legacy_commands} adb commands")
+    print(
+        f"before  {args.reads} reads (est.)  {legacy_seconds * args.reads:9.1f} s   "
+        f"{legacy_commands * args.reads} adb commands"
+    )
+    print(f"after   cold refresh       {cold_seconds * 1000:9.1f} ms  {cold_commands} commands (incl. simctl)")
+    print(f"after   {args.reads} reads         {read_seconds * 1e6:9.1f} us  {adb.commands} adb commands")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
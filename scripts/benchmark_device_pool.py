@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Stress benchmark for DevicePool
+
+Many worker threads lease and release devices from a large pool with mixed
+platform/version filters for a fixed time. Compares the previous pool
+(full scan per acquire_device, callers polling while nothing is free) with
+the indexed pool and its blocking acquire(timeout).
+
+Reports lease throughput, CPU time burned by the process, lease wait
+percentiles (of leases that succeeded), Jain's fairness index over
+per-thread lease counts (1.0 = every thread got the same share) and the
+number of threads that never got a device.
+
+Usage:
+    python scripts/benchmark_device_pool.py --devices 300 --threads 400 --seconds 3
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.devices.device_layer import (  # noqa: E402
+    Device,
+    DeviceCapabilities,
+    DeviceStatus,
+    DeviceType,
+    Platform,
+)
+from framework.devices.device_pool import DevicePool  # noqa: E402
+
+VERSIONS = {Platform.ANDROID: ["11", "12", "13", "14"], Platform.IOS: ["16.4", "17.0", "17.2"]}
+
+
+class LegacyDevicePool:
+    """The pool before indexing: scan all devices, lock the chosen one, None if busy (log output removed)"""
+
+    def __init__(self, devices):
+        self.devices = devices
+        self._locks = {d.id: threading.Lock() for d in devices}
+        self._reserved = {d.id: False for d in devices}
+        self._last_used_index = 0
+        self._compare_versions = DevicePool(name="compare")._compare_versions
+
+    def acquire_device(self, filters=None):
+        candidates = [
+            d for d in self.devices if not self._reserved.get(d.id, False) and d.status == DeviceStatus.AVAILABLE
+        ]
+        if filters and "platform" in filters:
+            candidates = [d for d in candidates if d.platform == filters["platform"]]
+        if filters and "min_version" in filters:
+            candidates = [
+                d for d in candidates if self._compare_versions(d.platform_version, filters["min_version"]) >= 0
+            ]
+        if not candidates:
+            return None
+
+        self._last_used_index = (self._last_used_index + 1) % len(candidates)
+        device = candidates[self._last_used_index]
+        with self._locks[device.id]:
+            if not self._reserved[device.id]:
+                self._reserved[device.id] = True
+                device.status = DeviceStatus.BUSY
+                return device
+        return None
+
+    def release_device(self, device_id):
+        with self._locks[device_id]:
+            self._reserved[device_id] = False
+            for device in self.devices:
+                if device.id == device_id:
+                    device.status = DeviceStatus.AVAILABLE
+                    break
+
+    def acquire(self, filters, timeout, poll_interval=0.001):
+        """What callers had to do: poll until a device frees up"""
+        deadline = time.monotonic() + timeout
+        while True:
+            device = self.acquire_device(filters)
+            if device is not None or time.monotonic() >= deadline:
+                return device
+            time.sleep(poll_interval)
+
+
+def make_devices(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    devices = []
+    for i in range(count):
+        platform = Platform.ANDROID if i % 3 else Platform.IOS
+        device_type = DeviceType.EMULATOR if platform == Platform.ANDROID else DeviceType.SIMULATOR
+        caps = DeviceCapabilities(platform, rng.choice(VERSIONS[platform]), f"device-{i}", f"udid-{i}", device_type)
+        devices.append(Device(caps, driver=None))
+    return devices
+
+
+def make_filters(rng: random.Random) -> dict:
+    platform = rng.choice([Platform.ANDROID, Platform.ANDROID, Platform.IOS])
+    filters = {"platform": platform}
+    if rng.random() < 0.5:
+        filters["min_version"] = rng.choice(VERSIONS[platform][:-1])
+    return filters
+
+
+def run(pool, threads: int, seconds: float, hold_ms: float, seed: int) -> dict:
+    counts = [0] * threads
+    waits = []
+    waits_lock = threading.Lock()
+    stop = time.monotonic() + seconds
+    start_barrier = threading.Barrier(threads)
+
+    def worker(index: int):
+        rng = random.Random(seed + index)
+        local_waits = []
+        start_barrier.wait()
+        while time.monotonic() < stop:
+            filters = make_filters(rng)
+            begin = time.perf_counter()
+            device = pool.acquire(filters, timeout=max(0.0, stop - time.monotonic()))
+            if device is None:
+                break
+            local_waits.append(time.perf_counter() - begin)
+            time.sleep(rng.uniform(0, 2 * hold_ms) / 1000)  # Run a test on the device
+            pool.release_device(device.id)
+            counts[index] += 1
+        with waits_lock:
+            waits.extend(local_waits)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+
+    waits.sort()
+    total = sum(counts)
+    return {
+        "leases": total,
+        "throughput": total / wall,
+        "cpu": time.process_time() - cpu_start,
+        "p50": waits[len(waits) // 2] * 1000 if waits else 0.0,
+        "p99": waits[int(len(waits) * 0.99)] * 1000 if waits else 0.0,
+        "max": waits[-1] * 1000 if waits else 0.0,
+        "fairness": total**2 / (threads * sum(c * c for c in counts)) if total else 0.0,
+        "starved": sum(1 for c in counts if c == 0),
+    }
+
+
+def report(label: str, stats: dict):
+    print(
+        f"{label:<28} {stats['leases']:7d} leases  {stats['throughput']:8.0f}/s  cpu {stats['cpu']:6.2f}s  "
+        f"wait p50 {stats['p50']:7.2f}ms  p99 {stats['p99']:8.2f}ms  max {stats['max']:8.2f}ms  "
+        f"fairness {stats['fairness']:.3f}  starved threads {stats['starved']}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stress benchmark for DevicePool")
+    parser.add_argument("--devices", type=int, default=300, help="Devices in the pool")
+    parser.add_argument("--threads", type=int, default=400, help="Concurrent workers (more than devices = contention)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each run")
+    parser.add_argument("--hold-ms", type=float, default=5.0, help="Mean time a device is held per lease")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    print(f"Devices: {args.devices}  threads: {args.threads}  hold: {args.hold_ms}ms  run: {args.seconds}s")
+
+    legacy = LegacyDevicePool(make_devices(args.devices, args.seed))
+    report("scan + polling (before)", run(legacy, args.threads, args.seconds, args.hold_ms, args.seed))
+
+    indexed = DevicePool(name="bench", devices=make_devices(args.devices, args.seed))
+    report("indexed + blocking (after)", run(indexed, args.threads, args.seconds, args.hold_ms, args.seed))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
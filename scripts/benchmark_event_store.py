@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark EventStore ingest throughput
+
+Compares per-event ingest (add_event, one commit per event) with batched
+ingest (add_events) on a synthetic recording session, then measures the
+latency of small queries against a connect-per-call baseline.
+
+Usage:
+    python scripts/benchmark_event_store.py --events 50000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.storage.event_store import EventStore  # noqa: E402
+
+SCREENS = ["Login", "Home", "Catalog", "Product", "Cart", "Checkout", "Profile", "Settings"]
+
+
+def generate_events(count: int, session_id: str = "bench_session") -> list:
+    """Generate a synthetic mix of UI, network and navigation events"""
+    rng = random.Random(42)
+    events = []
+    screen = SCREENS[0]
+    timestamp = 0
+
+    for i in range(count):
+        timestamp += rng.randint(5, 200)
+        kind = i % 3
+        if kind == 0:
+            events.append({"sessionId": session_id, "timestamp": timestamp, "actionType": "tap", "screen": screen})
+        elif kind == 1:
+            events.append(
+                {"sessionId": session_id, "timestamp": timestamp, "method": "GET", "url": f"/api/{screen.lower()}"}
+            )
+        else:
+            to_screen = rng.choice(SCREENS)
+            events.append(
+                {
+                    "sessionId": session_id,
+                    "timestamp": timestamp,
+                    "navType": "push",
+                    "fromScreen": screen,
+                    "toScreen": to_screen,
+                }
+            )
+            screen = to_screen
+
+    return events
+
+
+def bench_single(db_path: Path, events: list) -> float:
+    """Ingest with one add_event call per event"""
+    store = EventStore(str(db_path))
+    start = time.perf_counter()
+    for event in events:
+        store.add_event(event)
+    return time.perf_counter() - start
+
+
+def bench_bulk(db_path: Path, events: list, batch_size: int) -> float:
+    """Ingest with add_events"""
+    store = EventStore(str(db_path))
+    start = time.perf_counter()
+    store.add_events(events, batch_size=batch_size)
+    return time.perf_counter() - start
+
+
+def bench_queries(db_path: Path, session_id: str, queries: int) -> tuple:
+    """Mean latency (µs) of a small query: connect-per-call vs pooled connection"""
+    import sqlite3
+
+    sql = "SELECT * FROM screens WHERE session_id = ? ORDER BY visit_count DESC"
+
+    start = time.perf_counter()
+    for _ in range(queries):
+        conn = sqlite3.connect(str(db_path))
+        conn.row_factory = sqlite3.Row
+        conn.execute(sql, (session_id,)).fetchall()
+        conn.close()
+    unpooled = (time.perf_counter() - start) / queries * 1e6
+
+    store = EventStore(str(db_path))
+    store.get_screens(session_id)  # Open the pooled connection
+    start = time.perf_counter()
+    for _ in range(queries):
+        store.get_screens(session_id)
+    pooled = (time.perf_counter() - start) / queries * 1e6
+    store.close()
+
+    return unpooled, pooled
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark EventStore ingest")
+    parser.add_argument("--events", type=int, default=20000, help="Number of synthetic events")
+    parser.add_argument("--batch-size", type=int, default=EventStore.DEFAULT_BATCH_SIZE, help="Bulk batch size")
+    parser.add_argument("--skip-single", action="store_true", help="Skip the slow per-event baseline")
+    parser.add_argument("--queries", type=int, default=2000, help="Number of small queries to time")
+    args = parser.parse_args()
+
+    events = generate_events(args.events)
+    print(f"Events: {len(events)}  batch size: {args.batch_size}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+
+        single_rate = None
+        if not args.skip_single:
+            elapsed = bench_single(tmp_dir / "single.db", events)
+            single_rate = len(events) / elapsed
+            print(f"add_event  (before): {elapsed:8.2f}s  {single_rate:12,.0f} events/sec")
+
+        elapsed = bench_bulk(tmp_dir / "bulk.db", events, args.batch_size)
+        bulk_rate = len(events) / elapsed
+        print(f"add_events (after):  {elapsed:8.2f}s  {bulk_rate:12,.0f} events/sec")
+
+        if single_rate:
+            print(f"Speedup: {bulk_rate / single_rate:.1f}x")
+
+        unpooled, pooled = bench_queries(tmp_dir / "bulk.db", "bench_session", args.queries)
+        print(f"get_screens connect-per-call: {unpooled:8.1f} µs/query")
+        print(f"get_screens pooled:           {pooled:8.1f} µs/query")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
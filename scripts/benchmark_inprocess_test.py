@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark in-process load test iterations
+
+Times LoadTester iterations of a trivial test (a fixture and an assertion)
+run the previous way, a `python -m pytest` process per iteration, and with
+InProcessTest, which collects the test and sets its fixture up once and
+then only calls the test body. With a trivial test body, the difference
+is the per-iteration overhead that was counted as response time.
+
+Usage:
+    python scripts/benchmark_inprocess_test.py --iterations 20
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.execution.inprocess_test import InProcessTest  # noqa: E402
+from framework.execution.test_runner import TestRunner  # noqa: E402
+
+TARGET = textwrap.dedent(
+    """
+    import pytest
+
+    @pytest.fixture
+    def account():
+        return {"balance": 100}
+
+    def test_load_test_0(account):
+        assert account["balance"] > 0
+    """
+)
+
+
+def report(label: str, durations: list):
+    durations = sorted(durations)
+    p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+    print(
+        f"{label:7s} {len(durations):6d} iterations  mean {statistics.mean(durations) * 1000:9.3f} ms  "
+        f"p95 {p95 * 1000:9.3f} ms  throughput {len(durations) / sum(durations):10.1f}/s"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark in-process load test iterations")
+    parser.add_argument("--iterations", type=int, default=20, help="Subprocess iterations (in-process runs 100x)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "test_benchmark_target.py"
+        path.write_text(TARGET)
+
+        durations = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            TestRunner().run_test(test_name="load_test_0", test_path=path)
+            durations.append(time.perf_counter() - start)
+        report("before", durations)
+
+        start = time.perf_counter()
+        test = InProcessTest(f"{path}::test_load_test_0")
+        test.start()
+        setup = time.perf_counter() - start
+        durations = []
+        for _ in range(args.iterations * 100):
+            start = time.perf_counter()
+            test.run()
+            durations.append(time.perf_counter() - start)
+        test.close()
+        report("after", durations)
+        print(f"(in-process collection and fixture setup, once per virtual user: {setup * 1000:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
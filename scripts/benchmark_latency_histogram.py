@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark LoadTester response time statistics
+
+Compares the previous approach (append every response time to a list,
+sort it at the end) with LatencyRecorder on a synthetic long-tailed
+latency stream: memory held, recording and reporting time, and the
+error of p50/p95/p99 relative to the exact values.
+
+Usage:
+    python scripts/benchmark_latency_histogram.py --samples 2000000
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.testing.latency import LatencyRecorder  # noqa: E402
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def measure(label, make):
+    """Time recording and reporting, then measure the memory held in a second, traced run"""
+    record, report = make()
+    start = time.perf_counter()
+    record()
+    recorded = time.perf_counter() - start
+    start = time.perf_counter()
+    values = report()
+    reported = time.perf_counter() - start
+
+    tracemalloc.start()
+    record, _ = make()
+    record()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:7s} record {recorded:6.2f} s  report {reported * 1000:8.2f} ms  memory {memory / 1e6:8.2f} MB")
+    return values
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark LoadTester response time statistics")
+    parser.add_argument("--samples", type=int, default=2_000_000, help="Response times to record")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    samples = [rng.lognormvariate(-1.5, 0.8) for _ in range(args.samples)]
+    print(f"Samples: {args.samples}")
+
+    def make_list():
+        response_times = []
+
+        def record():
+            for sample in samples:
+                response_times.append(sample)
+
+        def report():
+            ordered = sorted(response_times)
+            return [ordered[int(len(ordered) * q)] for q in QUANTILES]
+
+        return record, report
+
+    def make_recorder():
+        # One second per 1000 samples, like a load test at 1000 requests/s
+        clock = [0.0]
+        recorder = LatencyRecorder(clock=lambda: clock[0])
+
+        def record():
+            for i, sample in enumerate(samples):
+                clock[0] = i / 1000
+                recorder.record(sample)
+
+        return record, lambda: recorder.total.quantiles(QUANTILES)
+
+    exact = measure("before", make_list)
+    sketched = measure("after", make_recorder)
+
+    for q, e, s in zip(QUANTILES, exact, sketched):
+        print(f"p{q * 100:g}: exact {e:.6f}  sketch {s:.6f}  error {abs(s - e) / e:.3%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
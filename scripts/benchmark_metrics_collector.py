@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark MetricsCollector recording
+
+Records the same stream of device action durations with the previous
+collector (a label key string built per call, every observation appended
+to a list and a new Metric object per call), with the name-and-labels
+MetricsCollector.observe_histogram, and with a pre-registered histogram
+handle. It reports the time per observation, the memory held afterwards
+and the export time.
+
+Usage:
+    python scripts/benchmark_metrics_collector.py --observations 1000000 --threads 4
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.observability.metrics import Metric, MetricsCollector, MetricType  # noqa: E402
+
+LABELS = {"device": "emulator-5554", "action": "tap"}
+
+
+class PreviousCollector:
+    """The recording and export path of MetricsCollector before handles"""
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.histograms: Dict[str, List[float]] = {}
+
+    def observe_histogram(self, name, value, labels=None, help_text=""):
+        key = MetricsCollector._make_key(name, labels or {})
+        if key not in self.histograms:
+            self.histograms[key] = []
+        self.histograms[key].append(value)
+        self.metrics[key] = Metric(
+            name=name, type=MetricType.HISTOGRAM, value=value, labels=labels or {}, help_text=help_text
+        )
+
+    def export_prometheus(self):
+        return "\n".join(f"{m.name}{m.labels} {m.value}" for m in self.metrics.values())
+
+
+def run(label: str, make, samples: List[float], threads: int):
+    """Time recording samples from each thread, then measure memory held in a second, traced run"""
+
+    def record(collector, observe):
+        workers = [threading.Thread(target=observe, args=(collector,)) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    collector, observe = make()
+    start = time.perf_counter()
+    record(collector, observe)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    collector.export_prometheus()
+    exported = time.perf_counter() - start
+
+    tracemalloc.start()
+    collector, observe = make()
+    record(collector, observe)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = len(samples) * threads
+    print(
+        f"{label:16s} {elapsed / total * 1e9:7.0f} ns/observation  memory {memory / 1e6:8.2f} MB  "
+        f"export {exported * 1000:7.2f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark MetricsCollector recording")
+    parser.add_argument("--observations", type=int, default=1_000_000, help="Observations per thread")
+    parser.add_argument("--threads", type=int, default=4, help="Recording threads")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(-2, 1) for _ in range(args.observations)]
+    print(f"{args.observations} observations x {args.threads} threads")
+
+    def make_previous():
+        def observe(collector):
+            for value in samples:
+                collector.observe_histogram("device_action_seconds", value, labels=LABELS)
+
+        return PreviousCollector(), observe
+
+    def make_by_name():
+        def observe(collector):
+            for value in samples:
+                collector.observe_histogram("device_action_seconds", value, labels=LABELS)
+
+        return MetricsCollector(), observe
+
+    def make_handle():
+        def observe(collector):
+            histogram = collector.histogram("device_action_seconds", LABELS)
+            for value in samples:
+                histogram.observe(value)
+
+        return MetricsCollector(), observe
+
+    run("before", make_previous, samples, args.threads)
+    run("after (by name)", make_by_name, samples, args.threads)
+    run("after (handle)", make_handle, samples, args.threads)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark ParallelExecutor worker modes
+
+Generates a synthetic test suite whose conftest has a slow import (standing
+in for Appium client and plugin imports) and runs it with one pytest
+subprocess per test and with persistent pytest workers.
+
+Usage:
+    python scripts/benchmark_parallel_executor.py --files 4 --tests-per-file 10 --workers 2
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.execution.parallel_executor import ParallelExecutor, TestStatus  # noqa: E402
+from framework.execution.test_sharding import ShardStrategy, TestCase, TestSharding  # noqa: E402
+
+
+def generate_suite(root: Path, files: int, tests_per_file: int, test_ms: int, import_ms: int) -> list:
+    """Write the synthetic suite and return its TestCases"""
+    (root / "conftest.py").write_text(f"import time\n\ntime.sleep({import_ms / 1000})  # Heavy imports\n")
+
+    tests = []
+    for f in range(files):
+        lines = ["import time\n"]
+        for t in range(tests_per_file):
+            lines.append(f"\ndef test_case_{t}():\n    time.sleep({test_ms / 1000})\n")
+            tests.append(TestCase(file=Path(f"test_synthetic_{f}.py"), name=f"test_case_{t}"))
+        (root / f"test_synthetic_{f}.py").write_text("".join(lines))
+
+    return tests
+
+
+def bench(tests: list, root: Path, workers: int, persistent: bool) -> tuple:
+    """Wall time and pass count of one run"""
+    shards = TestSharding().create_shards(tests, num_shards=workers, strategy=ShardStrategy.ROUND_ROBIN)
+    executor = ParallelExecutor(
+        max_workers=workers, pytest_args=["-q", "-p", "no:cacheprovider"], persistent_workers=persistent
+    )
+
+    start = time.perf_counter()
+    results = executor.execute_shards(shards, root)
+    elapsed = time.perf_counter() - start
+
+    passed = sum(1 for shard in results for r in shard.test_results if r.status == TestStatus.PASSED)
+    return elapsed, passed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ParallelExecutor worker modes")
+    parser.add_argument("--files", type=int, default=4, help="Test files in the synthetic suite")
+    parser.add_argument("--tests-per-file", type=int, default=10, help="Tests per file")
+    parser.add_argument("--test-ms", type=int, default=100, help="Duration of each test (ms)")
+    parser.add_argument("--import-ms", type=int, default=500, help="Simulated conftest import cost (ms)")
+    parser.add_argument("--workers", type=int, default=2, help="Parallel workers")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        tests = generate_suite(root, args.files, args.tests_per_file, args.test_ms, args.import_ms)
+        test_time = len(tests) * args.test_ms / 1000 / args.workers
+        print(f"Tests: {len(tests)}  workers: {args.workers}  pure test time per worker: {test_time:.1f}s")
+
+        legacy, legacy_passed = bench(tests, root, args.workers, persistent=False)
+        print(f"subprocess per test (before): {legacy:8.2f}s  {legacy_passed} passed")
+
+        persistent, persistent_passed = bench(tests, root, args.workers, persistent=True)
+        print(f"persistent workers (after):   {persistent:8.2f}s  {persistent_passed} passed")
+
+        print(f"Speedup: {legacy / persistent:.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel SAST analysis
+
+Generates a synthetic Android/iOS/Python source tree and runs
+SASTAnalyzer.analyze_directory with increasing worker counts, reporting
+files/sec, speedup over the sequential run and whether the merged findings
+are identical to it.
+
+Usage:
+    python scripts/benchmark_sast_workers.py --files 2000 --workers 1,2,4,8
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.security.sast_analyzer import SASTAnalyzer  # noqa: E402
+
+PYTHON_SNIPPETS = [
+    "def handler_{i}(request):\n    query = request.args.get('q')\n    cursor.execute('SELECT * FROM t WHERE a=' + query)\n",
+    "def digest_{i}(data):\n    import hashlib\n    return hashlib.md5(data).hexdigest()\n",
+    "def load_{i}(blob):\n    import pickle\n    return pickle.loads(blob)\n",
+    "def total_{i}(items):\n    result = 0\n    for item in items:\n        result += item\n    return result\n",
+]
+
+JAVA_SNIPPETS = [
+    '    public void query{i}(String id) {{ db.rawQuery("SELECT * FROM t WHERE id=" + id, null); }}\n',
+    '    public byte[] hash{i}(byte[] d) throws Exception {{ return MessageDigest.getInstance("MD5").digest(d); }}\n',
+    "    public int add{i}(int a, int b) {{ return a + b; }}\n",
+]
+
+
+def generate_tree(root: Path, files: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for index in range(files):
+        package = root / f"pkg_{index % 50}"
+        package.mkdir(exist_ok=True)
+        functions = rng.randint(10, 60)
+        if index % 2:
+            body = "".join(rng.choice(JAVA_SNIPPETS).format(i=i) for i in range(functions))
+            (package / f"Module{index}.java").write_text(f"public class Module{index} {{\n{body}}}\n")
+        else:
+            body = "\n".join(rng.choice(PYTHON_SNIPPETS).format(i=i) for i in range(functions))
+            (package / f"module_{index}.py").write_text(body)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark parallel SAST analysis")
+    parser.add_argument("--files", type=int, default=2000, help="Source files to generate")
+    parser.add_argument(
+        "--workers", default=None, help="Comma-separated worker counts (default: powers of two up to CPU count)"
+    )
+    parser.add_argument("--seed", type=int, default=5, help="Random seed")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    if args.workers:
+        worker_counts = [int(w) for w in args.workers.split(",")]
+    else:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cpus:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != cpus:
+            worker_counts.append(cpus)
+
+    analyzer = SASTAnalyzer()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        generate_tree(root, args.files, args.seed)
+        print(f"Files: {args.files}  CPUs: {cpus}")
+
+        baseline_rate = None
+        baseline_findings = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            findings = [f.to_dict() for f in analyzer.analyze_directory(root, workers=workers)]
+            elapsed = time.perf_counter() - start
+
+            rate = args.files / elapsed
+            if baseline_rate is None:
+                baseline_rate, baseline_findings = rate, findings
+            same = "identical" if findings == baseline_findings else "DIFFERENT"
+            print(
+                f"workers {workers:3d}  {elapsed:7.2f} s  {rate:8.1f} files/s  "
+                f"speedup {rate / baseline_rate:5.2f}x  {len(findings)} findings ({same})"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
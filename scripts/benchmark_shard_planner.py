@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shard planner
+
+Plans a synthetic suite with long-tailed (log-normal) test durations into
+device shards with the previous greedy planner (a scan over all shards per
+test, then optimize_shards moving single tests) and with the LPT planner
+plus refinement, and reports planning time and imbalance ratio.
+
+Usage:
+    python scripts/benchmark_shard_planner.py --tests 10000 --shards 128
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.execution.test_sharding import ShardStrategy, TestCase, TestShard, TestSharding  # noqa: E402
+
+
+def generate_tests(count: int, files: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [
+        TestCase(
+            file=Path(f"tests/test_module_{rng.randrange(files)}.py"),
+            name=f"test_{i}",
+            estimated_duration=rng.lognormvariate(0.5, 1.0),
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_plan(tests: list, num_shards: int) -> list:
+    """The planner before the LPT rewrite: min() scan per test, then single-test moves"""
+    shards = [TestShard(shard_id=i, total_shards=num_shards, tests=[]) for i in range(num_shards)]
+    for test in sorted(tests, key=lambda t: t.estimated_duration, reverse=True):
+        shard = min(shards, key=lambda s: s.estimated_duration)
+        shard.tests.append(test)
+
+    avg_duration = sum(s.estimated_duration for s in shards) / num_shards
+    for _ in range(100):
+        heaviest = max(shards, key=lambda s: s.estimated_duration)
+        lightest = min(shards, key=lambda s: s.estimated_duration)
+        if (heaviest.estimated_duration - lightest.estimated_duration) / avg_duration <= 0.2:
+            break
+        test_to_move = min(heaviest.tests, key=lambda t: t.estimated_duration)
+        heaviest.tests.remove(test_to_move)
+        lightest.tests.append(test_to_move)
+
+    return shards
+
+
+def report(label: str, shards: list, elapsed: float, sharding: TestSharding):
+    stats = sharding.get_shard_statistics(shards)
+    ideal = stats["total_estimated_duration"] / stats["total_shards"]
+    print(
+        f"{label:<34} {elapsed * 1000:9.1f} ms  imbalance {stats['imbalance_ratio']:.4f}  "
+        f"makespan {stats['max_shard_duration'] / ideal:.4f}x ideal"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the shard planner")
+    parser.add_argument("--tests", type=int, default=10000, help="Number of tests")
+    parser.add_argument("--shards", type=int, default=128, help="Number of shards")
+    parser.add_argument("--files", type=int, default=1000, help="Test files the tests are spread over")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    sharding = TestSharding(history_path=None)
+    print(f"Tests: {args.tests}  shards: {args.shards}  files: {args.files}")
+
+    tests = generate_tests(args.tests, args.files, args.seed)
+    start = time.perf_counter()
+    shards = legacy_plan(tests, args.shards)
+    report("greedy scan + moves (before)", shards, time.perf_counter() - start, sharding)
+
+    for label, strategy in [
+        ("LPT + refinement (after)", ShardStrategy.DURATION_BASED),
+        ("LPT + refinement, file affinity", ShardStrategy.FILE_BASED),
+    ]:
+        tests = generate_tests(args.tests, args.files, args.seed)
+        start = time.perf_counter()
+        shards = sharding.create_shards(tests, num_shards=args.shards, strategy=strategy)
+        report(label, shards, time.perf_counter() - start, sharding)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
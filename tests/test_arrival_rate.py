@@ -0,0 +1,149 @@
+"""
+Tests for open-model (arrival-rate) load generation
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+from framework.cli.load_commands import load
+
+from framework.testing.arrival_rate import ArrivalRateGenerator, ArrivalRateProfile, RateStage
+from framework.testing.load_tester import LoadProfile, LoadTestConfig, LoadTester
+
+
+class TestArrivalRateProfile:
+    """Test arrival schedules"""
+
+    def test_constant_and_stepped_arrivals(self):
+        """Arrivals are evenly spaced within each stage"""
+        assert list(ArrivalRateProfile.constant(4, 1).arrivals()) == [0.0, 0.25, 0.5, 0.75]
+
+        stepped = ArrivalRateProfile.stepped(start_rate=1, step_rate=1, steps=3, step_seconds=2)
+        assert [s.rate for s in stepped.stages] == [1, 2, 3]
+        assert len(list(stepped.arrivals())) == 2 + 4 + 6
+        assert stepped.duration_seconds == 6
+
+        # Float products are rounded, not truncated
+        assert len(list(ArrivalRateProfile.constant(0.29, 100).arrivals())) == 29
+
+    def test_parse(self):
+        """Rate specs give a constant rate or stages"""
+        assert ArrivalRateProfile.parse("50", 30).stages == [RateStage(50, 30)]
+
+        profile = ArrivalRateProfile.parse("10:60,0:5,20:30", 999, max_in_flight=5)
+        assert profile.stages == [RateStage(10, 60), RateStage(0, 5), RateStage(20, 30)]
+        assert profile.max_in_flight == 5
+        assert list(profile.arrivals())[600] == 65.0
+
+        for spec in ("fast", "10:", "-1:10", "10:0"):
+            with pytest.raises(ValueError):
+                ArrivalRateProfile.parse(spec, 10)
+
+
+class TestArrivalRateGenerator:
+    """Test the asyncio scheduler"""
+
+    def test_async_sessions_run_concurrently(self):
+        """Arrivals start on schedule while earlier sessions are still running"""
+        running = []
+        peak = []
+
+        async def session(index):
+            running.append(index)
+            peak.append(len(running))
+            await asyncio.sleep(0.2)
+            running.remove(index)
+            return index % 10 != 0
+
+        result = ArrivalRateGenerator(ArrivalRateProfile.constant(200, 0.5), session).run()
+
+        assert (result.scheduled, result.completed, result.dropped) == (100, 100, 0)
+        assert (result.passed, result.failed) == (90, 10)
+        assert max(peak) >= 20
+        assert 0.5 <= result.duration_seconds < 2
+        assert result.latency.total.quantile(0.5) == pytest.approx(0.2, abs=0.1)
+
+    def test_latency_includes_queueing(self):
+        """A saturated system's backlog shows in latency, not in service time"""
+
+        def session(index):
+            time.sleep(0.1)
+            return True
+
+        generator = ArrivalRateGenerator(ArrivalRateProfile.constant(20, 0.5), session, blocking_workers=1)
+        result = generator.run()
+
+        assert result.completed == 10
+        # The 10th arrival was scheduled at 0.45 s but only finished after ~1 s of work
+        assert result.latency.total.max > 0.4
+        assert result.max_start_lag > 0.3
+        assert result.service_time.max < 0.3
+
+    def test_arrivals_dropped_when_saturated(self):
+        """No more than max_in_flight sessions run; the excess is counted"""
+
+        async def session(index):
+            await asyncio.sleep(1)
+            return True
+
+        result = ArrivalRateGenerator(ArrivalRateProfile.constant(20, 0.5, max_in_flight=2), session).run()
+
+        assert (result.scheduled, result.completed, result.dropped) == (10, 2, 8)
+
+    def test_exceptions_are_failures(self):
+        """Session exceptions fail the session and are recorded"""
+
+        def session(index):
+            raise RuntimeError(f"boom {index}")
+
+        result = ArrivalRateGenerator(ArrivalRateProfile.constant(10, 0.3), session).run()
+
+        assert (result.completed, result.failed) == (3, 3)
+        assert result.errors[0] == {"arrival": 0, "error": "boom 0"}
+
+
+class TestLoadTesterOpenModel:
+    """Test LoadTester with an arrival rate"""
+
+    def test_run_with_arrival_rate(self):
+        """LoadTester.run starts one test execution per arrival"""
+        profile = LoadProfile(name="Unused", description="", virtual_users=1, duration_seconds=1)
+        config = LoadTestConfig(
+            test_path=None, profile=profile, arrival_rate=ArrivalRateProfile.constant(20, 0.5), max_workers=4
+        )
+        tester = LoadTester(config, inventory=Mock())
+        tester._execute_test = lambda index: index != 3
+
+        result = tester.run()
+
+        assert result.profile_name == "Constant 20/s"
+        assert (result.total_tests, result.passed_tests, result.failed_tests) == (10, 9, 1)
+        assert result.metrics["scheduled_sessions"] == 10
+        assert result.metrics["dropped_sessions"] == 0
+        assert result.metrics["service_time"]["count"] == 10
+        assert tester.latency.total.count == 10
+
+    @pytest.mark.parametrize(
+        "args, workers",
+        [
+            (["--rate", "50", "--max-in-flight", "300"], 300),
+            (["--rate", "50", "--workers", "64"], 64),
+            ([], 10),
+        ],
+    )
+    def test_cli_workers(self, monkeypatch, tmp_path, args, workers):
+        """--rate sizes the session threads from --max-in-flight unless --workers is given"""
+        configs = []
+
+        def run(self, progress_callback=None):
+            configs.append(self.config)
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(LoadTester, "run", run)
+        CliRunner().invoke(load, ["run", str(tmp_path), "--duration", "1", *args])
+
+        assert configs[0].max_workers == workers
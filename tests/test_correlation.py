@@ -0,0 +1,661 @@
+"""
+Tests for Event Correlation
+"""
+
+import json
+import os
+import random
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from framework.cli.record_commands import record
+from framework.correlation import MultiSessionSummary, SessionCorrelationOutcome, candidate_index
+from framework.correlation.candidate_index import CandidateIndex
+from framework.correlation.correlator import EventCorrelator
+from framework.correlation.numpy_backend import NumpyCorrelationBackend
+from framework.correlation.strategies import (
+    CorrelationIDStrategy,
+    HybridCorrelationStrategy,
+    TemporalProximityStrategy,
+)
+from framework.correlation.streaming import StreamingCorrelator, follow_session
+from framework.correlation.types import (
+    APIToNavigationCorrelation,
+    CorrelationMethod,
+    CorrelationStrength,
+    FullFlowCorrelation,
+    UIToAPICorrelation,
+)
+from framework.storage.event_store import EventStore
+
+SCREENS = ["Login", "Home", "Cart", None]
+
+
+def generate_session(ui_count=120, api_count=200, nav_count=60, seed=7):
+    """Generate a random session with overlapping temporal, thread and screen signals"""
+    rng = random.Random(seed)
+    span = ui_count * 400
+
+    ui_events = [
+        {
+            "eventId": f"ui_{i}",
+            "action": "tap",
+            "timestamp": rng.randint(0, span),
+            "screen": rng.choice(SCREENS[:3]),
+            "threadId": rng.choice([None, "main", "io-1", "io-2"]),
+            "correlationId": rng.choice([None, None, f"c{rng.randint(0, 30)}"]),
+        }
+        for i in range(ui_count)
+    ]
+    api_events = [
+        {
+            "eventId": f"api_{i}",
+            "method": "POST",
+            "url": f"/api/{i % 9}",
+            "statusCode": rng.choice([200, 201, 404, 500]),
+            "timestamp": rng.randint(0, span),
+            "duration": rng.randint(5, 500),
+            "screen": rng.choice(SCREENS),
+            "thread_id": rng.choice([None, "main", "io-1", "io-3"]),
+            "correlation_id": rng.choice([None, f"c{rng.randint(0, 30)}"]),
+        }
+        for i in range(api_count)
+    ]
+    nav_events = [
+        {
+            "eventId": f"nav_{i}",
+            "timestamp": rng.randint(0, span),
+            "fromScreen": rng.choice(SCREENS[:3]),
+            "toScreen": rng.choice(SCREENS[:3]),
+        }
+        for i in range(nav_count)
+    ]
+    return ui_events, api_events, nav_events
+
+
+class _FullScan:
+    """Candidate index stand-in that returns every target (the pre-index behaviour)"""
+
+    def __init__(self, targets):
+        self.targets = targets
+
+    def candidates(self, source):
+        return range(len(self.targets))
+
+
+@pytest.fixture
+def full_scan(monkeypatch):
+    """Force the correlator back to evaluating every pair"""
+
+    def enable():
+        monkeypatch.setattr(CandidateIndex, "build", classmethod(lambda cls, strategy, targets: _FullScan(targets)))
+        monkeypatch.setattr(CandidateIndex, "for_window", classmethod(lambda cls, targets, delta: _FullScan(targets)))
+
+    return enable
+
+
+class TestCandidateIndex:
+    """Test candidate lookup structures"""
+
+    def test_window_lookup_is_inclusive(self):
+        """Targets on the window edges are returned, in original order"""
+        events = [{"timestamp": t} for t in (50, 10, 30, 70, 30)]
+        index = candidate_index.TimeWindowIndex(events)
+
+        assert sorted(index.between(30, 50)) == [0, 2, 4]
+        assert index.between(71, 100) == []
+
+    def test_hybrid_candidates_union(self):
+        """Hybrid candidates combine the window with key matches"""
+        targets = [
+            {"timestamp": 100},
+            {"timestamp": 99999, "threadId": "t1"},
+            {"timestamp": 99999, "screen": "Home"},
+            {"timestamp": 99999},
+        ]
+        index = CandidateIndex.build(HybridCorrelationStrategy(), targets)
+
+        assert index.candidates({"timestamp": 90, "thread_id": "t1", "screen": "Home"}) == [0, 1, 2]
+
+    def test_unknown_strategy_is_not_indexed(self):
+        """Custom strategies fall back to a full scan"""
+
+        class CustomTemporal(TemporalProximityStrategy):
+            pass
+
+        assert CandidateIndex.build(CustomTemporal(), [{"timestamp": 1}]) is None
+        assert CandidateIndex.build(HybridCorrelationStrategy([CustomTemporal()]), []) is None
+
+
+class TestEventCorrelator:
+    """Test the Python correlation engine"""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_indexed_matches_full_scan(self, full_scan, seed):
+        """Indexed correlation produces exactly the full-scan result"""
+        ui_events, api_events, nav_events = generate_session(seed=seed)
+        correlator = EventCorrelator(force_python=True)
+
+        indexed = correlator.correlate_events("s", ui_events, api_events, nav_events)
+        full_scan()
+        expected = correlator.correlate_events("s", ui_events, api_events, nav_events)
+
+        assert indexed.ui_to_api
+        assert indexed.api_to_navigation
+        assert indexed.model_dump() == expected.model_dump()
+
+    def test_temporal_only_strategy(self, full_scan):
+        """A purely temporal UI strategy is indexed by window alone"""
+        ui_events, api_events, nav_events = generate_session(seed=11)
+        correlator = EventCorrelator(force_python=True)
+        correlator.ui_strategy = TemporalProximityStrategy(max_time_delta_ms=750)
+
+        indexed = correlator.correlate_events("s", ui_events, api_events, nav_events)
+        full_scan()
+        expected = correlator.correlate_events("s", ui_events, api_events, nav_events)
+
+        assert indexed.model_dump() == expected.model_dump()
+
+
+def build_flow_inputs(flow_count, apis_per_flow=2, navs_per_api=2, seed=5):
+    """Synthetic UI→API and API→navigation correlations for flow assembly"""
+    rng = random.Random(seed)
+    strengths = [CorrelationStrength.STRONG, CorrelationStrength.MEDIUM, CorrelationStrength.WEAK]
+    ui_to_api = []
+    api_to_nav = []
+
+    for f in range(flow_count):
+        api_calls = []
+        for a in range(apis_per_flow):
+            api_id = f"api_{f}_{a}"
+            api_calls.append({"eventId": api_id, "method": "GET", "endpoint": f"/items/{a}", "timestamp": f * 10})
+            for n in range(rng.randint(0, navs_per_api)):
+                api_to_nav.append(
+                    APIToNavigationCorrelation(
+                        api_event_id=api_id,
+                        api_method="GET",
+                        api_endpoint=f"/items/{a}",
+                        api_status_code=200,
+                        api_timestamp=f * 10,
+                        navigation_event_id=f"nav_{f}_{a}_{n}",
+                        from_screen="List",
+                        to_screen=f"Detail{n}",
+                        navigation_timestamp=f * 10 + 5,
+                        strength=rng.choice(strengths),
+                        methods=[CorrelationMethod.TEMPORAL],
+                        confidence_score=rng.random(),
+                        time_delta_ms=5,
+                        condition="success",
+                    )
+                )
+        ui_to_api.append(
+            UIToAPICorrelation(
+                ui_event_id=f"ui_{f}",
+                ui_event_type="tap",
+                ui_screen="List",
+                ui_timestamp=f * 10,
+                api_calls=api_calls,
+                strength=rng.choice(strengths),
+                methods=[CorrelationMethod.HYBRID],
+                confidence_score=rng.random(),
+            )
+        )
+
+    rng.shuffle(api_to_nav)
+    return ui_to_api, api_to_nav
+
+
+class TestFlowBuilder:
+    """Test full flow assembly"""
+
+    def test_flows_keep_navigation_order(self):
+        """Each flow lists its navigations per API call, in api_to_nav order"""
+        ui_to_api, api_to_nav = build_flow_inputs(50)
+        flows = EventCorrelator(force_python=True)._build_full_flows(ui_to_api, api_to_nav)
+
+        assert len(flows) == 50
+        for flow in flows:
+            expected = [
+                nav
+                for call in flow.ui_correlation.api_calls
+                for nav in api_to_nav
+                if nav.api_event_id == call["eventId"]
+            ]
+            assert flow.api_navigation_correlations == expected
+
+    @pytest.mark.slow
+    def test_benchmark_thousands_of_flows(self):
+        """Flow assembly stays linear for sessions with thousands of flows"""
+        ui_to_api, api_to_nav = build_flow_inputs(5000, apis_per_flow=3)
+        correlator = EventCorrelator(force_python=True)
+
+        start = time.perf_counter()
+        flows = correlator._build_full_flows(ui_to_api, api_to_nav)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n{len(flows)} flows from {len(api_to_nav)} API→nav correlations in {elapsed * 1000:.1f}ms")
+        assert len(flows) == 5000
+        assert sum(len(f.api_navigation_correlations) for f in flows) == len(api_to_nav)
+        # A nested scan takes minutes at this size
+        assert elapsed < 10
+
+
+class TestNumpyBackend:
+    """Test the vectorized NumPy correlation backend"""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self):
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4])
+    def test_matches_python_engine(self, seed):
+        """NumPy and pure-Python engines produce identical results"""
+        ui_events, api_events, nav_events = generate_session(seed=seed)
+        # Float timestamps and keys under both spellings exercise conversion
+        for event in api_events[::7]:
+            event["timestamp"] = float(event["timestamp"])
+            event["correlationId"] = event.pop("correlation_id")
+
+        vectorized = EventCorrelator()
+        vectorized.use_rust = False
+        python = EventCorrelator(force_python=True)
+
+        expected = python.correlate_events("s", ui_events, api_events, nav_events)
+        result = vectorized._correlate_with_numpy(
+            NumpyCorrelationBackend.create(
+                vectorized.ui_strategy, vectorized.nav_strategy, EventCorrelator.NAV_WINDOW_MS
+            ),
+            "s",
+            ui_events,
+            api_events,
+            nav_events,
+        )
+
+        assert result.ui_to_api
+        assert result.model_dump() == expected.model_dump()
+
+    def test_small_blocks(self, monkeypatch):
+        """Results do not depend on block sizes"""
+        ui_events, api_events, nav_events = generate_session(seed=9)
+        monkeypatch.setattr(NumpyCorrelationBackend, "BLOCK_ROWS", 7)
+        monkeypatch.setattr(NumpyCorrelationBackend, "MAX_BLOCK_CELLS", 50)
+        backend = NumpyCorrelationBackend.create(
+            HybridCorrelationStrategy(), TemporalProximityStrategy(max_time_delta_ms=3000), 3000
+        )
+        correlator = EventCorrelator(force_python=True)
+
+        expected = correlator.correlate_events("s", ui_events, api_events, nav_events)
+        result = correlator._correlate_with_numpy(backend, "s", ui_events, api_events, nav_events)
+
+        assert result.model_dump() == expected.model_dump()
+
+    def test_selected_without_rust(self):
+        """The NumPy backend is chosen automatically unless force_python is set"""
+        assert EventCorrelator().use_numpy
+        assert not EventCorrelator(force_python=True).use_numpy
+
+    def test_unsupported_strategy(self):
+        """Custom or bare strategies are left to the Python engine"""
+
+        class CustomTemporal(TemporalProximityStrategy):
+            pass
+
+        nav = TemporalProximityStrategy(max_time_delta_ms=3000)
+        assert NumpyCorrelationBackend.create(HybridCorrelationStrategy([CustomTemporal()]), nav, 3000) is None
+        assert NumpyCorrelationBackend.create(TemporalProximityStrategy(), nav, 3000) is None
+        assert NumpyCorrelationBackend.create(HybridCorrelationStrategy(), CustomTemporal(), 3000) is None
+
+    def test_falls_back_on_non_numeric_timestamps(self):
+        """Events NumPy cannot represent are correlated by the Python engine"""
+        ui_events = [{"eventId": "u", "action": "tap", "screen": "Home", "timestamp": 10, "threadId": ["t"]}]
+        api_events = [{"eventId": "a", "method": "GET", "url": "/x", "timestamp": 20}]
+
+        correlator = EventCorrelator()
+        correlator.use_rust = False
+        result = correlator.correlate_events("s", ui_events, api_events, [])
+
+        assert len(result.ui_to_api) == 1
+
+
+@pytest.fixture
+def session_store(tmp_path):
+    """Event store with four recorded sessions of different sizes"""
+    store = EventStore(str(tmp_path / "events.db"))
+    events = []
+    for s in range(4):
+        session_id = f"session_{s}"
+        for i in range(10 * (s + 1)):
+            t = i * 1000
+            common = {"sessionId": session_id, "threadId": "main"}
+            events.append(
+                {**common, "eventType": "UIEvent", "eventId": f"ui_{s}_{i}", "screen": "Home", "timestamp": t}
+            )
+            events.append({**common, "eventType": "NetworkEvent", "eventId": f"api_{s}_{i}", "timestamp": t + 100})
+            events.append({**common, "eventType": "NavigationEvent", "eventId": f"nav_{s}_{i}", "timestamp": t + 300})
+    store.add_events(events)
+    yield store
+    store.close()
+
+
+class TestCorrelateAllSessions:
+    """Test parallel multi-session correlation"""
+
+    def test_parallel_matches_sequential(self, session_store):
+        """Worker processes produce the same results as correlate_session"""
+        correlator = EventCorrelator(session_store)
+        outcomes = list(correlator.correlate_all_sessions(max_workers=2))
+
+        assert sorted(o.session_id for o in outcomes) == [f"session_{s}" for s in range(4)]
+        for outcome in outcomes:
+            assert outcome.succeeded
+            assert outcome.worker_pid != os.getpid()
+            assert outcome.result.model_dump() == correlator.correlate_session(outcome.session_id).model_dump()
+
+    def test_single_worker_runs_in_process(self, session_store):
+        """max_workers=1 correlates the requested sessions without a pool"""
+        correlator = EventCorrelator(session_store)
+        outcomes = list(correlator.correlate_all_sessions(max_workers=1, session_ids=["session_3", "session_1"]))
+
+        assert [o.session_id for o in outcomes] == ["session_3", "session_1"]
+        assert all(o.worker_pid == os.getpid() for o in outcomes)
+        assert outcomes[0].result.total_ui_events == 40
+
+    def test_failed_session_does_not_abort_run(self, session_store, monkeypatch):
+        """A session that raises is reported and the others still complete"""
+        original = EventCorrelator.correlate_session
+
+        def correlate_session(self, session_id):
+            if session_id == "session_2":
+                raise RuntimeError("corrupt session")
+            return original(self, session_id)
+
+        monkeypatch.setattr(EventCorrelator, "correlate_session", correlate_session)
+        outcomes = list(EventCorrelator(session_store).correlate_all_sessions(max_workers=1))
+        summary = MultiSessionSummary.from_outcomes(outcomes, wall_time_ms=50.0)
+
+        assert summary.total_sessions == 4
+        assert summary.failed == 1
+        assert summary.failures == {"session_2": "RuntimeError: corrupt session"}
+
+    def test_summary(self):
+        """Summary aggregates per-session timings"""
+        outcomes = [
+            SessionCorrelationOutcome(session_id="a", elapsed_ms=30.0, worker_pid=1),
+            SessionCorrelationOutcome(session_id="b", elapsed_ms=10.0, worker_pid=2),
+        ]
+        summary = MultiSessionSummary.from_outcomes(outcomes, wall_time_ms=20.0)
+
+        assert summary.succeeded == 2
+        assert summary.mean_session_ms == 20.0
+        assert summary.max_session_ms == 30.0
+        assert summary.parallel_speedup == 2.0
+        assert summary.session_timings == {"a": 30.0, "b": 10.0}
+
+    def test_cli(self, session_store, tmp_path):
+        """correlate-all writes one result per session and a summary"""
+        output = tmp_path / "out"
+        result = CliRunner().invoke(
+            record, ["correlate-all", "--db", str(session_store.db_path), "--workers", "2", "--output", str(output)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert sorted(p.name for p in output.iterdir()) == [f"session_{s}.json" for s in range(4)] + ["summary.json"]
+        assert json.loads((output / "summary.json").read_text())["succeeded"] == 4
+
+    def test_cli_sanitizes_session_ids(self, tmp_path):
+        """Session IDs from recorded data cannot write outside --output or onto each other"""
+        session_ids = ["../escape/x", "..", "a/b", "a_b", "summary"]
+        store = EventStore(str(tmp_path / "events.db"))
+        store.add_events(
+            {"sessionId": session_id, "eventType": "UIEvent", "eventId": f"u{i}", "screen": "Home", "timestamp": 0}
+            for i, session_id in enumerate(session_ids)
+        )
+        store.close()
+
+        output = tmp_path / "out"
+        result = CliRunner().invoke(
+            record, ["correlate-all", "--db", str(tmp_path / "events.db"), "--workers", "1", "--output", str(output)]
+        )
+
+        assert result.exit_code == 0, result.output
+        names = sorted(p.name for p in output.iterdir())
+        assert len(names) == len(session_ids) + 1
+        assert "a_b.json" in names and "summary.json" in names
+        assert [n for n in names if n.startswith("_escape_x-") and n.endswith(".json")]
+        assert json.loads((output / "summary.json").read_text())["total_sessions"] == len(session_ids)
+        assert not (tmp_path / "escape").exists()
+
+
+def as_stream(ui_events, api_events, nav_events):
+    """Interleave the events of a session in timestamp order, tagged with their kind"""
+    tagged = [(e, "ui") for e in ui_events] + [(e, "api") for e in api_events] + [(e, "navigation") for e in nav_events]
+    return sorted(tagged, key=lambda item: item[0]["timestamp"])
+
+
+def run_stream(streaming, stream):
+    """Feed a stream and collect everything emitted, split by type"""
+    emitted = []
+    for event, kind in stream:
+        emitted.extend(streaming.add_event(event, kind))
+    emitted.extend(streaming.flush())
+
+    by_type = {UIToAPICorrelation: [], APIToNavigationCorrelation: [], FullFlowCorrelation: []}
+    for correlation in emitted:
+        by_type[type(correlation)].append(correlation.model_dump())
+    return by_type
+
+
+class TestStreamingCorrelator:
+    """Test online correlation of live sessions"""
+
+    def _assert_matches_batch(self, correlator, ui_events, api_events, nav_events):
+        # A recording delivers each kind of event in timestamp order
+        ui_events, api_events, nav_events = (
+            sorted(events, key=lambda e: e["timestamp"]) for events in (ui_events, api_events, nav_events)
+        )
+        batch = correlator.correlate_events("s", ui_events, api_events, nav_events)
+        streamed = run_stream(StreamingCorrelator(correlator), as_stream(ui_events, api_events, nav_events))
+
+        def key(correlation):
+            return json.dumps(correlation, sort_keys=True, default=str)
+
+        assert batch.full_flows
+        assert sorted(streamed[UIToAPICorrelation], key=key) == sorted(
+            (c.model_dump() for c in batch.ui_to_api), key=key
+        )
+        assert sorted(streamed[APIToNavigationCorrelation], key=key) == sorted(
+            (c.model_dump() for c in batch.api_to_navigation), key=key
+        )
+        assert sorted(streamed[FullFlowCorrelation], key=key) == sorted(
+            (f.model_dump() for f in batch.full_flows), key=key
+        )
+
+    @pytest.mark.parametrize("seed", [1, 2])
+    def test_temporal_matches_batch(self, seed):
+        """With a temporal UI strategy, streaming emits exactly the batch correlations"""
+        correlator = EventCorrelator(force_python=True)
+        correlator.ui_strategy = TemporalProximityStrategy(max_time_delta_ms=750)
+
+        self._assert_matches_batch(correlator, *generate_session(seed=seed))
+
+    def test_hybrid_matches_batch_for_nearby_keys(self):
+        """Key matches inside the horizon are found like in batch correlation"""
+        ui_events, api_events, nav_events = generate_session(seed=3)
+        for event in ui_events + api_events:
+            # Keys shared only by events close in time
+            bucket = event["timestamp"] // 2000
+            event["correlationId"] = f"c{bucket}" if event["timestamp"] % 3 == 0 else None
+            event.pop("correlation_id", None)
+            event.pop("threadId", None)
+            event.pop("thread_id", None)
+            event["screen"] = f"{event['screen']}-{bucket}" if event["screen"] else None
+
+        self._assert_matches_batch(EventCorrelator(force_python=True), ui_events, api_events, nav_events)
+
+    def test_emits_when_window_closes(self):
+        """Correlations come out as soon as later events move time past their window"""
+        streaming = StreamingCorrelator(horizon_ms=1000)
+
+        assert streaming.add_ui_event({"eventId": "u", "action": "tap", "screen": "Home", "timestamp": 0}) == []
+        assert streaming.add_api_event({"eventId": "a", "method": "GET", "url": "/x", "timestamp": 100}) == []
+        assert streaming.add_navigation_event({"eventId": "n", "toScreen": "Cart", "timestamp": 300}) == []
+
+        ui_closed = streaming.advance_to(1001)
+        assert [type(c) for c in ui_closed] == [UIToAPICorrelation]
+        assert ui_closed[0].api_calls[0]["eventId"] == "a"
+
+        nav_closed = streaming.advance_to(EventCorrelator.NAV_WINDOW_MS + 101)
+        assert [type(c) for c in nav_closed] == [APIToNavigationCorrelation, FullFlowCorrelation]
+        assert nav_closed[1].api_navigation_correlations == [nav_closed[0]]
+        assert streaming.flush() == []
+
+    def test_buffer_bounded_by_window(self):
+        """Memory stays bounded by the window over a long session"""
+        streaming = StreamingCorrelator()
+        peak = 0
+
+        for i in range(5000):
+            t = i * 1000
+            streaming.add_ui_event({"eventId": f"u{i}", "action": "tap", "screen": "Home", "timestamp": t})
+            streaming.add_api_event({"eventId": f"a{i}", "method": "GET", "url": "/x", "timestamp": t + 50})
+            streaming.add_navigation_event({"eventId": f"n{i}", "toScreen": "Cart", "timestamp": t + 120})
+            peak = max(peak, streaming.buffered_events, len(streaming._navs_by_api))
+
+        # Two horizons (5s) plus the navigation window (3s) of events, one per second per kind
+        assert peak < 50
+        assert streaming.emitted["ui_to_api"] > 4900
+
+    def test_classify_and_late_events(self):
+        """Raw events are classified; events behind the watermark are counted"""
+        streaming = StreamingCorrelator()
+
+        streaming.add_event({"actionType": "tap", "timestamp": 10000})
+        streaming.add_event({"method": "GET", "url": "/x", "timestamp": 10})
+        streaming.add_event({"eventType": "NavigationEvent", "timestamp": 10001})
+        streaming.add_event({"eventType": "Log", "timestamp": 10002})
+
+        assert streaming.events_received == 3
+        assert streaming.late_events == 1
+
+    def test_requires_horizon_without_temporal_strategy(self):
+        """A UI strategy without a temporal window needs an explicit horizon"""
+        correlator = EventCorrelator(force_python=True)
+        correlator.ui_strategy = HybridCorrelationStrategy([CorrelationIDStrategy()])
+
+        with pytest.raises(ValueError):
+            StreamingCorrelator(correlator)
+        assert StreamingCorrelator(correlator, horizon_ms=2000).horizon_ms == 2000
+
+
+class TestFollowSession:
+    """Test live correlation of a session as it is written to the store"""
+
+    @staticmethod
+    def _flow_pairs(flows):
+        return sorted(
+            (
+                f.ui_correlation.ui_event_id,
+                sorted(api["eventId"] for api in f.ui_correlation.api_calls),
+                sorted((n.api_event_id, n.navigation_event_id) for n in f.api_navigation_correlations),
+            )
+            for f in flows
+        )
+
+    def test_matches_batch(self, tmp_path):
+        """Following a stored session emits the batch correlator's flows for the recorded payloads"""
+        correlator = EventCorrelator(force_python=True)
+        correlator.ui_strategy = TemporalProximityStrategy(max_time_delta_ms=750)
+        ui_events, api_events, nav_events = (
+            sorted(events, key=lambda e: e["timestamp"]) for events in generate_session(seed=1)
+        )
+        batch = correlator.correlate_events("s", ui_events, api_events, nav_events)
+
+        store = EventStore(str(tmp_path / "follow.db"))
+        typed = [(e, "UIEvent") for e in ui_events] + [(e, "NetworkEvent") for e in api_events]
+        typed += [(e, "NavigationEvent") for e in nav_events]
+        store.add_events(
+            {**event, "sessionId": "s", "eventType": event_type}
+            for event, event_type in sorted(typed, key=lambda item: item[0]["timestamp"])
+        )
+        emitted = list(
+            follow_session(store, "s", StreamingCorrelator(correlator), poll_interval=0.01, idle_timeout=0.05)
+        )
+        store.close()
+
+        flows = [c for c in emitted if isinstance(c, FullFlowCorrelation)]
+        assert batch.full_flows
+        assert self._flow_pairs(flows) == self._flow_pairs(batch.full_flows)
+        assert all(f.ui_correlation.ui_event_id.startswith("ui_") for f in flows)
+
+    def test_sdk_event_types(self, tmp_path):
+        """SDK events, stored as ui/network/navigation, are classified from their payloads"""
+        store = EventStore(str(tmp_path / "sdk.db"))
+        for n, t in ((1, 0), (2, 20000)):
+            store.add_event(
+                {"sessionId": "sdk", "actionType": "tap", "eventId": f"u{n}", "screen": "Login", "timestamp": t}
+            )
+            store.add_event(
+                {
+                    "sessionId": "sdk",
+                    "method": "POST",
+                    "url": "/login",
+                    "statusCode": 200,
+                    "eventId": f"a{n}",
+                    "timestamp": t + 100,
+                }
+            )
+            store.add_event({"sessionId": "sdk", "toScreen": "Home", "eventId": f"n{n}", "timestamp": t + 300})
+        assert {e["event_type"] for e in store.iter_events(session_id="sdk")} == {"ui", "network", "navigation"}
+
+        emitted = list(follow_session(store, "sdk", poll_interval=0.01, idle_timeout=0.05))
+        store.close()
+
+        flows = [c for c in emitted if isinstance(c, FullFlowCorrelation)]
+        assert self._flow_pairs(flows) == [("u1", ["a1"], [("a1", "n1")]), ("u2", ["a2"], [("a2", "n2")])]
+
+    def test_picks_up_events_written_while_following(self, tmp_path):
+        """Events stored after following started are correlated too"""
+        store = EventStore(str(tmp_path / "live.db"))
+        common = {"sessionId": "live", "threadId": "main"}
+        store.add_event({**common, "eventType": "UIEvent", "eventId": "u0", "screen": "Home", "timestamp": 0})
+
+        def record():
+            time.sleep(0.05)
+            store.add_event({**common, "eventType": "NetworkEvent", "eventId": "a0", "timestamp": 100})
+            store.add_event({**common, "eventType": "NavigationEvent", "eventId": "n0", "timestamp": 300})
+
+        writer = threading.Thread(target=record)
+        writer.start()
+        emitted = list(follow_session(store, "live", poll_interval=0.01, idle_timeout=0.3))
+        writer.join()
+        store.close()
+
+        flows = [c for c in emitted if isinstance(c, FullFlowCorrelation)]
+        assert self._flow_pairs(flows) == [("u0", ["a0"], [("a0", "n0")])]
+
+    def test_cli(self, session_store, tmp_path):
+        """record follow writes emitted correlations as JSON lines"""
+        output = tmp_path / "flows.jsonl"
+        result = CliRunner().invoke(
+            record,
+            [
+                "follow",
+                "--db",
+                str(session_store.db_path),
+                "--session-id",
+                "session_0",
+                "--poll-interval",
+                "0.01",
+                "--idle-timeout",
+                "0.05",
+                "--output",
+                str(output),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert any(r["type"] == "FullFlowCorrelation" for r in records)
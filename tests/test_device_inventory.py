@@ -0,0 +1,218 @@
+"""
+Tests for the shared device inventory
+"""
+
+import io
+import json
+import os
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from framework.devices.device_inventory import DeviceInventory, read_track_devices
+from framework.devices.device_layer import DeviceStatus, LocalDeviceProvider, Platform
+from framework.devices.device_pool import PoolManager
+
+SIMCTL_OUTPUT = json.dumps(
+    {
+        "devices": {
+            "com.apple.CoreSimulator.SimRuntime.iOS-17-0": [
+                {"name": "iPhone 15", "udid": "SIM-1", "isAvailable": True, "state": "Booted"},
+                {"name": "iPhone SE", "udid": "SIM-2", "isAvailable": True, "state": "Shutdown"},
+                {"name": "iPad", "udid": "SIM-3", "isAvailable": False, "state": "Shutdown"},
+            ]
+        }
+    }
+)
+
+
+class FakeTools:
+    """Stands in for adb and simctl: a mutable device list, counting every command run"""
+
+    def __init__(self, devices=None):
+        # serial -> (state, model, sdk, release)
+        self.devices = dict(devices or {})
+        self.commands = []
+        self.lock = threading.Lock()
+
+    def run(self, command, **kwargs):
+        with self.lock:
+            self.commands.append(command)
+        if command[:2] == ["adb", "devices"]:
+            lines = "".join(f"{serial}\t{info[0]}\n" for serial, info in self.devices.items())
+            return Mock(stdout=f"List of devices attached\n{lines}\n", returncode=0)
+        if command[0] == "adb" and command[1] == "-s":
+            _, model, sdk, release = self.devices[command[2]]
+            return Mock(stdout=f"{model}\n{sdk}\n{release}\n", returncode=0)
+        if command[0] == "xcrun":
+            return Mock(stdout=SIMCTL_OUTPUT, returncode=0)
+        raise AssertionError(f"unexpected command {command}")
+
+    def probes(self):
+        return [c[2] for c in self.commands if c[:2] == ["adb", "-s"]]
+
+
+def _inventory(tools, **kwargs):
+    patcher = patch("framework.devices.device_inventory.subprocess.run", side_effect=tools.run)
+    patcher.start()
+    return DeviceInventory(**kwargs), patcher
+
+
+class TestDeviceInventory:
+    """Test snapshot caching, probing and change notifications"""
+
+    def test_refresh_probes_each_device_once(self):
+        """Properties are read in one adb shell per newly connected device"""
+        tools = FakeTools(
+            {
+                "emulator-5554": ("device", "sdk_gphone64", "34", "14"),
+                "R58M1234": ("device", "Pixel 8", "35", "15"),
+                "R58M9999": ("unauthorized", "", "", ""),
+            }
+        )
+        inventory, patcher = _inventory(tools)
+        try:
+            snapshot = inventory.refresh()
+            assert sorted(tools.probes()) == ["R58M1234", "emulator-5554"]
+
+            pixel = inventory.get("R58M1234")
+            assert pixel["name"] == "Pixel 8"
+            assert pixel["api_level"] == 35
+            assert pixel["platform_version"] == "15"
+            assert pixel["device_type"] == "real"
+            assert inventory.get("R58M9999")["status"] == "unauthorized"
+            assert inventory.get("SIM-1")["platform_version"] == "17.0"
+            assert inventory.get("SIM-3") is None
+            assert [d["id"] for d in snapshot.available_by_platform["ios"]] == ["SIM-1"]
+            assert len(inventory.available_devices("android")) == 2
+
+            inventory.refresh()
+            assert len(tools.probes()) == 2
+        finally:
+            patcher.stop()
+
+    def test_reads_within_ttl_run_no_commands(self):
+        """Reads are served from the snapshot until it is older than the TTL"""
+        tools = FakeTools({"emulator-5554": ("device", "sdk", "34", "14")})
+        inventory, patcher = _inventory(tools, ttl=60)
+        try:
+            for _ in range(100):
+                assert len(inventory.devices()) == 3
+            assert inventory.refreshes == 1
+
+            inventory.ttl = 0
+            inventory.devices("android")
+            assert inventory.refreshes == 2
+        finally:
+            patcher.stop()
+
+    def test_change_notifications(self):
+        """Subscribers get the added, removed and changed devices"""
+        tools = FakeTools({"emulator-5554": ("device", "sdk", "34", "14")})
+        inventory, patcher = _inventory(tools)
+        changes = []
+        inventory.subscribe(changes.append)
+        try:
+            inventory.refresh()
+            assert {d["id"] for d in changes[0].added} == {"emulator-5554", "SIM-1", "SIM-2"}
+
+            inventory.refresh()
+            assert len(changes) == 1
+
+            tools.devices["emulator-5556"] = ("device", "sdk", "33", "13")
+            tools.devices["emulator-5554"] = ("offline", "sdk", "34", "14")
+            inventory.refresh()
+            assert [d["id"] for d in changes[1].added] == ["emulator-5556"]
+            assert [(d["id"], d["status"]) for d in changes[1].changed] == [("emulator-5554", "offline")]
+
+            del tools.devices["emulator-5556"]
+            inventory.refresh()
+            assert [d["id"] for d in changes[2].removed] == ["emulator-5556"]
+        finally:
+            patcher.stop()
+
+    def test_read_track_devices(self):
+        """Each length-prefixed track-devices update is a full device list"""
+        payload = b"emulator-5554\tdevice\nR58M1234\toffline\n"
+        stream = io.BytesIO(b"%04x" % len(payload) + payload + b"0000")
+
+        updates = list(read_track_devices(stream))
+
+        assert updates == [[("emulator-5554", "device"), ("R58M1234", "offline")], []]
+
+    def test_background_tracking(self):
+        """Android updates from adb track-devices are applied as they arrive"""
+        tools = FakeTools({"emulator-5554": ("device", "sdk", "34", "14")})
+        read_fd, write_fd = os.pipe()
+        tracker = Mock(stdout=os.fdopen(read_fd, "rb"))
+        tracker.poll.return_value = 0
+        changes = []
+
+        inventory, patcher = _inventory(tools, ttl=60)
+        try:
+            with patch("framework.devices.device_inventory.subprocess.Popen", return_value=tracker):
+                inventory.start()
+                inventory.subscribe(changes.append)
+                assert inventory.running
+
+                tools.devices["emulator-5556"] = ("device", "sdk", "33", "13")
+                payload = b"emulator-5554\tdevice\nemulator-5556\tdevice\n"
+                with os.fdopen(write_fd, "wb") as stream:
+                    stream.write(b"%04x" % len(payload) + payload)
+
+                deadline = time.monotonic() + 5
+                while not changes:
+                    assert time.monotonic() < deadline, "track-devices update not applied"
+                    time.sleep(0.01)
+                inventory.stop()
+
+            assert [d["id"] for d in changes[0].added] == ["emulator-5556"]
+            assert inventory.get("emulator-5556")["api_level"] == 33
+            assert tools.probes() == ["emulator-5554", "emulator-5556"]
+            assert not inventory.running
+        finally:
+            tracker.stdout.close()
+            patcher.stop()
+
+    def test_local_provider_reads_snapshot(self):
+        """LocalDeviceProvider lists valid Android devices and booted simulators"""
+        tools = FakeTools({"emulator-5554": ("device", "sdk", "34", "14"), "bad;id": ("device", "x", "1", "1")})
+        inventory, patcher = _inventory(tools, ttl=60)
+        try:
+            devices = LocalDeviceProvider(inventory).list_devices()
+            commands = len(tools.commands)
+            LocalDeviceProvider(inventory).list_devices()
+
+            assert [(d.udid, d.platform, d.platform_version) for d in devices] == [
+                ("emulator-5554", Platform.ANDROID, "14"),
+                ("SIM-1", Platform.IOS, "17.0"),
+            ]
+            assert len(tools.commands) == commands
+        finally:
+            patcher.stop()
+
+    def test_pool_follows_inventory(self):
+        """Pools created from the inventory track connects and disconnects"""
+        tools = FakeTools({"emulator-5554": ("device", "sdk", "34", "14")})
+        inventory, patcher = _inventory(tools, ttl=60)
+        try:
+            manager = PoolManager(inventory)
+            pool = manager.create_pool("android", from_inventory=True, platform="android")
+            assert [d.id for d in pool.devices] == ["emulator-5554"]
+
+            tools.devices["emulator-5556"] = ("device", "sdk", "33", "13")
+            tools.devices["emulator-5554"] = ("offline", "sdk", "34", "14")
+            inventory.refresh()
+            assert pool.get_device("emulator-5556").status == DeviceStatus.AVAILABLE
+            assert pool.get_device("emulator-5554").status == DeviceStatus.OFFLINE
+
+            tools.devices["emulator-5554"] = ("device", "sdk", "34", "14")
+            inventory.refresh()
+            assert pool.get_available_count() == 2
+
+            manager.delete_pool("android")
+            del tools.devices["emulator-5556"]
+            inventory.refresh()
+            assert pool.get_device("emulator-5556").status == DeviceStatus.AVAILABLE
+        finally:
+            patcher.stop()
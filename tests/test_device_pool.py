@@ -0,0 +1,225 @@
+"""
+Tests for DevicePool
+"""
+
+import threading
+import time
+
+import pytest
+
+from framework.devices.device_layer import Device, DeviceCapabilities, DeviceStatus, DeviceType, Platform
+from framework.devices.device_pool import DevicePool, PoolStrategy
+
+
+def _device(udid, platform=Platform.ANDROID, version="13", device_type=DeviceType.EMULATOR, name=None):
+    return Device(DeviceCapabilities(platform, version, name or f"Device {udid}", udid, device_type), driver=None)
+
+
+@pytest.fixture
+def pool():
+    """Mixed Android/iOS pool"""
+    return DevicePool(
+        name="test",
+        devices=[
+            _device("a11", version="11"),
+            _device("a13", version="13"),
+            _device("a14-real", version="14", device_type=DeviceType.REAL, name="Pixel 8"),
+            _device("ios17", Platform.IOS, "17.0", DeviceType.SIMULATOR),
+        ],
+    )
+
+
+def _wait_for_waiters(pool, count):
+    deadline = time.monotonic() + 5
+    while len(pool._waiters) < count:
+        assert time.monotonic() < deadline, "waiters did not block"
+        time.sleep(0.001)
+
+
+class TestDevicePool:
+    """Test indexed leasing and blocking acquisition"""
+
+    def test_filters(self, pool):
+        """Filters select from the platform/version free lists"""
+        assert pool.acquire_device({"platform": "ios"}).id == "ios17"
+        assert pool.acquire_device({"platform": Platform.IOS}) is None
+        assert pool.acquire_device({"min_version": "14"}).id == "a14-real"
+        assert pool.acquire_device({"type": "real"}) is None
+        assert pool.acquire_device({"model": "device a1", "min_version": "12"}).id == "a13"
+        assert pool.get_available_count() == 1
+        assert pool.count_devices({"platform": "android"}) == 3
+
+    def test_release_and_round_robin(self, pool):
+        """Released devices go to the back of their free list"""
+        first = pool.acquire_device({"platform": "android", "min_version": "13"})
+        assert first.status == DeviceStatus.BUSY
+
+        pool.release_device(first.id)
+        assert first.status == DeviceStatus.AVAILABLE
+        second = pool.acquire_device({"platform": "android", "min_version": "13"})
+
+        assert second.id != first.id
+        pool.release_device(second.id)
+        pool.release_device(second.id)  # Double release is a no-op
+        assert pool.get_available_count() == 4
+
+    def test_priority_strategy(self):
+        """PRIORITY always leases the earliest added free device"""
+        pool = DevicePool(name="p", strategy=PoolStrategy.PRIORITY)
+        for udid in ("d1", "d2", "d3"):
+            pool.add_device(_device(udid))
+
+        assert pool.acquire_device().id == "d1"
+        pool.release_device("d1")
+        assert pool.acquire_device().id == "d1"
+
+    def test_acquire_blocks_until_release(self, pool):
+        """acquire waits for a matching device instead of returning None"""
+        held = pool.acquire_device({"platform": "ios"})
+        threading.Timer(0.1, pool.release_device, args=(held.id,)).start()
+
+        start = time.monotonic()
+        device = pool.acquire({"platform": "ios"}, timeout=5)
+
+        assert device is held
+        assert time.monotonic() - start >= 0.05
+
+    def test_acquire_timeout(self, pool):
+        """acquire gives up after the timeout and leaves no waiter behind"""
+        pool.acquire_device({"platform": "ios"})
+
+        start = time.monotonic()
+        assert pool.acquire({"platform": "ios"}, timeout=0.05) is None
+        assert time.monotonic() - start >= 0.05
+        assert not pool._waiters
+
+    def test_waiters_served_in_order(self, pool):
+        """Released devices go to the longest-waiting matching caller; new callers cannot barge"""
+        held = pool.acquire_device({"platform": "ios"})
+        order = []
+
+        def wait(index):
+            device = pool.acquire({"platform": "ios"}, timeout=5)
+            order.append(index)
+            pool.release_device(device.id)
+
+        threads = []
+        for index in range(4):
+            thread = threading.Thread(target=wait, args=(index,))
+            thread.start()
+            threads.append(thread)
+            _wait_for_waiters(pool, index + 1)
+
+        pool.release_device(held.id)
+        assert pool.acquire_device({"platform": "ios"}) is None  # Handed off, not free
+        for thread in threads:
+            thread.join()
+
+        assert order == [0, 1, 2, 3]
+
+    def test_waiter_skipped_when_device_does_not_match(self, pool):
+        """A release wakes the first waiter whose filters match the device"""
+        ios = pool.acquire_device({"platform": "ios"})
+        androids = [pool.acquire_device({"platform": "android"}) for _ in range(3)]
+        results = {}
+
+        def wait(platform):
+            results[platform] = pool.acquire({"platform": platform}, timeout=5)
+
+        ios_waiter = threading.Thread(target=wait, args=("ios",))
+        ios_waiter.start()
+        _wait_for_waiters(pool, 1)
+        android_waiter = threading.Thread(target=wait, args=("android",))
+        android_waiter.start()
+        _wait_for_waiters(pool, 2)
+
+        pool.release_device(androids[0].id)
+        android_waiter.join(timeout=5)
+        assert results["android"] is androids[0]
+        assert "ios" not in results
+
+        pool.release_device(ios.id)
+        ios_waiter.join(timeout=5)
+        assert results["ios"] is ios
+
+    def test_unhealthy_devices_not_leased(self, pool):
+        """Offline devices are skipped until they come back"""
+        pool.set_device_status("ios17", DeviceStatus.OFFLINE)
+        assert pool.acquire_device({"platform": "ios"}) is None
+        assert pool.count_devices({"platform": "ios"}) == 0
+
+        pool.set_device_status("ios17", DeviceStatus.AVAILABLE)
+        device = pool.acquire_device({"platform": "ios"})
+        pool.set_device_status(device.id, DeviceStatus.ERROR)
+        pool.release_device(device.id)
+
+        assert device.status == DeviceStatus.ERROR
+        assert pool.acquire_device({"platform": "ios"}) is None
+
+    def test_offline_release_not_handed_to_waiter(self, pool):
+        """A device that went offline while leased is not given to a blocked acquire"""
+        device = pool.acquire_device({"platform": "ios"})
+        result = {}
+        waiter = threading.Thread(target=lambda: result.update(device=pool.acquire({"platform": "ios"}, timeout=5)))
+        waiter.start()
+        _wait_for_waiters(pool, 1)
+
+        pool.set_device_status(device.id, DeviceStatus.OFFLINE)
+        pool.release_device(device.id)
+        assert device.status == DeviceStatus.OFFLINE
+        assert pool.get_available_count() == 3
+
+        pool.set_device_status(device.id, DeviceStatus.AVAILABLE)
+        waiter.join(timeout=5)
+        assert result["device"] is device
+        assert device.status == DeviceStatus.BUSY
+
+    def test_invalid_filter_rejected_before_waiting(self, pool):
+        """Bad platform/type filters raise up front instead of queueing a waiter"""
+        held = pool.acquire_device({"platform": "ios"})
+
+        with pytest.raises(ValueError):
+            pool.acquire({"platform": "andriod"}, timeout=5)
+        with pytest.raises(ValueError):
+            pool.acquire({"type": "phone"}, timeout=5)
+        assert not pool._waiters
+
+        pool.release_device(held.id)
+        assert pool.acquire_device({"platform": "ios"}) is held
+
+    def test_remove_device(self, pool):
+        """Removed devices are no longer leased"""
+        pool.remove_device("ios17")
+
+        assert pool.acquire_device({"platform": "ios"}) is None
+        assert len(pool.devices) == 3
+
+    def test_concurrent_leases_are_exclusive(self):
+        """Under contention no device is ever leased twice at once"""
+        pool = DevicePool(name="stress", devices=[_device(f"d{i}", version=str(10 + i % 3)) for i in range(6)])
+        in_use = set()
+        guard = threading.Lock()
+        errors = []
+
+        def worker():
+            for _ in range(200):
+                device = pool.acquire({"min_version": "11"} if len(errors) % 2 else None, timeout=5)
+                if device is None:
+                    errors.append("timeout")
+                    return
+                with guard:
+                    if device.id in in_use:
+                        errors.append(f"double lease of {device.id}")
+                    in_use.add(device.id)
+                with guard:
+                    in_use.discard(device.id)
+                pool.release_device(device.id)
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert pool.get_available_count() == 6
@@ -0,0 +1,334 @@
+"""
+Tests for EventStore
+"""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from framework.storage.connection_pool import SQLiteConnectionPool
+from framework.storage.event_store import EventFileReader, EventStore, StoredEvent
+
+
+def _nav_event(session_id, from_screen, to_screen, timestamp):
+    return {
+        "sessionId": session_id,
+        "timestamp": timestamp,
+        "navType": "push",
+        "fromScreen": from_screen,
+        "toScreen": to_screen,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create an empty event store"""
+    return EventStore(str(tmp_path / "events.db"))
+
+
+@pytest.fixture
+def sample_events():
+    """Mixed UI, network and navigation events across two sessions"""
+    events = []
+    for i in range(25):
+        session_id = f"session_{i % 2}"
+        events.append({"sessionId": session_id, "timestamp": i * 100, "actionType": "tap", "screen": "Login"})
+        events.append({"sessionId": session_id, "timestamp": i * 100 + 10, "method": "GET", "url": "/api/items"})
+        events.append(_nav_event(session_id, "Login", "Home" if i % 3 else "Settings", i * 100 + 20))
+    return events
+
+
+class TestBulkIngest:
+    """Test batched event ingest"""
+
+    def test_add_events_returns_count(self, store, sample_events):
+        """add_events reports how many events were written"""
+        assert store.add_events(sample_events, batch_size=7) == len(sample_events)
+        assert len(store.get_events(limit=1000)) == len(sample_events)
+
+    def test_add_events_matches_add_event(self, tmp_path, sample_events):
+        """Bulk ingest produces the same screens and flows as per-event ingest"""
+        single = EventStore(str(tmp_path / "single.db"))
+        for event in sample_events:
+            single.add_event(event)
+
+        bulk = EventStore(str(tmp_path / "bulk.db"))
+        bulk.add_events(iter(sample_events), batch_size=4)
+
+        for session_id in ("session_0", "session_1"):
+            assert bulk.get_screens(session_id) == single.get_screens(session_id)
+            assert bulk.get_flows(session_id) == single.get_flows(session_id)
+
+        assert len(bulk.get_sessions()) == 2
+
+    def test_screen_stats_span_batches(self, store):
+        """Visit counters accumulate across batch boundaries"""
+        events = [_nav_event("s", "A", "B", ts) for ts in (10, 20, 30)]
+        store.add_events(events, batch_size=2)
+
+        (screen,) = store.get_screens("s")
+        assert screen["visit_count"] == 3
+        assert screen["first_visit"] == 10
+        assert screen["last_visit"] == 30
+
+        (flow,) = store.get_flows("s")
+        assert flow["count"] == 3
+
+    def test_import_from_json(self, store, sample_events, tmp_path):
+        """import_from_json goes through bulk ingest"""
+        export = tmp_path / "export.json"
+        export.write_text(json.dumps({"events": sample_events}))
+
+        assert store.import_from_json(str(export), batch_size=10) == len(sample_events)
+
+    def test_session_recreated_after_clear(self, store):
+        """Cached session IDs are forgotten when the session is cleared"""
+        store.add_event({"sessionId": "s", "timestamp": 5, "actionType": "tap"})
+        store.clear_session("s")
+        store.add_event({"sessionId": "s", "timestamp": 7, "actionType": "tap"})
+
+        sessions = store.get_sessions()
+        assert [s["session_id"] for s in sessions] == ["s"]
+        assert sessions[0]["start_time"] == 7
+
+    def test_invalid_batch_size(self, store):
+        """batch_size must be positive"""
+        with pytest.raises(ValueError):
+            store.add_events([], batch_size=0)
+
+
+class TestStreamingImport:
+    """Test incremental import of large export files"""
+
+    def test_envelope_streamed_in_small_chunks(self, sample_events, tmp_path):
+        """Events are decoded correctly when split across many chunks"""
+        export = tmp_path / "export.json"
+        export.write_text(json.dumps({"version": 1, "meta": {"n": [1, 2]}, "events": sample_events, "tail": 12345}))
+
+        reader = EventFileReader(str(export), chunk_size=7)
+        assert list(reader) == sample_events
+        assert 0 < reader.bytes_read <= reader.total_bytes
+
+    def test_bare_array_and_empty_envelope(self, tmp_path):
+        """A bare array and an envelope without events are both accepted"""
+        bare = tmp_path / "bare.json"
+        bare.write_text('[{"a": 1}, {"a": 22}]')
+        empty = tmp_path / "empty.json"
+        empty.write_text('{"events": []}')
+
+        assert list(EventFileReader(str(bare), chunk_size=3)) == [{"a": 1}, {"a": 22}]
+        assert list(EventFileReader(str(empty))) == []
+
+    def test_malformed_envelope(self, tmp_path):
+        """Truncated exports raise ValueError"""
+        broken = tmp_path / "broken.json"
+        broken.write_text('{"events": [{"a": 1}, {"a": ')
+
+        with pytest.raises(ValueError):
+            list(EventFileReader(str(broken), chunk_size=4))
+
+    def test_import_json_lines(self, store, sample_events, tmp_path):
+        """.jsonl files are imported one event per line"""
+        export = tmp_path / "export.jsonl"
+        export.write_text("\n".join(json.dumps(e) for e in sample_events) + "\n\n")
+
+        assert store.import_from_json(str(export)) == len(sample_events)
+
+        renamed = tmp_path / "export.txt"
+        export.rename(renamed)
+        assert store.import_from_jsonl(str(renamed)) == len(sample_events)
+
+    def test_import_reports_progress(self, store, sample_events, tmp_path):
+        """Progress is reported per batch and ends at the file size"""
+        export = tmp_path / "export.json"
+        export.write_text(json.dumps({"events": sample_events}))
+        progress = []
+
+        store.import_from_json(str(export), batch_size=20, progress_callback=lambda done, total: progress.append(done))
+
+        assert len(progress) == 4
+        assert progress == sorted(progress)
+        assert progress[-1] == export.stat().st_size
+
+
+class TestConnectionPool:
+    """Test persistent per-thread connections"""
+
+    def test_connection_reused_within_thread(self, tmp_path):
+        """Repeated acquires on one thread return the same connection"""
+        with SQLiteConnectionPool(str(tmp_path / "pool.db")) as pool:
+            assert pool.acquire() is pool.acquire()
+            assert pool.size == 1
+
+    def test_connection_per_thread(self, tmp_path):
+        """Each thread gets its own connection"""
+        pool = SQLiteConnectionPool(str(tmp_path / "pool.db"))
+        main_conn = pool.acquire()
+        seen = []
+
+        thread = threading.Thread(target=lambda: seen.append(pool.acquire()))
+        thread.start()
+        thread.join()
+
+        assert seen[0] is not main_conn
+        pool.close()
+        assert pool.size == 0
+
+    def test_wal_and_pragmas(self, tmp_path):
+        """Connections are opened in WAL mode with tuned pragmas"""
+        pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), pragmas={"cache_size": -1024})
+        conn = pool.acquire()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -1024
+        pool.close()
+
+    def test_reader_not_blocked_by_writer(self, store, sample_events):
+        """A reader thread sees committed data while a write transaction is open"""
+        store.add_events(sample_events)
+        results = []
+
+        with store._get_connection() as conn:
+            conn.execute("INSERT INTO events (session_id, event_type, timestamp, data) VALUES ('x', 'ui', 1, '{}')")
+
+            reader = threading.Thread(target=lambda: results.append(len(store.get_events(limit=1000))))
+            reader.start()
+            reader.join(timeout=2)
+
+        assert results == [len(sample_events)]
+        assert len(store.get_events(limit=1000)) == len(sample_events) + 1
+
+    def test_store_reopens_after_close(self, store, sample_events):
+        """Closing the store releases connections; later calls reconnect"""
+        store.add_events(sample_events)
+        store.close()
+
+        assert len(store.get_sessions()) == 2
+
+    def test_read_only_store(self, store, sample_events):
+        """A read-only store queries an existing database and rejects writes"""
+        store.add_events(sample_events)
+        reader = EventStore(str(store.db_path), read_only=True)
+
+        assert len(reader.get_sessions()) == 2
+        with pytest.raises(sqlite3.OperationalError):
+            reader.add_events(sample_events[:1])
+        reader.close()
+
+    def test_read_only_store_requires_database(self, tmp_path):
+        """Opening a missing database read-only fails instead of creating it"""
+        with pytest.raises(FileNotFoundError):
+            EventStore(str(tmp_path / "missing.db"), read_only=True)
+        assert not (tmp_path / "missing.db").exists()
+
+
+class TestIndexes:
+    """Test schema migrations and query plans"""
+
+    CORRELATOR_EVENT_TYPES = ["UIEvent", "NetworkEvent", "NavigationEvent"]
+
+    def _plan(self, store, query, params):
+        with store._get_connection() as conn:
+            return [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+
+    def test_schema_version(self, store):
+        """New databases are created at the current schema version"""
+        with store._get_connection() as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == EventStore.SCHEMA_VERSION
+
+    def test_migrates_legacy_database(self, tmp_path):
+        """Databases created before composite indexes are upgraded in place"""
+        import sqlite3
+
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript(
+            """
+            CREATE TABLE events (id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT NOT NULL,
+                                 event_type TEXT NOT NULL, timestamp INTEGER NOT NULL, screen TEXT,
+                                 data TEXT NOT NULL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            CREATE INDEX idx_session_id ON events(session_id);
+            INSERT INTO events (session_id, event_type, timestamp, data) VALUES ('s', 'UIEvent', 1, '{}');
+            """
+        )
+        conn.close()
+
+        store = EventStore(str(db_path))
+        with store._get_connection() as conn:
+            indexes = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == EventStore.SCHEMA_VERSION
+
+        assert "idx_session_id" not in indexes
+        assert {"idx_events_session_type_time", "idx_events_session_screen_time"} <= indexes
+        assert len(store.get_events(session_id="s", event_type="UIEvent")) == 1
+
+    @pytest.mark.parametrize("event_type", CORRELATOR_EVENT_TYPES)
+    def test_correlator_loads_use_range_scan(self, store, sample_events, event_type):
+        """Per-session loads by type are index range scans with no sort step"""
+        store.add_events(sample_events)
+        query, params = store._build_events_query(session_id="session_0", event_type=event_type)
+        plan = self._plan(store, query + " LIMIT ?", params + [100])
+
+        assert any("SEARCH" in step and "idx_events_session_type_time" in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+    def test_screen_lookup_has_no_sort(self, store, sample_events):
+        """Session + type + screen lookups stay in timestamp order"""
+        store.add_events(sample_events)
+        query, params = store._build_events_query(session_id="session_0", event_type="ui", screen="Login")
+        plan = self._plan(store, query, params)
+
+        assert any("SEARCH" in step and "idx_events_session_" in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+class TestEventIteration:
+    """Test keyset-paginated event iteration"""
+
+    def test_iterates_past_default_limit(self, store):
+        """iter_events returns every event, unlike the limited get_events"""
+        store.add_events({"sessionId": "s", "timestamp": i, "actionType": "tap"} for i in range(250))
+
+        assert len(store.get_events(session_id="s")) == 100
+        events = list(store.iter_events(session_id="s", page_size=64))
+        assert [e["timestamp"] for e in events] == list(range(250))
+
+    def test_ties_across_page_boundaries(self, store):
+        """Events sharing a timestamp are neither skipped nor repeated between pages"""
+        store.add_events({"sessionId": "s", "timestamp": i // 5, "actionType": "tap", "n": i} for i in range(23))
+
+        events = list(store.iter_events(session_id="s", event_type="ui", page_size=3))
+        assert [e["data"]["n"] for e in events] == list(range(23))
+
+    def test_lazy_data(self, store, sample_events):
+        """Lazy events decode data on access and compare equal to eager ones"""
+        store.add_events(sample_events)
+
+        lazy = list(store.iter_events(session_id="session_1", lazy_data=True))
+        eager = list(store.iter_events(session_id="session_1"))
+
+        assert isinstance(lazy[0], StoredEvent)
+        assert isinstance(lazy[0].raw_data, str)
+        assert lazy[0]["data"] is lazy[0]["data"]
+        assert [e.to_dict() for e in lazy] == eager
+        assert dict(lazy[0]) == eager[0]
+
+    def test_timeline_is_complete(self, store):
+        """get_event_timeline is no longer capped"""
+        store.add_events({"sessionId": "s", "timestamp": i, "actionType": "tap"} for i in range(10050))
+
+        assert len(store.get_event_timeline("s")) == 10050
+
+    def test_keyset_page_uses_index(self, store, sample_events):
+        """Resuming a page is an index range scan with no sort"""
+        store.add_events(sample_events)
+        query, params = store._build_events_query(session_id="session_0", event_type="ui", after=(100, 5))
+
+        with store._get_connection() as conn:
+            plan = [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+
+        assert any("SEARCH" in step and "idx_events_session_type_time" in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
@@ -0,0 +1,129 @@
+"""
+Tests for in-process test execution
+"""
+
+import sys
+import textwrap
+from unittest.mock import Mock
+
+import pytest
+
+from framework.execution.inprocess_test import InProcessTest, InProcessTestError
+from framework.execution.test_runner import TestResultStatus as Status
+from framework.testing.arrival_rate import ArrivalRateProfile
+from framework.testing.load_tester import LoadProfile, LoadTestConfig, LoadTester
+
+TARGET = textwrap.dedent(
+    """
+    import pytest
+
+    EVENTS = []
+
+    @pytest.fixture
+    def account():
+        EVENTS.append("setup")
+        yield {"calls": 0}
+        EVENTS.append("teardown")
+
+    def test_buy(account):
+        account["calls"] += 1
+        EVENTS.append(account["calls"])
+
+    def test_broken():
+        assert 1 == 2
+
+    def test_skipped():
+        pytest.skip("not today")
+    """
+)
+
+
+@pytest.fixture(scope="module")
+def target(tmp_path_factory):
+    path = tmp_path_factory.mktemp("inprocess") / "test_inprocess_target.py"
+    path.write_text(TARGET)
+    yield path
+    sys.modules.pop("test_inprocess_target", None)
+
+
+def events():
+    """Fixture and test events recorded by the target module so far"""
+    module = sys.modules.get("test_inprocess_target")
+    return module.EVENTS if module else []
+
+
+class TestInProcessTest:
+    """Test collecting once and running many times"""
+
+    def test_fixtures_set_up_once(self, target):
+        """Runs share one fixture setup, torn down on close"""
+        before = len(events())
+        with InProcessTest(f"{target}::test_buy") as test:
+            results = [test.run() for _ in range(3)]
+
+        assert [r.status for r in results] == [Status.PASSED] * 3
+        assert results[0].name.endswith("::test_buy")
+        assert events()[before:] == ["setup", 1, 2, 3, "teardown"]
+
+    def test_failures_and_skips(self, target):
+        """Assertion errors fail a run, pytest.skip skips it"""
+        with InProcessTest(f"{target}::test_broken") as test:
+            failed = test.run()
+        with InProcessTest(target, ["-k", "skipped"]) as test:
+            skipped = test.run()
+
+        assert failed.status == Status.FAILED
+        assert "assert 1 == 2" in failed.message
+        assert (skipped.status, skipped.message) == (Status.SKIPPED, "not today")
+
+    def test_must_select_one_test(self, target):
+        """Selecting several tests, or none, is an error"""
+        with pytest.raises(InProcessTestError, match="selects 3 tests"):
+            InProcessTest(target).start()
+        with pytest.raises(InProcessTestError):
+            InProcessTest(target.parent / "missing.py").start()
+        with pytest.raises(InProcessTestError, match="call start"):
+            InProcessTest(target).run()
+
+
+class TestLoadTesterInProcess:
+    """Test LoadTester with in-process execution"""
+
+    def config(self, target, **kwargs):
+        profile = LoadProfile(
+            name="In-process", description="", virtual_users=2, duration_seconds=60, think_time_seconds=0, iterations=5
+        )
+        return LoadTestConfig(test_path=target, profile=profile, in_process=True, test_filter="test_buy", **kwargs)
+
+    def inventory(self):
+        return Mock(devices=Mock(return_value=[{"id": "emulator-5554"}]))
+
+    def test_virtual_users_reuse_fixtures(self, target):
+        """Each virtual user sets up once and runs all its iterations in process"""
+        before = len(events())
+        result = LoadTester(self.config(target), inventory=self.inventory()).run()
+
+        assert (result.total_tests, result.passed_tests) == (10, 10)
+        new = events()[before:]
+        assert (new.count("setup"), new.count("teardown")) == (2, 2)
+
+    def test_filter_selecting_nothing(self, target):
+        """A selection error is reported per virtual user instead of an empty result"""
+        config = self.config(target)
+        config.test_filter = "no_such_test"
+        result = LoadTester(config, inventory=self.inventory()).run()
+
+        assert (result.total_tests, result.failed_tests) == (2, 2)
+        assert [e["user_id"] for e in sorted(result.errors, key=lambda e: e["user_id"])] == [0, 1]
+        assert all("selects 0 tests" in e["error"] for e in result.errors)
+
+    def test_open_model(self, target):
+        """Arrivals reuse one set-up test per worker thread"""
+        before = len(events())
+        config = self.config(target, arrival_rate=ArrivalRateProfile.constant(40, 0.5), max_workers=2)
+        result = LoadTester(config, inventory=self.inventory()).run()
+
+        assert (result.total_tests, result.passed_tests) == (20, 20)
+        new = events()[before:]
+        assert 1 <= new.count("setup") <= 2
+        assert new.count("teardown") == new.count("setup")
@@ -0,0 +1,144 @@
+"""
+Tests for streaming latency statistics
+"""
+
+import random
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from framework.testing.latency import LatencyHistogram, LatencyRecorder
+from framework.testing.load_tester import LoadProfile, LoadTestConfig, LoadTester
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class TestLatencyHistogram:
+    """Test the quantile sketch"""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Quantiles match nearest-rank percentiles of the raw values within 1%"""
+        rng = random.Random(3)
+        values = [rng.lognormvariate(-1, 1.2) for _ in range(50_000)] + [0.0, 1e-9]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for q in (0.0, 0.5, 0.9, 0.95, 0.99, 0.999, 1.0):
+            assert histogram.quantile(q) == pytest.approx(_exact(values, q), rel=0.01, abs=1e-6)
+        assert histogram.count == len(values)
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+        assert (histogram.min, histogram.max) == (min(values), max(values))
+        # Memory is bounded by the value range, not the number of values
+        assert histogram.bucket_count < 1200
+
+    def test_merge_equals_recording_everything(self):
+        """Merged histograms answer like one histogram of all values"""
+        rng = random.Random(4)
+        parts = [[rng.expovariate(5) for _ in range(1000)] for _ in range(4)]
+        merged, combined = LatencyHistogram(), LatencyHistogram()
+        for part in parts:
+            histogram = LatencyHistogram()
+            for value in part:
+                histogram.record(value)
+                combined.record(value)
+            merged.merge(histogram)
+
+        assert merged.summary() == pytest.approx(combined.summary())
+        with pytest.raises(ValueError):
+            merged.merge(LatencyHistogram(relative_accuracy=0.05))
+
+    def test_concurrent_recording(self):
+        """Recording from many threads loses no values"""
+        histogram = LatencyHistogram()
+
+        def record():
+            for i in range(5000):
+                histogram.record(0.001 * (i % 100 + 1))
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert histogram.count == 40_000
+        assert histogram.sum == pytest.approx(8 * 50 * 5.05)
+
+    def test_empty(self):
+        """An empty histogram reports zeros"""
+        assert LatencyHistogram().summary() == {
+            "count": 0,
+            "mean": 0.0,
+            "min": 0.0,
+            "max": 0.0,
+            "p50": 0.0,
+            "p95": 0.0,
+            "p99": 0.0,
+        }
+
+
+class TestLatencyRecorder:
+    """Test per-second snapshots and live windows"""
+
+    def test_timeline_and_window(self):
+        """Each second is summarized; window() covers only the recent seconds"""
+        now = [100.0]
+        recorder = LatencyRecorder(window_seconds=3, clock=lambda: now[0])
+
+        for second, latency in enumerate([0.1, 0.2, 0.3, 0.4, 5.0]):
+            now[0] = 100.0 + second + 0.5
+            for _ in range(10):
+                recorder.record(latency)
+
+        timeline = recorder.timeline()
+        assert [entry["second"] for entry in timeline] == [0, 1, 2, 3, 4]
+        assert [entry["count"] for entry in timeline] == [10] * 5
+        assert timeline[-1]["p95"] == pytest.approx(5.0)
+
+        window = recorder.window(2)
+        assert window.count == 20
+        assert window.min == pytest.approx(0.4)
+        assert recorder.window().count == 30
+        assert recorder.total.count == 50
+
+        # Quiet seconds drop out of the window
+        now[0] = 110.0
+        assert recorder.window().count == 0
+        assert recorder.total.quantile(0.5) == pytest.approx(0.3, rel=0.01)
+
+    def test_history_is_bounded(self):
+        """Only the last history_seconds summaries are kept"""
+        now = [0.0]
+        recorder = LatencyRecorder(history_seconds=5, clock=lambda: now[0])
+        for second in range(20):
+            now[0] = second
+            recorder.record(0.01)
+
+        assert [entry["second"] for entry in recorder.timeline()] == [14, 15, 16, 17, 18, 19]
+
+
+class TestLoadTesterLatency:
+    """Test LoadTester response time statistics"""
+
+    def test_results_from_sketch(self):
+        """Percentiles, live stats and the per-second timeline come from the recorder"""
+        profile = LoadProfile(
+            name="Unit", description="", virtual_users=3, duration_seconds=60, think_time_seconds=0, iterations=20
+        )
+        tester = LoadTester(LoadTestConfig(test_path=None, profile=profile, max_workers=3), inventory=Mock())
+        tester._execute_test = lambda user_id: user_id != 2
+
+        result = tester.run()
+
+        assert result.total_tests == 60
+        assert result.passed_tests == 40
+        assert tester.latency.total.count == 60
+        assert 0 <= result.min_response_time <= result.p50_response_time <= result.p99_response_time
+        assert result.p99_response_time <= result.max_response_time
+        assert sum(entry["count"] for entry in result.metrics["response_time_timeline"]) == 60
+        assert tester.live_stats()["count"] == 60
@@ -0,0 +1,119 @@
+"""
+Tests for MetricsCollector
+"""
+
+import threading
+
+import pytest
+
+from framework.observability.metrics import MetricsCollector, MetricType
+
+
+class TestMetricHandles:
+    """Test pre-registered handles"""
+
+    def test_handles_are_cached_per_label_set(self):
+        """The same name and labels give the same handle, in any label order"""
+        collector = MetricsCollector()
+        handle = collector.counter("actions_total", {"device": "emulator-5554", "action": "tap"})
+
+        assert collector.counter("actions_total", {"action": "tap", "device": "emulator-5554"}) is handle
+        assert collector.counter("actions_total", {"action": "swipe", "device": "emulator-5554"}) is not handle
+
+        handle.inc()
+        collector.inc_counter("actions_total", 2, labels={"action": "tap", "device": "emulator-5554"})
+        assert handle.value == 3.0
+
+    def test_type_and_bucket_conflicts(self):
+        """A name keeps its type and histogram buckets"""
+        collector = MetricsCollector()
+        collector.counter("requests_total")
+        collector.histogram("latency_seconds", buckets=(0.1, 1))
+
+        with pytest.raises(ValueError):
+            collector.gauge("requests_total")
+        with pytest.raises(ValueError):
+            collector.histogram("latency_seconds", buckets=(0.5,))
+        with pytest.raises(ValueError):
+            collector.histogram("other_seconds", buckets=(1, 0.1))
+        with pytest.raises(ValueError):
+            collector.counter("requests_total").inc(-1)
+
+    def test_concurrent_recording(self):
+        """Per-thread shards lose no updates, including from threads that have ended"""
+        collector = MetricsCollector()
+        counter = collector.counter("taps_total")
+        histogram = collector.histogram("tap_seconds", buckets=(0.1, 1))
+
+        def record():
+            for _ in range(5000):
+                counter.inc()
+                histogram.observe(0.5)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value == 40000
+        assert histogram.count == 40000
+        assert histogram.sum == pytest.approx(20000)
+        assert histogram.cumulative_counts() == [0, 40000, 40000]
+
+
+class TestPrometheusExport:
+    """Test the text exposition format"""
+
+    def test_histogram_exposition(self):
+        """Histograms export cumulative buckets, _sum and _count"""
+        collector = MetricsCollector()
+        duration = collector.histogram(
+            "test_duration_seconds", {"suite": "login"}, help_text="Test duration", buckets=(0.5, 1, 5)
+        )
+        for value in (0.2, 0.5, 0.7, 3, 12):
+            duration.observe(value)
+
+        assert collector.export_prometheus().splitlines() == [
+            "# HELP test_duration_seconds Test duration",
+            "# TYPE test_duration_seconds histogram",
+            'test_duration_seconds_bucket{suite="login",le="0.5"} 2',
+            'test_duration_seconds_bucket{suite="login",le="1.0"} 3',
+            'test_duration_seconds_bucket{suite="login",le="5.0"} 4',
+            'test_duration_seconds_bucket{suite="login",le="+Inf"} 5',
+            'test_duration_seconds_sum{suite="login"} 16.4',
+            'test_duration_seconds_count{suite="login"} 5',
+        ]
+
+    def test_counters_and_gauges(self, tmp_path):
+        """Families are sorted by name; label values are escaped"""
+        collector = MetricsCollector()
+        collector.set_gauge("devices_available", 3, help_text="Available devices")
+        collector.inc_counter("tests_failed_total", labels={"test": 'say "hi"'})
+        output = tmp_path / "metrics.txt"
+
+        text = collector.export_prometheus(output)
+
+        assert text.splitlines() == [
+            "# HELP devices_available Available devices",
+            "# TYPE devices_available gauge",
+            "devices_available 3",
+            "# TYPE tests_failed_total counter",
+            'tests_failed_total{test="say \\"hi\\""} 1.0',
+        ]
+        assert output.read_text() == text
+
+    def test_summary(self):
+        """The summary counts label sets and gives histogram counts and sums"""
+        collector = MetricsCollector()
+        collector.inc_counter("taps_total", labels={"device": "a"})
+        collector.inc_counter("taps_total", labels={"device": "b"})
+        collector.observe_histogram("tap_seconds", 0.25)
+        collector.observe_histogram("tap_seconds", 0.75)
+
+        summary = collector.get_summary()
+
+        assert (summary["total_metrics"], summary["counters"], summary["histograms"]) == (3, 2, 1)
+        histogram = next(m for m in summary["metrics"] if m["type"] == "histogram")
+        assert (histogram["count"], histogram["sum"]) == (2, 1.0)
+        assert collector.metrics["taps_total{device=a}"].type is MetricType.COUNTER
@@ -2,21 +2,30 @@
 Tests for Parallel Execution
 """
 
+import random
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
+from framework.devices.device_layer import Device, DeviceCapabilities, DeviceType, Platform
+from framework.devices.device_pool import DevicePool
+from framework.execution.duration_history import DurationHistory, percentile
 from framework.execution.parallel_executor import (
     ParallelExecutor,
     TestStatus,
     ExecutionResult,
     ShardResult,
 )
+from framework.execution.shard_planner import karmarkar_karp, lpt_assign, plan_shards
 from framework.execution.test_sharding import (
     TestCase,
+    TestShard,
     ShardStrategy,
     TestSharding,
 )
+from framework.execution.work_queue import WorkQueue
 
 
 @pytest.fixture
@@ -112,6 +121,57 @@ class TestTestSharding:
         assert len(shards) <= len(sample_tests)
 
 
+class TestShardPlanner:
+    """Test LPT planning with local-search refinement"""
+
+    def test_lpt_assignment(self):
+        """Longest items go to the least-loaded shard"""
+        assert lpt_assign([1, 5, 3, 4], 2) == [0, 0, 1, 1]  # 5+1 | 4+3
+        with pytest.raises(ValueError):
+            lpt_assign([1], 0)
+
+    def test_karmarkar_karp_split(self):
+        """Differencing splits into two sides with a small difference"""
+        weights = [8, 7, 6, 5, 4]
+        heavy, light = karmarkar_karp(weights, range(5))
+
+        assert sorted(heavy + light) == [0, 1, 2, 3, 4]
+        assert sum(weights[i] for i in heavy) - sum(weights[i] for i in light) == 2
+        assert karmarkar_karp(weights, []) == ([], [])
+
+    def test_refinement_beats_lpt(self):
+        """Swaps fix LPT's worst case: 3,3,2,2,2 on two shards is 6/6, not 7/5"""
+        weights = [3, 3, 2, 2, 2]
+        loads = [0, 0]
+        for item, shard in enumerate(plan_shards(weights, 2)):
+            loads[shard] += weights[item]
+
+        assert loads == [6, 6]
+
+    def test_large_suite_balance(self):
+        """Thousands of long-tailed tests on many shards end up almost perfectly balanced"""
+        rng = random.Random(7)
+        tests = [TestCase(Path(f"t{i % 50}.py"), f"t{i}", rng.lognormvariate(0, 1)) for i in range(2000)]
+        sharding = TestSharding(history_path=None)
+
+        shards = sharding.create_shards(tests, num_shards=32, strategy=ShardStrategy.DURATION_BASED)
+
+        assert sorted(t.name for shard in shards for t in shard.tests) == sorted(t.name for t in tests)
+        assert sharding.get_shard_statistics(shards)["imbalance_ratio"] < 0.01
+
+    def test_optimize_shards_keeps_files_together(self):
+        """optimize_shards rebalances by moving whole files when asked to"""
+        tests = [TestCase(Path(f"f{i}.py"), f"t{j}", 1.0) for i in range(6) for j in range(2)]
+        shards = [TestShard(0, 2, tests[:10]), TestShard(1, 2, tests[10:])]
+
+        TestSharding(history_path=None).optimize_shards(shards, max_imbalance=0.0, keep_files_together=True)
+
+        assert [shard.estimated_duration for shard in shards] == [6.0, 6.0]
+        for shard in shards:
+            for test in shard.tests:
+                assert all(other.file != test.file for other in shards[1 - shard.shard_id].tests)
+
+
 class TestParallelExecutor:
     """Test parallel executor functionality"""
 
@@ -283,6 +343,377 @@ class TestExecutionResult:
         assert result.error_message == "Connection timeout"
 
 
+SYNTHETIC_SUITE = """
+import os
+import time
+
+import pytest
+
+
+def test_pass():
+    print("worker", os.getpid())
+
+
+def test_fail():
+    assert 1 == 2
+
+
+@pytest.mark.skip(reason="not today")
+def test_skip():
+    pass
+
+
+@pytest.fixture
+def broken():
+    raise RuntimeError("fixture boom")
+
+
+def test_setup_error(broken):
+    pass
+
+
+@pytest.mark.parametrize("value", [1, 0])
+def test_param(value):
+    assert value
+
+
+class TestGroup:
+    def test_method(self):
+        pass
+
+
+def test_crash():
+    os._exit(3)
+
+
+def test_hang():
+    time.sleep(60)
+"""
+
+
+@pytest.fixture
+def synthetic_suite(tmp_path):
+    """Project with one test file covering every outcome"""
+    (tmp_path / "test_synthetic.py").write_text(SYNTHETIC_SUITE)
+    (tmp_path / "test_other.py").write_text("def test_one():\n    pass\n\n\ndef test_two():\n    pass\n")
+    return tmp_path
+
+
+def _run(executor, root, names):
+    tests = [TestCase(Path(file), name) for file, name in names]
+    shard_result = executor.execute_shards([TestShard(0, 1, tests)], root)[0]
+    return {r.test.name: r for r in shard_result.test_results}, shard_result
+
+
+class TestPersistentWorkers:
+    """Test shard execution in persistent pytest workers"""
+
+    def test_statuses_in_one_worker(self, synthetic_suite):
+        """Every test of the shard runs in the same worker with its own status"""
+        executor = ParallelExecutor(max_workers=1)
+        names = ["test_pass", "test_fail", "test_skip", "test_setup_error", "test_param", "TestGroup"]
+        results, shard_result = _run(executor, synthetic_suite, [("test_synthetic.py", n) for n in names])
+
+        assert results["test_pass"].status == TestStatus.PASSED
+        assert results["test_fail"].status == TestStatus.FAILED
+        assert "assert 1 == 2" in results["test_fail"].error_message
+        assert results["test_skip"].status == TestStatus.SKIPPED
+        assert results["test_setup_error"].status == TestStatus.ERROR
+        assert results["test_param"].status == TestStatus.FAILED  # One of two cases fails
+        assert results["TestGroup"].status == TestStatus.PASSED
+        assert shard_result.worker_id == f"pytest-worker-{results['test_pass'].output.split()[1]}"
+
+    def test_whole_file_and_missing_tests(self, synthetic_suite):
+        """A TestCase named after its file runs the file; unknown tests are reported as not collected"""
+        executor = ParallelExecutor(max_workers=1)
+        results, _ = _run(executor, synthetic_suite, [("test_other.py", "test_other"), ("test_other.py", "test_nope")])
+
+        assert results["test_other"].status == TestStatus.PASSED
+        assert results["test_nope"].status == TestStatus.SKIPPED
+        assert results["test_nope"].error_message == "No tests collected"
+
+    def test_worker_restarted_after_crash_and_timeout(self, synthetic_suite, monkeypatch):
+        """Crashing or hanging tests are reported and the rest of the shard still runs"""
+        monkeypatch.setattr(ParallelExecutor, "TEST_TIMEOUT", 3)
+        executor = ParallelExecutor(max_workers=1)
+        results, _ = _run(
+            executor,
+            synthetic_suite,
+            [("test_synthetic.py", "test_crash"), ("test_synthetic.py", "test_hang"), ("test_other.py", "test_one")],
+        )
+
+        assert results["test_crash"].status == TestStatus.ERROR
+        assert "crashed" in results["test_crash"].error_message
+        assert results["test_hang"].status == TestStatus.ERROR
+        assert "timeout" in results["test_hang"].error_message
+        assert results["test_one"].status == TestStatus.PASSED
+
+    def test_node_ids(self):
+        """TestCases map to pytest node IDs"""
+        assert ParallelExecutor._node_id(TestCase(Path("tests/test_a.py"), "test_x")) == "tests/test_a.py::test_x"
+        assert ParallelExecutor._node_id(TestCase(Path("tests/test_a.py"), "test_a")) == "tests/test_a.py"
+
+    def test_invalid_batch_size(self):
+        """batch_size must be positive"""
+        with pytest.raises(ValueError):
+            ParallelExecutor(batch_size=0)
+
+
+class TestDynamicScheduling:
+    """Test work-stealing execution from a shared queue"""
+
+    @staticmethod
+    def _fake_execute(executed):
+        def execute(self, test, project_root, env=None):
+            executed.append((threading.get_ident(), test.name))
+            time.sleep(test.estimated_duration / 100)
+            return ExecutionResult(test, TestStatus.PASSED, test.estimated_duration / 100)
+
+        return execute
+
+    def test_queue_longest_first_and_guided_chunks(self):
+        """Chunks come longest-first and shrink as the queue drains"""
+        tests = [TestCase(Path("t.py"), f"t{i}", d) for i, d in enumerate([1, 9, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1])]
+        queue = WorkQueue(tests, workers=2, max_chunk=10)
+
+        first = queue.take()
+        assert [t.name for t in first] == ["t1"]  # Exceeds the budget alone
+        chunks = [first]
+        while len(queue):
+            chunks.append(queue.take())
+
+        assert sorted(t.name for chunk in chunks for t in chunk) == sorted(t.name for t in tests)
+        assert len(chunks[1]) > len(chunks[-1]) == 1
+        assert queue.take() == []
+
+    def test_dynamic_beats_skewed_static_shards(self, monkeypatch, tmp_path):
+        """Idle workers pick up remaining tests; makespan stays near the lower bound"""
+        executed = []
+        monkeypatch.setattr(ParallelExecutor, "_execute_test", self._fake_execute(executed))
+        durations = [20, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3]
+        tests = [TestCase(Path("t.py"), f"t{i}", d) for i, d in enumerate(durations)]
+        executor = ParallelExecutor(max_workers=2, persistent_workers=False)
+
+        results = executor.execute_dynamic(tests, tmp_path)
+        aggregated = executor.aggregate_results(results)
+
+        assert len(results) == 2
+        assert aggregated["total_tests"] == len(tests)
+        assert executed[0][1] == "t0"  # Longest test starts first
+        assert aggregated["makespan_ratio"] < 1.3
+
+        # Round-robin shards put the 20 with six 3s on one worker
+        static = executor.execute_shards(
+            TestSharding().create_shards(tests, num_shards=2, strategy=ShardStrategy.ROUND_ROBIN), tmp_path
+        )
+        assert executor.aggregate_results(static)["makespan"] > aggregated["makespan"]
+
+    def test_dynamic_progress(self, monkeypatch, tmp_path):
+        """Progress is reported per completed test"""
+        monkeypatch.setattr(ParallelExecutor, "_execute_test", self._fake_execute([]))
+        tests = [TestCase(Path("t.py"), f"t{i}", 1) for i in range(5)]
+        progress = []
+
+        ParallelExecutor(max_workers=3, persistent_workers=False).execute_dynamic(
+            tests, tmp_path, progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert progress[-1] == (5, 5)
+        assert ParallelExecutor(max_workers=3).execute_dynamic([], tmp_path) == []
+
+    def test_load_balance_metrics(self):
+        """aggregate_results reports makespan against the ideal lower bound"""
+        executor = ParallelExecutor(max_workers=2)
+        test = TestCase(Path("t.py"), "t", 1.0)
+        shard_results = [
+            ShardResult(0, [ExecutionResult(test, TestStatus.PASSED, 3.0)], total_duration=3.0),
+            ShardResult(1, [ExecutionResult(test, TestStatus.PASSED, 1.0)], total_duration=1.0),
+        ]
+
+        aggregated = executor.aggregate_results(shard_results)
+
+        assert aggregated["makespan"] == 3.0
+        assert aggregated["makespan_lower_bound"] == 3.0  # The longest test alone
+        assert aggregated["makespan_ratio"] == 1.0
+        assert aggregated["imbalance_ratio"] == 1.0
+        assert "Makespan:" in executor.generate_summary(shard_results)
+
+    def test_load_balance_ignores_idle_shards_and_queued_shards(self):
+        """Shards that ran nothing are excluded; queued shards add up per worker"""
+        executor = ParallelExecutor(max_workers=2)
+        test = TestCase(Path("t.py"), "t", 1.0)
+        shard_results = [
+            ShardResult(i, [ExecutionResult(test, TestStatus.PASSED, d)], total_duration=d)
+            for i, d in enumerate([2.0, 2.0, 1.0, 1.0])
+        ] + [
+            ShardResult(4, [], total_duration=0),  # Lease failed
+            ShardResult(5, [ExecutionResult(test, TestStatus.ERROR, 0.0)], total_duration=0, worker_id="unscheduled"),
+        ]
+
+        aggregated = executor.aggregate_results(shard_results)
+
+        assert aggregated["makespan"] == 3.0  # 2 + 1 on each of the two workers
+        assert aggregated["makespan_lower_bound"] == 3.0
+        assert aggregated["imbalance_ratio"] == pytest.approx(1 / 1.5)
+
+        timed = [
+            ShardResult(0, [ExecutionResult(test, TestStatus.PASSED, 2.0)], 2.0, started_at=100.0, finished_at=102.0),
+            ShardResult(1, [ExecutionResult(test, TestStatus.PASSED, 2.0)], 2.0, started_at=100.5, finished_at=102.5),
+        ]
+        assert executor.aggregate_results(timed)["makespan"] == 2.5
+
+
+def _device(udid, platform=Platform.ANDROID, version="13"):
+    device_type = DeviceType.EMULATOR if platform == Platform.ANDROID else DeviceType.SIMULATOR
+    return Device(DeviceCapabilities(platform, version, f"Device {udid}", udid, device_type), driver=None)
+
+
+class TestDeviceExecution:
+    """Test execution with workers bound to DevicePool leases"""
+
+    @staticmethod
+    def _pool(*devices):
+        pool = DevicePool(name="test")
+        for device in devices:
+            pool.add_device(device)
+        return pool
+
+    @staticmethod
+    def _fake_execute(seen):
+        def execute(self, test, project_root, env=None):
+            seen.append((test.name, env["OBSERVE_DEVICE_UDID"], env.get("ANDROID_SERIAL")))
+            time.sleep(0.01)
+            return ExecutionResult(test, TestStatus.PASSED, 0.01)
+
+        return execute
+
+    def test_workers_follow_matching_devices(self, monkeypatch, tmp_path):
+        """One worker per device matching the filters; devices are returned afterwards"""
+        seen = []
+        monkeypatch.setattr(ParallelExecutor, "_execute_test", self._fake_execute(seen))
+        pool = self._pool(_device("emulator-1"), _device("emulator-2"), _device("sim-1", Platform.IOS, "17.0"))
+        tests = [TestCase(Path("t.py"), f"t{i}", 1.0) for i in range(12)]
+        executor = ParallelExecutor(max_workers=8, persistent_workers=False)
+
+        results = executor.execute_on_devices(tests, tmp_path, pool, device_filters={"platform": "android"})
+        aggregated = executor.aggregate_results(results)
+
+        assert len(results) == 2
+        assert {r.device_id for r in results} == {"emulator-1", "emulator-2"}
+        assert {udid for _, udid, _ in seen} == {"emulator-1", "emulator-2"}
+        assert all(serial == udid for _, udid, serial in seen)
+        assert aggregated["total_tests"] == 12
+        assert aggregated["devices_used"] == 2
+        assert 0 < aggregated["device_utilization"] <= 1
+        assert pool.get_available_count() == 3
+        assert "Devices:" in executor.generate_summary(results)
+
+    def test_lease_wait_reported(self, monkeypatch, tmp_path):
+        """Workers wait for busy devices and report how long"""
+        monkeypatch.setattr(ParallelExecutor, "_execute_test", self._fake_execute([]))
+        pool = self._pool(_device("emulator-1"))
+        held = pool.acquire_device()
+        threading.Timer(0.2, pool.release_device, args=(held.id,)).start()
+
+        executor = ParallelExecutor(max_workers=2, persistent_workers=False)
+        results = executor.execute_on_devices([TestCase(Path("t.py"), "t", 1.0)], tmp_path, pool)
+
+        assert results[0].test_results[0].status == TestStatus.PASSED
+        assert executor.aggregate_results(results)["lease_wait_max"] >= 0.15
+
+    def test_lease_timeout_and_no_matching_device(self, monkeypatch, tmp_path):
+        """Tests fail with an error when no device can be leased"""
+        pool = self._pool(_device("emulator-1"))
+        pool.acquire_device()
+        tests = [TestCase(Path("t.py"), f"t{i}", 1.0) for i in range(3)]
+        executor = ParallelExecutor(persistent_workers=False)
+
+        results = executor.execute_on_devices(tests, tmp_path, pool, lease_timeout=0.05)
+
+        unscheduled = [r for result in results for r in result.test_results]
+        assert [r.status for r in unscheduled] == [TestStatus.ERROR] * 3
+        assert "No device leased" in unscheduled[0].error_message
+
+        with pytest.raises(RuntimeError):
+            executor.execute_on_devices(tests, tmp_path, pool, device_filters={"platform": "ios"})
+
+    def test_persistent_worker_sees_device(self, tmp_path):
+        """Tests in a persistent worker run with the leased device in their environment"""
+        (tmp_path / "test_device.py").write_text(
+            "import os\n\n\ndef test_device():\n    assert os.environ['OBSERVE_DEVICE_UDID'] == 'emulator-1'\n"
+        )
+        pool = self._pool(_device("emulator-1"))
+
+        results = ParallelExecutor(pytest_args=["-p", "no:cacheprovider"]).execute_on_devices(
+            [TestCase(Path("test_device.py"), "test_device")], tmp_path, pool
+        )
+
+        assert results[0].test_results[0].status == TestStatus.PASSED
+        assert results[0].device_id == "emulator-1"
+
+
+class TestDurationHistory:
+    """Test the persistent duration history feeding sharding"""
+
+    def test_ewma_and_p90(self, tmp_path):
+        """Each run updates the moving average and the windowed p90"""
+        with DurationHistory(tmp_path / "durations.db", alpha=0.5, window=10) as history:
+            history.record([("t.py::a", 2.0)])
+            history.record([("t.py::a", 4.0), ("t.py::b", 1.0)])
+            for duration in range(1, 11):
+                history.record([("t.py::c", float(duration))])
+
+            assert history.estimates() == {"t.py::a": 3.0, "t.py::b": 1.0, "t.py::c": pytest.approx(9.0, abs=0.01)}
+            p90 = history.estimates("p90")
+            assert p90["t.py::a"] == 4.0
+            assert p90["t.py::c"] == 9.0
+            assert history.stats()[0]["runs"] == 10
+
+            with pytest.raises(ValueError):
+                history.estimates("mean")
+
+        assert percentile([5.0, 1.0, 3.0], 90) == 5.0
+        assert DurationHistory(tmp_path / "missing.db").estimates() == {}
+        assert not (tmp_path / "missing.db").exists()
+
+    def test_sharding_loads_history(self, tmp_path, sample_tests):
+        """create_shards balances on recorded durations without being handed them"""
+        db = tmp_path / "durations.db"
+        with DurationHistory(db) as history:
+            history.record([(test.full_name, 1.0) for test in sample_tests[1:]] + [(sample_tests[0].full_name, 8.0)])
+
+        shards = TestSharding(history_path=db).create_shards(
+            sample_tests, num_shards=2, strategy=ShardStrategy.DURATION_BASED
+        )
+
+        assert sorted(shard.estimated_duration for shard in shards) == [4.0, 8.0]
+        assert any(shard.tests == [sample_tests[0]] for shard in shards)
+        assert TestSharding({}, history_path=db).duration_history == {}
+
+    def test_executor_records_durations(self, monkeypatch, tmp_path):
+        """Passed and failed tests are recorded after a run and used as estimates by the next one"""
+
+        def execute(self, test, project_root, env=None):
+            status = TestStatus.SKIPPED if test.name == "skipped" else TestStatus.PASSED
+            return ExecutionResult(test, status, 0.25)
+
+        monkeypatch.setattr(ParallelExecutor, "_execute_test", execute)
+        tests = [TestCase(Path("t.py"), name, 10.0) for name in ("a", "b", "skipped")]
+        executor = ParallelExecutor(max_workers=2, persistent_workers=False, history_path=Path("history.db"))
+
+        executor.execute_shards(TestSharding(history_path=None).create_shards(tests, 2), tmp_path)
+        with DurationHistory(tmp_path / "history.db") as history:
+            assert history.estimates() == {"t.py::a": 0.25, "t.py::b": 0.25}
+
+        executor.execute_dynamic(tests, tmp_path)
+        assert [test.estimated_duration for test in tests] == [0.25, 0.25, 10.0]
+
+        ParallelExecutor(persistent_workers=False, history_path=None).execute_shards(
+            [TestShard(0, 1, tests)], tmp_path / "elsewhere"
+        )
+        assert not (tmp_path / "elsewhere").exists()
+
+
 def test_integration_sharding_and_execution(sample_tests):
     """Integration test: create shards and mock execution"""
     # Create balanced shards
@@ -15,6 +15,8 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import os
+import shutil
+import subprocess
 
 # Import security modules
 from framework.security.sast_analyzer import (
@@ -27,6 +29,7 @@ from framework.security.sast_analyzer import (
     CryptoAnalyzer,
     InsecureAPIAnalyzer,
 )
+from framework.security.sast_cache import SASTFindingsCache
 from framework.security.dast_analyzer import DASTAnalyzer, DASTResult, DASTFinding, DASTTestType, DASTSeverity
 from framework.security.supply_chain import (
     SupplyChainAnalyzer,
@@ -206,6 +209,132 @@ result = eval(user_input)
             assert isinstance(result, SASTResult)
             assert result.files_scanned >= 2
 
+    def test_parallel_analysis_matches_sequential(self):
+        """Findings from a process pool are merged in the same order as a sequential run"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(12):
+                (Path(tmpdir) / f"module_{i:02d}.py").write_text(
+                    "import hashlib, pickle\n"
+                    f"digest = hashlib.md5(b'{i}')\n"
+                    "data = pickle.loads(input())\n"
+                    "eval(input())\n"
+                )
+
+            analyzer = SASTAnalyzer()
+            sequential = analyzer.analyze_directory(Path(tmpdir))
+            parallel = analyzer.analyze_directory(Path(tmpdir), workers=3)
+
+            assert sequential
+            assert [f.to_dict() for f in parallel] == [f.to_dict() for f in sequential]
+            assert analyzer.analyze(Path(tmpdir), workers=2).files_scanned == 12
+
+
+VULNERABLE_PY = "import hashlib\nquery = input()\ncursor.execute(query)\ndigest = hashlib.md5(b'x')\n"
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args], cwd=cwd, check=True)
+
+
+class TestSASTFindingsCache:
+    """Tests for incremental SAST with the findings cache"""
+
+    def _project(self, root):
+        root.mkdir(exist_ok=True)
+        for i in range(4):
+            (root / f"module_{i}.py").write_text(VULNERABLE_PY + f"value = {i}\n")
+        return root
+
+    def _counting_analyzer(self, cache, monkeypatch):
+        analyzer = SASTAnalyzer(cache=cache)
+        analyzed = []
+        analyze_file = analyzer.analyze_file
+
+        def counting(file_path):
+            analyzed.append(file_path.name)
+            return analyze_file(file_path)
+
+        monkeypatch.setattr(analyzer, "analyze_file", counting)
+        return analyzer, analyzed
+
+    def test_unchanged_files_reuse_cached_findings(self, tmp_path, monkeypatch):
+        """Only files whose content changed are analyzed again"""
+        project = self._project(tmp_path / "src")
+        expected = [f.to_dict() for f in SASTAnalyzer().analyze_directory(project)]
+
+        with SASTFindingsCache(tmp_path / "cache.db") as cache:
+            analyzer, analyzed = self._counting_analyzer(cache, monkeypatch)
+            first = analyzer.analyze(project)
+            (project / "module_2.py").write_text("x = 1\n")
+            second = analyzer.analyze(project)
+
+        assert [f.to_dict() for f in first.findings] == expected
+        assert analyzed == ["module_0.py", "module_1.py", "module_2.py", "module_3.py", "module_2.py"]
+        assert second.files_from_cache == 3
+        assert not [f for f in second.findings if f.file_path.endswith("module_2.py")]
+        assert len(second.findings) == len(first.findings) * 3 // 4
+
+    def test_cached_findings_round_trip(self, tmp_path):
+        """Cached findings keep taint flows and follow copied content to its new path"""
+        project = self._project(tmp_path / "src")
+        with SASTFindingsCache(tmp_path / "cache.db") as cache:
+            SASTAnalyzer(cache=cache).analyze(project / "module_0.py")
+            (project / "copy.py").write_text((project / "module_0.py").read_text())
+
+            analyzer = SASTAnalyzer(cache=cache)
+            cached = analyzer.analyze(project / "copy.py")
+            fresh = SASTAnalyzer().analyze(project / "copy.py")
+
+        assert cached.files_from_cache == 1
+        assert any(f.taint_flow for f in cached.findings)
+        assert cached.findings == fresh.findings
+
+    def test_same_content_different_suffix(self, tmp_path):
+        """Identical content is not shared between files of different kinds"""
+        project = tmp_path / "src"
+        project.mkdir()
+        content = "try:\n    x = 1\nexcept:\n    pass\n"
+        (project / "a.py").write_text(content)
+        (project / "b.js").write_text(content)
+        expected = [f.to_dict() for f in SASTAnalyzer().analyze_directory(project)]
+
+        with SASTFindingsCache(tmp_path / "cache.db") as cache:
+            SASTAnalyzer(cache=cache).analyze(project)
+            second = SASTAnalyzer(cache=cache).analyze(project)
+
+        assert second.files_from_cache == 2
+        assert [f.to_dict() for f in second.findings] == expected
+        assert any(f.file_path.endswith("a.py") and f.title == "Bare except clause" for f in second.findings)
+
+    def test_ruleset_change_invalidates(self, tmp_path, monkeypatch):
+        """Findings cached under other rules are not reused"""
+        project = self._project(tmp_path / "src")
+        with SASTFindingsCache(tmp_path / "cache.db") as cache:
+            SASTAnalyzer(cache=cache).analyze(project)
+            monkeypatch.setattr("framework.security.sast_analyzer.ruleset_version", lambda: "new-rules")
+            result = SASTAnalyzer(cache=cache).analyze(project)
+
+            assert result.files_from_cache == 0
+            assert cache.prune("new-rules") == 4
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_since_only_considers_changed_files(self, tmp_path):
+        """--since analyzes files changed since the ref plus untracked ones"""
+        project = self._project(tmp_path)
+        _git(project, "init", "-q")
+        _git(project, "add", ".")
+        _git(project, "commit", "-q", "-m", "initial")
+
+        (project / "module_1.py").write_text(VULNERABLE_PY + "changed = True\n")
+        (project / "new.py").write_text(VULNERABLE_PY)
+
+        result = SASTAnalyzer().analyze(project, since="HEAD")
+
+        assert result.files_scanned == 2
+        assert {Path(f.file_path).name for f in result.findings} == {"module_1.py", "new.py"}
+        with pytest.raises(ValueError):
+            SASTAnalyzer().analyze(project, since="no-such-ref")
+
 
 class TestDASTAnalyzer:
     """Tests for Dynamic Application Security Testing analyzer"""